@@ -3,10 +3,12 @@
 from typing import AsyncIterator, Dict, Any
 import anthropic
 
+from common.cassette import create_anthropic_client
+from common.prompt_cache import CachedPromptMixin
 from common.config import Config
 
 
-class CoderAgent:
+class CoderAgent(CachedPromptMixin):
     """Claude API를 사용하여 Python 코드를 생성하는 에이전트"""
 
     SYSTEM_PROMPT = """당신은 Python 코드 생성 전문가입니다.
@@ -24,9 +26,12 @@ class CoderAgent:
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self):
+    MODEL = "claude-sonnet-4-20250514"
+
+    def __init__(self, prompt_rules: str = ""):
         Config.validate()
-        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = create_anthropic_client(Config.ANTHROPIC_API_KEY)
+        self.set_prompt_rules(prompt_rules)
 
     async def generate(self, query: str) -> str:
         """
@@ -38,12 +43,7 @@ class CoderAgent:
         Returns:
             생성된 Python 코드
         """
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=4096,
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": query}],
-        )
+        response = self._create_message(4096, query)
 
         return response.content[0].text
 
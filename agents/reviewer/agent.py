@@ -3,10 +3,12 @@
 from typing import AsyncIterator, Dict, Any
 import anthropic
 
+from common.cassette import create_anthropic_client
+from common.prompt_cache import CachedPromptMixin
 from common.config import Config
 
 
-class ReviewerAgent:
+class ReviewerAgent(CachedPromptMixin):
     """Python 코드를 리뷰하고 개선점을 제안하는 에이전트"""
 
     SYSTEM_PROMPT = """당신은 시니어 Python 개발자이자 코드 리뷰 전문가입니다.
@@ -33,9 +35,12 @@ class ReviewerAgent:
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self):
+    MODEL = "claude-sonnet-4-20250514"
+
+    def __init__(self, prompt_rules: str = ""):
         Config.validate()
-        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = create_anthropic_client(Config.ANTHROPIC_API_KEY)
+        self.set_prompt_rules(prompt_rules)
 
     async def review(self, code: str) -> str:
         """
@@ -56,12 +61,7 @@ class ReviewerAgent:
 위 기준에 따라 상세한 코드 리뷰를 작성해주세요.
 """
 
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=3000,
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": review_prompt}],
-        )
+        response = self._create_message(3000, review_prompt)
 
         return response.content[0].text
 
@@ -7,10 +7,12 @@ import os
 from typing import AsyncIterator, Dict, Any
 import anthropic
 
+from common.cassette import create_anthropic_client
+from common.prompt_cache import CachedPromptMixin
 from common.config import Config
 
 
-class TesterAgent:
+class TesterAgent(CachedPromptMixin):
     """Python 코드를 실행하고 테스트하는 에이전트"""
 
     SYSTEM_PROMPT = """당신은 Python 코드 테스트 전문가입니다.
@@ -28,9 +30,12 @@ class TesterAgent:
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
 
-    def __init__(self):
+    MODEL = "claude-sonnet-4-20250514"
+
+    def __init__(self, prompt_rules: str = ""):
         Config.validate()
-        self.client = anthropic.Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+        self.client = create_anthropic_client(Config.ANTHROPIC_API_KEY)
+        self.set_prompt_rules(prompt_rules)
 
     def _execute_code(self, code: str) -> Dict[str, Any]:
         """
@@ -120,12 +125,7 @@ class TesterAgent:
 간결하게 답변해주세요.
 """
 
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            system=self.SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": analysis_prompt}],
-        )
+        response = self._create_message(2048, analysis_prompt)
 
         return response.content[0].text
 
@@ -0,0 +1,304 @@
+"""
+LLM 기록/재생 트랜스포트 (Cassette)
+
+실제 API 호출의 요청 → 응답 쌍을 gzip JSONL 카세트에 기록하고,
+재생 모드에서는 네트워크 없이 카세트에서 응답을 제공한다.
+
+- record: 실제 호출 + 기록 (지연시간 포함)
+- replay: 카세트 응답 + 합성 지연시간 (recorded / fixed / uniform / lognormal)
+- off: 그대로 실제 호출
+
+LLMClient(Gemini/OpenAI)와 에이전트의 Anthropic 클라이언트가 함께 사용
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from common.config import Config
+
+
+class CassetteMissError(KeyError):
+    """재생 모드에서 카세트에 없는 요청"""
+
+
+def request_key(request: dict) -> str:
+    """요청 정규화 해시 (키 순서 무관)"""
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LatencyModel:
+    """
+    재생 지연시간 분포
+
+    spec 예시: "recorded", "recorded:0.5" (기록값 × 0.5), "fixed:50",
+              "uniform:20:200", "lognormal:800:0.5"
+    """
+
+    def __init__(self, spec: str = "recorded", seed: int = 0):
+        parts = spec.split(":")
+        self.kind = parts[0]
+        self.params = [float(p) for p in parts[1:]]
+        if self.kind not in ("recorded", "fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency model: {spec}")
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample_ms(self, recorded_ms: Optional[float]) -> float:
+        with self._lock:
+            if self.kind == "fixed":
+                return self.params[0]
+            if self.kind == "uniform":
+                return self._rng.uniform(self.params[0], self.params[1])
+            if self.kind == "lognormal":
+                median, sigma = self.params
+                return self._rng.lognormvariate(math.log(median), sigma)
+            scale = self.params[0] if self.params else 1.0
+            return (recorded_ms or 0.0) * scale
+
+
+@dataclass
+class CassetteEntry:
+    """기록된 요청/응답"""
+    key: str
+    provider: str
+    model: str
+    response: Any
+    latency_ms: float
+    usage: dict = field(default_factory=dict)
+
+
+class Cassette:
+    """
+    gzip JSONL 카세트
+
+    한 줄 = 한 기록. 같은 요청이 여러 번 기록되면 재생 시 순환.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: dict[str, list[CassetteEntry]] = {}
+        self._cursor: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = CassetteEntry(**json.loads(line))
+                    self._entries.setdefault(entry.key, []).append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._entries.values())
+
+    def lookup(self, key: str) -> Optional[CassetteEntry]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return entries[index % len(entries)]
+
+    def append(self, entry: CassetteEntry) -> None:
+        with self._lock:
+            self._entries.setdefault(entry.key, []).append(entry)
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # gzip은 멤버 단위 append 가능 (읽을 때 이어서 해제됨)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(json.dumps(entry.__dict__, ensure_ascii=False) + "\n")
+
+
+class CassetteTransport:
+    """
+    기록/재생 트랜스포트
+
+    call(request, live_fn): 모드에 따라 live_fn 실행/기록 또는 카세트 재생
+    """
+
+    def __init__(
+        self,
+        mode: str = "off",
+        path: Optional[str] = None,
+        latency: Optional[LatencyModel] = None,
+    ):
+        if mode not in ("off", "record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.mode = mode
+        self.cassette = Cassette(path) if mode != "off" and path else None
+        self.latency = latency or LatencyModel()
+        self.stats = {"live": 0, "recorded": 0, "replayed": 0, "misses": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def call(
+        self,
+        request: dict,
+        live_fn: Callable[[], Any],
+        serialize: Callable[[Any], Any] = lambda r: r,
+        deserialize: Callable[[Any], Any] = lambda r: r,
+        usage_fn: Callable[[Any], dict] = lambda r: {},
+    ) -> Any:
+        """
+        요청 실행
+
+        Args:
+            request: 요청 내용 (provider, model 포함) → 카세트 키
+            live_fn: 실제 API 호출
+            serialize/deserialize: 응답 객체 ↔ JSON 변환
+            usage_fn: 응답에서 토큰 사용량 추출
+        """
+        if self.mode == "off":
+            self.stats["live"] += 1
+            return live_fn()
+
+        key = request_key(request)
+
+        if self.mode == "replay":
+            entry = self.cassette.lookup(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                raise CassetteMissError(
+                    f"No recording for {request.get('provider')}/{request.get('model')} ({key[:12]})"
+                )
+            self.stats["replayed"] += 1
+            delay_ms = self.latency.sample_ms(entry.latency_ms)
+            if delay_ms > 0:
+                time.sleep(delay_ms / 1000)
+            return deserialize(entry.response)
+
+        start = time.perf_counter()
+        response = live_fn()
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.cassette.append(CassetteEntry(
+            key=key,
+            provider=request.get("provider", ""),
+            model=request.get("model", ""),
+            response=serialize(response),
+            latency_ms=latency_ms,
+            usage=usage_fn(response),
+        ))
+        self.stats["recorded"] += 1
+        return response
+
+
+# ==================== Anthropic 클라이언트 래퍼 ====================
+
+@dataclass
+class _TextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class _Usage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+@dataclass
+class ReplayMessage:
+    """재생된 Anthropic 응답 (content[0].text / usage만 제공)"""
+    content: list
+    usage: _Usage
+    model: str = ""
+
+
+class _RecordingMessages:
+    def __init__(self, messages, transport: CassetteTransport):
+        self._messages = messages
+        self._transport = transport
+
+    def create(self, **kwargs):
+        request = {"provider": "anthropic", **kwargs}
+
+        def usage(message) -> dict:
+            u = getattr(message, "usage", None)
+            return {
+                "input_tokens": getattr(u, "input_tokens", 0),
+                "output_tokens": getattr(u, "output_tokens", 0),
+                "cache_creation_input_tokens": getattr(u, "cache_creation_input_tokens", 0) or 0,
+                "cache_read_input_tokens": getattr(u, "cache_read_input_tokens", 0) or 0,
+            }
+
+        def serialize(message) -> dict:
+            text = "".join(b.text for b in message.content if getattr(b, "type", "") == "text")
+            return {"text": text, "usage": usage(message)}
+
+        def deserialize(data: dict) -> ReplayMessage:
+            return ReplayMessage(
+                content=[_TextBlock(data["text"])],
+                usage=_Usage(**data.get("usage", {})),
+                model=kwargs.get("model", ""),
+            )
+
+        return self._transport.call(
+            request,
+            lambda: self._messages.create(**kwargs),
+            serialize=serialize,
+            deserialize=deserialize,
+            usage_fn=usage,
+        )
+
+
+class RecordingAnthropicClient:
+    """anthropic.Anthropic 래퍼: messages.create만 기록/재생, 나머지는 위임"""
+
+    def __init__(self, client, transport: CassetteTransport):
+        self._client = client
+        self.messages = _RecordingMessages(client.messages if client else None, transport)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def create_anthropic_client(api_key: str):
+    """
+    에이전트용 Anthropic 클라이언트
+
+    카세트 모드가 켜져 있으면 기록/재생 래퍼 반환 (재생 모드는 실제 클라이언트 불필요)
+    """
+    transport = get_cassette_transport()
+    if transport.mode == "replay":
+        return RecordingAnthropicClient(None, transport)
+
+    import anthropic
+    client = anthropic.Anthropic(api_key=api_key)
+    if transport.mode == "record":
+        return RecordingAnthropicClient(client, transport)
+    return client
+
+
+# 싱글톤 인스턴스
+_transport: Optional[CassetteTransport] = None
+
+
+def get_cassette_transport() -> CassetteTransport:
+    """환경변수 설정 기반 CassetteTransport 싱글톤"""
+    global _transport
+    if _transport is None:
+        _transport = CassetteTransport(
+            mode=Config.LLM_CASSETTE_MODE,
+            path=Config.LLM_CASSETTE_PATH,
+            latency=LatencyModel(Config.LLM_REPLAY_LATENCY, seed=Config.LLM_REPLAY_SEED),
+        )
+        if _transport.enabled:
+            print(f"[Cassette] {_transport.mode} mode: {Config.LLM_CASSETTE_PATH}")
+    return _transport
@@ -16,9 +16,18 @@ class Config:
     CODER_AGENT_HOST: str = os.getenv("CODER_AGENT_HOST", "localhost")
     CODER_AGENT_PORT: int = int(os.getenv("CODER_AGENT_PORT", "9999"))
 
+    # LLM 기록/재생 (off | record | replay)
+    LLM_CASSETTE_MODE: str = os.getenv("LLM_CASSETTE_MODE", "off").lower()
+    LLM_CASSETTE_PATH: str = os.getenv("LLM_CASSETTE_PATH", ".cassettes/llm.jsonl.gz")
+    # 재생 지연시간 분포: recorded | fixed:MS | uniform:LO:HI | lognormal:MEDIAN_MS:SIGMA
+    LLM_REPLAY_LATENCY: str = os.getenv("LLM_REPLAY_LATENCY", "recorded")
+    LLM_REPLAY_SEED: int = int(os.getenv("LLM_REPLAY_SEED", "0"))
+
     @classmethod
     def validate(cls) -> None:
         """필수 환경변수 검증"""
+        if cls.LLM_CASSETTE_MODE == "replay":
+            return  # 재생 모드는 API 키 불필요
         if not cls.ANTHROPIC_API_KEY:
             raise ValueError(
                 "ANTHROPIC_API_KEY가 설정되지 않았습니다.\n"
@@ -0,0 +1,119 @@
+"""
+제공자 프롬프트 캐싱 (Prompt Caching)
+
+매 호출마다 그대로 다시 보내는 고정 접두부 (에이전트 SYSTEM_PROMPT, 진화된 프롬프트 규칙)를
+제공자 캐시에 올려 첫 토큰까지 시간과 입력 비용을 줄인다.
+
+- Anthropic: system 블록의 마지막 고정 블록에 cache_control 지정 (그 앞까지 전부 캐시)
+- OpenAI / Gemini: 접두부 자동 캐싱 → 고정 부분을 앞에 두고 캐시된 토큰 수만 집계
+  (LLMClient 텔레메트리의 cached_prompt_tokens)
+
+제공자 최소 캐시 길이보다 짧은 접두부는 캐시되지 않음 (cache_control도 무시됨):
+- Anthropic: Sonnet/Opus 1024 토큰, Haiku 2048 토큰
+- OpenAI: 1024 토큰 / Gemini 암시적 캐시: Flash 1024, Pro 4096 토큰
+현재 에이전트 SYSTEM_PROMPT는 100 토큰 미만 → 진화 규칙이 쌓여 최소 길이를 넘을 때만 캐시 지점 지정
+"""
+
+import threading
+from typing import Optional
+
+
+# Anthropic 최소 캐시 접두부 (Sonnet 기준, 토큰)
+ANTHROPIC_MIN_CACHE_TOKENS = 1024
+
+
+def estimate_prefix_tokens(*blocks: Optional[str]) -> int:
+    """접두부 토큰 수 추정 (4자 ≈ 1토큰)"""
+    return sum(len(block) for block in blocks if block) // 4
+
+
+def cached_system(*blocks: Optional[str], min_tokens: int = ANTHROPIC_MIN_CACHE_TOKENS) -> list[dict]:
+    """
+    Anthropic system 블록 목록 (빈 블록 제외)
+
+    블록은 고정된 순서대로 (기본 프롬프트 → 진화 규칙) 전달하고,
+    접두부가 min_tokens 이상일 때만 마지막 블록에 ephemeral 캐시 지점을 둔다.
+    """
+    system = [{"type": "text", "text": block} for block in blocks if block]
+    if system and estimate_prefix_tokens(*blocks) >= min_tokens:
+        system[-1]["cache_control"] = {"type": "ephemeral"}
+    return system
+
+
+class PromptCacheStats:
+    """
+    모델별 프롬프트 캐시 적중 통계 (Anthropic usage 기준)
+
+    - cache_read_tokens: 캐시에서 읽은 입력 토큰 (적중)
+    - cache_write_tokens: 캐시에 새로 쓴 입력 토큰 (미스 후 저장)
+    - input_tokens: 캐시 지점 뒤 일반 입력 토큰
+    """
+
+    def __init__(self):
+        self._models: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, usage) -> None:
+        """응답 usage 기록"""
+        read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        fresh = getattr(usage, "input_tokens", 0) or 0
+        with self._lock:
+            stats = self._models.setdefault(model, {
+                "calls": 0, "hits": 0, "cache_read_tokens": 0,
+                "cache_write_tokens": 0, "input_tokens": 0,
+            })
+            stats["calls"] += 1
+            stats["hits"] += int(read > 0)
+            stats["cache_read_tokens"] += read
+            stats["cache_write_tokens"] += write
+            stats["input_tokens"] += fresh
+
+    def get_stats(self) -> dict:
+        """모델별 적중률 (호출 기준 / 토큰 기준)"""
+        with self._lock:
+            models = {model: dict(stats) for model, stats in self._models.items()}
+        for stats in models.values():
+            total = stats["cache_read_tokens"] + stats["cache_write_tokens"] + stats["input_tokens"]
+            stats["hit_rate"] = stats["hits"] / stats["calls"] if stats["calls"] else 0.0
+            stats["token_hit_ratio"] = stats["cache_read_tokens"] / total if total else 0.0
+        return models
+
+
+# 싱글톤 인스턴스
+_stats: Optional[PromptCacheStats] = None
+
+
+def get_prompt_cache_stats() -> PromptCacheStats:
+    """PromptCacheStats 싱글톤"""
+    global _stats
+    if _stats is None:
+        _stats = PromptCacheStats()
+    return _stats
+
+
+class CachedPromptMixin:
+    """
+    Anthropic 에이전트 공통: 진화된 프롬프트 규칙 + 캐시되는 system 접두부
+
+    사용하는 클래스는 SYSTEM_PROMPT, MODEL, self.client를 정의
+    """
+
+    SYSTEM_PROMPT = ""
+    MODEL = ""
+    prompt_rules = ""    # EvolutionEngine.get_active_prompt 결과
+
+    def set_prompt_rules(self, prompt_rules: str) -> None:
+        """진화된 프롬프트 규칙 교체 (캐시 접두부가 바뀌므로 규칙 변경 시에만 호출)"""
+        self.prompt_rules = prompt_rules or ""
+
+    def _create_message(self, max_tokens: int, content: str):
+        """고정 접두부 (시스템 프롬프트 + 진화 규칙)는 제공자 캐시 사용"""
+        response = self.client.messages.create(
+            model=self.MODEL,
+            max_tokens=max_tokens,
+            system=cached_system(self.SYSTEM_PROMPT, self.prompt_rules),
+            messages=[{"role": "user", "content": content}],
+        )
+        get_prompt_cache_stats().record(self.MODEL, response.usage)
+        return response
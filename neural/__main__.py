@@ -97,7 +97,8 @@ async def run_baby_mode(
 
     result = await baby.process(user_request)
 
-    # 기억 저장
+    # 백그라운드 학습 완료 후 기억 저장
+    await baby.drain()
     baby.save()
 
     # 세션 종료 시 상태 요약
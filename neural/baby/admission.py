@@ -0,0 +1,156 @@
+"""
+Admission Control - API 과부하 제어
+
+엔드포인트 클래스별 동시 실행 상한 + 짧은 대기열
+- 상한 안: 바로 실행
+- 상한 초과: 대기열(FIFO)에서 자리 대기, 대기열이 가득 차면 즉시 거절
+- 마감 인지 거절: 예상 대기시간(대기 순번 × 평균 처리시간 / 상한)이
+  남은 마감보다 길면 기다리지 않고 바로 거절 (Retry-After = 예상 대기시간)
+
+클래스에 속하지 않는 가벼운 엔드포인트(/api/state 등)는 제어 없이 항상 통과
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+
+SERVICE_TIME_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class AdmissionClass:
+    """엔드포인트 클래스 한도"""
+    max_in_flight: int
+    max_queue: int
+    max_wait_s: float                  # 기본 마감 (클라이언트 마감이 없을 때)
+    initial_service_s: float = 10.0    # 관측 전 평균 처리시간 추정치
+
+
+# 엔드포인트 클래스별 기본 한도
+ADMISSION_CLASSES = {
+    "pipeline": AdmissionClass(max_in_flight=4, max_queue=8, max_wait_s=10.0, initial_service_s=30.0),
+    "vision": AdmissionClass(max_in_flight=4, max_queue=8, max_wait_s=5.0, initial_service_s=5.0),
+}
+
+
+class OverloadedError(Exception):
+    """과부하로 거절 (HTTP 429)"""
+
+    def __init__(self, name: str, reason: str, retry_after_s: float):
+        super().__init__(f"{name} overloaded: {reason}")
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+
+    @property
+    def retry_after(self) -> str:
+        """Retry-After 헤더 값 (정수 초)"""
+        return str(max(1, math.ceil(self.retry_after_s)))
+
+
+class AdmissionGate:
+    """
+    클래스 하나의 동시 실행 게이트
+
+    자리가 나면 대기열 맨 앞 요청에 직접 넘겨줌 (새 요청이 끼어들지 않음)
+    """
+
+    def __init__(self, name: str, limits: AdmissionClass):
+        self.name = name
+        self.limits = limits
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._service_s = limits.initial_service_s
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "timed_out": 0}
+
+    def expected_wait_s(self) -> float:
+        """지금 들어오면 예상 대기시간"""
+        if self._in_flight < self.limits.max_in_flight and not self._waiters:
+            return 0.0
+        return (len(self._waiters) + 1) * self._service_s / self.limits.max_in_flight
+
+    @asynccontextmanager
+    async def admit(self, deadline_s: Optional[float] = None) -> AsyncIterator[None]:
+        """자리를 얻어 실행 (못 얻으면 OverloadedError)"""
+        await self._acquire(self.limits.max_wait_s if deadline_s is None else deadline_s)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            self._service_s += SERVICE_TIME_EWMA_ALPHA * (elapsed - self._service_s)
+            self._release()
+
+    async def _acquire(self, deadline_s: float) -> None:
+        if self._in_flight < self.limits.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            self._stats["admitted"] += 1
+            return
+
+        expected = self.expected_wait_s()
+        if len(self._waiters) >= self.limits.max_queue:
+            self._stats["rejected"] += 1
+            raise OverloadedError(self.name, "queue full", expected)
+        if expected > deadline_s:
+            self._stats["rejected"] += 1
+            raise OverloadedError(self.name, "deadline too short for queue", expected)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._stats["queued"] += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), deadline_s)
+        except asyncio.TimeoutError:
+            self._stats["timed_out"] += 1
+            self._abandon(waiter)
+            raise OverloadedError(self.name, "timed out in queue", self.expected_wait_s())
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        self._stats["admitted"] += 1
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """대기 포기: 이미 자리를 넘겨받았다면 반납"""
+        if waiter.done() and not waiter.cancelled():
+            self._release()
+        else:
+            waiter.cancel()
+            self._waiters.remove(waiter)
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)   # 자리 넘겨줌 (in_flight 유지)
+                return
+        self._in_flight -= 1
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "max_in_flight": self.limits.max_in_flight,
+            "max_queue": self.limits.max_queue,
+            "service_ms": self._service_s * 1000,
+        }
+
+
+class AdmissionController:
+    """엔드포인트 클래스 → 게이트"""
+
+    def __init__(self, classes: Optional[dict[str, AdmissionClass]] = None):
+        self._gates = {
+            name: AdmissionGate(name, limits)
+            for name, limits in (classes or ADMISSION_CLASSES).items()
+        }
+
+    def gate(self, name: str) -> Optional[AdmissionGate]:
+        return self._gates.get(name)
+
+    def get_stats(self) -> dict:
+        return {name: gate.get_stats() for name, gate in self._gates.items()}
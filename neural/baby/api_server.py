@@ -5,15 +5,49 @@ FastAPI 서버로 Baby AI의 기능을 외부에 노출합니다.
 Phase 4: Vision, Audio, Speech endpoints
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 import base64
+import json
+import os
 import uvicorn
 
-from .substrate import get_substrate
-from .vision import VisualInput, VisualSource, get_vision_processor
+from .admission import AdmissionController, OverloadedError
+from .db import close_async_supabase_client
+from .development import DevelopmentStage
+from .jobs import JobQueueFullError, get_job_manager
+from .substrate import BabyConfig
+from .substrate_pool import (
+    DEFAULT_BABY_ID,
+    MAX_RESIDENT_BABIES,
+    InvalidBabyIdError,
+    get_substrate_pool,
+    validate_baby_id,
+)
+from .vision import ImageBuffer, ImageTooLargeError, VisualInput, VisualSource, get_vision_processor
+
+
+# 아기별 상태 저장 경로 (CLI와 같은 프로젝트 루트의 .baby_memory/) / 최대 상주 아기 수
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MEMORY_PATH = os.getenv("BABY_MEMORY_PATH", os.path.join(PROJECT_ROOT, ".baby_memory"))
+MAX_RESIDENT = int(os.getenv("BABY_MAX_RESIDENT", MAX_RESIDENT_BABIES))
+
+pool = get_substrate_pool(BabyConfig(memory_path=MEMORY_PATH), max_resident=MAX_RESIDENT)
+jobs = get_job_manager(pool)
+
+SSE_KEEPALIVE_S = 15.0
+
+# 과부하 제어 대상 (POST 경로 → 엔드포인트 클래스), 나머지는 항상 통과
+admission = AdmissionController()
+ADMISSION_ROUTES = {
+    "/api/process": "pipeline",
+    "/api/vision/process": "vision",
+    "/api/vision/upload": "vision",
+}
+DEADLINE_HEADER = "X-Request-Deadline-Ms"   # 클라이언트 남은 마감 (선택)
 
 
 app = FastAPI(
@@ -22,6 +56,32 @@ app = FastAPI(
     version="0.4.0",
 )
 
+
+# 과부하 제어 (CORS보다 먼저 등록 → 429 응답에도 CORS 헤더 포함)
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    """무거운 엔드포인트는 클래스별 동시 실행 상한 + 대기열, 초과 시 429 + Retry-After"""
+    gate = admission.gate(ADMISSION_ROUTES.get(request.url.path, ""))
+    if gate is None or request.method != "POST":
+        return await call_next(request)
+
+    deadline_s = None
+    try:
+        deadline_s = float(request.headers[DEADLINE_HEADER]) / 1000
+    except (KeyError, ValueError):
+        pass
+
+    try:
+        async with gate.admit(deadline_s):
+            return await call_next(request)
+    except OverloadedError as e:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(e)},
+            headers={"Retry-After": e.retry_after},
+        )
+
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +92,14 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """진행 중인 작업 완료 후 상주 중인 모든 아기 상태 저장, 공유 HTTP/2 연결 풀 종료"""
+    await jobs.join()
+    await pool.close()
+    await close_async_supabase_client()
+
+
 # === Request/Response Models ===
 
 class VisionProcessRequest(BaseModel):
@@ -39,6 +107,7 @@ class VisionProcessRequest(BaseModel):
     image_data: str  # Base64 encoded
     mime_type: str = "image/jpeg"
     prompt: Optional[str] = None
+    baby_id: str = DEFAULT_BABY_ID
 
 
 class VisionProcessResponse(BaseModel):
@@ -53,6 +122,7 @@ class ProcessRequest(BaseModel):
     """일반 처리 요청"""
     task: str
     context: Optional[dict] = None
+    baby_id: str = DEFAULT_BABY_ID
 
 
 class ProcessResponse(BaseModel):
@@ -63,6 +133,13 @@ class ProcessResponse(BaseModel):
     development_stage: int
 
 
+class JobSubmitResponse(BaseModel):
+    """작업 등록 응답"""
+    job_id: str
+    status: str
+    events_url: str
+
+
 class StateResponse(BaseModel):
     """상태 조회 응답"""
     emotional_state: dict
@@ -101,29 +178,71 @@ async def process_vision(request: VisionProcessRequest):
             source=VisualSource.UPLOAD,
         )
 
-        # Substrate로 처리
-        substrate = get_substrate()
-        result = await substrate.process_image(image_data, request.prompt)
-
-        if result.visual_experience:
-            return VisionProcessResponse(
-                visual_experience=result.visual_experience.to_dict(),
-                emotional_changes=result.visual_experience.emotional_response,
-                success=result.success,
-                message="Image processed successfully",
-            )
-        else:
-            return VisionProcessResponse(
-                visual_experience={},
-                emotional_changes={},
-                success=False,
-                message=result.output or "Failed to process image",
-            )
+        # 아기별 Substrate로 처리
+        async with pool.session(request.baby_id) as substrate:
+            result = await substrate.process_image(image_data, request.prompt)
 
+        return _vision_response(result)
+
+    except InvalidBabyIdError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/vision/upload", response_model=VisionProcessResponse)
+async def upload_vision(
+    request: Request,
+    baby_id: str = DEFAULT_BABY_ID,
+    prompt: Optional[str] = None,
+):
+    """
+    바이너리 이미지 업로드 엔드포인트
+
+    - 본문 = 이미지 바이트 그대로 (Content-Type: image/*, base64/JSON 없음)
+    - 본문을 상한 버퍼로 스트리밍 → memoryview로 복사 없이 처리
+    - base64 인코딩은 LLM 제공자 경계에서만 수행
+    """
+    try:
+        content_length = request.headers.get("content-length")
+        buffer = ImageBuffer(expected_size=int(content_length) if content_length else None)
+        async for chunk in request.stream():
+            buffer.write(chunk)
+        if not len(buffer):
+            raise HTTPException(status_code=400, detail="Empty image body")
+
+        async with pool.session(baby_id) as substrate:
+            result = await substrate.process_image(buffer.view(), prompt)
+
+        return _vision_response(result)
+
+    except HTTPException:
+        raise
+    except ImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (InvalidBabyIdError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _vision_response(result) -> VisionProcessResponse:
+    """BabyResult → 이미지 처리 응답 (visual_experience는 이미 dict)"""
+    if result.visual_experience:
+        return VisionProcessResponse(
+            visual_experience=result.visual_experience,
+            emotional_changes=result.visual_experience.get("emotional_response", {}),
+            success=result.success,
+            message="Image processed successfully",
+        )
+    return VisionProcessResponse(
+        visual_experience={},
+        emotional_changes={},
+        success=False,
+        message=result.output or "Failed to process image",
+    )
+
+
 @app.get("/api/vision/stats")
 async def get_vision_stats():
     """시각 처리 통계"""
@@ -143,27 +262,86 @@ async def process_task(request: ProcessRequest):
     일반 작업 처리 엔드포인트
     """
     try:
-        substrate = get_substrate()
-        result = await substrate.process(request.task, request.context)
+        async with pool.session(request.baby_id) as substrate:
+            result = await substrate.process(request.task)
 
         return ProcessResponse(
             output=result.output,
             success=result.success,
             emotional_state=result.emotional_state,
-            development_stage=result.development_stage,
+            # development_progress["stage"]는 단계 이름 → 응답은 단계 번호
+            development_stage=DevelopmentStage[result.development_progress["stage"]].value,
         )
+    except InvalidBabyIdError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# === Job Endpoints (비동기 처리 + SSE 진행 이벤트) ===
+
+@app.post("/api/jobs", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(request: ProcessRequest):
+    """
+    작업 등록 - 즉시 job_id 반환, 워커 풀이 /api/process와 같은 파이프라인 실행
+    """
+    try:
+        job = jobs.submit(request.task, validate_baby_id(request.baby_id))
+    except InvalidBabyIdError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+
+    return JobSubmitResponse(
+        job_id=job.id,
+        status=job.status.value,
+        events_url=f"/api/jobs/{job.id}/events",
+    )
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태/결과 조회"""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    작업 진행 이벤트 SSE 스트림
+
+    event: queued | started | routing | code_generated | test_result | review | retry | done | failed
+    지난 이벤트부터 재생하고 done/failed 후 종료
+    """
+    if jobs.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def event_stream():
+        async for event in jobs.events(job_id, keepalive_s=SSE_KEEPALIVE_S):
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            payload = json.dumps(event, ensure_ascii=False, default=str)
+            yield f"id: {event['seq']}\nevent: {event['stage']}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/state", response_model=StateResponse)
-async def get_state():
+async def get_state(baby_id: str = DEFAULT_BABY_ID):
     """
     Baby AI 상태 조회
     """
     try:
-        substrate = get_substrate()
-        state = substrate.get_state()
+        async with pool.session(baby_id, exclusive=False) as substrate:
+            state = substrate.get_state()
 
         return StateResponse(
             emotional_state=state.get("emotional_state", {}),
@@ -171,10 +349,34 @@ async def get_state():
             experience_count=state.get("experience_count", 0),
             capabilities=state.get("capabilities", []),
         )
+    except InvalidBabyIdError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """
+    LLM 텔레메트리 조회
+
+    모델별 지연시간/TTFT/토큰 분포, 비용, 폴백, 에러 클래스 + 헤징/스케줄러 통계
+    """
+    try:
+        from .llm_client import get_llm_client
+        return get_llm_client().get_telemetry()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/pool")
+async def get_pool_stats():
+    """
+    아기 풀 / 작업 큐 / 과부하 제어 상태
+    """
+    return {**pool.get_stats(), "jobs": jobs.get_stats(), "admission": admission.get_stats()}
+
+
 # === Server Entry Point ===
 
 def run_server(host: str = "0.0.0.0", port: int = 8000):
@@ -0,0 +1,301 @@
+"""
+Causal Graph - 인메모리 인과 그래프
+
+causal_models 테이블을 정수 노드 ID + 가중치 인접 리스트로 메모리에 유지
+- 가중치: causal_strength × confidence
+- k-hop 도달 가능성, 최강 경로 (가중치 곱 최대), 상위 결과 조회
+- upsert_causal_model 경로에서 upsert()로 즉시 반영
+- 스냅샷 (JSON, 원자적 교체)으로 재시작 시 DB 전체 조회 없이 복원
+
+노드 키는 개념 ID (semantic_concepts.id), 이름 변환은 ConceptIndex 담당
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+REFRESH_INTERVAL_S = 600.0   # DB 전체 재로드 주기 (다른 프로세스의 변경 반영)
+AUTOSAVE_EVERY = 20          # 갱신 N회마다 스냅샷 저장
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class CausalEdge:
+    """원인 → 결과 간선"""
+    strength: float
+    confidence: float
+    relationship_type: str = "causes"
+
+    @property
+    def weight(self) -> float:
+        return self.strength * self.confidence
+
+
+class CausalGraph:
+    """
+    인과 그래프 (정수 노드 ID, 원인 → {결과: 간선})
+
+    모든 조회는 락 안에서 인접 리스트만 순회 (DB 조회 없음)
+    """
+
+    def __init__(self, persist_path: Optional[str] = None, refresh_interval_s: float = REFRESH_INTERVAL_S):
+        self.persist_path = persist_path
+        self.refresh_interval_s = refresh_interval_s
+        self._node_ids: dict[str, int] = {}          # 개념 ID → 노드 번호
+        self._nodes: list[str] = []                  # 노드 번호 → 개념 ID
+        self._out: list[dict[int, CausalEdge]] = []  # 노드 번호 → {결과 노드: 간선}
+        self._edge_count = 0
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._unsaved = 0
+        self._stats = {"full_loads": 0, "snapshot_loads": 0, "updates": 0, "queries": 0}
+
+        if persist_path:
+            self.load_snapshot()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    # ==================== 갱신 ====================
+
+    def _node(self, concept_id: str) -> int:
+        node = self._node_ids.get(concept_id)
+        if node is None:
+            node = len(self._nodes)
+            self._node_ids[concept_id] = node
+            self._nodes.append(concept_id)
+            self._out.append({})
+        return node
+
+    def _set_edge(self, cause_id: str, effect_id: str, edge: CausalEdge) -> None:
+        cause, effect = self._node(cause_id), self._node(effect_id)
+        if effect not in self._out[cause]:
+            self._edge_count += 1
+        self._out[cause][effect] = edge
+
+    def _apply_row(self, row: dict) -> bool:
+        cause_id = row.get("cause_concept_id")
+        effect_id = row.get("effect_concept_id")
+        if not cause_id or not effect_id or cause_id == effect_id:
+            return False
+        self._set_edge(cause_id, effect_id, CausalEdge(
+            strength=float(row.get("causal_strength") or 0.0),
+            confidence=float(row.get("confidence") or 0.0),
+            relationship_type=row.get("relationship_type") or "causes",
+        ))
+        return True
+
+    def upsert(self, row: dict) -> None:
+        """causal_models 행 한 건 반영"""
+        with self._lock:
+            if not self._apply_row(row):
+                return
+            self._stats["updates"] += 1
+            self._unsaved += 1
+        if self.persist_path and self._unsaved >= AUTOSAVE_EVERY:
+            self.save_snapshot()
+
+    def load(self, db) -> None:
+        """DB에서 전체 로드"""
+        rows = db.get_causal_edges()
+        with self._lock:
+            self._node_ids.clear()
+            self._nodes.clear()
+            self._out.clear()
+            self._edge_count = 0
+            for row in rows:
+                self._apply_row(row)
+            self._loaded_at = time.monotonic()
+            self._stats["full_loads"] += 1
+        if self.persist_path:
+            self.save_snapshot()
+
+    def ensure_fresh(self, db) -> None:
+        """처음이면 로드, 주기가 지났으면 DB에서 다시 로드"""
+        if db is None:
+            return
+        if not self.loaded or time.monotonic() - self._loaded_at >= self.refresh_interval_s:
+            self.load(db)
+
+    # ==================== 조회 ====================
+
+    def _best_paths(self, source: int, max_hops: int) -> list[dict[int, tuple[float, int]]]:
+        """
+        hop 수 제한 최대 곱 경로 (라운드별 완화)
+
+        layers[h][노드] = (점수, 이전 노드) - h hop 라운드에서 점수가 개선된 노드만
+        가중치 ≤ 1이므로 순환은 점수를 개선하지 못함
+        """
+        best = {source: 1.0}
+        layers = [{source: (1.0, -1)}]
+        for _ in range(max_hops):
+            layer = {}
+            for node, (score, _) in layers[-1].items():
+                for effect, edge in self._out[node].items():
+                    candidate = score * edge.weight
+                    if candidate > best.get(effect, 0.0) and effect != source:
+                        best[effect] = candidate
+                        layer[effect] = (candidate, node)
+            if not layer:
+                break
+            layers.append(layer)
+        return layers
+
+    def _path(self, layers: list[dict[int, tuple[float, int]]], node: int, hops: int) -> list[str]:
+        path = []
+        while hops >= 0:
+            path.append(self._nodes[node])
+            node = layers[hops][node][1]
+            hops -= 1
+        return list(reversed(path))
+
+    def _best_per_node(self, layers) -> dict[int, tuple[float, int]]:
+        """노드별 최고 점수와 그 점수가 나온 라운드"""
+        best: dict[int, tuple[float, int]] = {}
+        for hops, layer in enumerate(layers[1:], start=1):
+            for node, (score, _) in layer.items():
+                if score > best.get(node, (0.0, 0))[0]:
+                    best[node] = (score, hops)
+        return best
+
+    def reachable(self, concept_id: str, max_hops: int = 3, min_weight: float = 0.0) -> dict[str, int]:
+        """k-hop 안에 도달 가능한 개념 → 최소 hop 수 (BFS)"""
+        with self._lock:
+            self._stats["queries"] += 1
+            source = self._node_ids.get(concept_id)
+            if source is None:
+                return {}
+            hops = {source: 0}
+            frontier = [source]
+            for depth in range(1, max_hops + 1):
+                next_frontier = []
+                for node in frontier:
+                    for effect, edge in self._out[node].items():
+                        if effect not in hops and edge.weight >= min_weight:
+                            hops[effect] = depth
+                            next_frontier.append(effect)
+                frontier = next_frontier
+            return {self._nodes[node]: depth for node, depth in hops.items() if node != source}
+
+    def strongest_path(
+        self,
+        cause_id: str,
+        effect_id: str,
+        max_hops: int = 4,
+    ) -> Optional[tuple[list[str], float]]:
+        """가중치 곱이 가장 큰 경로 (개념 ID 목록, 점수), 없으면 None"""
+        with self._lock:
+            self._stats["queries"] += 1
+            source = self._node_ids.get(cause_id)
+            target = self._node_ids.get(effect_id)
+            if source is None or target is None or source == target:
+                return None
+            layers = self._best_paths(source, max_hops)
+            best = self._best_per_node(layers).get(target)
+            if best is None:
+                return None
+            score, hops = best
+            return self._path(layers, target, hops), score
+
+    def top_effects(self, concept_id: str, limit: int = 5, max_hops: int = 1) -> list[dict]:
+        """가장 강한 결과 개념 (max_hops > 1이면 간접 결과 포함, 경로 점수 순)"""
+        with self._lock:
+            self._stats["queries"] += 1
+            source = self._node_ids.get(concept_id)
+            if source is None:
+                return []
+            layers = self._best_paths(source, max_hops)
+            best = self._best_per_node(layers)
+            top = heapq.nlargest(limit, best.items(), key=lambda item: item[1][0])
+            return [
+                {
+                    "concept_id": self._nodes[node],
+                    "score": score,
+                    "path": self._path(layers, node, hops),
+                }
+                for node, (score, hops) in top
+            ]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["nodes"] = len(self._nodes)
+            stats["edges"] = self._edge_count
+        return stats
+
+    # ==================== 스냅샷 ====================
+
+    def save_snapshot(self) -> None:
+        """스냅샷 저장 (원자적 교체)"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            data = {
+                "version": SNAPSHOT_VERSION,
+                "nodes": list(self._nodes),
+                "edges": [
+                    [cause, effect, edge.strength, edge.confidence, edge.relationship_type]
+                    for cause, effects in enumerate(self._out)
+                    for effect, edge in effects.items()
+                ],
+            }
+            self._unsaved = 0
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.persist_path)
+
+    def load_snapshot(self) -> None:
+        """스냅샷 로드 (다음 ensure_fresh 주기까지 DB 로드 생략)"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[CausalGraph] Could not load snapshot: {e}")
+            return
+        if data.get("version") != SNAPSHOT_VERSION:
+            return
+        nodes = data["nodes"]
+        with self._lock:
+            self._node_ids.clear()
+            self._nodes.clear()
+            self._out.clear()
+            self._edge_count = 0
+            for cause, effect, strength, confidence, relationship_type in data["edges"]:
+                self._set_edge(nodes[cause], nodes[effect], CausalEdge(strength, confidence, relationship_type))
+            self._loaded_at = time.monotonic()
+            self._stats["snapshot_loads"] += 1
+
+    def configure_persistence(self, persist_path: str) -> None:
+        """스냅샷 경로 지정 (아직 로드 전이면 스냅샷에서 복원)"""
+        if self.persist_path == persist_path:
+            return
+        self.persist_path = persist_path
+        if not self.loaded:
+            self.load_snapshot()
+
+
+# 싱글톤 인스턴스
+_causal_graph: Optional[CausalGraph] = None
+
+
+def get_causal_graph() -> CausalGraph:
+    """CausalGraph 싱글톤"""
+    global _causal_graph
+    if _causal_graph is None:
+        _causal_graph = CausalGraph()
+    return _causal_graph
@@ -14,10 +14,17 @@ Cognitive Router - 인지적 모델 라우팅 시스템
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import re
+import time
 
 from .llm_client import get_llm_client, ModelTier, AVAILABLE_MODELS
+from .rate_limiter import RequestPriority
+from .keyword_matcher import KeywordMatcher
+from .response_cache import CacheKey, ResponseCache
+from .routing_policy import AdaptiveRoutingPolicy
+from .llm_metrics import estimate_tokens
 
 
 class DevelopmentStage(Enum):
@@ -52,6 +59,10 @@ class RoutingDecision:
     thinking_level: Optional[str]
     reasoning: str
     estimated_cost_factor: float  # 1.0 = baseline
+    context_key: Optional[str] = None  # 적응형 정책 컨텍스트 (복잡도:작업유형)
+    policy: str = "heuristic"          # heuristic | adaptive
+    served_model_key: Optional[str] = None  # 실제로 응답한 모델 (폴백 시 model_key와 다름)
+    cache_key: Optional[CacheKey] = None    # 응답을 내주거나 저장한 캐시 항목 (실패 시 무효화)
 
 
 @dataclass
@@ -65,6 +76,7 @@ class TaskContext:
     requires_code: bool = False
     requires_reasoning: bool = False
     previous_failures: int = 0
+    latency_budget_ms: Optional[float] = None  # 요청별 지연시간 예산
 
 
 class CognitiveRouter:
@@ -101,56 +113,48 @@ class CognitiveRouter:
         "프로그램", "program", "스크립트", "script",
     ]
 
-    def __init__(self):
+    # 깊은 추론이 필요함을 나타내는 키워드
+    REASONING_KEYWORDS = [
+        "왜", "why", "어떻게", "how",
+        "비교", "compare", "분석", "analyze",
+        "장단점", "pros and cons", "trade",
+        "최적", "optimal", "best",
+        "문제", "problem", "해결", "solve",
+    ]
+
+    # 헤징(보조 모델 동시 요청)을 사용할 긴급도
+    DEFAULT_HEDGE_URGENCIES = (Urgency.IMMEDIATE,)
+
+    # 모델별 비용 계수 (적응형 정책 선택 시)
+    MODEL_COST_FACTORS = {
+        "gemini-2-flash": 0.1,
+        "gpt-4o-mini": 0.5,
+        "gpt-5.2-thinking": 3.0,
+    }
+
+    def __init__(
+        self,
+        response_cache: Optional[ResponseCache] = None,
+        hedge_urgencies: tuple = DEFAULT_HEDGE_URGENCIES,
+        policy: Optional[AdaptiveRoutingPolicy] = None,
+    ):
         self.llm_client = get_llm_client()
         self._routing_history: List[RoutingDecision] = []
+        self.response_cache = response_cache  # None이면 캐시 없이 항상 LLM 호출
+        self.hedge_urgencies = set(hedge_urgencies)
+        self.policy = policy  # None이면 휴리스틱 라우팅만 사용
 
     def analyze_complexity(self, task: str) -> TaskComplexity:
         """작업 복잡도 분석"""
-        task_lower = task.lower()
-
-        # 키워드 기반 점수 계산
-        complex_score = sum(1 for kw in self.COMPLEX_KEYWORDS if kw in task_lower)
-        simple_score = sum(1 for kw in self.SIMPLE_KEYWORDS if kw in task_lower)
-
-        # 길이 기반 조정 (긴 요청 = 복잡할 가능성)
-        length_factor = len(task) / 100  # 100자당 +0.1 복잡도
-
-        # 코드 블록이나 특수 문자 포함 여부
-        has_code_block = "```" in task or "def " in task or "class " in task
-
-        # 최종 점수 계산
-        score = complex_score - simple_score + length_factor
-        if has_code_block:
-            score += 1
-
-        if score < 0:
-            return TaskComplexity.TRIVIAL
-        elif score < 1:
-            return TaskComplexity.SIMPLE
-        elif score < 2:
-            return TaskComplexity.MODERATE
-        elif score < 3:
-            return TaskComplexity.COMPLEX
-        else:
-            return TaskComplexity.CRITICAL
+        return extract_task_features(task).complexity
 
     def requires_code_generation(self, task: str) -> bool:
         """코드 생성이 필요한지 판단"""
-        task_lower = task.lower()
-        return any(kw in task_lower for kw in self.CODE_KEYWORDS)
+        return extract_task_features(task).requires_code
 
     def requires_deep_reasoning(self, task: str) -> bool:
         """깊은 추론이 필요한지 판단"""
-        task_lower = task.lower()
-        reasoning_indicators = [
-            "왜", "why", "어떻게", "how",
-            "비교", "compare", "분석", "analyze",
-            "장단점", "pros and cons", "trade",
-            "최적", "optimal", "best",
-            "문제", "problem", "해결", "solve",
-        ]
-        return any(kw in task_lower for kw in reasoning_indicators)
+        return extract_task_features(task).requires_reasoning
 
     def get_stage_routing_weights(self, stage: DevelopmentStage) -> Dict[str, float]:
         """
@@ -291,11 +295,37 @@ class CognitiveRouter:
                     reasoning += " (높은 좌절감 → Thinking 전환)"
                     cost_factor = 3.0
 
+        # 7. 적응형 정책 (관측된 지연시간/비용/성공률 기반)
+        # - 반복 실패 에스컬레이션은 유지
+        # - 예산 없는 긴급 요청은 Flash 유지
+        context_key = None
+        policy_name = "heuristic"
+        if self.policy is not None:
+            context_key = AdaptiveRoutingPolicy.context_key(complexity.name, context.task_type)
+            skip = context.previous_failures >= 2 or (
+                context.urgency == Urgency.IMMEDIATE and context.latency_budget_ms is None
+            )
+            chosen = None if skip else self.policy.select(
+                context_key, model_key, context.latency_budget_ms
+            )
+            if chosen:
+                policy_name = "adaptive"
+                if chosen != model_key:
+                    reasoning += f" → 적응형 정책: {chosen}"
+                    model_key = chosen
+                    cost_factor = self.MODEL_COST_FACTORS[chosen]
+                    if "thinking" not in chosen:
+                        thinking_level = None
+                    elif thinking_level is None:
+                        thinking_level = "medium"
+
         decision = RoutingDecision(
             model_key=model_key,
             thinking_level=thinking_level,
             reasoning=reasoning,
             estimated_cost_factor=cost_factor,
+            context_key=context_key,
+            policy=policy_name,
         )
 
         # 히스토리 저장
@@ -310,6 +340,8 @@ class CognitiveRouter:
         context: TaskContext = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        use_cache: bool = True,
+        decision: Optional[RoutingDecision] = None,
     ) -> str:
         """
         인지적 라우팅을 적용하여 응답 생성
@@ -320,6 +352,9 @@ class CognitiveRouter:
             context: 작업 컨텍스트 (없으면 자동 생성)
             temperature: 창의성
             max_tokens: 최대 토큰
+            use_cache: 응답 캐시 사용 여부 (EXPLORE/CREATIVE 전략은 False)
+            decision: 호출자가 이미 내린 라우팅 결정 (있으면 다시 라우팅하지 않음 →
+                      record_outcome이 실제 호출한 모델에 반영됨)
 
         Returns:
             생성된 응답
@@ -327,16 +362,31 @@ class CognitiveRouter:
         # 컨텍스트가 없으면 기본값으로 생성
         if context is None:
             context = TaskContext(task=task)
-        else:
-            context.task = task
 
-        # 라우팅 결정
-        decision = self.route(context)
+        # 라우팅 결정 (한 요청에 한 번만)
+        if decision is None:
+            context.task = task
+            decision = self.route(context)
+        decision.served_model_key = decision.model_key
+        decision.cache_key = None
 
         print(f"[CognitiveRouter] {decision.reasoning}")
         print(f"[CognitiveRouter] Model: {decision.model_key}, Thinking: {decision.thinking_level}")
 
+        # 응답 캐시 조회
+        cache = self.response_cache
+        if cache is not None:
+            if use_cache:
+                entry = cache.lookup(task, decision.model_key, system_prompt, temperature)
+                if entry is not None:
+                    print("[CognitiveRouter] Cache hit")
+                    decision.cache_key = entry.key
+                    return entry.response
+            else:
+                cache.record_bypass()
+
         # LLM 호출
+        start = time.perf_counter()
         try:
             response = self.llm_client.generate(
                 prompt=task,
@@ -345,7 +395,12 @@ class CognitiveRouter:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 thinking_level=decision.thinking_level,
+                hedge=context.urgency in self.hedge_urgencies,
+                priority=RequestPriority.INTERACTIVE,
             )
+            self._record_call(decision, decision.model_key, start, system_prompt, task, response)
+            if cache is not None and use_cache:
+                decision.cache_key = cache.put(task, response, decision.model_key, system_prompt, temperature)
             return response
 
         except Exception as e:
@@ -354,15 +409,56 @@ class CognitiveRouter:
             # 폴백: Flash로 재시도
             if decision.model_key != "gemini-2-flash":
                 print("[CognitiveRouter] Falling back to gemini-2-flash...")
-                return self.llm_client.generate(
+                start = time.perf_counter()
+                response = self.llm_client.generate(
                     prompt=task,
                     model_key="gemini-2-flash",
                     system_prompt=system_prompt,
                     temperature=temperature,
                     max_tokens=max_tokens,
+                    priority=RequestPriority.INTERACTIVE,
                 )
+                decision.served_model_key = "gemini-2-flash"
+                self._record_call(decision, "gemini-2-flash", start, system_prompt, task, response)
+                return response
             raise
 
+    def _record_call(
+        self,
+        decision: RoutingDecision,
+        model_key: str,
+        start: float,
+        system_prompt: Optional[str],
+        task: str,
+        response: str,
+    ) -> None:
+        """적응형 정책에 호출 지연시간/토큰 기록"""
+        if self.policy is None or decision.context_key is None:
+            return
+        self.policy.record_call(
+            decision.context_key,
+            model_key,
+            latency_ms=(time.perf_counter() - start) * 1000,
+            prompt_tokens=estimate_tokens((system_prompt or "") + task),
+            completion_tokens=estimate_tokens(response),
+        )
+
+    def record_outcome(self, decision: RoutingDecision, success: bool) -> None:
+        """평가 결과를 적응형 정책에 반영 (실제로 응답한 모델 기준)"""
+        if self.policy is not None and decision.context_key is not None:
+            model_key = decision.served_model_key or decision.model_key
+            self.policy.record_outcome(decision.context_key, model_key, success)
+
+    def invalidate_cached_response(self, decision: RoutingDecision) -> bool:
+        """
+        평가에 실패한 응답을 캐시에서 제거
+
+        generate()가 기록한 항목(의미 적중이면 원본 항목)을 제거 → 재시도에서 다시 나오지 않음
+        """
+        if self.response_cache is None or decision.cache_key is None:
+            return False
+        return self.response_cache.invalidate_key(decision.cache_key)
+
     def get_routing_stats(self) -> Dict[str, Any]:
         """라우팅 통계"""
         if not self._routing_history:
@@ -375,11 +471,71 @@ class CognitiveRouter:
             model_counts[decision.model_key] = model_counts.get(decision.model_key, 0) + 1
             total_cost_factor += decision.estimated_cost_factor
 
-        return {
+        stats = {
             "total_routes": len(self._routing_history),
             "model_distribution": model_counts,
             "average_cost_factor": total_cost_factor / len(self._routing_history),
         }
+        if self.response_cache is not None:
+            stats["response_cache"] = self.response_cache.get_stats()
+        if self.policy is not None:
+            stats["adaptive_policy"] = self.policy.get_stats()
+        return stats
+
+
+@dataclass(frozen=True)
+class TaskFeatures:
+    """작업 텍스트 분류 결과 (요청당 한 번 계산)"""
+    complex_score: int
+    simple_score: int
+    requires_code: bool
+    requires_reasoning: bool
+    complexity: TaskComplexity
+
+
+# 키워드 집합은 한 번만 컴파일
+_TASK_MATCHER = KeywordMatcher({
+    "complex": CognitiveRouter.COMPLEX_KEYWORDS,
+    "simple": CognitiveRouter.SIMPLE_KEYWORDS,
+    "code": CognitiveRouter.CODE_KEYWORDS,
+    "reasoning": CognitiveRouter.REASONING_KEYWORDS,
+})
+
+
+@lru_cache(maxsize=1024)
+def extract_task_features(task: str) -> TaskFeatures:
+    """한 번의 스캔으로 복잡도/코드/추론 여부 분류 (같은 요청은 캐시)"""
+    counts = _TASK_MATCHER.counts(task)
+
+    # 길이 기반 조정 (긴 요청 = 복잡할 가능성)
+    length_factor = len(task) / 100  # 100자당 +0.1 복잡도
+
+    # 코드 블록이나 특수 문자 포함 여부
+    has_code_block = "```" in task or "def " in task or "class " in task
+
+    # 최종 점수 계산
+    score = counts["complex"] - counts["simple"] + length_factor
+    if has_code_block:
+        score += 1
+
+    if score < 0:
+        complexity = TaskComplexity.TRIVIAL
+    elif score < 1:
+        complexity = TaskComplexity.SIMPLE
+    elif score < 2:
+        complexity = TaskComplexity.MODERATE
+    elif score < 3:
+        complexity = TaskComplexity.COMPLEX
+    else:
+        complexity = TaskComplexity.CRITICAL
+
+    return TaskFeatures(
+        complex_score=counts["complex"],
+        simple_score=counts["simple"],
+        requires_code=counts["code"] > 0,
+        requires_reasoning=counts["reasoning"] > 0,
+        complexity=complexity,
+    )
 
 
 # 싱글톤 인스턴스
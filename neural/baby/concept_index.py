@@ -0,0 +1,139 @@
+"""
+Concept Index - 인메모리 개념 이름 인덱스
+
+semantic_concepts의 이름/ID를 한 번 로드해 두고
+- 시나리오 텍스트에서 모든 개념 이름을 Aho-Corasick 한 번의 스캔으로 찾기
+- 이름 → ID 조회 (DB 왕복 없이)
+
+갱신:
+- insert_concept 경로에서 add()로 즉시 반영
+- 다른 프로세스가 추가한 개념은 주기적으로 created_at 이후분만 가져와 반영
+"""
+
+import threading
+import time
+from typing import Optional
+
+from .keyword_matcher import KeywordMatcher
+
+
+REFRESH_INTERVAL_S = 300.0   # 증분 갱신 주기
+MIN_CONCEPT_NAME_LENGTH = 2  # 이보다 짧은 이름은 매칭하지 않음 (오탐 방지)
+
+
+class ConceptIndex:
+    """
+    개념 이름 → ID 인덱스 + 다중 패턴 매처
+
+    매처는 개념이 추가되면 다음 match() 때 한 번 다시 컴파일
+    """
+
+    def __init__(self, refresh_interval_s: float = REFRESH_INTERVAL_S):
+        self.refresh_interval_s = refresh_interval_s
+        self._ids: dict[str, str] = {}          # 소문자 이름 → ID
+        self._names: dict[str, str] = {}        # 소문자 이름 → 원래 이름
+        self._by_id: dict[str, str] = {}        # ID → 원래 이름
+        self._matcher: Optional[KeywordMatcher] = None
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._last_created_at: Optional[str] = None
+        self._stats = {"full_loads": 0, "incremental_refreshes": 0, "matches": 0}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def add(self, concept: dict) -> None:
+        """개념 한 건 반영 (id, name, created_at)"""
+        name = concept.get("name")
+        concept_id = concept.get("id")
+        if not name or not concept_id:
+            return
+        key = name.lower()
+        with self._lock:
+            if self._ids.get(key) != concept_id:
+                self._by_id.pop(self._ids.get(key), None)
+                self._ids[key] = concept_id
+                self._names[key] = name
+                self._matcher = None
+            self._by_id[concept_id] = name
+            created_at = concept.get("created_at")
+            if created_at and (self._last_created_at is None or created_at > self._last_created_at):
+                self._last_created_at = created_at
+
+    def load(self, db) -> None:
+        """전체 로드 (id, name만)"""
+        concepts = db.get_concept_names()
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+            self._by_id.clear()
+            self._matcher = None
+            self._last_created_at = None
+        for concept in concepts:
+            self.add(concept)
+        self._loaded_at = time.monotonic()
+        self._stats["full_loads"] += 1
+
+    def refresh(self, db) -> None:
+        """마지막으로 본 created_at 이후 추가된 개념만 반영"""
+        if self._last_created_at is None:
+            self.load(db)
+            return
+        for concept in db.get_concept_names(created_after=self._last_created_at):
+            self.add(concept)
+        self._loaded_at = time.monotonic()
+        self._stats["incremental_refreshes"] += 1
+
+    def ensure_fresh(self, db) -> None:
+        """처음이면 전체 로드, 주기가 지났으면 증분 갱신"""
+        if db is None:
+            return
+        if not self.loaded:
+            self.load(db)
+        elif time.monotonic() - self._loaded_at >= self.refresh_interval_s:
+            self.refresh(db)
+
+    def get_id(self, name: str) -> Optional[str]:
+        """이름으로 개념 ID 조회 (대소문자 무시)"""
+        return self._ids.get(name.lower())
+
+    def get_name(self, concept_id: str) -> Optional[str]:
+        """개념 ID로 이름 조회"""
+        return self._by_id.get(concept_id)
+
+    def match(self, text: str) -> list[str]:
+        """텍스트에 등장하는 모든 개념 이름 (등장 위치 순)"""
+        with self._lock:
+            if self._matcher is None:
+                self._matcher = KeywordMatcher({
+                    "concept": [key for key in self._ids if len(key) >= MIN_CONCEPT_NAME_LENGTH],
+                })
+            matcher = self._matcher
+            names = dict(self._names)
+        self._stats["matches"] += 1
+
+        found = matcher.find_all(text).get("concept", set())
+        lowered = text.lower()
+        return [names[key] for key in sorted(found, key=lambda key: (lowered.find(key), key))]
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        stats["concepts"] = len(self._ids)
+        stats["last_created_at"] = self._last_created_at
+        return stats
+
+
+# 싱글톤 인스턴스
+_concept_index: Optional[ConceptIndex] = None
+
+
+def get_concept_index() -> ConceptIndex:
+    """ConceptIndex 싱글톤"""
+    global _concept_index
+    if _concept_index is None:
+        _concept_index = ConceptIndex()
+    return _concept_index
@@ -0,0 +1,221 @@
+"""
+Context Builder - 모델 티어별 토큰 예산 내 코더 입력 구성
+
+_execute_pipeline의 코더 입력 = 전략 지시 + 기억 예시 + 요청 + 이전 피드백
+- 변하지 않는 부분(전략 지시 + 예시)을 앞에 → 같은 요청의 재시도끼리 공통 접두부
+  (OpenAI/Gemini 자동 접두부 캐시는 1024 토큰 이상에서만 동작 → FLASH 예산에서는 대개 미적용)
+- 토큰 수는 로컬에서 추정 (4자 ≈ 1토큰)
+- 기억 예시: 요청과 유사도가 높은 순, 겹치는 예시 제거, 예산이 남는 만큼만
+- 피드백: 핵심 줄 (에러/실패/점수) 우선 요약 후 상한까지 자르기
+
+기억이 늘어나도 프롬프트 크기 (= 입력 토큰 비례 지연시간)가 티어 예산을 넘지 않음
+"""
+
+import re
+import threading
+from typing import Iterable, Optional
+
+from .llm_client import ModelTier
+from .llm_metrics import estimate_tokens
+
+
+# 코더 입력 토큰 예산 (시스템 프롬프트 제외)
+CONTEXT_TOKEN_BUDGETS = {
+    ModelTier.FLASH: 1500,
+    ModelTier.STANDARD: 3000,
+    ModelTier.THINKING: 6000,
+}
+FEEDBACK_MAX_TOKENS = 400        # 피드백 상한 (남은 예산과 중 작은 값)
+EXAMPLE_REQUEST_CHARS = 50       # 예시 요청 자르기 (기존 형식 유지)
+EXAMPLE_ACTION_CHARS = 100       # 예시 해법 자르기
+DUPLICATE_SIMILARITY = 0.8       # 이 이상 겹치는 예시는 중복으로 제거
+
+FEEDBACK_KEY_LINE = re.compile(
+    r"error|fail|exception|assert|traceback|line \d+|score|\d+/10|실패|오류|에러",
+    re.IGNORECASE,
+)
+
+
+def _shingles(text: str) -> set[str]:
+    """문자 3-gram 집합 (한국어처럼 띄어쓰기가 불규칙한 텍스트에도 동작)"""
+    normalized = " ".join((text or "").lower().split())
+    if len(normalized) < 3:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """문자 3-gram Jaccard 유사도 (0-1)"""
+    sa, sb = _shingles(a), _shingles(b)
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+def clip_to_tokens(text: str, max_tokens: int) -> str:
+    """토큰 상한까지 자르기"""
+    max_chars = max(0, max_tokens) * 4
+    if len(text) <= max_chars:
+        return text
+    return text[:max(0, max_chars - 3)].rstrip() + "..."
+
+
+def compress_feedback(feedback: str, max_tokens: int) -> str:
+    """
+    피드백 요약
+
+    첫 줄 (평가 요약) + 에러/실패/점수가 담긴 줄을 우선 남기고 중복 줄 제거.
+    예산이 남으면 나머지 줄을 원래 순서대로 채움.
+    """
+    if estimate_tokens(feedback) <= max_tokens:
+        return feedback
+
+    lines = []
+    seen = set()
+    for line in feedback.splitlines():
+        stripped = line.strip()
+        if stripped and stripped not in seen:
+            seen.add(stripped)
+            lines.append(stripped)
+    if not lines:
+        return ""
+
+    key_lines = [lines[0]] + [line for line in lines[1:] if FEEDBACK_KEY_LINE.search(line)]
+    other_lines = [line for line in lines[1:] if line not in key_lines]
+
+    # 줄바꿈 포함 문자 수로 예산 계산 (estimate_tokens와 같은 4자 기준)
+    kept: list[str] = []
+    used_chars = -1
+    for line in key_lines + other_lines:
+        if used_chars + len(line) + 1 > max_tokens * 4:
+            continue
+        kept.append(line)
+        used_chars += len(line) + 1
+
+    if not kept:
+        return clip_to_tokens(lines[0], max_tokens)
+    # 원래 순서 유지
+    order = {line: i for i, line in enumerate(lines)}
+    return "\n".join(sorted(kept, key=order.__getitem__))
+
+
+def rank_examples(request: str, candidates: Iterable[dict]) -> list[dict]:
+    """
+    기억 예시 정렬 + 중복 제거
+
+    요청과의 유사도 내림차순. 요청/해법이 이미 고른 예시와 겹치면 제외.
+    """
+    scored = []
+    for index, example in enumerate(candidates):
+        score = similarity(request, example.get("request", ""))
+        scored.append((-score, index, example))
+    scored.sort(key=lambda item: (item[0], item[1]))
+
+    selected: list[dict] = []
+    for _, _, example in scored:
+        duplicate = any(
+            similarity(example.get("request", ""), chosen.get("request", "")) >= DUPLICATE_SIMILARITY
+            or similarity(example.get("action", ""), chosen.get("action", "")) >= DUPLICATE_SIMILARITY
+            for chosen in selected
+        )
+        if not duplicate:
+            selected.append(example)
+    return selected
+
+
+def format_example(example: dict, action_only: bool = False) -> str:
+    """예시 한 개 (기존 프롬프트 형식)"""
+    action = example.get("action", "")[:EXAMPLE_ACTION_CHARS]
+    if action_only:
+        return f"- {action}...\n"
+    request = example.get("request", "")[:EXAMPLE_REQUEST_CHARS]
+    return f"- Request: {request}...\n  Solution: {action}...\n"
+
+
+class ContextBuilder:
+    """
+    티어별 토큰 예산 내 코더 입력 구성
+
+    우선순위: 요청 > 전략 지시 > 피드백 > 기억 예시
+    """
+
+    def __init__(self, budgets: Optional[dict[ModelTier, int]] = None):
+        self.budgets = {**CONTEXT_TOKEN_BUDGETS, **(budgets or {})}
+        self._lock = threading.Lock()
+        self._stats = {
+            "builds": 0,
+            "max_tokens": 0,
+            "total_tokens": 0,
+            "examples_used": 0,
+            "examples_dropped": 0,
+            "feedback_compressed": 0,
+        }
+
+    def build(
+        self,
+        request: str,
+        tier: ModelTier,
+        header: str = "",
+        examples: Iterable[dict] = (),
+        max_examples: int = 3,
+        action_only: bool = False,
+        feedback: str = "",
+    ) -> str:
+        """
+        코더 입력 생성
+
+        Args:
+            request: 사용자 요청 (항상 전체 포함)
+            tier: 라우팅된 모델 티어 → 토큰 예산
+            header: 전략 지시 (예: "[Previous successful examples]")
+            examples: 기억 예시 후보 (request/action 키)
+            max_examples: 예시 최대 개수
+            action_only: 예시를 해법만으로 표시
+            feedback: 이전 시도 피드백
+        """
+        budget = self.budgets.get(tier, CONTEXT_TOKEN_BUDGETS[ModelTier.FLASH])
+        remaining = budget - estimate_tokens(request) - estimate_tokens(header) - estimate_tokens("\n[Request]\n")
+
+        feedback_block = ""
+        compressed = False
+        if feedback:
+            limit = min(FEEDBACK_MAX_TOKENS, max(remaining, 0))
+            summary = compress_feedback(feedback, limit)
+            compressed = summary != feedback
+            if summary:
+                feedback_block = f"\n\n[Feedback from previous attempt]\n{summary}"
+                remaining -= estimate_tokens(feedback_block)
+
+        ranked = rank_examples(request, examples)
+        example_lines = []
+        for example in ranked[:max_examples]:
+            line = format_example(example, action_only)
+            cost = estimate_tokens(line)
+            if cost > remaining:
+                break
+            example_lines.append(line)
+            remaining -= cost
+
+        # 고정 접두부 (전략 지시 + 예시) → 요청 → 시도마다 바뀌는 피드백
+        prefix = (header + "".join(example_lines)).lstrip("\n")
+        if prefix:
+            prefix += "\n[Request]\n"
+        text = prefix + request + feedback_block
+        tokens = estimate_tokens(text)
+
+        with self._lock:
+            self._stats["builds"] += 1
+            self._stats["max_tokens"] = max(self._stats["max_tokens"], tokens)
+            self._stats["total_tokens"] += tokens
+            self._stats["examples_used"] += len(example_lines)
+            self._stats["examples_dropped"] += len(ranked) - len(example_lines)
+            self._stats["feedback_compressed"] += int(compressed)
+        return text
+
+    def get_stats(self) -> dict:
+        """프롬프트 크기 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_tokens"] = stats["total_tokens"] / stats["builds"] if stats["builds"] else 0.0
+        stats["budgets"] = {tier.value: budget for tier, budget in self.budgets.items()}
+        return stats
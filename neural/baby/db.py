@@ -9,6 +9,7 @@ Robot_Brain 프로젝트 DB 연동
 - emotion_logs 테이블: 감정 히스토리
 """
 
+import asyncio
 import os
 from typing import Optional, Any
 from dataclasses import dataclass
@@ -19,6 +20,30 @@ load_dotenv()
 
 # Lazy import for supabase
 _supabase_client = None
+_async_supabase_client = None
+
+# 비동기 연결 풀 설정 (HTTP/2 + keep-alive)
+ASYNC_MAX_CONNECTIONS = 20        # 풀 전체 최대 연결 수
+ASYNC_MAX_KEEPALIVE = 10          # 유지할 idle 연결 수
+ASYNC_KEEPALIVE_EXPIRY = 30.0     # idle 연결 유지 시간 (초)
+ASYNC_TIMEOUT = 30.0              # 요청 타임아웃 (초)
+ASYNC_MAX_CONCURRENCY = 16        # AsyncBrainDatabase 동시 쿼리 상한
+SELECT_PAGE_SIZE = 1000           # 전체 조회 페이지 크기 (PostgREST 기본 max-rows)
+
+
+def _index_concepts(concepts: list[dict]) -> None:
+    """새로 저장된 개념을 ConceptIndex에 즉시 반영"""
+    from .concept_index import get_concept_index
+    index = get_concept_index()
+    for concept in concepts:
+        index.add(concept)
+
+
+def _index_causal_model(model: dict) -> None:
+    """저장된 인과 모델을 CausalGraph에 즉시 반영"""
+    if model:
+        from .causal_graph import get_causal_graph
+        get_causal_graph().upsert(model)
 
 
 @dataclass
@@ -52,6 +77,50 @@ def get_supabase_client():
     return _supabase_client
 
 
+def get_async_supabase_client():
+    """
+    비동기 Supabase 클라이언트 싱글톤
+
+    HTTP/2 + keep-alive 연결 풀을 공유하는 httpx.AsyncClient 위에서 동작
+    (PostgREST, Storage, Functions 모두 같은 풀 사용)
+    """
+    global _async_supabase_client
+
+    if _async_supabase_client is None:
+        import httpx
+        from supabase import AsyncClient, AsyncClientOptions
+
+        config = SupabaseConfig.from_env()
+        http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=ASYNC_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=ASYNC_MAX_KEEPALIVE,
+                keepalive_expiry=ASYNC_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _async_supabase_client = AsyncClient(
+            config.url,
+            config.anon_key,
+            AsyncClientOptions(httpx_client=http_client),
+        )
+
+    return _async_supabase_client
+
+
+async def close_async_supabase_client() -> None:
+    """비동기 클라이언트 연결 풀 종료 (서버 shutdown 시 호출)"""
+    global _async_supabase_client
+
+    if _async_supabase_client is not None:
+        http_client = _async_supabase_client.options.httpx_client
+        _async_supabase_client = None
+        if http_client is not None:
+            await http_client.aclose()
+
+
 class BrainDatabase:
     """
     Baby Brain Database Operations
@@ -172,6 +241,18 @@ class BrainDatabase:
         """기억 강화 (RPC 함수 호출)"""
         self.client.rpc("reinforce_memory", {"exp_id": experience_id}).execute()
 
+    def _select_all(self, build_query) -> list[dict]:
+        """페이지 단위로 끝까지 조회 (build_query: 매 페이지 새 쿼리 생성)"""
+        rows = []
+        start = 0
+        while True:
+            response = build_query().range(start, start + SELECT_PAGE_SIZE - 1).execute()
+            page = response.data or []
+            rows.extend(page)
+            if len(page) < SELECT_PAGE_SIZE:
+                return rows
+            start += SELECT_PAGE_SIZE
+
     # ==================== semantic_concepts ====================
 
     def insert_concept(
@@ -196,7 +277,9 @@ class BrainDatabase:
             data["embedding"] = embedding
 
         response = self.client.table("semantic_concepts").insert(data).execute()
-        return response.data[0] if response.data else {}
+        concept = response.data[0] if response.data else {}
+        _index_concepts([concept])
+        return concept
 
     def get_concept_by_name(self, name: str) -> Optional[dict]:
         """이름으로 개념 조회"""
@@ -477,6 +560,21 @@ class BrainDatabase:
         )
         return response.data[0] if response.data else {}
 
+    def update_predictions_bulk(self, rows: list[dict]) -> list[dict]:
+        """
+        예측 여러 건 일괄 업데이트 (id 기준 upsert, 한 번의 요청)
+
+        rows는 조회한 전체 행에 변경 필드를 합친 것 (upsert의 INSERT 경로가 NOT NULL을 만족하도록)
+        """
+        if not rows:
+            return []
+        response = (
+            self.client.table("predictions")
+            .upsert(rows, on_conflict="id")
+            .execute()
+        )
+        return response.data or []
+
     def get_recent_predictions(self, limit: int = 10) -> list[dict]:
         """최근 예측 조회"""
         response = (
@@ -632,7 +730,9 @@ class BrainDatabase:
 
             response = self.client.table("causal_models").insert(data).execute()
 
-        return response.data[0] if response.data else {}
+        model = response.data[0] if response.data else {}
+        _index_causal_model(model)
+        return model
 
     def get_causal_models(self, min_confidence: float = 0.3, limit: int = 50) -> list[dict]:
         """인과 모델 조회"""
@@ -646,6 +746,14 @@ class BrainDatabase:
         )
         return response.data or []
 
+    def get_causal_edges(self) -> list[dict]:
+        """인과 그래프용 전체 간선 조회 (필요한 열만, 페이지 단위)"""
+        return self._select_all(lambda: (
+            self.client.table("causal_models")
+            .select("id, cause_concept_id, effect_concept_id, relationship_type, causal_strength, confidence")
+            .order("id")
+        ))
+
     # ==================== World Model: Imagination Sessions ====================
 
     def start_imagination_session(
@@ -775,6 +883,20 @@ class BrainDatabase:
         )
         return response.data or []
 
+    def get_concept_names(self, created_after: str = None) -> list[dict]:
+        """개념 id/name/created_at만 조회 (created_after 이후 추가분만 가능, 페이지 단위)"""
+        def build():
+            query = (
+                self.client.table("semantic_concepts")
+                .select("id, name, created_at")
+                .order("created_at")
+            )
+            if created_after:
+                query = query.gt("created_at", created_after)
+            return query
+
+        return self._select_all(build)
+
     def get_experience_concept_links(self, limit: int = 100) -> list[dict]:
         """경험-개념 연결 조회 (시냅스 시각화용)"""
         response = (
@@ -787,13 +909,786 @@ class BrainDatabase:
         return response.data or []
 
 
-# Singleton instance
-_db_instance: Optional[BrainDatabase] = None
+class AsyncBrainDatabase:
+    """
+    Baby Brain Database Operations (async)
 
+    BrainDatabase와 동일한 메서드를 코루틴으로 제공
+    - HTTP/2 연결 풀 공유 (get_async_supabase_client)
+    - 세마포어로 동시 쿼리 수 제한
+    - table()/rpc()로 Phase 10 엔진(evolution, team_optimizer, persistence)의
+      `await db.table(...).execute()` 호출을 그대로 지원
+    """
 
-def get_brain_db() -> BrainDatabase:
-    """BrainDatabase 싱글톤"""
-    global _db_instance
-    if _db_instance is None:
-        _db_instance = BrainDatabase()
-    return _db_instance
+    def __init__(self, max_concurrency: int = ASYNC_MAX_CONCURRENCY):
+        self._client = None
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_async_supabase_client()
+        return self._client
+
+    def table(self, table_name: str):
+        """PostgREST 테이블 빌더 (execute()는 await 필요)"""
+        return self.client.table(table_name)
+
+    def rpc(self, fn: str, params: Optional[dict] = None):
+        """RPC 빌더 (execute()는 await 필요)"""
+        return self.client.rpc(fn, params or {})
+
+    async def _execute(self, query):
+        """동시성 제한 하에 쿼리 실행"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await query.execute()
+
+    async def gather(self, *queries) -> list:
+        """여러 쿼리를 동시에 실행 (결과 순서 유지)"""
+        return list(await asyncio.gather(*(self._execute(q) for q in queries)))
+
+    # ==================== baby_state (싱글톤) ====================
+
+    async def get_baby_state(self) -> Optional[dict]:
+        """현재 baby_state 조회 (싱글톤)"""
+        response = await self._execute(self.client.table("baby_state").select("*").limit(1))
+        return response.data[0] if response.data else None
+
+    async def update_baby_state(self, **kwargs) -> dict:
+        """baby_state 업데이트"""
+        state = await self.get_baby_state()
+        if not state:
+            response = await self._execute(self.client.table("baby_state").insert(kwargs))
+        else:
+            response = await self._execute(
+                self.client.table("baby_state").update(kwargs).eq("id", state["id"])
+            )
+        return response.data[0] if response.data else {}
+
+    # ==================== experiences ====================
+
+    async def insert_experience(
+        self,
+        task: str,
+        task_type: str,
+        output: str,
+        success: bool,
+        emotional_salience: float = 0.5,
+        dominant_emotion: str = None,
+        embedding: list[float] = None,
+        emotion_snapshot: dict = None,
+        development_stage: int = 0,
+        tags: list[str] = None,
+        extras: dict = None,
+    ) -> dict:
+        """경험 저장"""
+        data = {
+            "task": task,
+            "task_type": task_type,
+            "output": output,
+            "success": success,
+            "emotional_salience": emotional_salience,
+            "development_stage": development_stage,
+        }
+
+        if dominant_emotion:
+            data["dominant_emotion"] = dominant_emotion
+        if embedding:
+            data["embedding"] = embedding
+        if emotion_snapshot:
+            data["emotion_snapshot"] = emotion_snapshot
+        if tags:
+            data["tags"] = tags
+        if extras:
+            data["extras"] = extras
+
+        response = await self._execute(self.client.table("experiences").insert(data))
+        return response.data[0] if response.data else {}
+
+    async def insert_experiences_bulk(self, rows: list[dict]) -> list[dict]:
+        """경험 여러 건을 한 번의 요청으로 저장"""
+        if not rows:
+            return []
+        response = await self._execute(self.client.table("experiences").insert(rows))
+        return response.data or []
+
+    async def search_similar_experiences(
+        self,
+        embedding: list[float],
+        threshold: float = 0.7,
+        limit: int = 5,
+    ) -> list[dict]:
+        """벡터 유사도로 경험 검색 (RPC 함수 호출)"""
+        response = await self._execute(self.client.rpc(
+            "search_similar_experiences",
+            {
+                "query_embedding": embedding,
+                "match_threshold": threshold,
+                "match_count": limit,
+            }
+        ))
+        return response.data or []
+
+    async def get_recent_experiences(self, limit: int = 10) -> list[dict]:
+        """최근 경험 조회"""
+        response = await self._execute(
+            self.client.table("experiences")
+            .select("*")
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    async def get_successful_experiences(
+        self,
+        task_type: str = None,
+        limit: int = 5,
+    ) -> list[dict]:
+        """성공한 경험 조회"""
+        query = self.client.table("experiences").select("*").eq("success", True)
+
+        if task_type:
+            query = query.eq("task_type", task_type)
+
+        response = await self._execute(query.order("emotional_salience", desc=True).limit(limit))
+        return response.data or []
+
+    async def reinforce_memory(self, experience_id: str) -> None:
+        """기억 강화 (RPC 함수 호출)"""
+        await self._execute(self.client.rpc("reinforce_memory", {"exp_id": experience_id}))
+
+    # ==================== semantic_concepts ====================
+
+    async def insert_concept(
+        self,
+        name: str,
+        category: str = None,
+        description: str = None,
+        embedding: list[float] = None,
+        acquired_at_stage: int = 0,
+    ) -> dict:
+        """개념 저장"""
+        data = {
+            "name": name,
+            "acquired_at_stage": acquired_at_stage,
+        }
+
+        if category:
+            data["category"] = category
+        if description:
+            data["description"] = description
+        if embedding:
+            data["embedding"] = embedding
+
+        response = await self._execute(self.client.table("semantic_concepts").insert(data))
+        concept = response.data[0] if response.data else {}
+        _index_concepts([concept])
+        return concept
+
+    async def insert_concepts_bulk(
+        self,
+        rows: list[dict],
+        ignore_duplicates: bool = True,
+    ) -> list[dict]:
+        """개념 여러 건 저장 (name 중복은 건너뜀)"""
+        if not rows:
+            return []
+        response = await self._execute(
+            self.client.table("semantic_concepts").upsert(
+                rows,
+                on_conflict="name",
+                ignore_duplicates=ignore_duplicates,
+            )
+        )
+        _index_concepts(response.data or [])
+        return response.data or []
+
+    async def get_concept_by_name(self, name: str) -> Optional[dict]:
+        """이름으로 개념 조회"""
+        response = await self._execute(
+            self.client.table("semantic_concepts")
+            .select("*")
+            .eq("name", name)
+            .limit(1)
+        )
+        return response.data[0] if response.data else None
+
+    async def update_concept_strength(self, concept_id: str, delta: float = 0.1) -> None:
+        """개념 강도 업데이트"""
+        concept = await self._execute(
+            self.client.table("semantic_concepts").select("strength, usage_count").eq("id", concept_id).single()
+        )
+        if concept.data:
+            new_strength = min(1.0, concept.data["strength"] + delta)
+            await self._execute(self.client.table("semantic_concepts").update({
+                "strength": new_strength,
+                "usage_count": concept.data["usage_count"] + 1,
+            }).eq("id", concept_id))
+
+    async def link_experience_concept(
+        self,
+        experience_id: str,
+        concept_id: str,
+        confidence: float = 0.5,
+    ) -> None:
+        """경험-개념 연결 (Hebb's Law)"""
+        await self._execute(self.client.rpc(
+            "strengthen_experience_concept_link",
+            {
+                "p_experience_id": experience_id,
+                "p_concept_id": concept_id,
+                "p_boost": confidence * 0.2,
+            }
+        ))
+
+    async def get_associated_concepts(
+        self,
+        experience_id: str,
+        min_confidence: float = 0.3,
+        limit: int = 10,
+    ) -> list[dict]:
+        """경험에 연관된 개념 조회"""
+        response = await self._execute(self.client.rpc(
+            "find_associated_concepts",
+            {
+                "p_experience_id": experience_id,
+                "p_min_confidence": min_confidence,
+                "p_limit": limit,
+            }
+        ))
+        return response.data or []
+
+    # ==================== procedural_patterns ====================
+
+    async def upsert_pattern(
+        self,
+        task_type: str,
+        approach: str,
+        success: bool,
+    ) -> dict:
+        """절차 패턴 저장/업데이트"""
+        existing = await self._execute(
+            self.client.table("procedural_patterns")
+            .select("*")
+            .eq("task_type", task_type)
+            .eq("approach", approach)
+            .limit(1)
+        )
+
+        if existing.data:
+            pattern = existing.data[0]
+            update_data = {
+                "total_uses": pattern["total_uses"] + 1,
+                "last_used": "now()",
+            }
+            if success:
+                update_data["success_count"] = pattern["success_count"] + 1
+            else:
+                update_data["failure_count"] = pattern["failure_count"] + 1
+
+            response = await self._execute(
+                self.client.table("procedural_patterns")
+                .update(update_data)
+                .eq("id", pattern["id"])
+            )
+        else:
+            data = {
+                "task_type": task_type,
+                "approach": approach,
+                "success_count": 1 if success else 0,
+                "failure_count": 0 if success else 1,
+                "total_uses": 1,
+            }
+            response = await self._execute(self.client.table("procedural_patterns").insert(data))
+
+        return response.data[0] if response.data else {}
+
+    async def get_best_patterns(
+        self,
+        task_type: str,
+        min_uses: int = 3,
+        limit: int = 5,
+    ) -> list[dict]:
+        """최고 성공률 패턴 조회"""
+        response = await self._execute(
+            self.client.table("procedural_patterns")
+            .select("*")
+            .eq("task_type", task_type)
+            .gte("total_uses", min_uses)
+            .order("success_rate", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    async def record_learning_event(
+        self,
+        pattern_id: str,
+        experience_id: str,
+        outcome: str,
+        reward_signal: float = 0.0,
+        prediction_error: float = 0.0,
+    ) -> None:
+        """학습 이벤트 기록"""
+        await self._execute(self.client.table("pattern_learning_events").insert({
+            "pattern_id": pattern_id,
+            "experience_id": experience_id,
+            "outcome": outcome,
+            "reward_signal": reward_signal,
+            "prediction_error": prediction_error,
+        }))
+
+    # ==================== emotion_logs ====================
+
+    async def log_emotion(
+        self,
+        curiosity: float,
+        joy: float,
+        fear: float,
+        surprise: float,
+        frustration: float,
+        boredom: float,
+        dominant_emotion: str,
+        trigger_task: str = None,
+        trigger_type: str = None,
+        experience_id: str = None,
+        development_stage: int = 0,
+    ) -> dict:
+        """감정 로그 저장"""
+        data = {
+            "curiosity": curiosity,
+            "joy": joy,
+            "fear": fear,
+            "surprise": surprise,
+            "frustration": frustration,
+            "boredom": boredom,
+            "dominant_emotion": dominant_emotion,
+            "development_stage": development_stage,
+        }
+
+        if trigger_task:
+            data["trigger_task"] = trigger_task
+        if trigger_type:
+            data["trigger_type"] = trigger_type
+        if experience_id:
+            data["experience_id"] = experience_id
+
+        response = await self._execute(self.client.table("emotion_logs").insert(data))
+        return response.data[0] if response.data else {}
+
+    async def boost_memory_by_emotion(
+        self,
+        experience_id: str,
+        emotion_intensity: float,
+    ) -> None:
+        """감정 강도로 기억 강화"""
+        await self._execute(self.client.rpc(
+            "boost_memory_by_emotion",
+            {
+                "p_experience_id": experience_id,
+                "p_emotion_intensity": emotion_intensity,
+            }
+        ))
+
+    # ==================== Utility ====================
+
+    async def decay_connections(self, decay_rate: float = 0.01) -> None:
+        """모든 연결 강도 감쇠 (시간 기반 망각)"""
+        await self._execute(self.client.rpc("decay_all_connections", {"p_decay_rate": decay_rate}))
+
+    async def get_stats(self) -> dict:
+        """전체 DB 통계 (세 개의 count 쿼리를 동시에 실행)"""
+        experiences, concepts, patterns = await self.gather(
+            self.client.table("experiences").select("id", count="exact"),
+            self.client.table("semantic_concepts").select("id", count="exact"),
+            self.client.table("procedural_patterns").select("id", count="exact"),
+        )
+
+        return {
+            "experiences_count": experiences.count or 0,
+            "concepts_count": concepts.count or 0,
+            "patterns_count": patterns.count or 0,
+        }
+
+    # ==================== World Model: Predictions ====================
+
+    async def insert_prediction(
+        self,
+        scenario: str,
+        prediction: str,
+        confidence: float = 0.5,
+        reasoning: str = None,
+        based_on_concepts: list[str] = None,
+        based_on_experiences: list[str] = None,
+        prediction_type: str = "outcome",
+        domain: str = None,
+        development_stage: int = 0,
+    ) -> dict:
+        """예측 저장"""
+        data = {
+            "scenario": scenario,
+            "prediction": prediction,
+            "confidence": confidence,
+            "prediction_type": prediction_type,
+            "development_stage": development_stage,
+        }
+
+        if reasoning:
+            data["reasoning"] = reasoning
+        if based_on_concepts:
+            valid_uuids = [c for c in based_on_concepts if len(c) == 36 and c.count('-') == 4]
+            if valid_uuids:
+                data["based_on_concepts"] = valid_uuids
+        if based_on_experiences:
+            valid_uuids = [e for e in based_on_experiences if len(e) == 36 and e.count('-') == 4]
+            if valid_uuids:
+                data["based_on_experiences"] = valid_uuids
+        if domain:
+            data["domain"] = domain
+
+        response = await self._execute(self.client.table("predictions").insert(data))
+        return response.data[0] if response.data else {}
+
+    async def verify_prediction(
+        self,
+        prediction_id: str,
+        actual_outcome: str,
+        was_correct: bool,
+        prediction_error: float = 0.0,
+        insight_gained: str = None,
+    ) -> dict:
+        """예측 검증 결과 업데이트"""
+        from datetime import datetime
+
+        data = {
+            "actual_outcome": actual_outcome,
+            "was_correct": was_correct,
+            "prediction_error": prediction_error,
+            "verified_at": datetime.utcnow().isoformat(),
+        }
+
+        if insight_gained:
+            data["insight_gained"] = insight_gained
+
+        response = await self._execute(
+            self.client.table("predictions")
+            .update(data)
+            .eq("id", prediction_id)
+        )
+        return response.data[0] if response.data else {}
+
+    async def get_recent_predictions(self, limit: int = 10) -> list[dict]:
+        """최근 예측 조회"""
+        response = await self._execute(
+            self.client.table("predictions")
+            .select("*")
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    async def get_unverified_predictions(self, limit: int = 10) -> list[dict]:
+        """미검증 예측 조회"""
+        response = await self._execute(
+            self.client.table("predictions")
+            .select("*")
+            .is_("verified_at", "null")
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    # ==================== World Model: Simulations ====================
+
+    async def insert_simulation(
+        self,
+        initial_state: dict,
+        target_goal: str = None,
+        simulation_type: str = "planning",
+        steps: list[dict] = None,
+        predicted_outcome: dict = None,
+        success_probability: float = 0.5,
+        complexity_level: int = 1,
+        triggered_by_experience: str = None,
+        development_stage: int = 0,
+    ) -> dict:
+        """시뮬레이션 저장"""
+        data = {
+            "initial_state": initial_state,
+            "simulation_type": simulation_type,
+            "success_probability": success_probability,
+            "complexity_level": complexity_level,
+            "development_stage": development_stage,
+        }
+
+        if target_goal:
+            data["target_goal"] = target_goal
+        if steps:
+            data["steps"] = steps
+        if predicted_outcome:
+            data["predicted_outcome"] = predicted_outcome
+        if triggered_by_experience:
+            data["triggered_by_experience"] = triggered_by_experience
+
+        response = await self._execute(self.client.table("simulations").insert(data))
+        return response.data[0] if response.data else {}
+
+    async def complete_simulation(
+        self,
+        simulation_id: str,
+        actual_outcome: dict = None,
+        was_validated: bool = False,
+        accuracy_score: float = None,
+    ) -> dict:
+        """시뮬레이션 완료"""
+        from datetime import datetime
+
+        data = {
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+
+        if actual_outcome:
+            data["actual_outcome"] = actual_outcome
+        if was_validated is not None:
+            data["was_validated"] = was_validated
+        if accuracy_score is not None:
+            data["accuracy_score"] = accuracy_score
+
+        response = await self._execute(
+            self.client.table("simulations")
+            .update(data)
+            .eq("id", simulation_id)
+        )
+        return response.data[0] if response.data else {}
+
+    async def get_recent_simulations(self, limit: int = 10) -> list[dict]:
+        """최근 시뮬레이션 조회"""
+        response = await self._execute(
+            self.client.table("simulations")
+            .select("*")
+            .order("created_at", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    # ==================== World Model: Causal Models ====================
+
+    async def upsert_causal_model(
+        self,
+        cause_concept_id: str,
+        effect_concept_id: str,
+        relationship_type: str = "causes",
+        causal_strength: float = 0.5,
+        confidence: float = 0.5,
+        domain: str = None,
+        discovered_at_stage: int = 0,
+    ) -> dict:
+        """인과 모델 저장/업데이트"""
+        existing = await self._execute(
+            self.client.table("causal_models")
+            .select("*")
+            .eq("cause_concept_id", cause_concept_id)
+            .eq("effect_concept_id", effect_concept_id)
+            .limit(1)
+        )
+
+        if existing.data:
+            model = existing.data[0]
+            new_strength = min(1.0, model["causal_strength"] + 0.05)
+            new_confidence = min(1.0, model["confidence"] + 0.02)
+            new_evidence = (model.get("evidence_count") or 0) + 1
+
+            response = await self._execute(
+                self.client.table("causal_models")
+                .update({
+                    "causal_strength": new_strength,
+                    "confidence": new_confidence,
+                    "evidence_count": new_evidence,
+                    "validation_count": (model.get("validation_count") or 0) + 1,
+                })
+                .eq("id", model["id"])
+            )
+        else:
+            data = {
+                "cause_concept_id": cause_concept_id,
+                "effect_concept_id": effect_concept_id,
+                "relationship_type": relationship_type,
+                "causal_strength": causal_strength,
+                "confidence": confidence,
+                "evidence_count": 1,
+                "discovered_at_stage": discovered_at_stage,
+            }
+            if domain:
+                data["domain"] = domain
+
+            response = await self._execute(self.client.table("causal_models").insert(data))
+
+        model = response.data[0] if response.data else {}
+        _index_causal_model(model)
+        return model
+
+    async def get_causal_models(self, min_confidence: float = 0.3, limit: int = 50) -> list[dict]:
+        """인과 모델 조회"""
+        response = await self._execute(
+            self.client.table("causal_models")
+            .select("*")
+            .gte("confidence", min_confidence)
+            .order("causal_strength", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    # ==================== World Model: Imagination Sessions ====================
+
+    async def start_imagination_session(
+        self,
+        topic: str,
+        trigger: str = None,
+        imagination_type: str = "exploration",
+        curiosity_level: float = 0.5,
+        emotional_state: dict = None,
+        development_stage: int = 0,
+    ) -> dict:
+        """상상 세션 시작"""
+        from datetime import datetime
+
+        data = {
+            "topic": topic,
+            "imagination_type": imagination_type,
+            "curiosity_level": curiosity_level,
+            "development_stage": development_stage,
+            "started_at": datetime.utcnow().isoformat(),
+            "thoughts": [],
+            "visualizations": [],
+            "insights": [],
+        }
+
+        if trigger:
+            data["trigger"] = trigger
+        if emotional_state:
+            data["emotional_state"] = emotional_state
+
+        response = await self._execute(self.client.table("imagination_sessions").insert(data))
+        return response.data[0] if response.data else {}
+
+    async def add_imagination_thought(
+        self,
+        session_id: str,
+        thought: dict,
+    ) -> dict:
+        """상상 세션에 생각 추가"""
+        session = await self._execute(
+            self.client.table("imagination_sessions")
+            .select("thoughts")
+            .eq("id", session_id)
+            .single()
+        )
+
+        if session.data:
+            thoughts = session.data.get("thoughts") or []
+            thoughts.append(thought)
+
+            response = await self._execute(
+                self.client.table("imagination_sessions")
+                .update({"thoughts": thoughts})
+                .eq("id", session_id)
+            )
+            return response.data[0] if response.data else {}
+
+        return {}
+
+    async def end_imagination_session(
+        self,
+        session_id: str,
+        insights: list[str] = None,
+        predictions_made: list[str] = None,
+        simulations_run: list[str] = None,
+        duration_ms: int = None,
+    ) -> dict:
+        """상상 세션 종료"""
+        from datetime import datetime
+
+        data = {
+            "ended_at": datetime.utcnow().isoformat(),
+        }
+
+        if insights:
+            data["insights"] = insights
+        if predictions_made:
+            data["predictions_made"] = predictions_made
+        if simulations_run:
+            data["simulations_run"] = simulations_run
+        if duration_ms is not None:
+            data["duration_ms"] = duration_ms
+
+        response = await self._execute(
+            self.client.table("imagination_sessions")
+            .update(data)
+            .eq("id", session_id)
+        )
+        return response.data[0] if response.data else {}
+
+    async def get_active_imagination_session(self) -> Optional[dict]:
+        """활성 상상 세션 조회"""
+        response = await self._execute(
+            self.client.table("imagination_sessions")
+            .select("*")
+            .is_("ended_at", "null")
+            .order("started_at", desc=True)
+            .limit(1)
+        )
+        return response.data[0] if response.data else None
+
+    async def get_recent_imagination_sessions(self, limit: int = 10) -> list[dict]:
+        """최근 상상 세션 조회"""
+        response = await self._execute(
+            self.client.table("imagination_sessions")
+            .select("*")
+            .order("started_at", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+    # ==================== World Model: Experience-Concept Links ====================
+
+    async def get_all_concepts(self) -> list[dict]:
+        """모든 개념 조회"""
+        response = await self._execute(
+            self.client.table("semantic_concepts")
+            .select("*")
+            .order("strength", desc=True)
+        )
+        return response.data or []
+
+    async def get_experience_concept_links(self, limit: int = 100) -> list[dict]:
+        """경험-개념 연결 조회 (시냅스 시각화용)"""
+        response = await self._execute(
+            self.client.table("experience_concepts")
+            .select("*")
+            .order("relevance", desc=True)
+            .limit(limit)
+        )
+        return response.data or []
+
+
+# Singleton instance
+_db_instance: Optional[BrainDatabase] = None
+_async_db_instance: Optional[AsyncBrainDatabase] = None
+
+
+def get_brain_db() -> BrainDatabase:
+    """BrainDatabase 싱글톤"""
+    global _db_instance
+    if _db_instance is None:
+        _db_instance = BrainDatabase()
+    return _db_instance
+
+
+def get_async_brain_db() -> AsyncBrainDatabase:
+    """AsyncBrainDatabase 싱글톤"""
+    global _async_db_instance
+    if _async_db_instance is None:
+        _async_db_instance = AsyncBrainDatabase()
+    return _async_db_instance
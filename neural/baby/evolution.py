@@ -18,6 +18,11 @@ from collections import Counter
 import json
 import re
 
+try:
+    from .keyword_matcher import KeywordMatcher
+except ImportError:  # 단독 실행 (python evolution.py)
+    from keyword_matcher import KeywordMatcher
+
 
 class FailureType(Enum):
     """실패 유형"""
@@ -137,6 +142,11 @@ EVOLUTION_RULES: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# 규칙 키워드를 한 번만 컴파일 (텍스트당 1회 스캔)
+EVOLUTION_RULE_MATCHER = KeywordMatcher({
+    rule_name: rule['keywords'] for rule_name, rule in EVOLUTION_RULES.items()
+})
+
 
 class FailurePatternDetector:
     """
@@ -227,19 +237,20 @@ class FailurePatternDetector:
         keyword_examples: Dict[str, List[str]] = {}
 
         for f in failures:
-            task_text = (f.get('task', '') + ' ' + f.get('output', '')).lower()
+            task_text = f.get('task', '') + ' ' + f.get('output', '')
+            hits = EVOLUTION_RULE_MATCHER.find_all(task_text)
 
-            for rule_name, rule in EVOLUTION_RULES.items():
-                for keyword in rule['keywords']:
-                    if keyword.lower() in task_text:
-                        if rule_name not in keyword_counts:
-                            keyword_counts[rule_name] = 0
-                            keyword_examples[rule_name] = []
-                        keyword_counts[rule_name] += 1
+            # 같은 규칙에서 하나만 카운트
+            for rule_name in EVOLUTION_RULES:
+                if rule_name not in hits:
+                    continue
+                if rule_name not in keyword_counts:
+                    keyword_counts[rule_name] = 0
+                    keyword_examples[rule_name] = []
+                keyword_counts[rule_name] += 1
 
-                        if len(keyword_examples[rule_name]) < 3:
-                            keyword_examples[rule_name].append(f.get('task', '')[:100])
-                        break  # 같은 규칙에서 하나만 카운트
+                if len(keyword_examples[rule_name]) < 3:
+                    keyword_examples[rule_name].append(f.get('task', '')[:100])
 
         for rule_name, count in keyword_counts.items():
             if count >= 2:  # 2번 이상 발견
@@ -344,14 +355,12 @@ class PromptEvolver:
             failure_pattern.task_type,
             ' '.join(failure_pattern.keywords),
             ' '.join(failure_pattern.example_tasks)
-        ]).lower()
+        ])
+        rule_hits = EVOLUTION_RULE_MATCHER.find_all(pattern_text)
 
         for rule_name, rule in EVOLUTION_RULES.items():
             # 키워드 매칭 점수 계산
-            match_score = sum(
-                1 for kw in rule['keywords']
-                if kw.lower() in pattern_text
-            )
+            match_score = len(rule_hits.get(rule_name, ()))
 
             if match_score > 0:
                 matched_rules.append((rule_name, rule, match_score))
@@ -988,8 +997,16 @@ class EvolutionEngine:
 
 # 편의 함수
 async def create_evolution_engine(supabase_url: str = None, supabase_key: str = None):
-    """EvolutionEngine 생성 헬퍼"""
-    from supabase import create_client, Client
+    """
+    EvolutionEngine 생성 헬퍼
+
+    URL/키를 지정하지 않으면 공유 HTTP/2 풀 기반 AsyncBrainDatabase 사용
+    """
+    if not supabase_url and not supabase_key:
+        from .db import get_async_brain_db
+        return EvolutionEngine(get_async_brain_db())
+
+    from supabase import acreate_client
     import os
 
     url = supabase_url or os.getenv('SUPABASE_URL')
@@ -998,5 +1015,5 @@ async def create_evolution_engine(supabase_url: str = None, supabase_key: str =
     if not url or not key:
         raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY required")
 
-    client: Client = create_client(url, key)
+    client = await acreate_client(url, key)
     return EvolutionEngine(client)
@@ -0,0 +1,222 @@
+"""
+Job Manager - 비동기 작업 API
+
+긴 코더/테스터/리뷰어 루프를 HTTP 연결과 분리
+- submit(): 작업 ID 즉시 반환, 제한된 워커 풀이 순서대로 실행
+- get(): 상태/결과 조회
+- events(): 단계별 진행 이벤트 (지난 이벤트 재생 + 실시간), SSE 스트림용
+
+진행 이벤트는 BabySubstrate.process(on_progress=...)에서 발생
+(routing → code_generated → test_result → review → retry ... → done/failed)
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import AsyncIterator, Optional
+
+from .substrate_pool import DEFAULT_BABY_ID, SubstratePool
+
+
+MAX_JOB_WORKERS = 4        # 동시에 실행할 작업 수
+MAX_PENDING_JOBS = 64      # 대기열 상한 (초과 시 JobQueueFullError)
+MAX_RETAINED_JOBS = 500    # 완료된 작업 보관 수 (오래된 것부터 삭제)
+TERMINAL_STAGES = ("done", "failed")
+
+
+class JobStatus(Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobQueueFullError(Exception):
+    """대기열이 가득 참"""
+
+
+@dataclass
+class Job:
+    """작업 한 건"""
+    id: str
+    task: str
+    baby_id: str = DEFAULT_BABY_ID
+    status: JobStatus = JobStatus.QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    events: list[dict] = field(default_factory=list)
+    _subscribers: list[asyncio.Queue] = field(default_factory=list, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def emit(self, stage: str, data: dict) -> None:
+        """진행 이벤트 기록 + 구독자에게 전달 (이벤트 루프 스레드에서 호출)"""
+        event = {"seq": len(self.events), "stage": stage, "data": data, "ts": time.time()}
+        self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        data = {
+            "id": self.id,
+            "task": self.task,
+            "baby_id": self.baby_id,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "events": len(self.events),
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """
+    작업 대기열 + 워커 풀
+
+    워커는 현재 이벤트 루프에서 처음 submit()할 때 시작
+    """
+
+    def __init__(
+        self,
+        pool: SubstratePool,
+        max_workers: int = MAX_JOB_WORKERS,
+        max_pending: int = MAX_PENDING_JOBS,
+        max_retained: int = MAX_RETAINED_JOBS,
+    ):
+        self._pool = pool
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        self._stats = {"submitted": 0, "succeeded": 0, "failed": 0, "rejected": 0}
+
+    def submit(self, task: str, baby_id: str = DEFAULT_BABY_ID) -> Job:
+        """작업 등록 (대기열이 가득 차면 JobQueueFullError)"""
+        queue = self._ensure_workers()
+        if queue.full():
+            self._stats["rejected"] += 1
+            raise JobQueueFullError(f"Job queue is full ({self.max_pending} pending)")
+
+        job = Job(id=uuid.uuid4().hex, task=task, baby_id=baby_id)
+        self._jobs[job.id] = job
+        self._trim()
+        queue.put_nowait(job)
+        job.emit("queued", {"position": queue.qsize()})
+        self._stats["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def events(self, job_id: str, keepalive_s: Optional[float] = None) -> AsyncIterator[Optional[dict]]:
+        """
+        진행 이벤트 스트림 (지난 이벤트부터, done/failed에서 종료)
+
+        keepalive_s 동안 이벤트가 없으면 None을 내보냄 (SSE 연결 유지용)
+        """
+        job = self._jobs[job_id]
+        queue: asyncio.Queue = asyncio.Queue()
+        # 스냅샷과 구독 사이에 await가 없으므로 이벤트 누락/중복 없음
+        backlog = list(job.events)
+        job._subscribers.append(queue)
+        try:
+            for event in backlog:
+                yield event
+            if job.finished:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), keepalive_s)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+                if event["stage"] in TERMINAL_STAGES:
+                    return
+        finally:
+            job._subscribers.remove(queue)
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """현재 이벤트 루프의 대기열/워커 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        alive = [w for w in self._workers if not w.done() and w.get_loop() is loop]
+        if self._queue is None or not alive:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._workers = [loop.create_task(self._worker(self._queue)) for _ in range(self.max_workers)]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        job.emit("started", {})
+        try:
+            async with self._pool.session(job.baby_id) as substrate:
+                result = await substrate.process(job.task, on_progress=job.emit)
+            job.result = asdict(result)
+            job.status = JobStatus.SUCCEEDED
+            self._stats["succeeded"] += 1
+            job.finished_at = time.time()
+            job.emit("done", {"success": result.success, "iterations": result.iterations})
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            self._stats["failed"] += 1
+            job.finished_at = time.time()
+            job.emit("failed", {"error": job.error})
+
+    def _trim(self) -> None:
+        """보관 상한 초과 시 오래된 완료 작업부터 삭제"""
+        overflow = len(self._jobs) - self.max_retained
+        if overflow <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:overflow]:
+            del self._jobs[job_id]
+
+    async def join(self) -> None:
+        """대기 중인 작업이 모두 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "running": sum(1 for job in self._jobs.values() if job.status == JobStatus.RUNNING),
+            "retained": len(self._jobs),
+            "max_workers": self.max_workers,
+        }
+
+
+# 싱글톤 인스턴스
+_job_manager: Optional[JobManager] = None
+
+
+def get_job_manager(pool: SubstratePool) -> JobManager:
+    """JobManager 싱글톤 (pool은 처음 생성할 때만 사용)"""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager(pool)
+    return _job_manager
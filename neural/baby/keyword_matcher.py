@@ -0,0 +1,89 @@
+"""
+Keyword Matcher - 컴파일된 다중 키워드 매처
+
+Aho-Corasick 오토마톤으로 키워드 집합을 한 번만 컴파일하고
+텍스트를 한 번 훑어서 모든 그룹의 매칭 키워드를 반환
+
+`kw in text`를 키워드마다 반복하는 것과 같은 결과 (부분 문자열, 대소문자 무시,
+겹치는 키워드 모두 탐지)
+"""
+
+from collections import deque
+from typing import Iterable, Mapping, Optional
+
+
+class KeywordMatcher:
+    """
+    그룹별 키워드 매처
+
+    Example:
+        matcher = KeywordMatcher({"code": ["함수", "class"], "test": ["테스트"]})
+        matcher.find_all("함수 테스트")  # {"code": {"함수"}, "test": {"테스트"}}
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        self.groups = {name: tuple(keywords) for name, keywords in groups.items()}
+
+        # 트라이 (goto), 실패 링크, 출력 (그룹, 원래 키워드)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, str]]] = [[]]
+
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                self._add(name, keyword)
+        self._build_failure_links()
+
+    def _add(self, group: str, keyword: str) -> None:
+        normalized = keyword.lower()
+        if not normalized:
+            return
+        node = 0
+        for ch in normalized:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[node][ch] = nxt
+            node = nxt
+        self._out[node].append((group, keyword))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> dict[str, set[str]]:
+        """한 번의 스캔으로 그룹별 매칭 키워드 반환 (매칭 없는 그룹은 제외)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: dict[str, set[str]] = {}
+        node = 0
+        for ch in text.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for group, keyword in out[node]:
+                hits.setdefault(group, set()).add(keyword)
+        return hits
+
+    def counts(self, text: str) -> dict[str, int]:
+        """그룹별 서로 다른 매칭 키워드 수 (모든 그룹 포함)"""
+        hits = self.find_all(text)
+        return {name: len(hits.get(name, ())) for name in self.groups}
+
+    def first_group(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """정의 순서상 처음 매칭되는 그룹"""
+        hits = self.find_all(text)
+        for name in self.groups:
+            if name in hits:
+                return name
+        return default
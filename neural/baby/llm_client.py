@@ -11,12 +11,19 @@ LLM Client - Multi-Model AI Client
 - GPT-5.2 Thinking = System 2 (느린 분석)
 """
 
+import hashlib
 import os
-from typing import Optional, Literal
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Literal, Union
 from dataclasses import dataclass
 from enum import Enum
 from dotenv import load_dotenv
 
+from .llm_metrics import LLMTelemetry, estimate_tokens
+from .rate_limiter import RateLimitScheduler, RequestPriority, is_rate_limit_error
+
 load_dotenv()
 
 
@@ -101,6 +108,46 @@ AVAILABLE_MODELS = {
 }
 
 
+# 헤징 설정: 주 모델이 마감 시간 내 응답하지 않으면 보조 모델에 동시 요청
+HEDGE_FALLBACKS = {
+    "gemini-3-flash": "gpt-4o-mini",
+    "gemini-3-pro": "gpt-4o-mini",
+    "gemini-2-flash": "gpt-4o-mini",
+    "gpt-5.2": "gemini-2-flash",
+    "gpt-5.2-thinking": "gpt-4o-mini",
+    "gpt-4o-mini": "gemini-2-flash",
+}
+HEDGE_PERCENTILE = 95     # 마감 시간 = 관측 지연시간의 p95
+HEDGE_MIN_SAMPLES = 20    # 이보다 적으면 티어별 기본 마감 시간 사용
+HEDGE_DEFAULT_DELAY_S = {
+    ModelTier.FLASH: 3.0,
+    ModelTier.STANDARD: 8.0,
+    ModelTier.THINKING: 20.0,
+}
+HEDGE_MAX_WORKERS = 8
+
+# 제공자 사용량이 없을 때 이미지 1장당 추정 토큰 (Gemini 기준)
+IMAGE_TOKEN_ESTIMATE = 258
+
+# 프롬프트 캐시 적중 토큰의 입력 단가 배율 (제공자/모델별 할인율 차이 있음, 근사값)
+CACHED_INPUT_COST_FACTOR = 0.25
+
+# Gemini 실패 시 폴백 모델
+GOOGLE_FALLBACK_MODEL = "gpt-4o-mini"
+
+
+class ProviderFallback(Exception):
+    """제공자 호출 실패 → 슬롯을 반납하고 폴백 모델로 (429가 아닌 에러만)"""
+
+    def __init__(self, error: BaseException):
+        super().__init__(f"{type(error).__name__}, falling back to {GOOGLE_FALLBACK_MODEL}")
+        self.error = error
+
+
+class HedgeCancelled(Exception):
+    """헤징 패자 호출 중단 (승자가 먼저 응답)"""
+
+
 class LLMClient:
     """
     통합 LLM 클라이언트
@@ -116,6 +163,26 @@ class LLMClient:
         self._google_client = None
         self._anthropic_client = None
 
+        # 모델별 지연시간/TTFT/토큰/비용/폴백/에러 (지연시간은 헤징 마감 시간 산출에도 사용)
+        self.telemetry = LLMTelemetry()
+        # 호출 중인 스레드별 사용량/TTFT/폴백 정보 (제공자 함수 → _call_model)
+        self._call_meta = threading.local()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_stats = {"requests": 0, "fired": 0, "primary_wins": 0, "hedge_wins": 0, "cancelled": 0}
+        self._hedge_lock = threading.Lock()   # 헤징 통계는 여러 호출 스레드에서 갱신
+
+        # 제공자별 동시 실행/속도 제한 + 우선순위 대기열
+        self._scheduler = RateLimitScheduler()
+
+        # 기록/재생 트랜스포트 (LLM_CASSETTE_MODE, 기본 off)
+        from common.cassette import get_cassette_transport
+        self._transport = get_cassette_transport()
+
+        # Single-flight: 동일 요청이 진행 중이면 같은 결과를 공유
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._single_flight_stats = {"leaders": 0, "coalesced": 0}
+
     def _get_openai_client(self):
         """OpenAI 클라이언트 (lazy init)"""
         if self._openai_client is None:
@@ -151,6 +218,8 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 4096,
         thinking_level: Literal["minimal", "low", "medium", "high"] = None,
+        hedge: bool = False,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> str:
         """
         텍스트 생성
@@ -162,6 +231,8 @@ class LLMClient:
             temperature: 창의성 (0.0 ~ 1.0)
             max_tokens: 최대 출력 토큰
             thinking_level: Thinking 모델용 사고 깊이
+            hedge: p95 마감 시간 초과 시 보조 모델에 동시 요청 (먼저 온 응답 사용)
+            priority: 제공자 대기열 우선순위 (사용자 요청 > 백그라운드)
 
         Returns:
             생성된 텍스트
@@ -169,19 +240,372 @@ class LLMClient:
         if model_key not in AVAILABLE_MODELS:
             raise ValueError(f"Unknown model: {model_key}")
 
+        # 동일 요청이 이미 진행 중이면 그 결과를 기다림
+        key = (model_key, system_prompt, prompt, temperature, max_tokens, thinking_level)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+                self._single_flight_stats["leaders"] += 1
+            else:
+                self._single_flight_stats["coalesced"] += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            response = self._generate_uncoalesced(
+                prompt, model_key, system_prompt, temperature, max_tokens,
+                thinking_level, hedge, priority,
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _generate_uncoalesced(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        thinking_level: str,
+        hedge: bool,
+        priority: RequestPriority,
+    ) -> str:
+        """실제 생성 (헤징 여부에 따라 분기)"""
+        if hedge and model_key in HEDGE_FALLBACKS:
+            return self._generate_hedged(
+                prompt, model_key, system_prompt, temperature, max_tokens, thinking_level, priority
+            )
+
+        return self._call_model(
+            prompt, model_key, system_prompt, temperature, max_tokens, thinking_level,
+            priority=priority,
+        )
+
+    def _call_model(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        thinking_level: str,
+        fallback: bool = True,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> str:
+        """
+        제공자별 생성 호출 + 지연시간 기록
+
+        제공자 스케줄러 슬롯 안에서 실행 (429는 스케줄러가 백오프 후 재시도).
+        fallback=False면 실패 시 예외 전파.
+        """
         config = AVAILABLE_MODELS[model_key]
 
         if config.provider == ModelProvider.GOOGLE:
-            return self._generate_google(
-                prompt, config, system_prompt, temperature, max_tokens, thinking_level
-            )
+            generate_fn = self._generate_google
         elif config.provider == ModelProvider.OPENAI:
-            return self._generate_openai(
-                prompt, config, system_prompt, temperature, max_tokens, thinking_level
-            )
+            generate_fn = self._generate_openai
         else:
             raise ValueError(f"Unsupported provider: {config.provider}")
 
+        request = {
+            "provider": config.provider.value,
+            "model": config.model_id,
+            "system": system_prompt,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "thinking_level": thinking_level,
+        }
+        meta = self._begin_call(model_key)
+        try:
+            try:
+                response = self._scheduler.run(
+                    config.provider.value,
+                    lambda: self._transport.call(
+                        request,
+                        lambda: self._run_live(
+                            generate_fn,
+                            prompt, config, system_prompt, temperature, max_tokens, thinking_level, fallback,
+                        ),
+                        usage_fn=lambda _: self._usage_dict(),
+                    ),
+                    priority,
+                )
+            except ProviderFallback as e:
+                response = self._call_fallback(e, request, priority)
+        except Exception as e:
+            if not isinstance(e, HedgeCancelled):
+                self.telemetry.record_error(model_key, e)
+            meta.key = None
+            raise
+
+        self._finish_call(meta, estimate_tokens((system_prompt or "") + prompt), response)
+        return response
+
+    def _call_fallback(self, fallback: ProviderFallback, request: dict, priority: RequestPriority) -> str:
+        """
+        Gemini 실패 → OpenAI 폴백
+
+        Gemini 슬롯은 이미 반납됨 → OpenAI 토큰 버킷/우선순위 큐를 거쳐 호출
+        (OpenAI 429는 OpenAI 버킷에서 백오프)
+        """
+        self._note_fallback(GOOGLE_FALLBACK_MODEL, fallback.error)
+        config = AVAILABLE_MODELS[GOOGLE_FALLBACK_MODEL]
+        fallback_request = dict(request, provider=config.provider.value, model=config.model_id, thinking_level=None)
+        return self._scheduler.run(
+            config.provider.value,
+            lambda: self._transport.call(
+                fallback_request,
+                lambda: self._run_live(
+                    self._generate_openai_fallback,
+                    request["prompt"], request["system"], request["temperature"], request["max_tokens"],
+                ),
+                usage_fn=lambda _: self._usage_dict(),
+            ),
+            priority,
+        )
+
+    # ==================== 텔레메트리 ====================
+
+    def _begin_call(self, telemetry_key: str):
+        """스레드별 호출 정보 초기화"""
+        meta = self._call_meta
+        meta.key = telemetry_key
+        meta.served_by = telemetry_key
+        meta.start = time.perf_counter()
+        meta.live_start = None
+        meta.ttft_ms = None
+        meta.usage = None
+        return meta
+
+    def _run_live(self, generate_fn, *args):
+        """실제 제공자 호출 (재시도마다 TTFT/사용량 초기화)"""
+        meta = self._call_meta
+        meta.live_start = time.perf_counter()
+        meta.ttft_ms = None
+        meta.usage = None
+        return generate_fn(*args)
+
+    def _note_first_token(self) -> None:
+        """스트리밍 응답의 첫 토큰 도착"""
+        meta = self._call_meta
+        if getattr(meta, "live_start", None) is not None and meta.ttft_ms is None:
+            meta.ttft_ms = (time.perf_counter() - meta.live_start) * 1000
+
+    def _note_usage(self, response) -> None:
+        """
+        응답의 토큰 사용량 (OpenAI usage / Gemini usage_metadata)
+
+        두 제공자 모두 공통 접두부 (앞에 오는 시스템 프롬프트 등)를 자동 캐싱하므로
+        캐시 적중 토큰 수도 함께 기록
+        """
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            self._call_meta.usage = (
+                getattr(usage, "prompt_tokens", 0) or 0,
+                getattr(usage, "completion_tokens", 0) or 0,
+                getattr(details, "cached_tokens", 0) or 0,
+            )
+            return
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata is not None:
+            self._call_meta.usage = (
+                getattr(metadata, "prompt_token_count", 0) or 0,
+                getattr(metadata, "candidates_token_count", 0) or 0,
+                getattr(metadata, "cached_content_token_count", 0) or 0,
+            )
+
+    def _note_fallback(self, target: str, error: BaseException) -> None:
+        """제공자 함수 내부 폴백 (원래 모델 에러 기록, 이후 사용량은 대체 모델 기준)"""
+        meta = self._call_meta
+        if getattr(meta, "key", None) is None:
+            return
+        self.telemetry.record_fallback(meta.key, target, error)
+        meta.served_by = target
+        meta.ttft_ms = None
+        meta.usage = None
+
+    def _usage_dict(self) -> dict:
+        usage = getattr(self._call_meta, "usage", None)
+        if usage is None:
+            return {}
+        return {"prompt_tokens": usage[0], "completion_tokens": usage[1], "cached_tokens": usage[2]}
+
+    def _finish_call(
+        self,
+        meta,
+        estimated_prompt_tokens: int,
+        response: str,
+        config: Optional[ModelConfig] = None,
+    ) -> None:
+        """성공한 호출 기록 (사용량이 없으면 문자 수로 추정)"""
+        latency_ms = (time.perf_counter() - meta.start) * 1000
+        if meta.usage is not None:
+            prompt_tokens, completion_tokens, cached_tokens = meta.usage
+        else:
+            prompt_tokens, completion_tokens = estimated_prompt_tokens, estimate_tokens(response)
+            cached_tokens = 0
+
+        config = AVAILABLE_MODELS.get(meta.served_by, config)
+        cost = 0.0
+        if config:
+            billed_input = prompt_tokens - cached_tokens + cached_tokens * CACHED_INPUT_COST_FACTOR
+            cost = (
+                billed_input * config.input_cost_per_1m + completion_tokens * config.output_cost_per_1m
+            ) / 1_000_000
+
+        self.telemetry.record_call(
+            meta.served_by, latency_ms, prompt_tokens, completion_tokens, cost,
+            ttft_ms=meta.ttft_ms,
+            estimated=meta.usage is None,
+            cached_tokens=cached_tokens,
+        )
+        meta.key = None
+
+    def get_telemetry(self) -> dict:
+        """모델별 텔레메트리 + 헤징/single-flight/스케줄러 통계"""
+        return {
+            **self.telemetry.get_stats(),
+            "hedging": self._get_hedge_stats(),
+            "single_flight": self.get_single_flight_stats(),
+            "scheduler": self.get_scheduler_stats(),
+        }
+
+    # ==================== 헤징 요청 ====================
+
+    def hedge_deadline(self, model_key: str) -> float:
+        """헤징 마감 시간 (초): 관측 p95, 표본 부족 시 티어 기본값"""
+        histogram = self.telemetry.latency(model_key)
+        if histogram.count >= HEDGE_MIN_SAMPLES:
+            return histogram.percentile(HEDGE_PERCENTILE) / 1000
+        return HEDGE_DEFAULT_DELAY_S[AVAILABLE_MODELS[model_key].tier]
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge"
+            )
+        return self._hedge_executor
+
+    def _count_hedge(self, name: str) -> None:
+        with self._hedge_lock:
+            self._hedge_stats[name] += 1
+
+    def _run_cancellable(self, cancel: threading.Event, fn, *args):
+        """헤징 작업 스레드에서 fn 실행 (취소 신호를 스레드별 호출 정보에 연결)"""
+        self._call_meta.cancel = cancel
+        try:
+            return fn(*args)
+        finally:
+            self._call_meta.cancel = None
+
+    def _generate_hedged(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        thinking_level: str,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> str:
+        """
+        헤징 생성
+
+        주 모델이 마감 시간 내 응답하지 않거나 실패하면 보조 모델 요청을 띄우고
+        먼저 성공한 응답을 반환. 패자는 취소 신호를 받음:
+        - 아직 시작 전이면 실행하지 않음
+        - Gemini 스트리밍은 다음 청크에서 스트림을 닫아 남은 출력 생성 중단
+        - OpenAI (비스트리밍 동기 호출)는 중단 불가 → 결과만 폐기, 비용은 두 호출 모두 발생
+        """
+        hedge_key = HEDGE_FALLBACKS[model_key]
+        executor = self._get_hedge_executor()
+        self._count_hedge("requests")
+
+        cancels: dict[Future, threading.Event] = {}
+
+        def submit(key: str, level: Optional[str]) -> Future:
+            cancel = threading.Event()
+            future = executor.submit(
+                self._run_cancellable, cancel, self._call_model, prompt, key, system_prompt,
+                temperature, max_tokens, level, False, priority,
+            )
+            cancels[future] = cancel
+            return future
+
+        primary = submit(model_key, thinking_level)
+        deadline = self.hedge_deadline(model_key)
+        done, _ = wait([primary], timeout=deadline)
+
+        if done and primary.exception() is None:
+            self._count_hedge("primary_wins")
+            return primary.result()
+
+        if done:
+            print(f"[LLMClient] {model_key} failed: {primary.exception()}, hedging to {hedge_key}...")
+            pending = set()
+        else:
+            print(f"[LLMClient] {model_key} exceeded {deadline:.1f}s, hedging to {hedge_key}...")
+            pending = {primary}
+
+        self._count_hedge("fired")
+        secondary = submit(hedge_key, None)
+        pending.add(secondary)
+
+        error: Optional[BaseException] = primary.exception() if done else None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                    cancels[loser].set()
+                    self._count_hedge("cancelled")
+                self._count_hedge("primary_wins" if future is primary else "hedge_wins")
+                return future.result()
+
+        raise error
+
+    def get_latency_stats(self) -> dict:
+        """모델별 지연시간 + 헤징 통계"""
+        return {
+            "models": {
+                key: model["latency"] for key, model in self.telemetry.get_stats()["models"].items()
+            },
+            "hedging": dict(self._hedge_stats),
+        }
+
+    def _get_hedge_stats(self) -> dict:
+        with self._hedge_lock:
+            return dict(self._hedge_stats)
+
+    def get_single_flight_stats(self) -> dict:
+        """중복 요청 제거 통계"""
+        with self._inflight_lock:
+            stats = dict(self._single_flight_stats)
+            stats["in_flight"] = len(self._inflight)
+        total = stats["leaders"] + stats["coalesced"]
+        stats["dedup_rate"] = stats["coalesced"] / total if total else 0.0
+        return stats
+
+    def get_scheduler_stats(self) -> dict:
+        """제공자별 대기열 깊이/처리량/429 통계"""
+        return self._scheduler.get_stats()
+
     def _generate_google(
         self,
         prompt: str,
@@ -190,6 +614,7 @@ class LLMClient:
         temperature: float,
         max_tokens: int,
         thinking_level: str,
+        fallback: bool = True,
     ) -> str:
         """Google Gemini 생성"""
         client = self._get_google_client()
@@ -210,12 +635,26 @@ class LLMClient:
                 if system_prompt:
                     contents = f"{system_prompt}\n\n{prompt}"
 
-                response = client.models.generate_content(
+                # 스트리밍으로 받아 첫 토큰까지 시간(TTFT) 측정, 사용량은 마지막 청크 기준
+                chunks = []
+                last_chunk = None
+                cancel = getattr(self._call_meta, "cancel", None)
+                stream = client.models.generate_content_stream(
                     model=config.model_id,
                     contents=contents,
                     config=generation_config,
                 )
-                return response.text
+                for chunk in stream:
+                    if cancel is not None and cancel.is_set():
+                        # 헤징 패자: 스트림을 닫아 남은 출력 생성 중단
+                        getattr(stream, "close", lambda: None)()
+                        raise HedgeCancelled(config.model_id)
+                    if chunk.text:
+                        self._note_first_token()
+                        chunks.append(chunk.text)
+                    last_chunk = chunk
+                self._note_usage(last_chunk)
+                return "".join(chunks)
             else:
                 # 구버전 SDK
                 model = client.GenerativeModel(config.model_id)
@@ -233,12 +672,16 @@ class LLMClient:
                     full_prompt,
                     generation_config=generation_config,
                 )
+                self._note_usage(response)
                 return response.text
 
         except Exception as e:
-            # Fallback to OpenAI if Google fails
+            # 429는 다른 제공자로 넘기지 않고 스케줄러가 백오프 후 재시도
+            if not fallback or is_rate_limit_error(e) or isinstance(e, HedgeCancelled):
+                raise
+            # Fallback to OpenAI if Google fails (Gemini 슬롯을 반납한 뒤 _call_model이 실행)
             print(f"[LLMClient] Gemini error: {e}, falling back to OpenAI...")
-            return self._generate_openai_fallback(prompt, system_prompt, temperature, max_tokens)
+            raise ProviderFallback(e) from e
 
     def _generate_google_fallback(
         self,
@@ -293,6 +736,7 @@ class LLMClient:
             temperature=temperature,
             max_tokens=max_tokens,
         )
+        self._note_usage(response)
         return response.choices[0].message.content
 
     def _generate_openai(
@@ -303,6 +747,7 @@ class LLMClient:
         temperature: float,
         max_tokens: int,
         thinking_level: str,
+        fallback: bool = True,
     ) -> str:
         """OpenAI 생성"""
         client = self._get_openai_client()
@@ -338,49 +783,106 @@ class LLMClient:
                     max_tokens=max_tokens,
                 )
 
+            self._note_usage(response)
             return response.choices[0].message.content
 
         except Exception as e:
+            if not fallback or is_rate_limit_error(e):
+                raise
             # Fallback
             print(f"[LLMClient] OpenAI error: {e}, falling back to gpt-4o-mini...")
+            self._note_fallback("gpt-4o-mini", e)
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
+            self._note_usage(response)
             return response.choices[0].message.content
 
     def generate_multimodal(
         self,
         prompt: str,
-        images: list[bytes] = None,
+        images: list[Union[bytes, memoryview]] = None,
         model_key: str = "gemini-2-flash",
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> str:
         """
         멀티모달 생성 (이미지 + 텍스트)
 
         Gemini Vision API를 사용하여 이미지와 텍스트를 함께 처리
+        (텍스트 호출과 같은 제공자 스케줄러 슬롯에서 실행 → 동시성/토큰 버킷/429 백오프)
 
         Args:
             prompt: 텍스트 프롬프트
-            images: 이미지 바이너리 데이터 리스트
+            images: 이미지 바이너리 데이터 리스트 (bytes 또는 memoryview, 인코딩은 SDK 경계에서)
             model_key: 모델 키 (gemini-2-flash, gemini-3-flash 등)
             temperature: 창의성 (0.0 ~ 1.0)
             max_tokens: 최대 출력 토큰
+            priority: 제공자 대기열 우선순위
 
         Returns:
             생성된 텍스트
         """
         if not images:
             # 이미지가 없으면 일반 텍스트 생성
-            return self.generate(prompt, model_key, temperature=temperature, max_tokens=max_tokens)
+            return self.generate(
+                prompt, model_key, temperature=temperature, max_tokens=max_tokens, priority=priority,
+            )
 
-        # Gemini만 지원 (현재)
-        client = self._get_google_client()
         config = AVAILABLE_MODELS.get(model_key, AVAILABLE_MODELS["gemini-2-flash"])
+        request = {
+            "provider": "google-multimodal",
+            "model": config.model_id,
+            "prompt": prompt,
+            "images": [hashlib.sha256(img).hexdigest() for img in images],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        # 이미지 호출은 토큰 구성이 달라 별도 키로 기록 (텍스트 폴백은 내부 generate가 기록)
+        telemetry_key = f"{model_key}:vision"
+        meta = self._begin_call(telemetry_key)
+        try:
+            response = self._scheduler.run(
+                config.provider.value,
+                lambda: self._transport.call(
+                    request,
+                    lambda: self._run_live(
+                        self._generate_multimodal_live,
+                        prompt, images, config, model_key, temperature, max_tokens,
+                    ),
+                    usage_fn=lambda _: self._usage_dict(),
+                ),
+                priority,
+            )
+        except Exception as e:
+            self.telemetry.record_error(telemetry_key, e)
+            meta.key = None
+            raise
+
+        if meta.served_by == telemetry_key:
+            self._finish_call(
+                meta,
+                estimate_tokens(prompt) + IMAGE_TOKEN_ESTIMATE * len(images),
+                response,
+                config=config,
+            )
+        return response
+
+    def _generate_multimodal_live(
+        self,
+        prompt: str,
+        images: list[Union[bytes, memoryview]],
+        config: ModelConfig,
+        model_key: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """멀티모달 실제 호출 (Gemini만 지원)"""
+        client = self._get_google_client()
 
         try:
             import base64
@@ -389,14 +891,12 @@ class LLMClient:
             if hasattr(client, 'models'):
                 from google.genai import types
 
-                # 이미지 파트 생성
+                # 이미지 파트 생성 (원본 바이트 그대로, base64 인코딩은 SDK가 요청 직렬화 때 수행)
                 parts = []
                 for img_data in images:
-                    # base64 인코딩
-                    img_b64 = base64.b64encode(img_data).decode('utf-8')
                     parts.append(types.Part.from_bytes(
-                        data=img_data,
-                        mime_type="image/jpeg",  # 기본값, 실제로는 감지해야 함
+                        data=img_data if isinstance(img_data, bytes) else bytes(img_data),
+                        mime_type=self.detect_image_mime_type(img_data),
                     ))
 
                 # 텍스트 파트 추가
@@ -413,6 +913,7 @@ class LLMClient:
                     contents=parts,
                     config=generation_config,
                 )
+                self._note_usage(response)
                 return response.text
 
             else:
@@ -434,7 +935,7 @@ class LLMClient:
                         # PIL 없으면 base64로
                         img_b64 = base64.b64encode(img_data).decode('utf-8')
                         contents.append({
-                            "mime_type": "image/jpeg",
+                            "mime_type": self.detect_image_mime_type(img_data),
                             "data": img_b64,
                         })
 
@@ -447,10 +948,12 @@ class LLMClient:
                         "max_output_tokens": max_tokens,
                     },
                 )
+                self._note_usage(response)
                 return response.text
 
         except Exception as e:
             print(f"[LLMClient] Multimodal generation failed: {e}")
+            self._note_fallback(model_key, e)
             # 폴백: 이미지 없이 텍스트만 처리
             return self.generate(
                 prompt=f"[이미지가 있다고 가정하고 답변해주세요]\n\n{prompt}",
@@ -459,7 +962,7 @@ class LLMClient:
                 max_tokens=max_tokens,
             )
 
-    def detect_image_mime_type(self, image_data: bytes) -> str:
+    def detect_image_mime_type(self, image_data: Union[bytes, memoryview]) -> str:
         """이미지 MIME 타입 감지"""
         # 매직 바이트로 감지
         if image_data[:3] == b'\xff\xd8\xff':
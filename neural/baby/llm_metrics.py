@@ -0,0 +1,206 @@
+"""
+LLM Metrics - 모델별 지연시간 히스토그램 + 호출 텔레메트리
+
+HDR 스타일 로그 버킷 히스토그램
+- 메모리 고정 (값이 아닌 버킷 카운트만 저장)
+- 상대 오차 ~2.5% 내에서 백분위수 계산
+- 스레드 안전 (헤징 요청은 워커 스레드에서 기록)
+
+LLMTelemetry: 모델별 전체 지연시간, 첫 토큰까지 시간(TTFT), 프롬프트/완성 토큰,
+비용, 폴백 발생, 에러 클래스
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+BUCKET_GROWTH = 1.05   # 버킷 간 비율 (상대 정밀도)
+MIN_TRACKED_MS = 0.1   # 이하 값은 첫 버킷으로
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (4자 ≈ 1토큰)"""
+    return max(1, len(text or "") // 4)
+
+
+class LatencyHistogram:
+    """스트리밍 지연시간 히스토그램 (ms 단위)"""
+
+    def __init__(self):
+        self._buckets: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    @staticmethod
+    def _bucket(value_ms: float) -> int:
+        return int(math.log(max(value_ms, MIN_TRACKED_MS) / MIN_TRACKED_MS, BUCKET_GROWTH))
+
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        """버킷 대표값 (구간 중앙)"""
+        return MIN_TRACKED_MS * BUCKET_GROWTH ** (index + 0.5)
+
+    def record(self, value_ms: float) -> None:
+        """값 기록"""
+        index = self._bucket(value_ms)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total_ms += value_ms
+            self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+            self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p 백분위수 (0-100), 기록 없으면 None"""
+        with self._lock:
+            if self.count == 0:
+                return None
+            rank = max(1, math.ceil(self.count * p / 100))
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    value = self._bucket_value(index)
+                    return min(max(value, self.min_ms), self.max_ms)
+            return self.max_ms
+
+    @property
+    def mean_ms(self) -> Optional[float]:
+        return self.total_ms / self.count if self.count else None
+
+    def to_dict(self, unit: str = "ms") -> dict:
+        """요약 통계 (unit: 키 접미사, 토큰 분포는 "tokens")"""
+        return {
+            "count": self.count,
+            f"mean_{unit}": self.mean_ms,
+            f"min_{unit}": self.min_ms,
+            f"max_{unit}": self.max_ms,
+            f"p50_{unit}": self.percentile(50),
+            f"p95_{unit}": self.percentile(95),
+            f"p99_{unit}": self.percentile(99),
+        }
+
+
+@dataclass
+class ModelTelemetry:
+    """모델별 호출 텔레메트리"""
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    ttft: LatencyHistogram = field(default_factory=LatencyHistogram)
+    prompt_tokens: LatencyHistogram = field(default_factory=LatencyHistogram)
+    completion_tokens: LatencyHistogram = field(default_factory=LatencyHistogram)
+    calls: int = 0
+    estimated_usage: int = 0     # 제공자 사용량 없이 추정한 호출 수
+    prompt_tokens_total: int = 0
+    completion_tokens_total: int = 0
+    cached_prompt_tokens_total: int = 0   # 제공자 프롬프트 캐시 적중 토큰
+    cache_hit_calls: int = 0
+    cost: float = 0.0            # $
+    fallbacks: dict[str, int] = field(default_factory=dict)   # 대체 모델 → 횟수
+    errors: dict[str, int] = field(default_factory=dict)      # 예외 클래스 → 횟수
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "estimated_usage": self.estimated_usage,
+            "prompt_tokens_total": self.prompt_tokens_total,
+            "completion_tokens_total": self.completion_tokens_total,
+            "cached_prompt_tokens_total": self.cached_prompt_tokens_total,
+            "cache_hit_rate": self.cache_hit_calls / self.calls if self.calls else 0.0,
+            "cache_token_ratio": (
+                self.cached_prompt_tokens_total / self.prompt_tokens_total
+                if self.prompt_tokens_total else 0.0
+            ),
+            "cost": self.cost,
+            "latency": self.latency.to_dict(),
+            "ttft": self.ttft.to_dict(),
+            "prompt_tokens": self.prompt_tokens.to_dict("tokens"),
+            "completion_tokens": self.completion_tokens.to_dict("tokens"),
+            "fallbacks": dict(self.fallbacks),
+            "errors": dict(self.errors),
+        }
+
+
+class LLMTelemetry:
+    """
+    LLM 호출 텔레메트리 (모델별)
+
+    - record_call(): 성공한 호출의 지연시간/TTFT/토큰/비용
+    - record_error(): 실패한 호출의 예외 클래스
+    - record_fallback(): 다른 모델로 대체된 호출 (원래 에러 포함)
+    """
+
+    def __init__(self):
+        self._models: dict[str, ModelTelemetry] = {}
+        self._lock = threading.Lock()
+
+    def _model(self, model_key: str) -> ModelTelemetry:
+        with self._lock:
+            return self._models.setdefault(model_key, ModelTelemetry())
+
+    def latency(self, model_key: str) -> LatencyHistogram:
+        """모델의 전체 지연시간 히스토그램 (헤징 마감 시간 계산용)"""
+        return self._model(model_key).latency
+
+    def record_call(
+        self,
+        model_key: str,
+        latency_ms: float,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: float,
+        ttft_ms: Optional[float] = None,
+        estimated: bool = False,
+        cached_tokens: int = 0,
+    ) -> None:
+        """성공한 호출 기록 (cached_tokens: prompt_tokens 중 캐시 적중분)"""
+        model = self._model(model_key)
+        model.latency.record(latency_ms)
+        if ttft_ms is not None:
+            model.ttft.record(ttft_ms)
+        model.prompt_tokens.record(prompt_tokens)
+        model.completion_tokens.record(completion_tokens)
+        with self._lock:
+            model.calls += 1
+            model.estimated_usage += int(estimated)
+            model.prompt_tokens_total += prompt_tokens
+            model.completion_tokens_total += completion_tokens
+            model.cached_prompt_tokens_total += cached_tokens
+            model.cache_hit_calls += int(cached_tokens > 0)
+            model.cost += cost
+
+    def record_error(self, model_key: str, error: BaseException) -> None:
+        """실패한 호출 기록"""
+        model = self._model(model_key)
+        name = type(error).__name__
+        with self._lock:
+            model.errors[name] = model.errors.get(name, 0) + 1
+
+    def record_fallback(self, model_key: str, target: str, error: BaseException) -> None:
+        """폴백 기록 (원래 모델의 에러 + 대체 모델)"""
+        self.record_error(model_key, error)
+        model = self._model(model_key)
+        with self._lock:
+            model.fallbacks[target] = model.fallbacks.get(target, 0) + 1
+
+    def get_stats(self) -> dict:
+        """모델별 텔레메트리 + 전체 합계"""
+        with self._lock:
+            models = dict(self._models)
+        per_model = {key: model.to_dict() for key, model in models.items()}
+        return {
+            "models": per_model,
+            "totals": {
+                "calls": sum(m["calls"] for m in per_model.values()),
+                "errors": sum(sum(m["errors"].values()) for m in per_model.values()),
+                "fallbacks": sum(sum(m["fallbacks"].values()) for m in per_model.values()),
+                "prompt_tokens": sum(m["prompt_tokens_total"] for m in per_model.values()),
+                "completion_tokens": sum(m["completion_tokens_total"] for m in per_model.values()),
+                "cached_prompt_tokens": sum(m["cached_prompt_tokens_total"] for m in per_model.values()),
+                "cost": sum(m["cost"] for m in per_model.values()),
+            },
+        }
@@ -6,13 +6,21 @@ Migration Script: .baby_memory/ JSON → Supabase
 사용법:
     cd e:\A2A\our-a2a-project
     .\.venv\Scripts\python.exe -m neural.baby.migrate_to_supabase
+
+벌크 모드 (배치 임베딩 + 청크 insert + 재개 가능):
+    python -m neural.baby.migrate_to_supabase --bulk
+    python -m neural.baby.migrate_to_supabase --bulk --dry-run      # 처리량 추정만
+    python -m neural.baby.migrate_to_supabase --bulk --reset        # 체크포인트 초기화
 """
 
+import argparse
+import asyncio
 import os
 import json
 import sys
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Optional
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -21,6 +29,79 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# 벌크 모드 설정
+EMBEDDING_BATCH_LIMIT = 2048   # OpenAI embeddings API 요청당 최대 입력 수
+DEFAULT_BATCH_SIZE = 100       # 청크당 레코드 수 (임베딩 1회 + insert 1회)
+DEFAULT_CONCURRENCY = 4        # 테이블 전체에서 동시에 처리할 청크 수
+CHECKPOINT_FILENAME = ".migration_checkpoint.json"
+
+# dry-run 추정용 기본 지연 (실측 불가 시)
+EST_EMBED_BATCH_SEC = 1.5
+EST_INSERT_CHUNK_SEC = 0.4
+
+
+def experience_embed_text(exp: dict) -> str:
+    """경험 임베딩용 텍스트"""
+    return f"{exp.get('request', '')} {exp.get('action', '')[:500]}"
+
+
+def concept_embed_text(name: str, info: Any) -> str:
+    """개념 임베딩용 텍스트"""
+    category = info.get("category", "") if isinstance(info, dict) else ""
+    return f"{name} {category}"
+
+
+def experience_row(exp: dict, embedding: list[float] = None) -> dict:
+    """episodic.json 항목 → experiences 행"""
+    row = {
+        "task": exp.get("request", ""),
+        "task_type": exp.get("task_type", "default"),
+        "output": exp.get("action", ""),
+        "success": exp.get("success", False),
+        "emotional_salience": exp.get("emotional_weight", 0.5),
+        "development_stage": 0,
+        "tags": [exp.get("task_type", "default")],
+    }
+    if embedding:
+        row["embedding"] = embedding
+    return row
+
+
+def concept_row(name: str, info: Any, embedding: list[float] = None) -> dict:
+    """semantic.json 항목 → semantic_concepts 행"""
+    row = {
+        "name": name,
+        "acquired_at_stage": 0,
+    }
+    category = info.get("category", "") if isinstance(info, dict) else ""
+    description = info.get("description", "") if isinstance(info, dict) else str(info)
+    if category:
+        row["category"] = category
+    if description:
+        row["description"] = description
+    if embedding:
+        row["embedding"] = embedding
+    return row
+
+
+def load_experience_records(episodic_path: str) -> list[dict]:
+    """episodic.json의 short_term + long_term (순서 고정)"""
+    if not os.path.exists(episodic_path):
+        return []
+    with open(episodic_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("short_term", []) + data.get("long_term", [])
+
+
+def load_concept_records(semantic_path: str) -> list[tuple[str, Any]]:
+    """semantic.json의 knowledge 항목 (순서 고정)"""
+    if not os.path.exists(semantic_path):
+        return []
+    with open(semantic_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return list(data.get("knowledge", {}).items())
+
+
 def migrate_baby_state(state_path: str, db) -> bool:
     """baby_state 마이그레이션"""
     if not os.path.exists(state_path):
@@ -78,8 +159,7 @@ def migrate_experiences(episodic_path: str, db, embedder) -> int:
             embedding = None
             if embedder:
                 try:
-                    embed_text = f"{exp.get('request', '')} {exp.get('action', '')[:500]}"
-                    embedding = embedder(embed_text)
+                    embedding = embedder(experience_embed_text(exp))
                 except Exception as e:
                     print(f"  [WARN] 임베딩 생성 실패: {e}")
 
@@ -126,9 +206,7 @@ def migrate_semantic(semantic_path: str, db, embedder) -> int:
             embedding = None
             if embedder:
                 try:
-                    category = info.get("category", "") if isinstance(info, dict) else ""
-                    embed_text = f"{name} {category}"
-                    embedding = embedder(embed_text)
+                    embedding = embedder(concept_embed_text(name, info))
                 except:
                     pass
 
@@ -201,8 +279,320 @@ def migrate_procedural(procedural_path: str, db) -> int:
     return migrated
 
 
-def main():
+class MigrationCheckpoint:
+    """
+    마이그레이션 진행 상황 파일
+
+    테이블별로 연속 완료 오프셋(offset)과 그 이후 완료된 구간(completed)을 기록
+    - 청크가 병렬로 끝나도 재개 시 중복 insert 없음
+    - 청크마다 원자적으로 저장 (임시 파일 → os.replace)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data: dict = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except Exception as e:
+                print(f"[WARN] 체크포인트 로드 실패 (처음부터 진행): {e}")
+                self._data = {}
+
+    def _table(self, table: str) -> dict:
+        return self._data.setdefault(table, {"offset": 0, "completed": []})
+
+    def offset(self, table: str) -> int:
+        """연속으로 완료된 레코드 수"""
+        return self._table(table)["offset"]
+
+    def is_done(self, table: str, start: int, end: int) -> bool:
+        """[start, end) 구간이 이미 완료되었는지"""
+        state = self._table(table)
+        if end <= state["offset"]:
+            return True
+        return any(s <= start and end <= e for s, e in state["completed"])
+
+    def mark_done(self, table: str, start: int, end: int) -> None:
+        """구간 완료 기록 후 연속 오프셋 전진"""
+        state = self._table(table)
+        state["completed"].append([start, end])
+        state["completed"].sort()
+
+        remaining = []
+        for s, e in state["completed"]:
+            if s <= state["offset"]:
+                state["offset"] = max(state["offset"], e)
+            else:
+                remaining.append([s, e])
+        state["completed"] = remaining
+        self.save()
+
+    def save(self) -> None:
+        self._data["updated_at"] = datetime.now().isoformat()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def reset(self) -> None:
+        self._data = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+async def bulk_migrate_table(
+    table: str,
+    records: list,
+    to_text: Callable[[Any], str],
+    to_row: Callable[[Any, Optional[list[float]]], dict],
+    insert_fn: Callable,
+    checkpoint: MigrationCheckpoint,
+    embed_batch: Optional[Callable[[list[str]], list[list[float]]]],
+    batch_size: int,
+    semaphore: asyncio.Semaphore,
+) -> int:
+    """
+    한 테이블 벌크 마이그레이션
+
+    청크마다 임베딩 1회(create_embeddings_batch) + insert 1회
+    청크는 공유 세마포어 범위 내에서 병렬 실행
+    임베딩/insert 실패 청크는 완료 기록하지 않음 → 재개 시 재시도
+    """
+    batch_size = max(1, min(batch_size, EMBEDDING_BATCH_LIMIT))
+    chunks = [
+        (start, min(start + batch_size, len(records)))
+        for start in range(0, len(records), batch_size)
+    ]
+    pending = [(s, e) for s, e in chunks if not checkpoint.is_done(table, s, e)]
+
+    print(f"[INFO] {table}: {len(records)}개 중 {len(records) - sum(e - s for s, e in pending)}개 완료됨, "
+          f"{len(pending)}개 청크 남음")
+
+    migrated = 0
+
+    async def run_chunk(start: int, end: int) -> int:
+        async with semaphore:
+            chunk = records[start:end]
+
+            embeddings = [None] * len(chunk)
+            if embed_batch:
+                try:
+                    embeddings = await asyncio.to_thread(embed_batch, [to_text(r) for r in chunk])
+                except Exception as e:
+                    # 임베딩 없이 넣고 완료 처리하면 재개 시 건너뛰어 영영 채워지지 않음
+                    raise RuntimeError(f"임베딩 실패, insert 생략 (재개 시 재시도): {e}") from e
+
+            rows = [to_row(record, embedding) for record, embedding in zip(chunk, embeddings)]
+            await insert_fn(rows)
+
+            checkpoint.mark_done(table, start, end)
+            print(f"  [OK] {table}[{start}:{end}] ({checkpoint.offset(table)}/{len(records)})")
+            return len(rows)
+
+    results = await asyncio.gather(
+        *(run_chunk(s, e) for s, e in pending),
+        return_exceptions=True,
+    )
+
+    for (start, end), result in zip(pending, results):
+        if isinstance(result, Exception):
+            print(f"  [ERROR] {table}[{start}:{end}]: {result}")
+        else:
+            migrated += result
+
+    print(f"[OK] {table} 벌크 마이그레이션: {migrated}개 저장, 재개 오프셋 {checkpoint.offset(table)}")
+    return migrated
+
+
+async def bulk_migrate(
+    memory_path: str,
+    db,
+    embed_batch: Optional[Callable[[list[str]], list[list[float]]]],
+    checkpoint: MigrationCheckpoint,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict:
+    """experiences / semantic_concepts 벌크 마이그레이션 (테이블 병렬)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    experiences = load_experience_records(os.path.join(memory_path, "episodic.json"))
+    concepts = load_concept_records(os.path.join(memory_path, "semantic.json"))
+
+    exp_count, concept_count = await asyncio.gather(
+        bulk_migrate_table(
+            "experiences",
+            experiences,
+            to_text=experience_embed_text,
+            to_row=experience_row,
+            insert_fn=db.insert_experiences_bulk,
+            checkpoint=checkpoint,
+            embed_batch=embed_batch,
+            batch_size=batch_size,
+            semaphore=semaphore,
+        ),
+        bulk_migrate_table(
+            "semantic_concepts",
+            concepts,
+            to_text=lambda item: concept_embed_text(*item),
+            to_row=lambda item, embedding: concept_row(item[0], item[1], embedding),
+            insert_fn=db.insert_concepts_bulk,
+            checkpoint=checkpoint,
+            embed_batch=embed_batch,
+            batch_size=batch_size,
+            semaphore=semaphore,
+        ),
+    )
+
+    return {"experiences": exp_count, "semantic_concepts": concept_count}
+
+
+def estimate_throughput(
+    memory_path: str,
+    checkpoint: MigrationCheckpoint,
+    embed_batch: Optional[Callable[[list[str]], list[list[float]]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict:
+    """
+    dry-run: 남은 작업량과 예상 소요 시간 계산 (DB 쓰기 없음)
+
+    임베딩이 활성화되어 있으면 샘플 1배치를 실측하여 추정에 사용
+    """
+    batch_size = max(1, min(batch_size, EMBEDDING_BATCH_LIMIT))
+    experiences = load_experience_records(os.path.join(memory_path, "episodic.json"))
+    concepts = load_concept_records(os.path.join(memory_path, "semantic.json"))
+
+    tables = {
+        "experiences": (experiences, experience_embed_text),
+        "semantic_concepts": (concepts, lambda item: concept_embed_text(*item)),
+    }
+
+    embed_sec = EST_EMBED_BATCH_SEC
+    measured = False
+    sample = [to_text(r) for records, to_text in tables.values() for r in records][:min(batch_size, 16)]
+    if embed_batch and sample:
+        try:
+            start = time.time()
+            embed_batch(sample)
+            # 배치 크기에 비례하지 않는 고정 지연이 대부분 → 샘플 지연을 그대로 사용
+            embed_sec = time.time() - start
+            measured = True
+        except Exception as e:
+            print(f"[WARN] 임베딩 실측 실패, 기본값 사용: {e}")
+
+    per_chunk_sec = (embed_sec if embed_batch else 0.0) + EST_INSERT_CHUNK_SEC
+    remaining_records = 0
+    remaining_chunks = 0
+    summary = {}
+
+    for table, (records, _) in tables.items():
+        chunks = [
+            (s, min(s + batch_size, len(records)))
+            for s in range(0, len(records), batch_size)
+        ]
+        pending = [(s, e) for s, e in chunks if not checkpoint.is_done(table, s, e)]
+        pending_records = sum(e - s for s, e in pending)
+        remaining_records += pending_records
+        remaining_chunks += len(pending)
+        summary[table] = {
+            "total": len(records),
+            "remaining": pending_records,
+            "chunks": len(pending),
+        }
+
+    waves = -(-remaining_chunks // max(1, concurrency))
+    est_seconds = waves * per_chunk_sec
+
+    summary["estimate"] = {
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+        "per_chunk_sec": round(per_chunk_sec, 3),
+        "embedding_latency_measured": measured,
+        "est_seconds": round(est_seconds, 1),
+        "records_per_sec": round(remaining_records / est_seconds, 1) if est_seconds else 0.0,
+    }
+    return summary
+
+
+def run_bulk(args, memory_path: str) -> None:
+    """벌크 모드 실행"""
+    checkpoint_path = args.checkpoint or os.path.join(memory_path, CHECKPOINT_FILENAME)
+    checkpoint = MigrationCheckpoint(checkpoint_path)
+    if args.reset:
+        checkpoint.reset()
+        print(f"[INFO] 체크포인트 초기화: {checkpoint_path}")
+
+    embed_batch = None
+    if not args.no_embed:
+        try:
+            from neural.baby.embeddings import create_embeddings_batch, get_openai_client
+            get_openai_client()
+            embed_batch = create_embeddings_batch
+            print("[OK] OpenAI 배치 임베딩 활성화")
+        except Exception as e:
+            print(f"[WARN] OpenAI 임베딩 비활성화: {e}")
+
+    if args.dry_run:
+        summary = estimate_throughput(
+            memory_path, checkpoint, embed_batch, args.batch_size, args.concurrency
+        )
+        print("\n[DRY RUN]")
+        for table in ("experiences", "semantic_concepts"):
+            info = summary[table]
+            print(f"  - {table}: 남은 {info['remaining']}/{info['total']}개, {info['chunks']}개 청크")
+        est = summary["estimate"]
+        source = "실측" if est["embedding_latency_measured"] else "기본값"
+        print(f"  - 청크당 {est['per_chunk_sec']}s ({source}), 동시 {est['concurrency']}")
+        print(f"  - 예상 소요: {est['est_seconds']}s (~{est['records_per_sec']} records/s)")
+        return
+
+    from neural.baby.db import get_async_brain_db, close_async_supabase_client
+
+    async def run():
+        db = get_async_brain_db()
+        try:
+            state_path = os.path.join(memory_path, "state.json")
+            if os.path.exists(state_path):
+                from neural.baby.db import get_brain_db
+                await asyncio.to_thread(migrate_baby_state, state_path, get_brain_db())
+
+            start = time.time()
+            counts = await bulk_migrate(
+                memory_path, db, embed_batch, checkpoint, args.batch_size, args.concurrency
+            )
+            elapsed = time.time() - start
+            total = sum(counts.values())
+            print(f"\n[OK] 벌크 마이그레이션: {total}개, {elapsed:.1f}s "
+                  f"({total / elapsed if elapsed else 0:.1f} records/s)")
+        finally:
+            await close_async_supabase_client()
+
+    asyncio.run(run())
+
+    # 절차 패턴은 upsert 누적 방식이라 기존 경로 사용
+    from neural.baby.db import get_brain_db
+    migrate_procedural(os.path.join(memory_path, "procedural.json"), get_brain_db())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Baby Brain Migration: JSON → Supabase")
+    parser.add_argument("--bulk", action="store_true", help="배치 임베딩 + 청크 insert + 재개 가능 모드")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"청크 크기 (최대 {EMBEDDING_BATCH_LIMIT})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="동시에 처리할 청크 수 (테이블 전체)")
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 파일 경로")
+    parser.add_argument("--reset", action="store_true", help="체크포인트 초기화 후 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="처리량/소요 시간 추정만 (DB 쓰기 없음)")
+    parser.add_argument("--no-embed", action="store_true", help="임베딩 없이 마이그레이션")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """메인 마이그레이션 함수"""
+    args = parse_args(argv)
+
     print("=" * 60)
     print("Baby Brain Migration: JSON → Supabase")
     print("=" * 60)
@@ -217,6 +607,10 @@ def main():
         print(f"[ERROR] .baby_memory/ 디렉토리가 없습니다!")
         return
 
+    if args.bulk:
+        run_bulk(args, memory_path)
+        return
+
     # Supabase 연결
     print("\n[INFO] Supabase 연결 중...")
     try:
@@ -14,7 +14,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
+import base64
 import json
+import uuid
+import zlib
 
 
 class SnapshotType(Enum):
@@ -93,16 +97,133 @@ class RestorePoint:
     strategy_weights: Dict[str, float]
 
 
+# ==================== 델타 스냅샷 인코딩 ====================
+
+SNAPSHOT_ENCODING = "zlib+json/v1"
+KEYFRAME_INTERVAL = 10  # N개 델타마다 전체 키프레임 저장
+STATE_SECTIONS = ("baby_state", "active_rules", "strategy_weights", "concept_strengths")
+# 요청마다 바뀌는 행 메타데이터 → 비교/저장에서 제외 (변경 없는 체크포인트는 생략되도록)
+VOLATILE_STATE_KEYS = frozenset({"created_at", "updated_at", "last_updated", "last_active_at", "last_applied_at"})
+
+
+def _strip_volatile(row: Dict) -> Dict:
+    return {k: v for k, v in row.items() if k not in VOLATILE_STATE_KEYS}
+
+
+def normalize_learning_state(state: Dict[str, Any]) -> Dict[str, Dict]:
+    """
+    수집된 학습 상태를 섹션별 dict로 정규화
+
+    active_rules는 리스트 → {rule_id: rule} 로 변환하여 키 단위 diff 가능하게 함
+    baby_state/규칙 행의 타임스탬프(VOLATILE_STATE_KEYS)는 제외
+    """
+    rules = state.get('active_rules') or []
+    if isinstance(rules, list):
+        rules = {
+            str(r.get('id') or r.get('rule_name') or i): _strip_volatile(r)
+            for i, r in enumerate(rules)
+        }
+
+    return {
+        'baby_state': _strip_volatile(state.get('baby_state') or {}),
+        'active_rules': {key: _strip_volatile(rule) for key, rule in rules.items()},
+        'strategy_weights': dict(state.get('strategy_weights') or {}),
+        'concept_strengths': dict(state.get('concept_strengths') or {}),
+    }
+
+
+def compute_state_delta(previous: Dict[str, Dict], current: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    두 정규화 상태의 차이 계산
+
+    Returns:
+        {section: {'set': {key: value}, 'del': [key, ...]}} (변경 없는 섹션 생략)
+    """
+    delta = {}
+    for section in STATE_SECTIONS:
+        old = previous.get(section, {})
+        new = current.get(section, {})
+        changed = {k: v for k, v in new.items() if k not in old or old[k] != v}
+        removed = [k for k in old if k not in new]
+        if changed or removed:
+            delta[section] = {'set': changed, 'del': removed}
+    return delta
+
+
+def apply_state_delta(base: Dict[str, Dict], delta: Dict[str, Dict]) -> Dict[str, Dict]:
+    """정규화 상태에 델타 적용 (base는 변경하지 않음)"""
+    result = {section: dict(base.get(section, {})) for section in STATE_SECTIONS}
+    for section, change in delta.items():
+        target = result.setdefault(section, {})
+        for key in change.get('del', []):
+            target.pop(key, None)
+        target.update(change.get('set', {}))
+    return result
+
+
+def encode_snapshot_payload(data: Dict) -> str:
+    """JSON → zlib 압축 → base64 문자열"""
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+    return base64.b64encode(zlib.compress(raw.encode('utf-8'), 9)).decode('ascii')
+
+
+def decode_snapshot_payload(payload: str) -> Dict:
+    """encode_snapshot_payload의 역변환"""
+    return json.loads(zlib.decompress(base64.b64decode(payload)).decode('utf-8'))
+
+
+def denormalize_learning_state(state: Dict[str, Dict]) -> Dict[str, Any]:
+    """정규화 상태 → 복원용 형태 (active_rules를 리스트로)"""
+    return {
+        'baby_state': state.get('baby_state', {}),
+        'active_rules': list(state.get('active_rules', {}).values()),
+        'strategy_weights': state.get('strategy_weights', {}),
+        'concept_strengths': state.get('concept_strengths', {}),
+    }
+
+
+def snapshot_row_to_state(row: Dict) -> Dict[str, Any]:
+    """레거시(비압축) 스냅샷 행 → 복원용 형태"""
+    return {
+        'baby_state': row.get('baby_state') or {
+            'development_stage': row.get('development_stage', 0),
+            **(row.get('emotional_state') or {}),
+        },
+        'active_rules': row.get('active_prompt_rules') or [],
+        'strategy_weights': row.get('strategy_weights') or {},
+        'concept_strengths': row.get('concept_strengths') or {},
+    }
+
+
 class SessionManager:
     """
     세션 관리자
 
     학습 세션의 생명주기 관리
+    - 독립적인 조회는 asyncio.gather로 동시 실행 (왕복 깊이 1)
+    - 핵심 학습은 한 번의 bulk insert로 저장
+    - 스냅샷은 직전 대비 델타만 압축 저장 (KEYFRAME_INTERVAL마다 전체 키프레임)
     """
 
     def __init__(self, supabase_client=None):
         self.db = supabase_client
         self._current_session_id: Optional[str] = None
+        self._session_started_at: Optional[str] = None
+
+        # 델타 체인 상태
+        self._last_state: Optional[Dict[str, Dict]] = None
+        self._last_snapshot_id: Optional[str] = None
+        self._keyframe_id: Optional[str] = None
+        self._sequence = 0
+        # 델타 체인 읽기(diff 기준) → insert → 갱신을 한 스냅샷씩 (동시 체크포인트가 같은 기준에 diff 방지)
+        self._snapshot_lock = asyncio.Lock()
+
+    def _reset_delta_chain(self):
+        """다음 스냅샷을 키프레임으로 강제"""
+        self._last_state = None
+        self._last_snapshot_id = None
+        self._keyframe_id = None
+        self._sequence = 0
 
     async def start_session(self, name: str = None) -> str:
         """세션 시작"""
@@ -123,7 +244,10 @@ class SessionManager:
             }
         }).execute()
 
-        self._current_session_id = result.data[0]['id'] if result.data else None
+        session = result.data[0] if result.data else {}
+        self._current_session_id = session.get('id')
+        self._session_started_at = session.get('started_at')
+        self._reset_delta_chain()
 
         # 초기 스냅샷 생성
         await self._create_snapshot(SnapshotType.CHECKPOINT, "Session start")
@@ -138,22 +262,54 @@ class SessionManager:
         result = await self.db.table('baby_state').select('*').limit(1).execute()
         return result.data[0] if result.data else {}
 
+    async def _collect_learning_state(self) -> Dict[str, Any]:
+        """
+        스냅샷/복원 포인트에 필요한 상태를 한 번에 수집
+
+        baby_state, 활성 규칙, 전략 가중치, 상위 개념 강도를 동시에 조회
+        """
+        state_result, rules_result, strategy_result, concepts_result = await asyncio.gather(
+            self.db.table('baby_state').select('*').limit(1).execute(),
+            self.db.table('learned_prompt_rules').select('*').eq('is_active', True).execute(),
+            self.db.table('strategy_effectiveness').select(
+                'strategy_name, effectiveness_score'
+            ).execute(),
+            self.db.table('semantic_concepts').select(
+                'name, strength'
+            ).order('strength', desc=True).limit(20).execute(),
+        )
+
+        return {
+            'baby_state': state_result.data[0] if state_result.data else {},
+            'active_rules': rules_result.data or [],
+            'strategy_weights': {
+                s['strategy_name']: s['effectiveness_score']
+                for s in strategy_result.data or []
+            },
+            'concept_strengths': {
+                c['name']: c['strength']
+                for c in concepts_result.data or []
+            },
+        }
+
     async def end_session(self, key_learnings: List[str] = None):
-        """세션 종료"""
+        """
+        세션 종료
+
+        1단계: 상태 수집 + 세션 통계 + 핵심 학습 원천 조회 (동시)
+        2단계: 스냅샷 / 세션 업데이트 / 복원 포인트 / 핵심 학습 쓰기 (동시)
+        """
         if not self.db or not self._current_session_id:
             return
 
-        # 종료 스냅샷 생성
-        await self._create_snapshot(SnapshotType.END_SESSION, "Session end")
-
-        # 세션 통계 계산
-        stats = await self._calculate_session_stats()
-
-        # 현재 상태
-        baby_state = await self._get_current_baby_state()
+        state, stats, core_rows = await asyncio.gather(
+            self._collect_learning_state(),
+            self._calculate_session_stats(),
+            self._collect_core_learnings(),
+        )
+        baby_state = state['baby_state']
 
-        # 세션 종료 업데이트
-        await self.db.table('learning_sessions').update({
+        session_update = self.db.table('learning_sessions').update({
             'ended_at': datetime.now().isoformat(),
             'duration_ms': stats.get('duration_ms', 0),
             'development_stage_end': baby_state.get('development_stage', 0),
@@ -165,50 +321,63 @@ class SessionManager:
             'key_learnings': key_learnings or []
         }).eq('id', self._current_session_id).execute()
 
-        # 복원 포인트 생성
-        await self._create_restore_point(RestoreType.AUTO)
+        # 스냅샷 id를 미리 생성하여 복원 포인트가 병렬로 참조할 수 있게 함
+        snapshot_id = str(uuid.uuid4())
 
-        # 핵심 학습 추출
-        await self._extract_core_learnings()
+        await asyncio.gather(
+            self._insert_snapshot(SnapshotType.END_SESSION, state, snapshot_id=snapshot_id),
+            session_update,
+            self._insert_restore_point(RestoreType.AUTO, snapshot_id),
+            self._insert_core_learnings(core_rows),
+        )
 
         self._current_session_id = None
+        self._session_started_at = None
+        self._reset_delta_chain()
 
-    async def _calculate_session_stats(self) -> Dict:
-        """세션 통계 계산"""
-        if not self.db or not self._current_session_id:
-            return {}
+    async def _get_session_started_at(self) -> Optional[str]:
+        """세션 시작 시각 (start_session에서 받은 값 우선)"""
+        if self._session_started_at:
+            return self._session_started_at
 
-        # 세션 정보
         session = await self.db.table('learning_sessions').select(
             'started_at'
         ).eq('id', self._current_session_id).single().execute()
 
         if not session.data:
+            return None
+
+        self._session_started_at = session.data['started_at']
+        return self._session_started_at
+
+    async def _calculate_session_stats(self) -> Dict:
+        """세션 통계 계산"""
+        if not self.db or not self._current_session_id:
             return {}
 
-        started_at = datetime.fromisoformat(
-            session.data['started_at'].replace('Z', '+00:00')
-        )
+        started_at_raw = await self._get_session_started_at()
+        if not started_at_raw:
+            return {}
+
+        started_at = datetime.fromisoformat(started_at_raw.replace('Z', '+00:00'))
         duration_ms = int((datetime.now(started_at.tzinfo) - started_at).total_seconds() * 1000)
 
-        # 세션 동안 생성된 경험 수
-        exp_result = await self.db.table('experiences').select(
-            'id, success', count='exact'
-        ).gte('created_at', session.data['started_at']).execute()
+        # 경험 / 개념 / 진화 통계 동시 조회
+        exp_result, concept_result, evo_result = await asyncio.gather(
+            self.db.table('experiences').select(
+                'id, success', count='exact'
+            ).gte('created_at', started_at_raw).execute(),
+            self.db.table('semantic_concepts').select(
+                'id', count='exact'
+            ).gte('created_at', started_at_raw).execute(),
+            self.db.table('prompt_evolution').select(
+                'was_adopted', count='exact'
+            ).gte('created_at', started_at_raw).execute(),
+        )
 
         experiences = exp_result.data or []
         successes = sum(1 for e in experiences if e.get('success'))
 
-        # 생성된 개념 수
-        concept_result = await self.db.table('semantic_concepts').select(
-            'id', count='exact'
-        ).gte('created_at', session.data['started_at']).execute()
-
-        # 진화 통계
-        evo_result = await self.db.table('prompt_evolution').select(
-            'was_adopted', count='exact'
-        ).gte('created_at', session.data['started_at']).execute()
-
         evolutions = evo_result.data or []
         adopted = sum(1 for e in evolutions if e.get('was_adopted'))
 
@@ -225,30 +394,59 @@ class SessionManager:
         self,
         snapshot_type: SnapshotType,
         note: str = ""
-    ):
+    ) -> Optional[str]:
         """스냅샷 생성"""
         if not self.db or not self._current_session_id:
-            return
+            return None
 
-        # 현재 상태들 수집
-        baby_state = await self._get_current_baby_state()
+        state = await self._collect_learning_state()
+        return await self._insert_snapshot(snapshot_type, state)
 
-        # 활성 규칙
-        rules_result = await self.db.table('learned_prompt_rules').select(
-            'rule_name, rule_text, priority'
-        ).eq('is_active', True).execute()
+    async def _insert_snapshot(
+        self,
+        snapshot_type: SnapshotType,
+        state: Dict[str, Any],
+        snapshot_id: str = None,
+    ) -> Optional[str]:
+        """
+        수집된 상태로 learning_snapshots 행 저장 (델타 인코딩)
+
+        - 세션 시작/종료, 마일스톤, KEYFRAME_INTERVAL 도달 시 키프레임 (전체 상태)
+        - 그 외에는 직전 스냅샷 대비 델타만 저장
+        - 변경이 없는 체크포인트는 저장을 생략하고 직전 스냅샷 id 반환
+
+        Returns:
+            스냅샷 id (복원 포인트가 참조)
+        """
+        async with self._snapshot_lock:
+            return await self._insert_snapshot_locked(snapshot_type, state, snapshot_id)
+
+    async def _insert_snapshot_locked(
+        self,
+        snapshot_type: SnapshotType,
+        state: Dict[str, Any],
+        snapshot_id: Optional[str],
+    ) -> Optional[str]:
+        current = normalize_learning_state(state)
+        is_keyframe = (
+            self._last_state is None
+            or snapshot_type != SnapshotType.CHECKPOINT
+            or self._sequence >= KEYFRAME_INTERVAL
+        )
 
-        # 전략 가중치
-        strategy_result = await self.db.table('strategy_effectiveness').select(
-            'strategy_name, effectiveness_score'
-        ).execute()
+        if is_keyframe:
+            payload = current
+        else:
+            payload = compute_state_delta(self._last_state, current)
+            if not payload and snapshot_id is None:
+                return self._last_snapshot_id
 
-        # 상위 개념 강도
-        concepts_result = await self.db.table('semantic_concepts').select(
-            'name, strength'
-        ).order('strength', desc=True).limit(20).execute()
+        snapshot_id = snapshot_id or str(uuid.uuid4())
+        sequence = 0 if is_keyframe else self._sequence + 1
+        baby_state = current['baby_state']
 
         await self.db.table('learning_snapshots').insert({
+            'id': snapshot_id,
             'session_id': self._current_session_id,
             'snapshot_type': snapshot_type.value,
             'development_stage': baby_state.get('development_stage', 0),
@@ -257,41 +455,40 @@ class SessionManager:
                 'joy': baby_state.get('joy', 0.3),
                 'frustration': baby_state.get('frustration', 0.1)
             },
-            'active_prompt_rules': rules_result.data or [],
-            'strategy_weights': {
-                s['strategy_name']: s['effectiveness_score']
-                for s in strategy_result.data or []
-            },
-            'concept_strengths': {
-                c['name']: c['strength']
-                for c in concepts_result.data or []
-            }
+            'is_keyframe': is_keyframe,
+            'base_snapshot_id': None if is_keyframe else self._keyframe_id,
+            'parent_snapshot_id': self._last_snapshot_id,
+            'sequence': sequence,
+            'payload_encoding': SNAPSHOT_ENCODING,
+            'payload': encode_snapshot_payload(payload),
         }).execute()
 
+        self._last_state = current
+        self._last_snapshot_id = snapshot_id
+        self._sequence = sequence
+        if is_keyframe:
+            self._keyframe_id = snapshot_id
+
+        return snapshot_id
+
     async def _create_restore_point(self, restore_type: RestoreType):
         """복원 포인트 생성"""
         if not self.db or not self._current_session_id:
             return
 
-        baby_state = await self._get_current_baby_state()
-
-        rules_result = await self.db.table('learned_prompt_rules').select(
-            '*'
-        ).eq('is_active', True).execute()
+        snapshot_id = await self._create_snapshot(SnapshotType.CHECKPOINT, "Restore point")
+        await self._insert_restore_point(restore_type, snapshot_id)
 
-        strategy_result = await self.db.table('strategy_effectiveness').select(
-            'strategy_name, effectiveness_score'
-        ).execute()
+    async def _insert_restore_point(self, restore_type: RestoreType, snapshot_id: str):
+        """
+        session_restore_points 행 저장
 
+        전체 상태 대신 스냅샷 id만 참조 (복원 시 키프레임 + 델타 재생)
+        """
         await self.db.table('session_restore_points').insert({
             'session_id': self._current_session_id,
             'restore_type': restore_type.value,
-            'baby_state': baby_state,
-            'active_rules': rules_result.data or [],
-            'strategy_weights': {
-                s['strategy_name']: s['effectiveness_score']
-                for s in strategy_result.data or []
-            },
+            'snapshot_id': snapshot_id,
             'expires_at': (datetime.now() + timedelta(days=30)).isoformat()
         }).execute()
 
@@ -300,15 +497,27 @@ class SessionManager:
         if not self.db or not self._current_session_id:
             return
 
-        # 1. 채택된 진화에서 학습 추출
-        evolutions = await self.db.table('prompt_evolution').select(
-            'id, failure_pattern, improvement_hypothesis, post_evolution_success_rate'
-        ).eq('was_adopted', True).gte(
-            'adopted_at', (datetime.now() - timedelta(days=1)).isoformat()
-        ).execute()
+        rows = await self._collect_core_learnings()
+        await self._insert_core_learnings(rows)
 
+    async def _collect_core_learnings(self) -> List[Dict]:
+        """채택된 진화 + 개선된 인사이트에서 core_learnings 행 구성"""
+        since = (datetime.now() - timedelta(days=1)).isoformat()
+
+        evolutions, insights = await asyncio.gather(
+            self.db.table('prompt_evolution').select(
+                'id, failure_pattern, improvement_hypothesis, post_evolution_success_rate'
+            ).eq('was_adopted', True).gte('adopted_at', since).execute(),
+            self.db.table('self_reflection_insights').select(
+                'insight_type, insight_text, confidence'
+            ).eq('outcome_after_apply', 'improved').gte('created_at', since).execute(),
+        )
+
+        rows = []
+
+        # 1. 채택된 진화에서 학습 추출
         for evo in evolutions.data or []:
-            await self.db.table('core_learnings').insert({
+            rows.append({
                 'learning_type': 'prompt_rule',
                 'summary': evo.get('improvement_hypothesis', ''),
                 'detailed_content': {
@@ -317,15 +526,9 @@ class SessionManager:
                 },
                 'source_session_ids': [self._current_session_id],
                 'confidence': evo.get('post_evolution_success_rate', 0.5)
-            }).execute()
+            })
 
         # 2. 새로운 인사이트 추출
-        insights = await self.db.table('self_reflection_insights').select(
-            'insight_type, insight_text, confidence'
-        ).eq('outcome_after_apply', 'improved').gte(
-            'created_at', (datetime.now() - timedelta(days=1)).isoformat()
-        ).execute()
-
         for insight in insights.data or []:
             learning_type = {
                 'failure_pattern': 'failure_lesson',
@@ -333,13 +536,20 @@ class SessionManager:
                 'improvement_idea': 'strategy_insight'
             }.get(insight.get('insight_type'), 'domain_knowledge')
 
-            await self.db.table('core_learnings').insert({
+            rows.append({
                 'learning_type': learning_type,
                 'summary': insight.get('insight_text', ''),
                 'detailed_content': {},
                 'source_session_ids': [self._current_session_id],
                 'confidence': insight.get('confidence', 0.5)
-            }).execute()
+            })
+
+        return rows
+
+    async def _insert_core_learnings(self, rows: List[Dict]):
+        """core_learnings bulk insert (한 번의 요청)"""
+        if rows:
+            await self.db.table('core_learnings').insert(rows).execute()
 
     @property
     def current_session_id(self) -> Optional[str]:
@@ -369,6 +579,50 @@ class LearningRestorer:
 
         return result.data[0] if result.data else None
 
+    async def load_snapshot_state(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷 상태 재구성
+
+        키프레임과 해당 키프레임 이후의 델타를 동시에 조회한 뒤 순서대로 재생
+        (레거시 전체 스냅샷 행도 지원)
+        """
+        if not self.db or not snapshot_id:
+            return None
+
+        target = await self.db.table('learning_snapshots').select(
+            '*'
+        ).eq('id', snapshot_id).single().execute()
+
+        if not target.data:
+            return None
+
+        row = target.data
+        if not row.get('payload'):
+            return snapshot_row_to_state(row)
+
+        if row.get('is_keyframe'):
+            return denormalize_learning_state(decode_snapshot_payload(row['payload']))
+
+        keyframe, deltas = await asyncio.gather(
+            self.db.table('learning_snapshots').select(
+                'id, payload'
+            ).eq('id', row['base_snapshot_id']).single().execute(),
+            self.db.table('learning_snapshots').select(
+                'id, sequence, payload'
+            ).eq('base_snapshot_id', row['base_snapshot_id']).lte(
+                'sequence', row['sequence']
+            ).order('sequence').execute(),
+        )
+
+        if not keyframe.data:
+            return None
+
+        state = decode_snapshot_payload(keyframe.data['payload'])
+        for delta_row in deltas.data or []:
+            state = apply_state_delta(state, decode_snapshot_payload(delta_row['payload']))
+
+        return denormalize_learning_state(state)
+
     async def restore_from_point(self, restore_point_id: str) -> bool:
         """복원 포인트에서 복원"""
         if not self.db:
@@ -384,6 +638,12 @@ class LearningRestorer:
 
         data = point.data
 
+        # 델타 스냅샷 참조 시 재구성, 레거시 행은 그대로 사용
+        if data.get('snapshot_id'):
+            data = await self.load_snapshot_state(data['snapshot_id'])
+            if not data:
+                return False
+
         # 1. baby_state 복원
         baby_state = data.get('baby_state', {})
         if baby_state:
@@ -407,18 +667,21 @@ class LearningRestorer:
                 'is_active': False
             }).execute()
 
-            # 저장된 규칙만 활성화
-            for rule in active_rules:
+            # 저장된 규칙만 활성화 (한 번의 요청)
+            rule_ids = [rule.get('id') for rule in active_rules if rule.get('id')]
+            if rule_ids:
                 await self.db.table('learned_prompt_rules').update({
                     'is_active': True
-                }).eq('id', rule.get('id')).execute()
+                }).in_('id', rule_ids).execute()
 
-        # 3. 전략 가중치 복원
+        # 3. 전략 가중치 복원 (동시 실행)
         strategy_weights = data.get('strategy_weights', {})
-        for strategy_name, weight in strategy_weights.items():
-            await self.db.table('strategy_effectiveness').update({
+        await asyncio.gather(*(
+            self.db.table('strategy_effectiveness').update({
                 'effectiveness_score': weight
             }).eq('strategy_name', strategy_name).execute()
+            for strategy_name, weight in strategy_weights.items()
+        ))
 
         return True
 
@@ -515,8 +778,8 @@ class ContinuityTracker:
             return {}
 
         # 개념 강도 비교
-        from_concepts = from_snapshot.get('concept_strengths', {})
-        to_concepts = to_snapshot.get('concept_strengths', {})
+        from_concepts = self._concept_strengths(from_snapshot)
+        to_concepts = self._concept_strengths(to_snapshot)
 
         retained = {}
         lost = {}
@@ -576,6 +839,13 @@ class ContinuityTracker:
 
         return result
 
+    @staticmethod
+    def _concept_strengths(snapshot: Dict) -> Dict[str, float]:
+        """스냅샷 행의 개념 강도 (세션 시작/종료 스냅샷은 항상 키프레임)"""
+        if snapshot.get('payload') and snapshot.get('is_keyframe'):
+            return decode_snapshot_payload(snapshot['payload']).get('concept_strengths', {})
+        return snapshot.get('concept_strengths') or {}
+
     async def _get_end_snapshot(self, session_id: str) -> Optional[Dict]:
         """세션 종료 스냅샷"""
         if not self.db:
@@ -610,7 +880,7 @@ class PersistentLearningSubstrate:
     세션 간 학습 상태 영속화 및 복원
 
     Usage:
-        substrate = PersistentLearningSubstrate(supabase_client)
+        substrate = await create_persistent_substrate()
 
         # 세션 시작
         session_id = await substrate.start_session("Training Session 1")
@@ -671,7 +941,7 @@ class PersistentLearningSubstrate:
         await self.session_manager.end_session(key_learnings)
 
     async def checkpoint(self):
-        """체크포인트 생성"""
+        """체크포인트 생성 (직전 대비 델타만 저장)"""
         await self.session_manager._create_snapshot(
             SnapshotType.CHECKPOINT,
             "Manual checkpoint"
@@ -713,25 +983,22 @@ class PersistentLearningSubstrate:
         if not self.db:
             return {}
 
-        # 세션 수
-        sessions = await self.db.table('learning_sessions').select(
-            'id', count='exact'
-        ).execute()
-
-        # 스냅샷 수
-        snapshots = await self.db.table('learning_snapshots').select(
-            'id', count='exact'
-        ).execute()
-
-        # 핵심 학습 수
-        learnings = await self.db.table('core_learnings').select(
-            'id', count='exact'
-        ).eq('is_active', True).execute()
-
-        # 평균 연속성 점수
-        continuity = await self.db.table('learning_continuity').select(
-            'continuity_score'
-        ).execute()
+        sessions, snapshots, learnings, continuity, restore_points = await asyncio.gather(
+            # 세션 수
+            self.db.table('learning_sessions').select('id', count='exact').execute(),
+            # 스냅샷 수
+            self.db.table('learning_snapshots').select('id', count='exact').execute(),
+            # 핵심 학습 수
+            self.db.table('core_learnings').select(
+                'id', count='exact'
+            ).eq('is_active', True).execute(),
+            # 평균 연속성 점수
+            self.db.table('learning_continuity').select('continuity_score').execute(),
+            # 복원 포인트 수
+            self.db.table('session_restore_points').select(
+                'id', count='exact'
+            ).eq('is_valid', True).execute(),
+        )
 
         avg_continuity = 0
         if continuity.data:
@@ -739,11 +1006,6 @@ class PersistentLearningSubstrate:
                 c['continuity_score'] for c in continuity.data
             ) / len(continuity.data)
 
-        # 복원 포인트 수
-        restore_points = await self.db.table('session_restore_points').select(
-            'id', count='exact'
-        ).eq('is_valid', True).execute()
-
         return {
             'total_sessions': sessions.count or 0,
             'total_snapshots': snapshots.count or 0,
@@ -752,3 +1014,27 @@ class PersistentLearningSubstrate:
             'valid_restore_points': restore_points.count or 0,
             'current_session_id': self.session_manager.current_session_id
         }
+
+
+# 편의 함수
+async def create_persistent_substrate(supabase_url: str = None, supabase_key: str = None):
+    """
+    PersistentLearningSubstrate 생성 헬퍼
+
+    URL/키를 지정하지 않으면 공유 HTTP/2 풀 기반 AsyncBrainDatabase 사용
+    """
+    if not supabase_url and not supabase_key:
+        from .db import get_async_brain_db
+        return PersistentLearningSubstrate(get_async_brain_db())
+
+    from supabase import acreate_client
+    import os
+
+    url = supabase_url or os.getenv('SUPABASE_URL')
+    key = supabase_key or os.getenv('SUPABASE_ANON_KEY')
+
+    if not url or not key:
+        raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY required")
+
+    client = await acreate_client(url, key)
+    return PersistentLearningSubstrate(client)
@@ -0,0 +1,230 @@
+"""
+Rate Limiter - 제공자별 LLM 요청 스케줄러
+
+제공자(OpenAI/Google)마다:
+- 토큰 버킷: 분당 요청 수 제한 (burst 허용)
+- 동시 실행 제한: in-flight 요청 수 상한
+- 우선순위 대기열: 사용자 요청(INTERACTIVE) > 일반 > 백그라운드(World Model 검증 등)
+- 429/retry-after 대응: 쿨다운 + 속도 절반 감소, 성공 시 점진 회복 (AIMD)
+"""
+
+import heapq
+import itertools
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+MAX_RATE_LIMIT_RETRIES = 4
+BASE_BACKOFF_S = 1.0
+MAX_BACKOFF_S = 60.0
+MIN_RATE_FRACTION = 0.1     # 429 연속 시 설정 속도의 10%까지 감소
+RATE_RECOVERY_STEP = 0.05   # 성공 1회당 회복량 (설정 속도 대비)
+
+
+class RequestPriority(IntEnum):
+    """요청 우선순위 (작을수록 먼저)"""
+    INTERACTIVE = 0   # 사용자 대면 (코더 호출)
+    NORMAL = 1
+    BACKGROUND = 2    # World Model 예측/검증 등
+
+
+@dataclass
+class ProviderLimits:
+    """제공자 한도"""
+    requests_per_minute: float
+    max_concurrency: int
+    burst: int = 10
+
+
+# 기본 한도 (계정 티어에 맞게 조정)
+DEFAULT_PROVIDER_LIMITS = {
+    "openai": ProviderLimits(requests_per_minute=500, max_concurrency=16, burst=20),
+    "google": ProviderLimits(requests_per_minute=300, max_concurrency=16, burst=20),
+}
+
+
+class RateLimitError(Exception):
+    """재시도 후에도 계속 제한된 요청"""
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """429 / quota 초과 에러 여부 (SDK별 예외 타입에 의존하지 않음)"""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "resource_exhausted" in message
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """retry-after 헤더/메시지에서 대기 시간(초) 추출"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    match = re.search(r"retry(?:[ _-]?after|Delay)?\D{0,10}(\d+(?:\.\d+)?)\s*s", str(error), re.I)
+    return float(match.group(1)) if match else None
+
+
+class ProviderScheduler:
+    """
+    단일 제공자 스케줄러
+
+    acquire()는 우선순위 순서대로 슬롯을 배정.
+    슬롯 조건: 동시 실행 여유 + 토큰 버킷 잔량 + 쿨다운 종료
+    """
+
+    def __init__(self, name: str, limits: ProviderLimits):
+        self.name = name
+        self.limits = limits
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int]] = []   # (priority, seq) 힙
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._tokens = float(limits.burst)
+        self._rate_fraction = 1.0
+        self._last_refill = time.monotonic()
+        self._cooldown_until = 0.0
+
+        # 메트릭
+        self.queue_depth = {p.name: 0 for p in RequestPriority}
+        self.completed = 0
+        self.rate_limited = 0
+        self.total_wait_s = 0.0
+
+    @property
+    def current_rpm(self) -> float:
+        return self.limits.requests_per_minute * self._rate_fraction
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(
+            float(self.limits.burst), self._tokens + elapsed * self.current_rpm / 60.0
+        )
+
+    def _wait_time(self, now: float) -> float:
+        """슬롯이 날 때까지 예상 대기 시간 (0이면 즉시 가능)"""
+        if self._cooldown_until > now:
+            return self._cooldown_until - now
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) * 60.0 / self.current_rpm
+        return 0.0
+
+    def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> None:
+        """슬롯 획득 (차례가 올 때까지 블로킹)"""
+        ticket = (int(priority), next(self._seq))
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            self.queue_depth[priority.name] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] == ticket and self._in_flight < self.limits.max_concurrency:
+                        wait = self._wait_time(now)
+                        if wait <= 0:
+                            break
+                        self._cond.wait(timeout=wait)
+                    else:
+                        self._cond.wait()
+                heapq.heappop(self._waiters)
+                self._tokens -= 1.0
+                self._in_flight += 1
+            finally:
+                self.queue_depth[priority.name] -= 1
+                self._cond.notify_all()
+        self.total_wait_s += time.monotonic() - start
+
+    def release(self, rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        """슬롯 반환 + 결과에 따라 속도 조정"""
+        with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self.rate_limited += 1
+                self._rate_fraction = max(MIN_RATE_FRACTION, self._rate_fraction / 2)
+                if retry_after:
+                    self._cooldown_until = max(self._cooldown_until, time.monotonic() + retry_after)
+            else:
+                self.completed += 1
+                self._rate_fraction = min(1.0, self._rate_fraction + RATE_RECOVERY_STEP)
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict:
+        """대기열/처리량 메트릭"""
+        with self._cond:
+            return {
+                "in_flight": self._in_flight,
+                "queue_depth": dict(self.queue_depth),
+                "current_rpm": self.current_rpm,
+                "completed": self.completed,
+                "rate_limited": self.rate_limited,
+                "avg_wait_ms": self.total_wait_s / max(self.completed, 1) * 1000,
+            }
+
+
+class RateLimitScheduler:
+    """제공자별 스케줄러 묶음 + 429 재시도"""
+
+    def __init__(self, limits: Optional[dict[str, ProviderLimits]] = None):
+        self._limits = dict(DEFAULT_PROVIDER_LIMITS, **(limits or {}))
+        self._providers: dict[str, ProviderScheduler] = {}
+        self._lock = threading.Lock()
+
+    def provider(self, name: str) -> ProviderScheduler:
+        with self._lock:
+            if name not in self._providers:
+                limits = self._limits.get(name, ProviderLimits(requests_per_minute=60, max_concurrency=4))
+                self._providers[name] = ProviderScheduler(name, limits)
+            return self._providers[name]
+
+    def run(
+        self,
+        provider: str,
+        fn: Callable[[], T],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> T:
+        """
+        슬롯을 얻어 fn 실행
+
+        429는 retry-after(없으면 지수 백오프 + 지터)만큼 쉬고 재시도.
+        그 외 예외는 그대로 전파.
+        """
+        scheduler = self.provider(provider)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            scheduler.acquire(priority)
+            try:
+                result = fn()
+            except BaseException as e:
+                if not isinstance(e, Exception) or not is_rate_limit_error(e):
+                    scheduler.release()
+                    raise
+                retry_after = get_retry_after(e)
+                backoff = retry_after or min(MAX_BACKOFF_S, BASE_BACKOFF_S * 2 ** attempt)
+                backoff *= random.uniform(1.0, 1.25)
+                scheduler.release(rate_limited=True, retry_after=backoff)
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise RateLimitError(f"{provider} rate limited after {attempt + 1} attempts") from e
+                print(f"[RateLimiter] {provider} rate limited, retrying in {backoff:.1f}s...")
+                continue
+            scheduler.release()
+            return result
+
+    def get_stats(self) -> dict:
+        """제공자별 메트릭"""
+        with self._lock:
+            providers = dict(self._providers)
+        return {name: s.get_stats() for name, s in providers.items()}
@@ -0,0 +1,309 @@
+"""
+Response Cache - LLM 응답 캐시
+
+CognitiveRouter.generate 앞단의 2단계 캐시
+1. 정확 일치: 프롬프트 해시
+2. 의미 유사: 임베딩 코사인 유사도 (임계값 이상)
+   정확 일치가 없을 때마다 동기 임베딩 호출 1회 (수백 ms) → 기질에서는 기본 off
+
+캐시 범위(scope) = model_key + system_prompt + temperature
+- TTL 만료 + LRU 제거
+- 선택적 디스크 저장 (JSON)
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+
+
+# 기본 설정
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+AUTOSAVE_EVERY = 10  # N번 저장마다 디스크 기록
+
+
+def make_scope(model_key: str, system_prompt: Optional[str], temperature: float) -> str:
+    """캐시 범위 키 (모델/시스템 프롬프트/온도가 다르면 다른 응답)"""
+    raw = f"{model_key}\x00{system_prompt or ''}\x00{temperature:.3f}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def hash_prompt(prompt: str) -> str:
+    """프롬프트 해시 (공백 정규화)"""
+    normalized = " ".join(prompt.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _normalize(vec: list[float]) -> list[float]:
+    norm = sum(v * v for v in vec) ** 0.5
+    if norm == 0:
+        return vec
+    return [v / norm for v in vec]
+
+
+CacheKey = tuple[str, str]   # (scope, prompt_hash)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    scope: str
+    prompt_hash: str
+    response: str
+    created_at: float
+    embedding: Optional[list[float]] = None  # 정규화된 벡터
+    hits: int = 0
+
+    @property
+    def key(self) -> CacheKey:
+        return (self.scope, self.prompt_hash)
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        data = asdict(self)
+        data["hit_rate"] = (self.exact_hits + self.semantic_hits) / lookups if lookups else 0.0
+        return data
+
+
+class ResponseCache:
+    """
+    2단계 LLM 응답 캐시
+
+    - get(): 정확 일치 → 의미 유사 순으로 조회 (lookup()은 응답한 항목 반환)
+    - put(): 응답 저장 (LRU 초과 시 가장 오래된 항목 제거)
+    - invalidate_key(): 실패한 응답을 낸 항목 제거
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        persist_path: Optional[str] = None,
+        embed_fn: Optional[Callable[[str], list[float]]] = None,
+        enable_semantic: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.persist_path = persist_path
+        self.enable_semantic = enable_semantic
+        self._embed_fn = embed_fn
+        self._entries: "OrderedDict[tuple[str, str], CacheEntry]" = OrderedDict()
+        self._last_query: Optional[tuple[CacheKey, list[float]]] = None   # 조회 임베딩 → put()에서 재사용
+        self._unsaved = 0
+        self.stats = CacheStats()
+
+        if persist_path:
+            self.load()
+
+    def _embed(self, prompt: str) -> Optional[list[float]]:
+        """임베딩 생성 (실패 시 None → 의미 캐시 생략)"""
+        if not self.enable_semantic:
+            return None
+        if self._embed_fn is None:
+            from .embeddings import get_embedding_cached
+            self._embed_fn = get_embedding_cached
+        try:
+            return _normalize(self._embed_fn(prompt))
+        except Exception as e:
+            print(f"[ResponseCache] Embedding unavailable, semantic tier disabled: {e}")
+            self.enable_semantic = False
+            return None
+
+    def _query_embedding(self, key: CacheKey, prompt: str) -> Optional[list[float]]:
+        """직전 조회(의미 미스)에서 만든 임베딩 재사용 → 미스 1회당 임베딩 1회"""
+        last, self._last_query = self._last_query, None
+        if last is not None and last[0] == key:
+            return last[1]
+        return self._embed(prompt)
+
+    def _is_expired(self, entry: CacheEntry, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+
+    def _purge_expired(self, now: float) -> None:
+        expired = [k for k, e in self._entries.items() if self._is_expired(e, now)]
+        for key in expired:
+            del self._entries[key]
+
+    def get(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Optional[str]:
+        """캐시 조회 (없으면 None)"""
+        entry = self.lookup(prompt, model_key, system_prompt, temperature)
+        return entry.response if entry is not None else None
+
+    def lookup(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Optional[CacheEntry]:
+        """캐시 조회: 응답한 항목 (의미 적중이면 원본 항목, 없으면 None)"""
+        now = time.time()
+        scope = make_scope(model_key, system_prompt, temperature)
+        key = (scope, hash_prompt(prompt))
+
+        # 1. 정확 일치
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._is_expired(entry, now):
+                del self._entries[key]
+            else:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self.stats.exact_hits += 1
+                return entry
+
+        # 2. 의미 유사
+        candidates = [e for e in self._entries.values() if e.scope == scope and e.embedding]
+        if self.enable_semantic and candidates:
+            query = self._embed(prompt)
+            if query is not None:
+                self._last_query = (key, query)
+                best, best_score = None, self.similarity_threshold
+                for candidate in candidates:
+                    if self._is_expired(candidate, now):
+                        continue
+                    score = sum(a * b for a, b in zip(query, candidate.embedding))
+                    if score >= best_score:
+                        best, best_score = candidate, score
+                if best is not None:
+                    self._entries.move_to_end((best.scope, best.prompt_hash))
+                    best.hits += 1
+                    self.stats.semantic_hits += 1
+                    return best
+
+        self.stats.misses += 1
+        return None
+
+    def put(
+        self,
+        prompt: str,
+        response: str,
+        model_key: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> Optional[CacheKey]:
+        """응답 저장 (저장한 항목의 키 반환)"""
+        if not response:
+            return None
+
+        now = time.time()
+        scope = make_scope(model_key, system_prompt, temperature)
+        key = (scope, hash_prompt(prompt))
+
+        self._entries[key] = CacheEntry(
+            scope=scope,
+            prompt_hash=key[1],
+            response=response,
+            created_at=now,
+            embedding=self._query_embedding(key, prompt),
+        )
+        self._entries.move_to_end(key)
+
+        # TTL 만료 → LRU 순으로 제거
+        if len(self._entries) > self.max_entries:
+            self._purge_expired(now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+        self._unsaved += 1
+        if self.persist_path and self._unsaved >= AUTOSAVE_EVERY:
+            self.save()
+        return key
+
+    def invalidate(
+        self,
+        prompt: str,
+        model_key: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+    ) -> bool:
+        """프롬프트 정확 일치 항목 제거"""
+        scope = make_scope(model_key, system_prompt, temperature)
+        return self.invalidate_key((scope, hash_prompt(prompt)))
+
+    def invalidate_key(self, key: CacheKey) -> bool:
+        """항목 제거 (평가 실패한 응답이 재사용되지 않도록, 키는 lookup()/put() 결과)"""
+        return self._entries.pop(key, None) is not None
+
+    def record_bypass(self) -> None:
+        """캐시 우회 기록 (EXPLORE/CREATIVE 등)"""
+        self.stats.bypasses += 1
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+        self._unsaved = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """캐시 통계"""
+        stats = self.stats.to_dict()
+        stats["entries"] = len(self._entries)
+        return stats
+
+    # ==================== 디스크 저장 ====================
+
+    def save(self) -> None:
+        """디스크에 저장 (원자적 교체)"""
+        if not self.persist_path:
+            return
+
+        now = time.time()
+        self._purge_expired(now)
+        data = {"entries": [asdict(e) for e in self._entries.values()]}
+
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.persist_path)
+        self._unsaved = 0
+
+    def load(self) -> None:
+        """디스크에서 로드 (만료 항목 제외)"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ResponseCache] Could not load cache: {e}")
+            return
+
+        now = time.time()
+        for raw in data.get("entries", []):
+            entry = CacheEntry(**raw)
+            if not self._is_expired(entry, now):
+                self._entries[(entry.scope, entry.prompt_hash)] = entry
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
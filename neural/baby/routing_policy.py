@@ -0,0 +1,220 @@
+"""
+Adaptive Routing Policy - 지연시간/비용 인지 온라인 라우팅
+
+(복잡도 × 작업 유형) 컨텍스트별 Thompson Sampling 밴딧
+- 성공률: Beta(성공+1, 실패+1)에서 샘플링 (_evaluate_results 결과)
+- 지연시간: 관측값의 지수이동평균 (EWMA)
+- 비용: 토큰 사용량 × 모델 단가 → 시간 등가 패널티
+
+목표: 기대 성공까지 걸리는 시간 (지연시간 / 성공률 + 비용 패널티) 최소화
+"""
+
+import json
+import os
+import random
+import threading
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+from .llm_client import AVAILABLE_MODELS
+
+
+# 라우팅 후보 모델과 사전 지연시간 (관측 전 기본값, ms)
+ROUTING_ARMS = {
+    "gemini-2-flash": 2000.0,
+    "gpt-4o-mini": 4000.0,
+    "gpt-5.2-thinking": 20000.0,
+}
+MIN_CONTEXT_OBSERVATIONS = 5   # 컨텍스트별 관측 수가 이보다 적으면 휴리스틱 사용
+LATENCY_EWMA_ALPHA = 0.2
+COST_PENALTY_MS_PER_DOLLAR = 100_000.0  # $0.01 ≈ 1초
+
+
+def estimate_cost(model_key: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """호출 비용 추정 ($)"""
+    config = AVAILABLE_MODELS[model_key]
+    return (
+        prompt_tokens * config.input_cost_per_1m + completion_tokens * config.output_cost_per_1m
+    ) / 1_000_000
+
+
+@dataclass
+class ArmStats:
+    """컨텍스트 × 모델별 관측 통계"""
+    successes: int = 0
+    failures: int = 0
+    calls: int = 0
+    latency_ms: Optional[float] = None   # EWMA
+    cost: Optional[float] = None         # EWMA ($/call)
+
+    def observe_call(self, latency_ms: float, cost: float) -> None:
+        self.calls += 1
+        if self.latency_ms is None:
+            self.latency_ms, self.cost = latency_ms, cost
+        else:
+            self.latency_ms += LATENCY_EWMA_ALPHA * (latency_ms - self.latency_ms)
+            self.cost += LATENCY_EWMA_ALPHA * (cost - self.cost)
+
+    def observe_outcome(self, success: bool) -> None:
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def expected_latency(self, model_key: str) -> float:
+        return self.latency_ms if self.latency_ms is not None else ROUTING_ARMS[model_key]
+
+    def sample_success_rate(self, rng: random.Random) -> float:
+        return rng.betavariate(self.successes + 1, self.failures + 1)
+
+
+class AdaptiveRoutingPolicy:
+    """
+    컨텍스트별 밴딧 라우팅 정책
+
+    - select(): 지연시간 예산 내 모델 중 기대 성공 시간이 가장 짧은 모델 선택
+    - record_call(): LLM 호출 지연시간/토큰 기록
+    - record_outcome(): 평가 결과 (성공/실패) 기록
+    """
+
+    def __init__(self, persist_path: Optional[str] = None, seed: Optional[int] = None):
+        self.persist_path = persist_path
+        self._arms: dict[str, dict[str, ArmStats]] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._decisions = 0
+        self._overrides = 0
+
+        if persist_path:
+            self.load()
+
+    @staticmethod
+    def context_key(complexity_name: str, task_type: Optional[str]) -> str:
+        return f"{complexity_name}:{task_type or 'general'}"
+
+    def _stats(self, context_key: str, model_key: str) -> ArmStats:
+        arms = self._arms.setdefault(context_key, {})
+        return arms.setdefault(model_key, ArmStats())
+
+    def observations(self, context_key: str) -> int:
+        """컨텍스트의 평가 완료 관측 수"""
+        arms = self._arms.get(context_key, {})
+        return sum(a.successes + a.failures for a in arms.values())
+
+    def select(
+        self,
+        context_key: str,
+        default_model: str,
+        latency_budget_ms: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        모델 선택
+
+        Returns:
+            선택된 모델 키, 관측이 부족하면 None (휴리스틱 유지)
+        """
+        with self._lock:
+            self._decisions += 1
+            if self.observations(context_key) < MIN_CONTEXT_OBSERVATIONS:
+                return None
+
+            candidates = list(ROUTING_ARMS)
+            if latency_budget_ms is not None:
+                within = [
+                    m for m in candidates
+                    if self._stats(context_key, m).expected_latency(m) <= latency_budget_ms
+                ]
+                candidates = within or [
+                    min(candidates, key=lambda m: self._stats(context_key, m).expected_latency(m))
+                ]
+
+            best_model, best_time = None, float("inf")
+            for model_key in candidates:
+                stats = self._stats(context_key, model_key)
+                success_rate = max(stats.sample_success_rate(self._rng), 1e-3)
+                cost = stats.cost if stats.cost is not None else 0.0
+                expected_time = (
+                    stats.expected_latency(model_key) + cost * COST_PENALTY_MS_PER_DOLLAR
+                ) / success_rate
+                if expected_time < best_time:
+                    best_model, best_time = model_key, expected_time
+
+            if best_model != default_model:
+                self._overrides += 1
+            return best_model
+
+    def record_call(
+        self,
+        context_key: str,
+        model_key: str,
+        latency_ms: float,
+        prompt_tokens: int,
+        completion_tokens: int,
+    ) -> None:
+        """LLM 호출 결과 기록"""
+        if model_key not in ROUTING_ARMS:
+            return
+        cost = estimate_cost(model_key, prompt_tokens, completion_tokens)
+        with self._lock:
+            self._stats(context_key, model_key).observe_call(latency_ms, cost)
+
+    def record_outcome(self, context_key: str, model_key: str, success: bool) -> None:
+        """평가 결과 기록"""
+        if model_key not in ROUTING_ARMS:
+            return
+        with self._lock:
+            self._stats(context_key, model_key).observe_outcome(success)
+
+    def get_stats(self) -> dict:
+        """정책 통계"""
+        with self._lock:
+            return {
+                "decisions": self._decisions,
+                "overrides": self._overrides,
+                "contexts": {
+                    ctx: {
+                        model: {
+                            "success_rate": (a.successes + 1) / (a.successes + a.failures + 2),
+                            "latency_ms": a.latency_ms,
+                            "cost": a.cost,
+                            "calls": a.calls,
+                        }
+                        for model, a in arms.items()
+                    }
+                    for ctx, arms in self._arms.items()
+                },
+            }
+
+    # ==================== 디스크 저장 ====================
+
+    def save(self) -> None:
+        """디스크에 저장 (원자적 교체)"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            data = {
+                ctx: {model: asdict(a) for model, a in arms.items()}
+                for ctx, arms in self._arms.items()
+            }
+        directory = os.path.dirname(self.persist_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.persist_path)
+
+    def load(self) -> None:
+        """디스크에서 로드"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[RoutingPolicy] Could not load policy: {e}")
+            return
+        self._arms = {
+            ctx: {model: ArmStats(**raw) for model, raw in arms.items()}
+            for ctx, arms in data.items()
+        }
@@ -13,8 +13,11 @@ NeuralSubstrate를 확장하여 발달 AI 기능 추가:
 
 import asyncio
 import os
+import re
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Callable, Optional, Any
 from datetime import datetime
 
 from .emotions import EmotionalCore, EmotionalState
@@ -28,11 +31,67 @@ from .cognitive_router import (
     DevelopmentStage as RouterDevelopmentStage,
     Urgency,
 )
-from .db import get_brain_db, BrainDatabase
+from .causal_graph import get_causal_graph
+from .db import get_brain_db, get_async_brain_db, BrainDatabase, AsyncBrainDatabase
 from .world_model import WorldModel, PredictionType, SimulationType
-from .llm_client import get_llm_client, LLMClient
+from .llm_client import get_llm_client, LLMClient, AVAILABLE_MODELS
 from .emotional_modulator import EmotionalLearningModulator, Strategy, StrategyDecision
-from .vision import VisionProcessor, VisualInput, VisualExperience, VisualSource
+from .vision import VisionProcessor, VisualInput, VisualExperience, VisualSource, ImageData
+from .response_cache import ResponseCache, DEFAULT_SIMILARITY_THRESHOLD, DEFAULT_TTL_SECONDS
+from .routing_policy import AdaptiveRoutingPolicy
+from .keyword_matcher import KeywordMatcher
+from .context_builder import ContextBuilder
+from .evolution import EvolutionEngine
+
+
+CODER_SYSTEM_PROMPT = "You are a skilled programmer. Generate clean, working code. Respond with code only."
+
+# 새로운 응답이 필요한 전략 → 응답 캐시 우회
+CACHE_BYPASS_STRATEGIES = (Strategy.EXPLORE, Strategy.CREATIVE)
+
+# 태스크 유형 분류 키워드 (정의 순서 = 우선순위)
+TASK_CATEGORY_MATCHER = KeywordMatcher({
+    "function": ["함수", "function", "def"],
+    "class": ["클래스", "class"],
+    "algorithm": ["알고리즘", "algorithm", "정렬", "sort"],
+    "api": ["api", "서버", "server"],
+    "test": ["테스트", "test"],
+})
+
+# 결과 평가 키워드
+RESULT_MATCHER = KeywordMatcher({
+    "failure": ["error", "fail", "bug", "issue", "problem"],
+    "success": ["pass", "success", "correct", "good"],
+})
+REVIEW_SCORE_PATTERN = re.compile(r'(\d+)\s*/\s*10')
+DEFAULT_REVIEW_SCORE = 7
+
+# 진행 이벤트 리스너 (process(on_progress=...)로 지정, 요청(태스크)마다 분리)
+ProgressListener = Callable[[str, dict], None]
+_progress_listener: ContextVar[Optional[ProgressListener]] = ContextVar("progress_listener", default=None)
+
+
+def parse_review_score(review_result: str) -> int:
+    """리뷰 결과에서 'N/10' 점수 추출 (없으면 기본값)"""
+    score_match = REVIEW_SCORE_PATTERN.search(review_result)
+    return int(score_match.group(1)) if score_match else DEFAULT_REVIEW_SCORE
+
+
+def emit_progress(stage: str, **data) -> None:
+    """현재 요청의 리스너에 진행 이벤트 전달 (리스너 오류는 무시)"""
+    listener = _progress_listener.get()
+    if listener is None:
+        return
+    try:
+        listener(stage, data)
+    except Exception as e:
+        print(f"[BABY] Progress listener failed: {e}")
+
+
+@lru_cache(maxsize=1024)
+def categorize_task(request: str) -> str:
+    """태스크 유형 분류 (같은 요청은 캐시)"""
+    return TASK_CATEGORY_MATCHER.first_group(request, default="general")
 
 
 @dataclass
@@ -44,6 +103,8 @@ class BabyConfig:
 
     # 기억 저장 경로
     memory_path: str = ""
+    # 인과 그래프 스냅샷 경로 (프로세스 공유 싱글톤, 비우면 memory_path/causal_graph.json)
+    causal_graph_path: str = ""
 
     # 발달 설정
     enable_development: bool = True
@@ -55,6 +116,7 @@ class BabyConfig:
 
     # Supabase 연동 설정
     enable_supabase: bool = True  # Supabase에 데이터 저장 여부
+    sync_baby_state: bool = True  # save() 시 baby_state(싱글톤 행) 갱신 여부
 
     # World Model 설정
     enable_world_model: bool = True  # World Model 활성화
@@ -66,9 +128,27 @@ class BabyConfig:
 
     # Phase 4: 멀티모달 설정
     enable_vision: bool = True       # 시각 처리 활성화
+    enable_vision_cache: bool = True  # 거의 같은 프레임은 캐시된 시각 경험 재사용
     enable_audio: bool = False       # 오디오 처리 활성화 (Phase 4.2)
     enable_speech: bool = False      # 음성 합성 활성화 (Phase 4.3)
 
+    # LLM 응답 캐시 설정
+    enable_response_cache: bool = True
+    # 의미 캐시: 정확 일치 미스마다 동기 임베딩 호출 (코더 경로 지연 ↑) → 기본 off
+    response_cache_semantic: bool = False
+    response_cache_similarity: float = DEFAULT_SIMILARITY_THRESHOLD  # 의미 캐시 임계값
+    response_cache_ttl: float = DEFAULT_TTL_SECONDS
+
+    # 적응형 라우팅 (관측 지연시간/비용/성공률 기반 모델 선택)
+    enable_adaptive_routing: bool = True
+
+    # 코더 호출 헤징: p95 마감 초과 시 보조 모델 동시 요청 (꼬리 지연 ↓, 중복 비용 가능 → 기본 off)
+    hedge_coder_calls: bool = False
+
+    # 백그라운드 학습: 결과 반환 후 학습/World Model 갱신을 순서 보장 큐에서 실행
+    background_learning: bool = True
+    learning_queue_size: int = 32   # 가득 차면 process()가 대기 (백프레셔)
+
 
 @dataclass
 class BabyResult:
@@ -104,6 +184,9 @@ class BabyResult:
     visual_experience: dict = field(default_factory=dict)  # 시각적 경험
     media_type: str = "text"  # text, image, audio
 
+    # 백그라운드 학습 대기 중이면 True (학습 관련 필드는 학습 전 스냅샷)
+    learning_pending: bool = False
+
 
 class BabySubstrate:
     """
@@ -127,7 +210,23 @@ class BabySubstrate:
         )
         self._development = DevelopmentTracker()
         self._self = SelfModel()
-        self._cognitive_router = CognitiveRouter()  # Cognitive Router 추가
+        self._cognitive_router = CognitiveRouter(  # Cognitive Router 추가
+            response_cache=self._create_response_cache(),
+            policy=self._create_routing_policy(),
+            # 코더 호출은 항상 NORMAL 긴급도 → 헤징을 켜면 모든 긴급도에서 헤징
+            hedge_urgencies=(
+                tuple(Urgency) if self.config.hedge_coder_calls
+                else CognitiveRouter.DEFAULT_HEDGE_URGENCIES
+            ),
+        )
+        # 코더 입력 토큰 예산 (모델 티어별)
+        self._context_builder = ContextBuilder()
+
+        # 백그라운드 학습 큐 (이벤트 루프별 워커 1개 → 순서 보장)
+        self._learning_queue: Optional[asyncio.Queue] = None
+        self._learning_worker: Optional[asyncio.Task] = None
+        self._learning_stats = {"queued": 0, "completed": 0, "failed": 0, "max_depth": 0}
+        self._last_world_model_stats: dict = {}
 
         # Phase 3: 감정 기반 학습 조절기
         self._emotional_modulator: Optional[EmotionalLearningModulator] = None
@@ -140,16 +239,27 @@ class BabySubstrate:
                 print("[BABY] Emotional Learning Modulator initialized")
 
         # Supabase DB 연동 (선택적)
+        # - _db: 동기 클라이언트 (WorldModel 등 동기 컴포넌트용)
+        # - _async_db: HTTP/2 풀 기반 비동기 클라이언트 (process() 내 쓰기용)
         self._db: Optional[BrainDatabase] = None
+        self._async_db: Optional[AsyncBrainDatabase] = None
         if self.config.enable_supabase:
             try:
                 self._db = get_brain_db()
+                self._async_db = get_async_brain_db()
                 if self.config.verbose:
                     print("[BABY] Supabase connection initialized")
             except Exception as e:
                 if self.config.verbose:
                     print(f"[BABY] Supabase connection failed: {e}")
                 self._db = None
+                self._async_db = None
+
+        # 진화된 프롬프트 규칙 (learned_prompt_rules → 에이전트 system 접두부)
+        self._evolution: Optional[EvolutionEngine] = (
+            EvolutionEngine(self._async_db) if self._async_db else None
+        )
+        self._prompt_rules_loaded = False
 
         # World Model 초기화
         self._world_model: Optional[WorldModel] = None
@@ -163,6 +273,12 @@ class BabySubstrate:
                     development_stage=self._development.stage.value,
                     verbose=self.config.verbose,
                 )
+                causal_graph_path = self.config.causal_graph_path or (
+                    os.path.join(self.config.memory_path, "causal_graph.json")
+                    if self.config.memory_path else ""
+                )
+                if causal_graph_path:
+                    get_causal_graph().configure_persistence(causal_graph_path)
                 if self.config.verbose:
                     print("[BABY] World Model initialized")
             except Exception as e:
@@ -174,7 +290,10 @@ class BabySubstrate:
         self._vision_processor: Optional[VisionProcessor] = None
         if self.config.enable_vision:
             try:
-                self._vision_processor = VisionProcessor(verbose=self.config.verbose)
+                self._vision_processor = VisionProcessor(
+                    verbose=self.config.verbose,
+                    enable_cache=self.config.enable_vision_cache,
+                )
                 if self.config.verbose:
                     print("[BABY] Vision Processor initialized")
             except Exception as e:
@@ -224,7 +343,33 @@ class BabySubstrate:
             print(f"[BABY] Ready! Stage: {stage.name} - {stage.description}")
             print(f"[BABY] Emotional state: {self._emotions}")
 
-    async def process(self, user_request: str) -> BabyResult:
+    async def _load_prompt_rules(self) -> None:
+        """에이전트별 활성 프롬프트 규칙 적용 (세션당 1회, 실패 시 기본 프롬프트 유지)"""
+        if self._prompt_rules_loaded or not self._evolution:
+            return
+        self._prompt_rules_loaded = True
+
+        agent_types = list(self._agents)
+        results = await asyncio.gather(
+            *(self._evolution.get_active_prompt(agent_type) for agent_type in agent_types),
+            return_exceptions=True,
+        )
+        for agent_type, rules in zip(agent_types, results):
+            if isinstance(rules, Exception):
+                if self.config.verbose:
+                    print(f"[EVOLUTION] Prompt rules load failed ({agent_type}): {rules}")
+                continue
+            if rules:
+                self._agents[agent_type].set_prompt_rules(rules)
+                if self.config.verbose:
+                    print(f"[EVOLUTION] Applied learned prompt rules to {agent_type}")
+
+    async def process(
+        self,
+        user_request: str,
+        *,
+        on_progress: Optional[ProgressListener] = None,
+    ) -> BabyResult:
         """
         요청 처리 (발달 AI 방식)
 
@@ -234,12 +379,29 @@ class BabySubstrate:
         4. 에이전트 실행
         5. 결과에서 학습
         6. 발달 업데이트
+
+        5~6은 기본적으로 결과 반환 후 백그라운드 큐에서 실행 (drain()으로 완료 대기),
+        다음 요청은 그 학습이 끝난 뒤 시작 → 같은 아기 요청을 직렬화하면 (SubstratePool)
+        요청과 학습이 겹치지 않고 순서대로 상태를 바꿈
+        on_progress(stage, data): 라우팅/코드 생성/테스트/리뷰/재시도 단계마다 호출
         """
+        token = _progress_listener.set(on_progress)
+        try:
+            return await self._process(user_request)
+        finally:
+            _progress_listener.reset(token)
+
+    async def _process(self, user_request: str) -> BabyResult:
         import time
         start_time = time.time()
 
-        # 에이전트 초기화
+        # 이전 요청의 백그라운드 학습이 끝난 뒤 시작
+        # (학습의 기억/감정/발달 갱신이 이번 요청의 회상/라우팅과 섞이지 않도록)
+        await self._wait_for_learning()
+
+        # 에이전트 초기화 + 진화된 프롬프트 규칙 적용
         self._initialize_agents()
+        await self._load_prompt_rules()
 
         if self.config.verbose:
             self._print_header(user_request)
@@ -291,8 +453,106 @@ class BabySubstrate:
             strategy_decision,
         )
 
+        execution_time = (time.time() - start_time) * 1000
+
+        # 결과 구성 (학습 전 상태 스냅샷)
+        baby_result = BabyResult(
+            success=result["success"],
+            output=result.get("code", ""),
+            iterations=result.get("iterations", 1),
+            execution_time_ms=execution_time,
+            emotional_state=self._emotions.get_state().to_dict(),
+            development_progress=self._development.get_progress(),
+            memory_stats=self._memory.get_stats(),
+            routing_info=self._cognitive_router.get_routing_stats(),
+            world_model_stats=self._last_world_model_stats,
+            emotional_influence=emotional_influence,
+            strategy_used=strategy_decision.__dict__ if strategy_decision else {},
+        )
+
+        # 6~13. 결과에서 학습: 기본은 백그라운드 큐 (응답 후 순서대로 실행)
+        if self.config.background_learning:
+            await self._enqueue_learning(user_request, result)
+            baby_result.learning_pending = True
+        else:
+            learned = await self._learn_from_pipeline(user_request, result)
+            baby_result.emotional_state = self._emotions.get_state().to_dict()
+            baby_result.curiosity_signal = learned["curiosity_signal"]
+            baby_result.development_progress = self._development.get_progress()
+            baby_result.memory_stats = self._memory.get_stats()
+            baby_result.experience_id = learned["experience_id"]
+            baby_result.world_model_stats = learned["world_model_stats"]
+            baby_result.prediction_made = learned["prediction_made"]
+
+        if self.config.verbose:
+            self._print_result(baby_result)
+
+        return baby_result
+
+    # ==================== 백그라운드 학습 ====================
+
+    async def _enqueue_learning(self, user_request: str, result: dict) -> None:
+        """학습 작업을 순서 보장 큐에 추가 (가득 차면 자리가 날 때까지 대기 = 백프레셔)"""
+        queue = self._ensure_learning_worker()
+        await queue.put((user_request, result))
+        self._learning_stats["queued"] += 1
+        self._learning_stats["max_depth"] = max(self._learning_stats["max_depth"], queue.qsize())
+
+    def _ensure_learning_worker(self) -> asyncio.Queue:
+        """현재 이벤트 루프의 학습 큐/워커 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        worker = self._learning_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._learning_queue = asyncio.Queue(maxsize=self.config.learning_queue_size)
+            self._learning_worker = loop.create_task(self._learning_loop(self._learning_queue))
+        return self._learning_queue
+
+    async def _learning_loop(self, queue: asyncio.Queue) -> None:
+        """학습 워커: 큐 순서대로 하나씩 실행 (실패해도 다음 작업 계속)"""
+        while True:
+            user_request, result = await queue.get()
+            try:
+                await self._learn_from_pipeline(user_request, result)
+                self._learning_stats["completed"] += 1
+            except Exception as e:
+                self._learning_stats["failed"] += 1
+                if self.config.verbose:
+                    print(f"\n[LEARNING] Background learning failed: {e}")
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        """
+        대기 중인 백그라운드 학습(+ 시각 경험 DB 저장)이 모두 끝날 때까지 대기
+
+        테스트와 종료 시 사용. asyncio.run()은 끝날 때 남은 태스크를 취소하므로
+        save() 전에 같은 루프에서 호출해야 학습 결과가 남는다.
+        """
+        if self._vision_processor:
+            await self._vision_processor.drain()
+        await self._wait_for_learning()
+
+    async def _wait_for_learning(self) -> None:
+        """현재 루프의 학습 큐가 빌 때까지 대기"""
+        worker = self._learning_worker
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            return
+        await self._learning_queue.join()
+
+    def get_learning_stats(self) -> dict:
+        """백그라운드 학습 큐 통계"""
+        stats = dict(self._learning_stats)
+        stats["pending"] = self._learning_queue.qsize() if self._learning_queue else 0
+        return stats
+
+    async def _learn_from_pipeline(self, user_request: str, result: dict) -> dict:
+        """
+        파이프라인 결과에서 학습
+
+        기억/DB 기록, 호기심·감정·발달·자아 업데이트, 주기적 기억 통합, World Model 예측 생성
+        """
         # 6. 결과에서 학습 (감정 조절된 학습률 적용)
-        experience = self._learn_from_result(
+        experience = await self._learn_from_result(
             user_request,
             result,
         )
@@ -364,7 +624,9 @@ class BabySubstrate:
                     "fear": self._emotions.get_state().fear,
                     "frustration": self._emotions.get_state().frustration,
                 }
-                wm_results = self._world_model.auto_generate_from_experience(
+                # 검증/예측 LLM 호출이 많아 워커 스레드에서 실행 (이벤트 루프 비블로킹)
+                wm_results = await asyncio.to_thread(
+                    self._world_model.auto_generate_from_experience,
                     experience={
                         "task": user_request,
                         "success": result["success"],
@@ -383,35 +645,41 @@ class BabySubstrate:
                         print(f"\n[WORLD_MODEL] Prediction: {prediction_made['prediction'][:50]}...")
 
                 world_model_stats = self._world_model.get_stats()
+                self._last_world_model_stats = world_model_stats
 
             except Exception as e:
                 if self.config.verbose:
                     print(f"\n[WORLD_MODEL] Error: {e}")
 
-        execution_time = (time.time() - start_time) * 1000
+        return {
+            "experience_id": experience.id if experience else "",
+            "curiosity_signal": curiosity_signal.to_dict(),
+            "world_model_stats": world_model_stats,
+            "prediction_made": prediction_made,
+        }
 
-        # 결과 구성
-        baby_result = BabyResult(
-            success=result["success"],
-            output=result.get("code", ""),
-            iterations=result.get("iterations", 1),
-            execution_time_ms=execution_time,
-            emotional_state=self._emotions.get_state().to_dict(),
-            curiosity_signal=curiosity_signal.to_dict(),
-            development_progress=self._development.get_progress(),
-            memory_stats=self._memory.get_stats(),
-            experience_id=experience.id if experience else "",
-            routing_info=self._cognitive_router.get_routing_stats(),
-            world_model_stats=world_model_stats,
-            prediction_made=prediction_made,
-            emotional_influence=emotional_influence,
-            strategy_used=strategy_decision.__dict__ if strategy_decision else {},
+    def _create_response_cache(self) -> Optional[ResponseCache]:
+        """LLM 응답 캐시 생성 (memory_path가 있으면 디스크 저장)"""
+        if not self.config.enable_response_cache:
+            return None
+        persist_path = None
+        if self.config.memory_path:
+            persist_path = os.path.join(self.config.memory_path, "response_cache.json")
+        return ResponseCache(
+            ttl_seconds=self.config.response_cache_ttl,
+            similarity_threshold=self.config.response_cache_similarity,
+            persist_path=persist_path,
+            enable_semantic=self.config.response_cache_semantic,
         )
 
-        if self.config.verbose:
-            self._print_result(baby_result)
-
-        return baby_result
+    def _create_routing_policy(self) -> Optional[AdaptiveRoutingPolicy]:
+        """적응형 라우팅 정책 생성 (memory_path가 있으면 디스크 저장)"""
+        if not self.config.enable_adaptive_routing:
+            return None
+        persist_path = None
+        if self.config.memory_path:
+            persist_path = os.path.join(self.config.memory_path, "routing_policy.json")
+        return AdaptiveRoutingPolicy(persist_path=persist_path)
 
     def _map_development_stage(self) -> RouterDevelopmentStage:
         """내부 발달 단계를 Cognitive Router 단계로 매핑"""
@@ -457,46 +725,45 @@ class BabySubstrate:
         strategy_params = strategy_decision.parameters if strategy_decision else {}
 
         # 유사 경험을 컨텍스트로 활용 (전략에 따라 다르게)
-        context = ""
+        # 예시 후보: 성공 경험 + 성공한 유사 경험 (ContextBuilder가 유사도 순 정렬/중복 제거)
+        header = ""
+        examples = memories["successful_examples"] + [
+            exp for exp in memories.get("similar_experiences", []) if exp.get("success")
+        ]
+        max_examples = 0
+        action_only = False
 
         # EXPLOIT: 성공 경험 많이 활용
-        if strategy == Strategy.EXPLOIT and memories["successful_examples"]:
-            examples = memories["successful_examples"][:3]  # 더 많은 예시
-            context = "\n\n[Previous successful examples - USE THESE AS REFERENCE]\n"
-            for ex in examples:
-                context += f"- Request: {ex['request'][:50]}...\n"
-                context += f"  Solution: {ex['action'][:100]}...\n"
+        if strategy == Strategy.EXPLOIT and examples:
+            header = "\n\n[Previous successful examples - USE THESE AS REFERENCE]\n"
+            max_examples = 3  # 더 많은 예시
 
         # EXPLORE: 최소한의 컨텍스트, 새로운 접근 장려
         elif strategy == Strategy.EXPLORE:
-            context = "\n\n[Note: Try a NEW and DIFFERENT approach. Be creative!]\n"
+            header = "\n\n[Note: Try a NEW and DIFFERENT approach. Be creative!]\n"
 
         # CAUTIOUS: 단계별 접근 강조
         elif strategy == Strategy.CAUTIOUS:
-            context = "\n\n[IMPORTANT: Be CAREFUL and THOROUGH. Validate each step.]\n"
-            if memories["successful_examples"]:
-                examples = memories["successful_examples"][:1]
-                context += "[Safe reference]\n"
-                for ex in examples:
-                    context += f"- {ex['action'][:100]}...\n"
+            header = "\n\n[IMPORTANT: Be CAREFUL and THOROUGH. Validate each step.]\n"
+            if examples:
+                header += "[Safe reference]\n"
+                max_examples = 1
+                action_only = True
 
         # ALTERNATIVE: 이전과 다른 방법 요청
         elif strategy == Strategy.ALTERNATIVE:
-            context = "\n\n[IMPORTANT: The previous approach FAILED. Use a COMPLETELY DIFFERENT method!]\n"
+            header = "\n\n[IMPORTANT: The previous approach FAILED. Use a COMPLETELY DIFFERENT method!]\n"
             if memories.get("recent_failures"):
-                context += "[Avoid these patterns]\n"
+                header += "[Avoid these patterns]\n"
 
         # CREATIVE: 조합/실험 허용
         elif strategy == Strategy.CREATIVE:
-            context = "\n\n[CREATIVE MODE: Combine different techniques. Think outside the box!]\n"
+            header = "\n\n[CREATIVE MODE: Combine different techniques. Think outside the box!]\n"
 
         # 기본 fallback (EXPLOIT)
-        elif memories["successful_examples"]:
-            examples = memories["successful_examples"][:2]
-            context = "\n\n[Previous successful examples]\n"
-            for ex in examples:
-                context += f"- Request: {ex['request'][:50]}...\n"
-                context += f"  Solution: {ex['action'][:100]}...\n"
+        elif examples:
+            header = "\n\n[Previous successful examples]\n"
+            max_examples = 2
 
         # Cognitive Router용 컨텍스트 준비
         router_stage = self._map_development_stage()
@@ -532,22 +799,43 @@ class BabySubstrate:
             if self.config.verbose:
                 print(f"  [ROUTER] {routing_decision.reasoning}")
                 print(f"  [MODEL] {routing_decision.model_key} (thinking: {routing_decision.thinking_level})")
+            emit_progress(
+                "routing",
+                iteration=iteration,
+                model=routing_decision.model_key,
+                thinking_level=routing_decision.thinking_level,
+                strategy=strategy.value,
+                reasoning=routing_decision.reasoning,
+            )
 
             # Coder 실행 (Cognitive Router 사용)
-            coder_input = user_request + context
-            if feedback_context:
-                coder_input += f"\n\n[Feedback from previous attempt]\n{feedback_context}"
+            # 라우팅된 모델 티어의 토큰 예산 내에서 요청 + 전략 + 피드백 + 예시 구성
+            # (같은 routing_decision을 generate()에 넘김 → 예산 티어 = 실제 호출 모델 티어)
+            coder_tier = AVAILABLE_MODELS[routing_decision.model_key].tier
+            coder_input = self._context_builder.build(
+                user_request,
+                coder_tier,
+                header=header,
+                examples=examples if max_examples else (),
+                max_examples=max_examples,
+                action_only=action_only,
+                feedback=feedback_context,
+            )
 
             if self.config.verbose:
                 print("  [CODER] Generating code...", end="", flush=True)
 
             start = time.time()
             try:
-                # Cognitive Router로 LLM 호출
-                code = self._cognitive_router.generate(
+                # Cognitive Router로 LLM 호출 (탐색/창의 전략은 캐시 우회)
+                # 워커 스레드에서 실행 → 이벤트 루프 비블로킹, 동시 요청은 single-flight로 병합
+                code = await asyncio.to_thread(
+                    self._cognitive_router.generate,
                     task=coder_input,
-                    system_prompt="You are a skilled programmer. Generate clean, working code. Respond with code only.",
+                    system_prompt=CODER_SYSTEM_PROMPT,
                     context=task_context,
+                    use_cache=strategy not in CACHE_BYPASS_STRATEGIES,
+                    decision=routing_decision,
                 )
                 coder_time = (time.time() - start) * 1000
                 if self.config.verbose:
@@ -558,9 +846,13 @@ class BabySubstrate:
                 code = ""
 
             results["code"] = code
+            emit_progress("code_generated", iteration=iteration, chars=len(code), ms=(time.time() - start) * 1000)
 
             if not code:
+                self._cognitive_router.record_outcome(routing_decision, False)
                 iteration += 1
+                if iteration <= self.config.max_iterations:
+                    emit_progress("retry", iteration=iteration, reason="empty code")
                 continue
 
             # Tester 실행
@@ -579,6 +871,7 @@ class BabySubstrate:
                 test_result = f"Error: {e}"
 
             results["test_result"] = test_result
+            emit_progress("test_result", iteration=iteration, summary=test_result[:200])
 
             # Reviewer 실행
             if self.config.verbose:
@@ -596,18 +889,24 @@ class BabySubstrate:
                 review_result = f"Error: {e}"
 
             results["review_result"] = review_result
+            emit_progress("review", iteration=iteration, score=parse_review_score(review_result))
 
             # 평가
             success, feedback = self._evaluate_results(test_result, review_result)
+            self._cognitive_router.record_outcome(routing_decision, success)
 
             if success:
                 if self.config.verbose:
                     print("  [RESULT] Success!")
             else:
+                # 실패한 응답은 캐시에서 제거
+                self._cognitive_router.invalidate_cached_response(routing_decision)
                 feedback_context = feedback
                 if self.config.verbose:
                     print(f"  [RESULT] Needs improvement: {feedback[:100]}...")
                 iteration += 1
+                if iteration <= self.config.max_iterations:
+                    emit_progress("retry", iteration=iteration, reason=feedback[:200])
 
         results["success"] = success
         results["iterations"] = iteration
@@ -620,19 +919,12 @@ class BabySubstrate:
         review_result: str,
     ) -> tuple[bool, str]:
         """결과 평가"""
-        test_lower = test_result.lower()
-        review_lower = review_result.lower()
-
-        failure_keywords = ["error", "fail", "bug", "issue", "problem"]
-        success_keywords = ["pass", "success", "correct", "good"]
-
-        has_failure = any(kw in test_lower for kw in failure_keywords)
-        has_success = any(kw in test_lower for kw in success_keywords)
+        hits = RESULT_MATCHER.find_all(test_result)
+        has_failure = "failure" in hits
+        has_success = "success" in hits
 
         # 리뷰 점수 추출
-        import re
-        score_match = re.search(r'(\d+)\s*/\s*10', review_lower)
-        review_score = int(score_match.group(1)) if score_match else 7
+        review_score = parse_review_score(review_result)
 
         if has_failure and not has_success:
             return False, f"Test issues. Review: {review_score}/10\n{test_result[:200]}"
@@ -642,7 +934,7 @@ class BabySubstrate:
 
         return True, ""
 
-    def _learn_from_result(
+    async def _learn_from_result(
         self,
         request: str,
         result: dict,
@@ -662,11 +954,11 @@ class BabySubstrate:
             task_type=task_type,
         )
 
-        # Supabase에도 경험 저장
-        if self._db:
+        # Supabase에도 경험 저장 (비동기 클라이언트 - 이벤트 루프 블로킹 없음)
+        if self._async_db:
             try:
                 emotional_state = self._emotions.get_state()
-                self._db.insert_experience(
+                await self._async_db.insert_experience(
                     task=request[:500],
                     task_type=task_type,
                     output=result.get("code", "")[:1000],
@@ -694,20 +986,7 @@ class BabySubstrate:
 
     def _categorize_task(self, request: str) -> str:
         """태스크 유형 분류"""
-        request_lower = request.lower()
-
-        if any(kw in request_lower for kw in ["함수", "function", "def"]):
-            return "function"
-        if any(kw in request_lower for kw in ["클래스", "class"]):
-            return "class"
-        if any(kw in request_lower for kw in ["알고리즘", "algorithm", "정렬", "sort"]):
-            return "algorithm"
-        if any(kw in request_lower for kw in ["api", "서버", "server"]):
-            return "api"
-        if any(kw in request_lower for kw in ["테스트", "test"]):
-            return "test"
-
-        return "general"
+        return categorize_task(request)
 
     def _print_header(self, request: str) -> None:
         """헤더 출력"""
@@ -758,6 +1037,13 @@ class BabySubstrate:
 
         self._memory.save()
 
+        # LLM 응답 캐시 / 라우팅 정책 저장
+        # 빈 캐시도 저장 (__len__ == 0이어도 만료/무효화 결과를 디스크에 반영)
+        if self._cognitive_router.response_cache is not None:
+            self._cognitive_router.response_cache.save()
+        if self._cognitive_router.policy is not None:
+            self._cognitive_router.policy.save()
+
         # 발달/자아 상태도 저장
         if self.config.memory_path:
             import os
@@ -778,8 +1064,8 @@ class BabySubstrate:
             with open(state_path, "w", encoding="utf-8") as f:
                 json.dump(state_data, f, indent=2, ensure_ascii=False)
 
-        # Supabase에 baby_state 저장
-        if self._db:
+        # Supabase에 baby_state 저장 (싱글톤 행 → 풀의 기본 아기만)
+        if self._db and self.config.sync_baby_state:
             try:
                 emotional_state = self._emotions.get_state()
                 dev_progress = self._development.get_progress()
@@ -882,6 +1168,8 @@ class BabySubstrate:
 
     def get_state(self) -> dict:
         """전체 상태"""
+        from common.prompt_cache import get_prompt_cache_stats
+
         state = {
             "session_start": self._session_start.isoformat(),
             "experience_count": self._experience_counter,
@@ -891,6 +1179,11 @@ class BabySubstrate:
             "memory": self._memory.get_stats(),
             "curiosity": self._curiosity.get_stats(),
             "cognitive_router": self._cognitive_router.get_routing_stats(),
+            # 실제 토큰/지연시간/TTFT/비용/폴백/에러 (모델별)
+            "llm_telemetry": self._cognitive_router.llm_client.get_telemetry(),
+            "prompt_context": self._context_builder.get_stats(),
+            "prompt_cache": get_prompt_cache_stats().get_stats(),
+            "learning_queue": self.get_learning_stats(),
         }
 
         # Phase 3: 감정 영향 정보 추가
@@ -914,17 +1207,18 @@ class BabySubstrate:
     async def process_multimodal(
         self,
         text: str = None,
-        images: list[bytes] = None,
+        images: list[ImageData] = None,
         audio: bytes = None,
     ) -> BabyResult:
         """
         멀티모달 입력 처리
 
         Phase 4: 텍스트 + 이미지 + 오디오를 통합 처리
+        텍스트 없이 익숙한(캐시된) 장면만 들어오면 코드 파이프라인 없이 시각 경험만 반환
 
         Args:
             text: 텍스트 입력 (질문, 명령 등)
-            images: 이미지 바이너리 리스트
+            images: 이미지 바이너리 리스트 (bytes 또는 업로드 버퍼 memoryview)
             audio: 오디오 바이너리 (Phase 4.2)
 
         Returns:
@@ -936,6 +1230,7 @@ class BabySubstrate:
         # 미디어 타입 결정
         media_type = "text"
         visual_experience_dict = {}
+        familiar_frames = 0
 
         if self.config.verbose:
             print("\n[BABY] Processing multimodal input...")
@@ -973,6 +1268,7 @@ class BabySubstrate:
 
                     # 시각적 경험 저장
                     visual_experience_dict = visual_exp.to_dict()
+                    familiar_frames += visual_exp.from_cache
 
                     if self.config.verbose:
                         print(f"  Scene: {visual_exp.scene_type}")
@@ -993,8 +1289,11 @@ class BabySubstrate:
                 visual_context += f"\n감지된 객체: {', '.join(objects)}"
             combined_prompt = visual_context + "\n\n" + (text or "이 이미지에 대해 설명해주세요.")
 
+        # 익숙한 장면만(캐시 재사용) + 텍스트 없음 → 새로 물을 것이 없으므로 코드 파이프라인 생략
+        familiar_only = not text and bool(visual_experience_dict) and familiar_frames == len(images)
+
         # 3. 기존 process() 로직과 통합
-        if combined_prompt:
+        if combined_prompt and not familiar_only:
             # 텍스트 처리는 기존 process() 활용
             result = await self.process(combined_prompt)
 
@@ -1025,6 +1324,11 @@ class BabySubstrate:
         if not emotional_response:
             return
 
+        # 반복 자극 (최근에 본 장면) → 새로움 대신 지루함
+        if emotional_response.get("repetition"):
+            self._emotions.on_repetition()
+            return
+
         # 호기심 변화
         if emotional_response.get("curiosity_change", 0) > 0:
             self._emotions.on_novelty(emotional_response["curiosity_change"])
@@ -1041,12 +1345,12 @@ class BabySubstrate:
         if emotional_response.get("surprise_change", 0) > 0:
             self._emotions.on_novelty(emotional_response["surprise_change"])
 
-    async def process_image(self, image_data: bytes, prompt: str = None) -> BabyResult:
+    async def process_image(self, image_data: ImageData, prompt: str = None) -> BabyResult:
         """
         이미지 단일 처리 헬퍼
 
         Args:
-            image_data: 이미지 바이너리
+            image_data: 이미지 바이너리 (memoryview면 복사 없이 처리)
             prompt: 선택적 텍스트 프롬프트
 
         Returns:
@@ -1061,7 +1365,9 @@ class BabySubstrate:
 async def run_baby(user_request: str, config: BabyConfig = None) -> BabyResult:
     """Baby Substrate 실행 헬퍼"""
     baby = BabySubstrate(config or BabyConfig())
-    return await baby.process(user_request)
+    result = await baby.process(user_request)
+    await baby.drain()
+    return result
 
 
 # Singleton instance
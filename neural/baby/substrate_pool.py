@@ -0,0 +1,228 @@
+"""
+Substrate Pool - 아기(테넌트)별 BabySubstrate 풀
+
+API 서버 한 프로세스에서 여러 아기를 동시에 운영
+- baby_id별 BabySubstrate (감정/호기심/발달/기억 상태 분리)
+- 처음 요청 시 memory_path에서 지연 로드 (hydration, 풀 잠금 밖에서 아기별로 한 번)
+- 인스턴스별 asyncio.Lock으로 요청 단위 상태 변경 직렬화 (요청은 이전 요청의 백그라운드 학습이 끝난 뒤 시작)
+- 상주 수 상한 초과 시 유휴 인스턴스를 LRU 순으로 저장 후 제거
+
+저장 위치: 기본 아기는 base memory_path, 나머지는 {memory_path}/babies/{baby_id}
+
+아기 간 공유 상태 (프로세스 싱글톤, 아기별로 분리되지 않음):
+- CausalGraph / ConceptIndex: 인과 지식과 개념 ID 색인, 스냅샷은 base memory_path 한 곳
+- LLMClient (텔레메트리, 스케줄러), Supabase 클라이언트, 프롬프트 캐시 통계
+- Supabase baby_state 행: 싱글톤이므로 기본 아기만 기록 (나머지는 로컬 state.json만)
+"""
+
+import asyncio
+import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Callable, Optional
+
+from .substrate import BabySubstrate, BabyConfig
+
+
+DEFAULT_BABY_ID = "default"
+MAX_RESIDENT_BABIES = 8
+BABY_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class InvalidBabyIdError(ValueError):
+    """baby_id 형식 오류 (경로로 쓰이므로 영숫자/_/-만 허용)"""
+
+
+def validate_baby_id(baby_id: str) -> str:
+    """baby_id 검증 (형식이 틀리면 InvalidBabyIdError)"""
+    if not BABY_ID_PATTERN.match(baby_id):
+        raise InvalidBabyIdError(f"Invalid baby_id: {baby_id!r}")
+    return baby_id
+
+
+@dataclass
+class PoolEntry:
+    """상주 중인 아기 한 명"""
+    substrate: BabySubstrate
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+    active: int = 0   # session() 진행 중(대기 포함) 요청 수
+
+    @property
+    def idle(self) -> bool:
+        return self.active == 0
+
+
+class SubstratePool:
+    """
+    baby_id → BabySubstrate LRU 풀
+
+    사용:
+        async with pool.session(baby_id) as substrate:
+            result = await substrate.process(task)
+    """
+
+    def __init__(
+        self,
+        base_config: Optional[BabyConfig] = None,
+        max_resident: int = MAX_RESIDENT_BABIES,
+        factory: Callable[[BabyConfig], BabySubstrate] = BabySubstrate,
+    ):
+        self.base_config = base_config or BabyConfig()
+        self.max_resident = max_resident
+        self._factory = factory
+        self._entries: "OrderedDict[str, PoolEntry]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._evicting: dict[str, asyncio.Task] = {}
+        self._hydrating: dict[str, asyncio.Future] = {}   # 로드 중인 아기 (완료 시 결과 설정)
+        self._stats = {"hits": 0, "hydrations": 0, "evictions": 0}
+
+    def config_for(self, baby_id: str) -> BabyConfig:
+        """아기별 설정 (memory_path만 분리, 공유 인과 그래프는 base 경로 고정)"""
+        base_path = self.base_config.memory_path
+        memory_path = base_path
+        if base_path and baby_id != DEFAULT_BABY_ID:
+            memory_path = os.path.join(base_path, "babies", baby_id)
+        causal_graph_path = self.base_config.causal_graph_path or (
+            os.path.join(base_path, "causal_graph.json") if base_path else ""
+        )
+        return replace(
+            self.base_config,
+            memory_path=memory_path,
+            causal_graph_path=causal_graph_path,
+            # baby_state는 아기 구분 없는 싱글톤 행 → 다른 아기가 덮어쓰지 않도록 기본 아기만 동기화
+            sync_baby_state=self.base_config.sync_baby_state and baby_id == DEFAULT_BABY_ID,
+        )
+
+    @asynccontextmanager
+    async def session(
+        self,
+        baby_id: str = DEFAULT_BABY_ID,
+        exclusive: bool = True,
+    ) -> AsyncIterator[BabySubstrate]:
+        """
+        아기 인스턴스 사용
+
+        exclusive=True: 잠그고 사용 (같은 아기의 상태 변경 요청은 순서대로 실행)
+        exclusive=False: 읽기 전용 (진행 중인 요청을 기다리지 않음, 제거는 막음)
+        """
+        entry = await self._checkout(baby_id)
+        try:
+            if exclusive:
+                async with entry.lock:
+                    yield entry.substrate
+            else:
+                yield entry.substrate
+        finally:
+            entry.active -= 1
+            entry.last_used = time.monotonic()
+        await self._evict_idle()
+
+    async def _checkout(self, baby_id: str) -> PoolEntry:
+        validate_baby_id(baby_id)
+
+        while True:
+            async with self._lock:
+                entry = self._entries.get(baby_id)
+                if entry is not None:
+                    self._stats["hits"] += 1
+                    self._entries.move_to_end(baby_id)
+                    entry.active += 1
+                    return entry
+                hydrating = self._hydrating.get(baby_id)
+                if hydrating is None:
+                    hydrating = asyncio.get_running_loop().create_future()
+                    self._hydrating[baby_id] = hydrating
+                    break
+            # 같은 아기를 다른 요청이 로드 중 → 끝나면 다시 조회 (실패했으면 직접 로드)
+            await asyncio.shield(hydrating)
+
+        # 로드는 풀 잠금 밖에서 (다른 아기 요청은 기다리지 않음)
+        try:
+            # 저장 중인 같은 아기가 있으면 저장이 끝난 뒤 다시 로드
+            evicting = self._evicting.get(baby_id)
+            if evicting:
+                await asyncio.shield(evicting)
+            substrate = await asyncio.to_thread(self._factory, self.config_for(baby_id))
+            async with self._lock:
+                entry = PoolEntry(substrate=substrate, active=1)
+                self._entries[baby_id] = entry
+                self._stats["hydrations"] += 1
+                print(f"[POOL] Hydrated baby '{baby_id}' ({len(self._entries)}/{self.max_resident})")
+            return entry
+        finally:
+            del self._hydrating[baby_id]
+            hydrating.set_result(None)
+
+    async def _evict_idle(self) -> None:
+        """
+        상한 초과분을 LRU 순으로 제거 (사용 중인 인스턴스는 건너뜀)
+
+        저장(학습 큐 비우기 + save)은 백그라운드 태스크로 → 요청은 다른 아기 저장을 기다리지 않음
+        같은 아기를 다시 부르면 _checkout이 _evicting의 저장 완료를 기다림
+        """
+        async with self._lock:
+            overflow = len(self._entries) - self.max_resident
+            if overflow <= 0:
+                return
+            victims = [baby_id for baby_id, entry in self._entries.items() if entry.idle][:overflow]
+            for baby_id in victims:
+                entry = self._entries.pop(baby_id)
+                self._evicting[baby_id] = asyncio.create_task(self._persist(baby_id, entry.substrate))
+
+    async def wait_evictions(self) -> None:
+        """진행 중인 제거 저장 완료 대기"""
+        while self._evicting:
+            await asyncio.gather(*list(self._evicting.values()))
+
+    async def _persist(self, baby_id: str, substrate: BabySubstrate) -> None:
+        """학습 큐를 비우고 상태 저장"""
+        try:
+            await substrate.drain()
+            await asyncio.to_thread(substrate.save)
+            self._stats["evictions"] += 1
+            print(f"[POOL] Evicted baby '{baby_id}'")
+        except Exception as e:
+            print(f"[POOL] Failed to persist baby '{baby_id}': {e}")
+        finally:
+            self._evicting.pop(baby_id, None)
+
+    async def close(self) -> None:
+        """모든 인스턴스 저장 (서버 종료 시)"""
+        await self.wait_evictions()
+        async with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+        for baby_id, entry in entries:
+            async with entry.lock:
+                await self._persist(baby_id, entry.substrate)
+
+    def get_stats(self) -> dict:
+        return {
+            **self._stats,
+            "resident": len(self._entries),
+            "evicting": len(self._evicting),
+            "max_resident": self.max_resident,
+            "babies": {
+                baby_id: {"active": entry.active, "idle_s": time.monotonic() - entry.last_used}
+                for baby_id, entry in self._entries.items()
+            },
+        }
+
+
+# 싱글톤 인스턴스
+_pool: Optional[SubstratePool] = None
+
+
+def get_substrate_pool(
+    base_config: Optional[BabyConfig] = None,
+    max_resident: int = MAX_RESIDENT_BABIES,
+) -> SubstratePool:
+    """SubstratePool 싱글톤 (인자는 처음 생성할 때만 사용)"""
+    global _pool
+    if _pool is None:
+        _pool = SubstratePool(base_config, max_resident)
+    return _pool
@@ -541,7 +541,7 @@ class TeamOptimizer:
     에이전트 팀 구성을 학습하고 최적화
 
     Usage:
-        optimizer = TeamOptimizer(supabase_client)
+        optimizer = await create_team_optimizer()
 
         # 팀 추천
         recommendation = await optimizer.recommend_team('coding', complexity=0.7)
@@ -884,3 +884,27 @@ class TeamOptimizer:
                 (adopted.count or 0) / max(1, experiments.count or 1)
             )
         }
+
+
+# 편의 함수
+async def create_team_optimizer(supabase_url: str = None, supabase_key: str = None):
+    """
+    TeamOptimizer 생성 헬퍼
+
+    URL/키를 지정하지 않으면 공유 HTTP/2 풀 기반 AsyncBrainDatabase 사용
+    """
+    if not supabase_url and not supabase_key:
+        from .db import get_async_brain_db
+        return TeamOptimizer(get_async_brain_db())
+
+    from supabase import acreate_client
+    import os
+
+    url = supabase_url or os.getenv('SUPABASE_URL')
+    key = supabase_key or os.getenv('SUPABASE_ANON_KEY')
+
+    if not url or not key:
+        raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY required")
+
+    client = await acreate_client(url, key)
+    return TeamOptimizer(client)
@@ -0,0 +1,103 @@
+"""
+과부하 제어 테스트
+
+동시 실행 상한 → 대기열 → 마감 인지 거절 (429 + Retry-After)
+"""
+
+import asyncio
+
+import pytest
+
+from neural.baby.admission import AdmissionClass, AdmissionGate, OverloadedError
+
+
+def make_gate(max_in_flight=2, max_queue=2, max_wait_s=1.0, initial_service_s=0.05) -> AdmissionGate:
+    return AdmissionGate("pipeline", AdmissionClass(max_in_flight, max_queue, max_wait_s, initial_service_s))
+
+
+async def hold(gate: AdmissionGate, seconds: float, log: list, name: str, deadline_s=None) -> None:
+    try:
+        async with gate.admit(deadline_s):
+            log.append(f"start {name}")
+            await asyncio.sleep(seconds)
+    except OverloadedError as e:
+        log.append(f"reject {name}: {e.reason}")
+
+
+class TestAdmissionGate:
+    """게이트 동작"""
+
+    def test_in_flight_bounded_and_fifo(self):
+        gate = make_gate(max_in_flight=1, max_queue=3)
+        log = []
+
+        async def run():
+            tasks = [asyncio.create_task(hold(gate, 0.02, log, str(i))) for i in range(3)]
+            await asyncio.sleep(0.005)
+            assert gate.get_stats()["in_flight"] == 1
+            assert gate.get_stats()["waiting"] == 2
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+
+        assert log == ["start 0", "start 1", "start 2"]
+        assert gate.get_stats()["in_flight"] == 0
+
+    def test_queue_full_rejects_immediately(self):
+        gate = make_gate(max_in_flight=1, max_queue=1)
+        log = []
+
+        async def run():
+            await asyncio.gather(*(hold(gate, 0.05, log, str(i)) for i in range(3)))
+
+        asyncio.run(run())
+
+        assert "reject 2: queue full" in log
+        assert gate.get_stats()["rejected"] == 1
+
+    def test_deadline_aware_shedding(self):
+        """예상 대기시간이 마감보다 길면 기다리지 않고 거절"""
+        gate = make_gate(max_in_flight=1, max_queue=5, initial_service_s=1.0)
+        log = []
+
+        async def run():
+            await asyncio.gather(
+                hold(gate, 0.05, log, "long"),
+                hold(gate, 0.0, log, "impatient", deadline_s=0.1),
+            )
+
+        asyncio.run(run())
+
+        assert log == ["start long", "reject impatient: deadline too short for queue"]
+
+    def test_wait_timeout_returns_retry_after(self):
+        gate = make_gate(max_in_flight=1, max_queue=5, initial_service_s=0.01)
+
+        async def run():
+            blocker = asyncio.create_task(hold(gate, 0.2, [], "blocker"))
+            await asyncio.sleep(0)
+            with pytest.raises(OverloadedError) as info:
+                async with gate.admit(deadline_s=0.05):
+                    pass
+            await blocker
+            return info.value
+
+        error = asyncio.run(run())
+
+        assert error.reason == "timed out in queue"
+        assert error.retry_after == "1"
+        stats = gate.get_stats()
+        assert stats["timed_out"] == 1
+        assert stats["waiting"] == 0
+        assert stats["in_flight"] == 0
+
+    def test_service_time_tracked(self):
+        gate = make_gate(initial_service_s=1.0)
+
+        async def run():
+            async with gate.admit():
+                await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        assert gate.get_stats()["service_ms"] < 1000
@@ -0,0 +1,98 @@
+"""
+API 서버 엔드포인트 테스트
+
+/api/process: 풀에서 아기 인스턴스를 빌려 파이프라인 실행 → 응답 변환
+(BabySubstrate는 가짜 객체로 교체, fastapi가 없으면 건너뜀)
+"""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+from neural.baby import api_server
+from neural.baby.substrate import BabyConfig
+from neural.baby.substrate_pool import SubstratePool
+
+
+@dataclass
+class FakeResult:
+    success: bool
+    output: str
+    emotional_state: dict = field(default_factory=dict)
+    development_progress: dict = field(default_factory=dict)
+
+
+class FakeSubstrate:
+    def __init__(self, config):
+        self.config = config
+        self.tasks = []
+
+    async def process(self, task, *, on_progress=None):
+        self.tasks.append(task)
+        return FakeResult(
+            success=True,
+            output=f"# {task}",
+            emotional_state={"joy": 0.6},
+            development_progress={"stage": "TODDLER"},
+        )
+
+    async def drain(self):
+        pass
+
+    def save(self):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    created = []
+
+    def factory(config):
+        created.append(FakeSubstrate(config))
+        return created[-1]
+
+    monkeypatch.setattr(api_server, "pool", SubstratePool(BabyConfig(), factory=factory))
+    return TestClient(api_server.app), created
+
+
+class TestProcessEndpoint:
+    """/api/process"""
+
+    def test_process_returns_stage_number(self, client):
+        http, created = client
+
+        response = http.post("/api/process", json={"task": "합 함수", "baby_id": "alice"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "output": "# 합 함수",
+            "success": True,
+            "emotional_state": {"joy": 0.6},
+            "development_stage": 3,
+        }
+        assert created[0].tasks == ["합 함수"]
+
+    def test_invalid_baby_id(self, client):
+        http, _ = client
+
+        response = http.post("/api/process", json={"task": "합 함수", "baby_id": "../etc"})
+
+        assert response.status_code == 400
+
+
+def test_shutdown_closes_async_client(client, monkeypatch):
+    """서버 종료 시 공유 비동기 Supabase 연결 풀 종료"""
+    http, _ = client
+    closed = []
+
+    async def fake_close():
+        closed.append(True)
+
+    monkeypatch.setattr(api_server, "close_async_supabase_client", fake_close)
+    with http:
+        pass
+
+    assert closed == [True]
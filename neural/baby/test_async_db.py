@@ -0,0 +1,97 @@
+"""
+AsyncBrainDatabase 테스트
+
+Supabase 연결 없이 가짜 쿼리로 동시성 제한/순서 보장 확인
+"""
+
+import asyncio
+
+from neural.baby.db import AsyncBrainDatabase, get_async_brain_db
+from neural.baby.evolution import create_evolution_engine
+from neural.baby.persistence import create_persistent_substrate
+from neural.baby.team_optimizer import create_team_optimizer
+
+
+class FakeResponse:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """execute()가 await 가능한 가짜 PostgREST 쿼리"""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, value, delay: float = 0.01):
+        self.value = value
+        self.delay = delay
+
+    async def execute(self):
+        FakeQuery.active += 1
+        FakeQuery.peak = max(FakeQuery.peak, FakeQuery.active)
+        await asyncio.sleep(self.delay)
+        FakeQuery.active -= 1
+        return FakeResponse([self.value], count=self.value)
+
+
+class TestAsyncBrainDatabase:
+    """비동기 DB 래퍼 테스트"""
+
+    def setup_method(self):
+        FakeQuery.active = 0
+        FakeQuery.peak = 0
+
+    def test_gather_preserves_order(self):
+        """gather 결과는 입력 순서 유지"""
+        db = AsyncBrainDatabase(max_concurrency=4)
+        queries = [FakeQuery(i, delay=0.01 * (5 - i)) for i in range(5)]
+
+        results = asyncio.run(db.gather(*queries))
+
+        assert [r.count for r in results] == [0, 1, 2, 3, 4]
+
+    def test_concurrency_limit(self):
+        """세마포어로 동시 실행 수 제한"""
+        db = AsyncBrainDatabase(max_concurrency=3)
+        queries = [FakeQuery(i) for i in range(10)]
+
+        asyncio.run(db.gather(*queries))
+
+        assert FakeQuery.peak == 3
+
+    def test_queries_overlap(self):
+        """제한 내에서는 쿼리가 겹쳐서 실행됨"""
+        db = AsyncBrainDatabase(max_concurrency=8)
+        queries = [FakeQuery(i, delay=0.05) for i in range(8)]
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await db.gather(*queries)
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+
+        assert FakeQuery.peak == 8
+        assert elapsed < 0.05 * 4
+
+
+class TestAsyncConsumers:
+    """Phase 10 엔진 생성 헬퍼는 같은 비동기 DB(공유 연결 풀) 사용"""
+
+    def test_default_helpers_share_async_db(self):
+        async def run():
+            return await asyncio.gather(
+                create_evolution_engine(),
+                create_persistent_substrate(),
+                create_team_optimizer(),
+            )
+
+        engine, substrate, optimizer = asyncio.run(run())
+
+        db = get_async_brain_db()
+        assert engine.db is substrate.db is optimizer.db is db
+        assert substrate.session_manager.db is db
+        assert substrate.restorer.db is db
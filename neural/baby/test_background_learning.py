@@ -0,0 +1,160 @@
+"""
+백그라운드 학습 큐 테스트
+
+process()는 파이프라인 결과만 나오면 반환하고, 학습은 순서 보장 큐에서 실행
+(에이전트/파이프라인/학습 단계는 가짜 함수로 교체)
+"""
+
+import asyncio
+
+from neural.baby.substrate import BabySubstrate, BabyConfig
+
+
+def make_substrate(
+    learn_delay: float = 0.0,
+    gate: asyncio.Event = None,
+    **config,
+) -> tuple[BabySubstrate, list]:
+    """가짜 파이프라인 + 지연 학습 기질, 학습 순서 기록 리스트 반환 (gate: 열릴 때까지 학습 대기)"""
+    substrate = BabySubstrate(BabyConfig(
+        verbose=False,
+        enable_supabase=False,
+        enable_world_model=False,
+        enable_vision=False,
+        enable_response_cache=False,
+        enable_adaptive_routing=False,
+        **config,
+    ))
+    learned = []
+
+    async def fake_pipeline(user_request, memories, approach, strategy_decision=None):
+        return {"success": True, "code": f"# {user_request}", "iterations": 1}
+
+    async def fake_learn(user_request, result):
+        await asyncio.sleep(learn_delay)
+        if gate is not None:
+            await gate.wait()
+        if user_request == "boom":
+            raise RuntimeError("learning failed")
+        learned.append(user_request)
+        return {
+            "experience_id": f"exp-{user_request}",
+            "curiosity_signal": {"zone": "optimal"},
+            "world_model_stats": {},
+            "prediction_made": {},
+        }
+
+    substrate._initialize_agents = lambda: None
+    # 기억 회상은 임베딩 클라이언트를 불러옴 → 빈 회상으로 교체
+    substrate._memory.recall_for_task = lambda task: {
+        "similar_experiences": [], "successful_examples": [], "recent_failures": [],
+    }
+    substrate._execute_pipeline = fake_pipeline
+    substrate._learn_from_pipeline = fake_learn
+    return substrate, learned
+
+
+class TestBackgroundLearning:
+    """응답 후 학습"""
+
+    def test_returns_before_learning(self):
+        async def run():
+            gate = asyncio.Event()
+            substrate, learned = make_substrate(gate=gate)
+            # 학습이 막혀 있어도 process()는 반환 (학습을 기다리면 시간 초과)
+            result = await asyncio.wait_for(substrate.process("첫 요청"), timeout=5)
+            pending = list(learned)
+            gate.set()
+            await substrate.drain()
+            return result, pending, learned
+
+        result, pending, learned = asyncio.run(run())
+
+        assert result.success
+        assert result.learning_pending
+        assert pending == []
+        assert learned == ["첫 요청"]
+
+    def test_learning_runs_in_order(self):
+        substrate, learned = make_substrate(learn_delay=0.01)
+        requests = [f"요청 {i}" for i in range(5)]
+
+        async def run():
+            for request in requests:
+                await substrate.process(request)
+            await substrate.drain()
+
+        asyncio.run(run())
+
+        assert learned == requests
+        assert substrate.get_learning_stats()["completed"] == 5
+
+    def test_next_request_sees_previous_learning(self):
+        substrate, learned = make_substrate(learn_delay=0.05)
+        recalls = []
+        recall = substrate._memory.recall_for_task
+
+        def recording_recall(task):
+            recalls.append((task, list(learned)))
+            return recall(task)
+
+        substrate._memory.recall_for_task = recording_recall
+
+        async def run():
+            await substrate.process("첫 요청")
+            await substrate.process("둘째 요청")
+            await substrate.drain()
+
+        asyncio.run(run())
+
+        # 둘째 요청의 회상은 첫 요청 학습이 끝난 뒤
+        assert recalls == [("첫 요청", []), ("둘째 요청", ["첫 요청"])]
+
+    def test_backpressure_bounds_queue(self):
+        substrate, learned = make_substrate(learn_delay=0.05, learning_queue_size=1)
+
+        async def run():
+            await asyncio.gather(*(substrate.process(f"요청 {i}") for i in range(4)))
+            await substrate.drain()
+
+        asyncio.run(run())
+
+        stats = substrate.get_learning_stats()
+        assert stats["max_depth"] <= 1
+        assert stats["pending"] == 0
+        assert len(learned) == 4
+
+    def test_failure_does_not_stop_worker(self):
+        substrate, learned = make_substrate()
+
+        async def run():
+            await substrate.process("boom")
+            await substrate.process("다음 요청")
+            await substrate.drain()
+
+        asyncio.run(run())
+
+        assert learned == ["다음 요청"]
+        assert substrate.get_learning_stats()["failed"] == 1
+
+    def test_inline_learning_when_disabled(self):
+        substrate, learned = make_substrate(background_learning=False)
+
+        result = asyncio.run(substrate.process("동기 학습"))
+
+        assert not result.learning_pending
+        assert result.experience_id == "exp-동기 학습"
+        assert learned == ["동기 학습"]
+
+    def test_new_event_loop_gets_new_worker(self):
+        """asyncio.run()을 여러 번 호출해도 학습 워커가 새 루프에서 동작"""
+        substrate, learned = make_substrate()
+
+        async def run(request):
+            await substrate.process(request)
+            await substrate.drain()
+
+        asyncio.run(run("첫 루프"))
+        asyncio.run(run("두 번째 루프"))
+
+        assert learned == ["첫 루프", "두 번째 루프"]
@@ -0,0 +1,116 @@
+"""
+LLM 기록/재생 트랜스포트 테스트
+
+기록 → 재생 왕복, 합성 지연시간, Anthropic 래퍼, LLMClient 통합 확인 (네트워크 없음)
+"""
+
+import time
+
+import pytest
+
+from common.cassette import (
+    CassetteMissError,
+    CassetteTransport,
+    LatencyModel,
+    RecordingAnthropicClient,
+)
+from neural.baby.llm_client import LLMClient
+
+
+REQUEST = {"provider": "google", "model": "gemini-2.0-flash", "prompt": "피보나치"}
+
+
+class FakeMessages:
+    """anthropic messages.create 흉내"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        block = type("Block", (), {"type": "text", "text": f"answer to {kwargs['messages'][0]['content']}"})()
+        usage = type("Usage", (), {"input_tokens": 10, "output_tokens": 20})()
+        return type("Message", (), {"content": [block], "usage": usage})()
+
+
+class TestCassetteTransport:
+    """카세트 기록/재생"""
+
+    def test_record_then_replay(self, tmp_path):
+        path = str(tmp_path / "llm.jsonl.gz")
+        recorder = CassetteTransport("record", path)
+        assert recorder.call(REQUEST, lambda: "def fib(n): ...") == "def fib(n): ..."
+
+        replayer = CassetteTransport("replay", path, LatencyModel("fixed:0"))
+
+        assert replayer.call(dict(reversed(list(REQUEST.items()))), lambda: pytest.fail("live call")) == "def fib(n): ..."
+        assert replayer.stats["replayed"] == 1
+
+    def test_replay_miss(self, tmp_path):
+        replayer = CassetteTransport("replay", str(tmp_path / "empty.jsonl.gz"))
+
+        with pytest.raises(CassetteMissError):
+            replayer.call(REQUEST, lambda: "live")
+
+    def test_repeated_recordings_cycle(self, tmp_path):
+        path = str(tmp_path / "llm.jsonl.gz")
+        recorder = CassetteTransport("record", path)
+        recorder.call(REQUEST, lambda: "first")
+        recorder.call(REQUEST, lambda: "second")
+
+        replayer = CassetteTransport("replay", path, LatencyModel("fixed:0"))
+
+        assert [replayer.call(REQUEST, lambda: None) for _ in range(3)] == ["first", "second", "first"]
+
+    def test_latency_models(self):
+        assert LatencyModel("fixed:50").sample_ms(None) == 50
+        assert LatencyModel("recorded:0.5").sample_ms(100) == 50
+        samples = [LatencyModel("lognormal:100:0.3", seed=1).sample_ms(None) for _ in range(3)]
+        assert all(s > 0 for s in samples)
+        assert samples[0] == samples[1]  # 시드 고정 → 결정적
+
+    def test_synthetic_latency_applied(self, tmp_path):
+        path = str(tmp_path / "llm.jsonl.gz")
+        CassetteTransport("record", path).call(REQUEST, lambda: "ok")
+        replayer = CassetteTransport("replay", path, LatencyModel("fixed:50"))
+
+        start = time.perf_counter()
+        replayer.call(REQUEST, lambda: None)
+
+        assert time.perf_counter() - start >= 0.05
+
+
+class TestAnthropicWrapper:
+    """에이전트용 Anthropic 클라이언트 래퍼"""
+
+    def test_record_and_replay_messages(self, tmp_path):
+        path = str(tmp_path / "anthropic.jsonl.gz")
+        fake = FakeMessages()
+        live = type("Client", (), {"messages": fake})()
+        kwargs = dict(model="claude", max_tokens=100, system="s", messages=[{"role": "user", "content": "q"}])
+
+        recorded = RecordingAnthropicClient(live, CassetteTransport("record", path)).messages.create(**kwargs)
+        replayed = RecordingAnthropicClient(
+            None, CassetteTransport("replay", path, LatencyModel("fixed:0"))
+        ).messages.create(**kwargs)
+
+        assert replayed.content[0].text == recorded.content[0].text == "answer to q"
+        assert replayed.usage.output_tokens == 20
+        assert fake.calls == 1
+
+
+class TestLLMClientReplay:
+    """LLMClient가 카세트로 동작 (API 키 없이)"""
+
+    def test_generate_from_cassette(self, tmp_path):
+        path = str(tmp_path / "llm.jsonl.gz")
+
+        recording = LLMClient()
+        recording._transport = CassetteTransport("record", path)
+        recording._generate_google = lambda *args, **kwargs: "recorded answer"
+        recording.generate("안녕", "gemini-2-flash", max_tokens=50)
+
+        replaying = LLMClient()
+        replaying._transport = CassetteTransport("replay", path, LatencyModel("fixed:0"))
+
+        assert replaying.generate("안녕", "gemini-2-flash", max_tokens=50) == "recorded answer"
@@ -0,0 +1,146 @@
+"""
+CausalGraph 테스트
+
+인접 리스트 갱신 → k-hop/최강 경로/상위 결과 조회 → 스냅샷 복원
+(DB/LLM은 가짜 객체로 교체)
+"""
+
+import pytest
+
+from neural.baby.causal_graph import CausalGraph
+from neural.baby.concept_index import ConceptIndex
+from neural.baby.world_model import WorldModel
+
+
+def edge(cause, effect, strength, confidence=1.0, relationship_type="causes"):
+    return {
+        "cause_concept_id": cause,
+        "effect_concept_id": effect,
+        "causal_strength": strength,
+        "confidence": confidence,
+        "relationship_type": relationship_type,
+    }
+
+
+# a → b → d 는 0.9 × 0.9 = 0.81, a → c → d 는 0.5 × 1.0 = 0.5, a → d 직접은 0.3
+EDGES = [
+    edge("a", "b", 0.9),
+    edge("b", "d", 0.9),
+    edge("a", "c", 0.5),
+    edge("c", "d", 1.0),
+    edge("a", "d", 0.3),
+    edge("d", "a", 1.0),
+    edge("d", "e", 0.8, confidence=0.5),
+]
+
+
+class FakeDB:
+    def __init__(self, edges):
+        self.edges = edges
+        self.loads = 0
+
+    def get_causal_edges(self):
+        self.loads += 1
+        return list(self.edges)
+
+    def get_concept_names(self, created_after=None):
+        return [
+            {"id": cid, "name": name, "created_at": "2026-01-01T00:00:00"}
+            for cid, name in [("a", "입력 검증"), ("b", "예외 감소"), ("d", "안정성"), ("e", "신뢰")]
+        ]
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.response
+
+
+def make_graph(**kwargs) -> CausalGraph:
+    graph = CausalGraph(**kwargs)
+    graph.load(FakeDB(EDGES))
+    return graph
+
+
+class TestQueries:
+    """그래프 조회"""
+
+    def test_reachable_within_hops(self):
+        graph = make_graph()
+
+        assert graph.reachable("a", max_hops=1) == {"b": 1, "c": 1, "d": 1}
+        assert graph.reachable("a", max_hops=2) == {"b": 1, "c": 1, "d": 1, "e": 2}
+        assert graph.reachable("a", max_hops=2, min_weight=0.5) == {"b": 1, "c": 1, "d": 2}
+
+    def test_strongest_path_prefers_product(self):
+        graph = make_graph()
+
+        path, score = graph.strongest_path("a", "d")
+
+        assert path == ["a", "b", "d"]
+        assert score == pytest.approx(0.81)
+
+    def test_strongest_path_respects_hop_limit(self):
+        graph = make_graph()
+
+        path, score = graph.strongest_path("a", "d", max_hops=1)
+
+        assert path == ["a", "d"]
+        assert score == pytest.approx(0.3)
+        assert graph.strongest_path("e", "a") is None
+
+    def test_top_effects(self):
+        graph = make_graph()
+
+        direct = graph.top_effects("a", limit=2)
+        indirect = graph.top_effects("a", limit=4, max_hops=2)
+
+        assert [e["concept_id"] for e in direct] == ["b", "c"]
+        assert [e["concept_id"] for e in indirect] == ["b", "d", "c", "e"]
+        assert indirect[3]["path"] == ["a", "d", "e"]   # 2-hop 제한 안에서 최선
+        assert graph.top_effects("a", limit=4, max_hops=3)[3]["path"] == ["a", "b", "d", "e"]
+
+    def test_upsert_updates_edge(self):
+        graph = make_graph()
+
+        graph.upsert(edge("a", "d", 1.0))
+
+        assert graph.strongest_path("a", "d")[0] == ["a", "d"]
+        assert graph.get_stats()["edges"] == len(EDGES)
+
+
+class TestSnapshot:
+    """스냅샷 저장/복원"""
+
+    def test_roundtrip(self, tmp_path):
+        path = str(tmp_path / "causal_graph.json")
+        make_graph(persist_path=path)
+
+        restored = CausalGraph(persist_path=path)
+        db = FakeDB(EDGES)
+        restored.ensure_fresh(db)
+
+        assert db.loads == 0
+        assert restored.get_stats()["snapshot_loads"] == 1
+        assert restored.strongest_path("a", "e")[0] == ["a", "b", "d", "e"]
+
+
+class TestWorldModelGrounding:
+    """시뮬레이션 프롬프트에 인과 경로 포함"""
+
+    def test_simulation_prompt_includes_causal_paths(self):
+        db = FakeDB(EDGES)
+        db.insert_simulation = lambda **kwargs: {}
+        llm = FakeLLM('{"action": "검증 추가", "outcome": "success", "new_state": {}}')
+        model = WorldModel(db=db, llm_client=llm, development_stage=3, verbose=False,
+                           concept_index=ConceptIndex(), causal_graph=CausalGraph())
+
+        model.run_simulation({"code": "함수"}, goal="입력 검증 추가", max_steps=2)
+
+        assert db.loads == 1
+        assert "입력 검증 → 예외 감소 → 안정성 (강도 0.81)" in llm.prompts[0]
+        assert llm.prompts[0].count("알려진 인과관계") == 1
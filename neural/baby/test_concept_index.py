@@ -0,0 +1,120 @@
+"""
+ConceptIndex 테스트
+
+개념 이름 일괄 로드 → 증분 갱신 → 시나리오 한 번 스캔 매칭
+(DB/LLM은 가짜 객체로 교체)
+"""
+
+from neural.baby.concept_index import ConceptIndex
+from neural.baby.world_model import WorldModel
+
+
+CONCEPTS = [
+    {"id": "c1", "name": "정렬", "created_at": "2026-01-01T00:00:00"},
+    {"id": "c2", "name": "Recursion", "created_at": "2026-01-02T00:00:00"},
+    {"id": "c3", "name": "리스트", "created_at": "2026-01-03T00:00:00"},
+    {"id": "c4", "name": "a", "created_at": "2026-01-04T00:00:00"},
+]
+
+
+class FakeDB:
+    def __init__(self, concepts):
+        self.concepts = list(concepts)
+        self.name_calls = []
+        self.lookups = []
+        self.causal_rows = []
+
+    def get_concept_names(self, created_after=None):
+        self.name_calls.append(created_after)
+        return [c for c in self.concepts if created_after is None or c["created_at"] > created_after]
+
+    def get_all_concepts(self):
+        raise AssertionError("get_all_concepts는 더 이상 호출되지 않아야 함")
+
+    def get_concept_by_name(self, name):
+        self.lookups.append(name)
+        return next((c for c in self.concepts if c["name"] == name), None)
+
+    def upsert_causal_model(self, **kwargs):
+        self.causal_rows.append(kwargs)
+        return kwargs
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.response
+
+
+class TestConceptIndex:
+    """인덱스 로드/갱신/매칭"""
+
+    def test_match_all_names_in_order(self):
+        index = ConceptIndex()
+        index.load(FakeDB(CONCEPTS))
+
+        assert index.match("리스트를 recursion 없이 정렬하기") == ["리스트", "Recursion", "정렬"]
+
+    def test_short_names_skipped(self):
+        index = ConceptIndex()
+        index.load(FakeDB(CONCEPTS))
+
+        assert index.get_id("a") == "c4"
+        assert index.match("a b c") == []
+
+    def test_incremental_refresh(self):
+        db = FakeDB(CONCEPTS)
+        index = ConceptIndex(refresh_interval_s=0)
+        index.ensure_fresh(db)
+        db.concepts.append({"id": "c5", "name": "캐시", "created_at": "2026-02-01T00:00:00"})
+
+        index.ensure_fresh(db)
+
+        assert db.name_calls == [None, "2026-01-04T00:00:00"]
+        assert index.get_id("캐시") == "c5"
+        assert index.match("캐시 정렬") == ["캐시", "정렬"]
+        assert index.get_stats()["incremental_refreshes"] == 1
+
+    def test_add_invalidates_matcher(self):
+        index = ConceptIndex()
+        index.load(FakeDB(CONCEPTS))
+        assert index.match("해시맵") == []
+
+        index.add({"id": "c9", "name": "해시맵", "created_at": "2026-03-01T00:00:00"})
+
+        assert index.match("해시맵") == ["해시맵"]
+        assert index.get_stats()["last_created_at"] == "2026-03-01T00:00:00"
+
+
+class TestWorldModelConcepts:
+    """WorldModel이 인덱스를 사용"""
+
+    def test_prediction_uses_index(self):
+        db = FakeDB(CONCEPTS)
+        llm = FakeLLM('{"prediction": "성공", "confidence": 0.7, "reasoning": "쉬움"}')
+        model = WorldModel(db=db, llm_client=llm, development_stage=2, verbose=False,
+                           concept_index=ConceptIndex())
+
+        model.make_prediction("리스트 정렬 함수 작성")
+        model.make_prediction("리스트 정렬 함수 작성")
+
+        assert db.name_calls == [None]
+        assert "관련 개념: 리스트, 정렬" in llm.prompts[0]
+
+    def test_causal_relation_resolves_ids_from_index(self):
+        db = FakeDB(CONCEPTS)
+        index = ConceptIndex()
+        index.load(db)
+        model = WorldModel(db=db, llm_client=None, development_stage=4, verbose=False,
+                           concept_index=index)
+
+        model.discover_causal_relation("정렬", "Recursion")
+        model.discover_causal_relation("정렬", "없는 개념")
+
+        assert db.causal_rows[0]["cause_concept_id"] == "c1"
+        assert db.causal_rows[0]["effect_concept_id"] == "c2"
+        assert db.lookups == ["없는 개념"]
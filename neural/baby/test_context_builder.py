@@ -0,0 +1,164 @@
+"""
+ContextBuilder 테스트
+
+티어별 토큰 예산, 예시 정렬/중복 제거, 피드백 요약
+"""
+
+import asyncio
+
+from neural.baby.context_builder import (
+    ContextBuilder,
+    CONTEXT_TOKEN_BUDGETS,
+    compress_feedback,
+    rank_examples,
+    similarity,
+)
+from neural.baby.llm_client import AVAILABLE_MODELS, ModelTier
+from neural.baby.llm_metrics import estimate_tokens
+from neural.baby.substrate import BabyConfig, BabySubstrate
+
+
+def example(request: str, action: str) -> dict:
+    return {"request": request, "action": action, "success": True}
+
+
+class TestRanking:
+    """기억 예시 선택"""
+
+    def test_most_similar_first(self):
+        ranked = rank_examples("피보나치 함수 만들어줘", [
+            example("스택 클래스 구현", "class Stack: ..."),
+            example("피보나치 함수 작성", "def fib(n): ..."),
+        ])
+        assert ranked[0]["request"] == "피보나치 함수 작성"
+
+    def test_duplicates_removed(self):
+        ranked = rank_examples("정렬", [
+            example("리스트 정렬 함수", "def sort(xs): return sorted(xs)"),
+            example("리스트 정렬 함수", "def sort(xs): return sorted(xs)"),
+            example("이진 탐색", "def search(xs, x): ..."),
+        ])
+        assert len(ranked) == 2
+
+    def test_similarity_bounds(self):
+        assert similarity("abc def", "abc def") == 1.0
+        assert similarity("", "abc") == 0.0
+
+
+class TestFeedback:
+    """피드백 요약"""
+
+    def test_short_feedback_unchanged(self):
+        assert compress_feedback("Low review score: 5/10", 100) == "Low review score: 5/10"
+
+    def test_key_lines_kept_within_budget(self):
+        feedback = "Test issues. Review: 4/10\n" + "\n".join(
+            f"filler line number {i} with padding text" for i in range(50)
+        ) + "\nAssertionError: expected 5"
+        summary = compress_feedback(feedback, 30)
+
+        assert estimate_tokens(summary) <= 30
+        assert summary.startswith("Test issues")
+        assert "AssertionError" in summary
+
+
+class TestBuild:
+    """예산 내 코더 입력 구성"""
+
+    def test_prompt_bounded_as_memory_grows(self):
+        builder = ContextBuilder()
+        examples = [example(f"요청 {i} " * 20, f"def solution_{i}(): pass " * 20) for i in range(200)]
+        text = builder.build(
+            "피보나치 함수 만들어줘",
+            ModelTier.FLASH,
+            header="\n\n[Previous successful examples]\n",
+            examples=examples,
+            max_examples=200,
+            feedback="Test issues\n" + "Traceback line\n" * 1000,
+        )
+
+        assert estimate_tokens(text) <= CONTEXT_TOKEN_BUDGETS[ModelTier.FLASH]
+        assert text.startswith("[Previous successful examples]\n- Request:")
+        assert "\n[Request]\n피보나치 함수 만들어줘" in text
+        assert "[Feedback from previous attempt]" in text
+        stats = builder.get_stats()
+        assert stats["examples_dropped"] > 0
+        assert stats["feedback_compressed"] == 1
+
+    def test_larger_tier_fits_more_examples(self):
+        examples = [example(f"작업 {i}", f"code_{i} " * 60) for i in range(20)]
+        flash = ContextBuilder(budgets={ModelTier.FLASH: 200}).build(
+            "작업", ModelTier.FLASH, examples=examples, max_examples=20,
+        )
+        thinking = ContextBuilder().build(
+            "작업", ModelTier.THINKING, examples=examples, max_examples=20,
+        )
+        assert thinking.count("- Request:") > flash.count("- Request:")
+
+    def test_stable_prefix_before_request(self):
+        text = ContextBuilder().build(
+            "정렬",
+            ModelTier.FLASH,
+            header="[Safe reference]\n",
+            examples=[example("정렬 함수", "def sort(xs): return sorted(xs)")],
+            max_examples=1,
+            action_only=True,
+        )
+        assert text == "[Safe reference]\n- def sort(xs): return sorted(xs)...\n\n[Request]\n정렬"
+        assert ContextBuilder().build("정렬", ModelTier.FLASH) == "정렬"
+
+
+class FakeClient:
+    def __init__(self):
+        self.models = []
+
+    def generate(self, prompt, model_key, **kwargs):
+        self.models.append(model_key)
+        return "def fib(n): ..."
+
+
+class FailingAgent:
+    """테스트/리뷰 항상 실패 → 재시도마다 다시 라우팅"""
+
+    async def analyze_and_test(self, code):
+        return "FAIL: error"
+
+    async def review(self, code):
+        return "2/10"
+
+
+class TestPipelineBudget:
+    """코더 입력 예산 = 실제로 호출한 모델의 티어"""
+
+    def test_budget_tier_matches_called_model(self):
+        substrate = BabySubstrate(BabyConfig(
+            verbose=False,
+            enable_supabase=False,
+            enable_world_model=False,
+            enable_vision=False,
+            enable_response_cache=False,
+            enable_adaptive_routing=False,
+            enable_emotional_modulation=False,
+        ))
+        client = FakeClient()
+        substrate._cognitive_router.llm_client = client
+        substrate._agents = {"tester": FailingAgent(), "reviewer": FailingAgent()}
+
+        tiers = []
+        build = substrate._context_builder.build
+
+        def spy(request, tier, **kwargs):
+            tiers.append(tier)
+            return build(request, tier, **kwargs)
+
+        substrate._context_builder.build = spy
+        memories = {
+            "successful_examples": [example(f"알고리즘 {i}", "def solve(): ... " * 30) for i in range(5)],
+            "similar_experiences": [],
+        }
+
+        asyncio.run(substrate._execute_pipeline("피보나치 함수 만들어줘", memories, "direct"))
+
+        assert len(client.models) == substrate.config.max_iterations
+        assert tiers == [AVAILABLE_MODELS[model].tier for model in client.models]
+        assert ModelTier.THINKING in tiers     # 2회 실패 후 Thinking 예산으로 확대
@@ -0,0 +1,196 @@
+"""
+비동기 작업 API 테스트
+
+작업 등록 → 워커 풀 실행 → 진행 이벤트 스트림 (재생 + 실시간)
+(BabySubstrate/파이프라인은 가짜 함수로 교체)
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from neural.baby.jobs import JobManager, JobQueueFullError, JobStatus
+from neural.baby.substrate import BabySubstrate, BabyConfig, emit_progress
+from neural.baby.substrate_pool import SubstratePool
+
+
+@dataclass
+class FakeResult:
+    success: bool
+    iterations: int
+    output: str
+
+
+class FakeSubstrate:
+    def __init__(self, config):
+        self.config = config
+        self.gate: asyncio.Event = None
+
+    async def process(self, task, *, on_progress=None):
+        if task == "boom":
+            raise RuntimeError("pipeline crashed")
+        on_progress("routing", {"iteration": 1, "model": "gemini-2-flash"})
+        if self.gate:
+            await self.gate.wait()
+        on_progress("review", {"iteration": 1, "score": 8})
+        return FakeResult(success=True, iterations=1, output=f"# {task}")
+
+    async def drain(self):
+        pass
+
+    def save(self):
+        pass
+
+
+def make_manager(**kwargs) -> tuple[JobManager, list]:
+    created = []
+
+    def factory(config):
+        created.append(FakeSubstrate(config))
+        return created[-1]
+
+    pool = SubstratePool(BabyConfig(), factory=factory)
+    return JobManager(pool, **kwargs), created
+
+
+async def collect(manager: JobManager, job_id: str) -> list[str]:
+    return [event["stage"] async for event in manager.events(job_id)]
+
+
+class TestJobManager:
+    """작업 실행과 이벤트"""
+
+    def test_job_runs_and_streams_events(self):
+        manager, _ = make_manager()
+
+        async def run():
+            job = manager.submit("정렬 함수")
+            stages = await collect(manager, job.id)
+            return job, stages
+
+        job, stages = asyncio.run(run())
+
+        assert stages == ["queued", "started", "routing", "review", "done"]
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result["output"] == "# 정렬 함수"
+        assert manager.get_stats()["succeeded"] == 1
+
+    def test_late_subscriber_gets_backlog(self):
+        manager, created = make_manager()
+
+        async def run():
+            job = manager.submit("첫 작업")
+            await manager.join()
+            return await collect(manager, job.id)
+
+        assert asyncio.run(run()) == ["queued", "started", "routing", "review", "done"]
+
+    def test_live_events_while_running(self):
+        manager, created = make_manager()
+
+        async def run():
+            job = manager.submit("warmup")
+            await manager.join()
+            created[0].gate = asyncio.Event()
+
+            job = manager.submit("긴 작업")
+            seen = []
+            async for event in manager.events(job.id):
+                seen.append(event["stage"])
+                if event["stage"] == "routing":
+                    assert job.status == JobStatus.RUNNING
+                    created[0].gate.set()
+            return seen
+
+        assert asyncio.run(run()) == ["queued", "started", "routing", "review", "done"]
+
+    def test_failure_reported(self):
+        manager, _ = make_manager()
+
+        async def run():
+            job = manager.submit("boom")
+            stages = await collect(manager, job.id)
+            return job, stages
+
+        job, stages = asyncio.run(run())
+
+        assert stages[-1] == "failed"
+        assert job.status == JobStatus.FAILED
+        assert "pipeline crashed" in job.error
+
+    def test_queue_full_rejected(self):
+        manager, created = make_manager(max_workers=1, max_pending=1)
+
+        async def run():
+            manager.submit("warmup")
+            await manager.join()
+            created[0].gate = asyncio.Event()
+            manager.submit("실행 중")
+            await asyncio.sleep(0)        # 워커가 첫 작업을 가져감
+            manager.submit("대기")
+            with pytest.raises(JobQueueFullError):
+                manager.submit("거절")
+            created[0].gate.set()
+            await manager.join()
+
+        asyncio.run(run())
+
+        assert manager.get_stats()["rejected"] == 1
+        assert manager.get_stats()["succeeded"] == 3
+
+    def test_retention_drops_oldest_finished(self):
+        manager, _ = make_manager(max_retained=2)
+
+        async def run():
+            ids = []
+            for i in range(3):
+                ids.append(manager.submit(f"작업 {i}").id)
+                await manager.join()
+            return ids
+
+        ids = asyncio.run(run())
+
+        assert manager.get(ids[0]) is None
+        assert manager.get(ids[2]) is not None
+
+
+class TestSubstrateProgress:
+    """process(on_progress=...) 이벤트 전달"""
+
+    def test_listener_is_per_request(self):
+        substrate = BabySubstrate(BabyConfig(
+            verbose=False,
+            enable_supabase=False,
+            enable_world_model=False,
+            enable_vision=False,
+            enable_response_cache=False,
+            enable_adaptive_routing=False,
+            background_learning=False,
+        ))
+
+        async def fake_pipeline(user_request, memories, approach, strategy_decision=None):
+            await asyncio.sleep(0.01)
+            emit_progress("code_generated", request=user_request)
+            return {"success": True, "code": "pass", "iterations": 1}
+
+        async def fake_learn(user_request, result):
+            return {"experience_id": "", "curiosity_signal": {}, "world_model_stats": {}, "prediction_made": {}}
+
+        substrate._initialize_agents = lambda: None
+        substrate._execute_pipeline = fake_pipeline
+        substrate._learn_from_pipeline = fake_learn
+
+        a, b = [], []
+
+        async def run():
+            await asyncio.gather(
+                substrate.process("A", on_progress=lambda stage, data: a.append(data["request"])),
+                substrate.process("B", on_progress=lambda stage, data: b.append(data["request"])),
+                substrate.process("C"),
+            )
+
+        asyncio.run(run())
+
+        assert a == ["A"]
+        assert b == ["B"]
@@ -0,0 +1,69 @@
+"""
+KeywordMatcher 테스트
+
+Aho-Corasick 결과가 키워드별 `kw in text` 반복과 같은지 확인
+"""
+
+import random
+
+from neural.baby.keyword_matcher import KeywordMatcher
+from neural.baby.cognitive_router import CognitiveRouter, extract_task_features
+from neural.baby.substrate import categorize_task
+from neural.baby.evolution import EVOLUTION_RULES, EVOLUTION_RULE_MATCHER
+
+
+def naive_find_all(groups: dict, text: str) -> dict:
+    lowered = text.lower()
+    hits = {}
+    for name, keywords in groups.items():
+        found = {kw for kw in keywords if kw.lower() in lowered}
+        if found:
+            hits[name] = found
+    return hits
+
+
+class TestKeywordMatcher:
+    """컴파일된 다중 키워드 매처"""
+
+    def test_overlapping_keywords(self):
+        """겹치는 키워드 (디버그/버그, debug/bug) 모두 탐지"""
+        matcher = KeywordMatcher({"complex": ["디버그", "버그", "debug", "bug"], "simple": ["hi"]})
+
+        hits = matcher.find_all("이 버그를 DEBUG 해줘, this")
+
+        assert hits == {"complex": {"버그", "debug", "bug"}, "simple": {"hi"}}
+
+    def test_matches_naive_scan(self):
+        """무작위 텍스트에서 단순 스캔과 동일한 결과"""
+        groups = {
+            "complex": CognitiveRouter.COMPLEX_KEYWORDS,
+            "simple": CognitiveRouter.SIMPLE_KEYWORDS,
+            "code": CognitiveRouter.CODE_KEYWORDS,
+            "reasoning": CognitiveRouter.REASONING_KEYWORDS,
+        }
+        matcher = KeywordMatcher(groups)
+        vocabulary = [kw for kws in groups.values() for kw in kws] + ["피보나치", "x", " ", "Hello"]
+        rng = random.Random(0)
+
+        for _ in range(200):
+            text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 8)))
+            assert matcher.find_all(text) == naive_find_all(groups, text)
+
+    def test_evolution_rules(self):
+        text = "TypeError: None has no attribute, test failed"
+        groups = {name: rule["keywords"] for name, rule in EVOLUTION_RULES.items()}
+
+        assert EVOLUTION_RULE_MATCHER.find_all(text) == naive_find_all(groups, text)
+
+    def test_first_group_order(self):
+        """정의 순서 우선 (function > class > ...)"""
+        assert categorize_task("클래스 안에 함수 작성") == "function"
+        assert categorize_task("정렬 알고리즘") == "algorithm"
+        assert categorize_task("안녕") == "general"
+
+    def test_features_memoized(self):
+        extract_task_features.cache_clear()
+        extract_task_features("피보나치 함수 만들어줘")
+        extract_task_features("피보나치 함수 만들어줘")
+
+        assert extract_task_features.cache_info().hits == 1
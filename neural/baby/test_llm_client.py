@@ -0,0 +1,280 @@
+"""
+LLMClient 헤징 / single-flight / 텔레메트리 테스트
+
+실제 API 호출 없이 _generate_google/_generate_openai를 가짜 지연 함수로 교체
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from neural.baby.cognitive_router import Urgency
+from neural.baby.llm_client import LLMClient, HEDGE_MIN_SAMPLES
+from neural.baby.llm_metrics import LatencyHistogram
+from neural.baby.substrate import BabyConfig, BabySubstrate
+
+
+def make_client(delays: dict, failures: set = ()) -> LLMClient:
+    """model_id별 지연(초)/실패를 흉내내는 클라이언트"""
+    client = LLMClient()
+
+    def fake(prompt, config, system_prompt, temperature, max_tokens, thinking_level, fallback=True):
+        time.sleep(delays.get(config.model_id, 0))
+        if config.model_id in failures:
+            raise RuntimeError(f"{config.model_id} down")
+        return config.model_id
+
+    client._generate_google = fake
+    client._generate_openai = fake
+    return client
+
+
+class TestLatencyHistogram:
+    """로그 버킷 히스토그램"""
+
+    def test_percentiles(self):
+        hist = LatencyHistogram()
+        for value in range(1, 101):
+            hist.record(float(value))
+
+        assert hist.count == 100
+        assert hist.percentile(50) == pytest.approx(50, rel=0.05)
+        assert hist.percentile(95) == pytest.approx(95, rel=0.05)
+        assert hist.percentile(100) <= hist.max_ms
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(95) is None
+
+
+class TestHedging:
+    """헤징 요청"""
+
+    def test_fast_primary_wins_without_hedge(self):
+        client = make_client({"gemini-2.0-flash": 0.01})
+        for _ in range(HEDGE_MIN_SAMPLES):
+            client.telemetry.latency("gemini-2-flash").record(100)
+
+        assert client.generate("hi", "gemini-2-flash", hedge=True) == "gemini-2.0-flash"
+        assert client._hedge_stats["fired"] == 0
+
+    def test_slow_primary_loses_to_hedge(self):
+        """p95 마감 시간 초과 → 보조 모델 응답 사용"""
+        client = make_client({"gemini-2.0-flash": 0.5, "gpt-4o-mini": 0.01})
+        for _ in range(HEDGE_MIN_SAMPLES):
+            client.telemetry.latency("gemini-2-flash").record(20)
+
+        start = time.perf_counter()
+        result = client.generate("hi", "gemini-2-flash", hedge=True)
+        elapsed = time.perf_counter() - start
+
+        assert result == "gpt-4o-mini"
+        assert elapsed < 0.3
+        assert client._hedge_stats["hedge_wins"] == 1
+
+    def test_failed_primary_hedges_immediately(self):
+        client = make_client({}, failures={"gemini-2.0-flash"})
+
+        assert client.generate("hi", "gemini-2-flash", hedge=True) == "gpt-4o-mini"
+        assert client._hedge_stats["fired"] == 1
+
+    def test_both_fail_raises(self):
+        client = make_client({}, failures={"gemini-2.0-flash", "gpt-4o-mini"})
+
+        with pytest.raises(RuntimeError):
+            client.generate("hi", "gemini-2-flash", hedge=True)
+
+    def test_losing_gemini_stream_closed(self):
+        """보조 모델이 이기면 주 모델 스트림은 다음 청크에서 닫힘 (남은 출력 생성 중단)"""
+        client = make_client({"gpt-4o-mini": 0.01})
+        del client._generate_google                      # 실제 스트리밍 경로 사용
+        stream_state = {"sent": 0, "closed": False}
+
+        def slow_stream(**kwargs):
+            try:
+                for _ in range(50):
+                    time.sleep(0.02)
+                    stream_state["sent"] += 1
+                    yield SimpleNamespace(text="x", usage_metadata=None)
+            finally:
+                stream_state["closed"] = True
+
+        client._get_google_client = lambda: SimpleNamespace(
+            models=SimpleNamespace(generate_content_stream=slow_stream),
+        )
+        for _ in range(HEDGE_MIN_SAMPLES):
+            client.telemetry.latency("gemini-2-flash").record(20)
+
+        assert client.generate("hi", "gemini-2-flash", hedge=True) == "gpt-4o-mini"
+        deadline = time.time() + 1
+        while not stream_state["closed"] and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert stream_state["closed"] and stream_state["sent"] < 50
+        stats = client.get_latency_stats()["hedging"]
+        assert stats["cancelled"] == 1 and stats["hedge_wins"] == 1
+        assert client.get_telemetry()["models"]["gemini-2-flash"]["errors"] == {}    # 취소는 에러 아님
+
+    def test_substrate_opt_in_hedges_coder_calls(self):
+        config = dict(verbose=False, enable_supabase=False, enable_world_model=False, enable_vision=False)
+        default = BabySubstrate(BabyConfig(**config))._cognitive_router
+        hedged = BabySubstrate(BabyConfig(hedge_coder_calls=True, **config))._cognitive_router
+
+        assert Urgency.NORMAL not in default.hedge_urgencies
+        assert Urgency.NORMAL in hedged.hedge_urgencies
+
+    def test_deadline_from_histogram(self):
+        client = make_client({})
+        default = client.hedge_deadline("gemini-2-flash")
+        for _ in range(HEDGE_MIN_SAMPLES):
+            client.telemetry.latency("gemini-2-flash").record(400)
+
+        assert default == 3.0
+        assert client.hedge_deadline("gemini-2-flash") == pytest.approx(0.4, rel=0.05)
+
+
+class TestSingleFlight:
+    """동일 요청 병합"""
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        client = make_client({"gemini-2.0-flash": 0.1})
+        calls = []
+        original = client._generate_google
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return original(*args, **kwargs)
+
+        client._generate_google = counting
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(lambda _: client.generate("같은 질문", "gemini-2-flash"), range(5)))
+
+        assert results == ["gemini-2.0-flash"] * 5
+        assert len(calls) == 1
+        stats = client.get_single_flight_stats()
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    def test_different_params_not_coalesced(self):
+        client = make_client({"gemini-2.0-flash": 0.05})
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(
+                lambda t: client.generate("같은 질문", "gemini-2-flash", temperature=t), [0.1, 0.9]
+            ))
+
+        assert client.get_single_flight_stats()["coalesced"] == 0
+
+    def test_errors_shared_with_followers(self):
+        client = make_client({"gemini-2.0-flash": 0.1}, failures={"gemini-2.0-flash"})
+
+        def call(_):
+            try:
+                client.generate("q", "gemini-2-flash")
+            except RuntimeError:
+                return "error"
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            assert list(pool.map(call, range(3))) == ["error"] * 3
+
+
+class TestTelemetry:
+    """모델별 토큰/지연시간/폴백/에러 기록"""
+
+    def test_provider_usage_and_cost(self):
+        client = LLMClient()
+
+        def fake(prompt, config, *args):
+            client._note_first_token()
+            client._note_usage(SimpleNamespace(usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=500)))
+            return "ok"
+
+        client._generate_openai = fake
+        client.generate("hi", "gpt-4o-mini")
+
+        model = client.get_telemetry()["models"]["gpt-4o-mini"]
+        assert model["calls"] == 1
+        assert model["estimated_usage"] == 0
+        assert model["prompt_tokens_total"] == 1000
+        assert model["completion_tokens_total"] == 500
+        assert model["cost"] == pytest.approx((1000 * 0.15 + 500 * 0.60) / 1_000_000)
+        assert model["ttft"]["count"] == 1
+
+    def test_estimated_usage_without_provider_usage(self):
+        client = make_client({})
+        client.generate("x" * 400, "gemini-2-flash")
+
+        model = client.get_telemetry()["models"]["gemini-2-flash"]
+        assert model["estimated_usage"] == 1
+        assert model["prompt_tokens_total"] == 100
+        assert model["ttft"]["count"] == 0
+
+    def test_error_classes(self):
+        client = make_client({}, failures={"gemini-2.0-flash"})
+
+        with pytest.raises(RuntimeError):
+            client.generate("hi", "gemini-2-flash")
+
+        stats = client.get_telemetry()
+        assert stats["models"]["gemini-2-flash"]["errors"] == {"RuntimeError": 1}
+        assert stats["totals"]["errors"] == 1
+
+    def test_internal_fallback_attributed_to_target(self):
+        client = LLMClient()
+
+        def fake(prompt, config, *args):
+            client._note_fallback("gpt-4o-mini", TimeoutError("slow"))
+            return "fallback"
+
+        client._generate_google = fake
+        client.generate("hi", "gemini-2-flash")
+
+        models = client.get_telemetry()["models"]
+        assert models["gemini-2-flash"]["fallbacks"] == {"gpt-4o-mini": 1}
+        assert models["gemini-2-flash"]["errors"] == {"TimeoutError": 1}
+        assert models["gemini-2-flash"]["calls"] == 0
+        assert models["gpt-4o-mini"]["calls"] == 1
+
+    def test_gemini_failure_falls_back_through_openai_slot(self):
+        """폴백은 Gemini 슬롯 반납 후 OpenAI 스케줄러를 거침"""
+        client = LLMClient()
+
+        def broken_stream(**kwargs):
+            raise RuntimeError("500 internal")
+
+        client._get_google_client = lambda: SimpleNamespace(
+            models=SimpleNamespace(generate_content_stream=broken_stream),
+        )
+        in_flight = {}
+
+        def fake_fallback(prompt, system_prompt, temperature, max_tokens):
+            stats = client.get_scheduler_stats()
+            in_flight.update({name: provider["in_flight"] for name, provider in stats.items()})
+            return "fallback"
+
+        client._generate_openai_fallback = fake_fallback
+
+        assert client.generate("hi", "gemini-2-flash") == "fallback"
+        assert in_flight == {"google": 0, "openai": 1}
+        assert client.get_scheduler_stats()["openai"]["completed"] == 1
+        models = client.get_telemetry()["models"]
+        assert models["gemini-2-flash"]["fallbacks"] == {"gpt-4o-mini": 1}
+        assert models["gpt-4o-mini"]["calls"] == 1
+
+    def test_multimodal_runs_in_google_slot(self):
+        """이미지 호출도 Gemini 스케줄러 슬롯 안에서"""
+        client = LLMClient()
+        in_flight = {}
+
+        def fake_live(prompt, images, config, model_key, temperature, max_tokens):
+            stats = client.get_scheduler_stats()
+            in_flight.update({name: provider["in_flight"] for name, provider in stats.items()})
+            return "장면"
+
+        client._generate_multimodal_live = fake_live
+
+        assert client.generate_multimodal("보여줘", images=[b"png"]) == "장면"
+        assert in_flight == {"google": 1}
+        assert client.get_scheduler_stats()["google"]["completed"] == 1
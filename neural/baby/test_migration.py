@@ -0,0 +1,120 @@
+"""
+벌크 마이그레이션 테스트
+
+가짜 임베딩/insert 함수로 배치 처리와 체크포인트 재개 확인
+"""
+
+import asyncio
+import os
+
+from neural.baby.migrate_to_supabase import (
+    MigrationCheckpoint,
+    bulk_migrate_table,
+    experience_embed_text,
+    experience_row,
+)
+
+
+RECORDS = [
+    {"id": str(i), "request": f"task {i}", "action": f"code {i}", "task_type": "function", "success": True}
+    for i in range(25)
+]
+
+
+class Recorder:
+    """임베딩/insert 호출 기록 (fail_on 청크 시작 오프셋에서 실패)"""
+
+    def __init__(self, fail_on: int = None, embed_fail_on: int = None):
+        self.embed_calls = []
+        self.inserted = []
+        self.fail_on = fail_on
+        self.embed_fail_on = embed_fail_on
+
+    def embed(self, texts):
+        self.embed_calls.append(len(texts))
+        if self.embed_fail_on is not None and texts[0].startswith(f"task {self.embed_fail_on} "):
+            raise RuntimeError("embedding failed")
+        return [[0.1, 0.2] for _ in texts]
+
+    async def insert(self, rows):
+        if self.fail_on is not None and rows[0]["task"] == f"task {self.fail_on}":
+            raise RuntimeError("insert failed")
+        self.inserted.extend(rows)
+        return rows
+
+
+def run_table(recorder: Recorder, checkpoint: MigrationCheckpoint, batch_size: int = 10) -> int:
+    return asyncio.run(bulk_migrate_table(
+        "experiences",
+        RECORDS,
+        to_text=experience_embed_text,
+        to_row=experience_row,
+        insert_fn=recorder.insert,
+        checkpoint=checkpoint,
+        embed_batch=recorder.embed,
+        batch_size=batch_size,
+        semaphore=asyncio.Semaphore(2),
+    ))
+
+
+class TestBulkMigration:
+    """벌크 모드 테스트"""
+
+    def test_batches_embeddings_and_inserts(self, tmp_path):
+        """청크당 임베딩 1회 + insert 1회"""
+        recorder = Recorder()
+        checkpoint = MigrationCheckpoint(str(tmp_path / "ckpt.json"))
+
+        migrated = run_table(recorder, checkpoint)
+
+        assert migrated == 25
+        assert sorted(recorder.embed_calls) == [5, 10, 10]
+        assert all(row["embedding"] for row in recorder.inserted)
+        assert checkpoint.offset("experiences") == 25
+
+    def test_resume_skips_completed_chunks(self, tmp_path):
+        """실패한 청크만 재시도, 완료 구간은 중복 insert 없음"""
+        path = str(tmp_path / "ckpt.json")
+
+        first = Recorder(fail_on=10)
+        run_table(first, MigrationCheckpoint(path))
+        assert len(first.inserted) == 15
+
+        reloaded = MigrationCheckpoint(path)
+        assert reloaded.offset("experiences") == 10
+        assert reloaded.is_done("experiences", 20, 25)
+
+        second = Recorder()
+        run_table(second, reloaded)
+        assert [row["task"] for row in second.inserted] == [f"task {i}" for i in range(10, 20)]
+        assert reloaded.offset("experiences") == 25
+
+    def test_embedding_failure_retried_on_resume(self, tmp_path):
+        """임베딩 실패 청크는 insert/완료 기록 없이 남겨 재개 시 임베딩과 함께 저장"""
+        path = str(tmp_path / "ckpt.json")
+
+        first = Recorder(embed_fail_on=10)
+        run_table(first, MigrationCheckpoint(path))
+        assert sorted(row["task"] for row in first.inserted) == sorted(
+            f"task {i}" for i in [*range(10), *range(20, 25)]
+        )
+
+        reloaded = MigrationCheckpoint(path)
+        assert not reloaded.is_done("experiences", 10, 20)
+
+        second = Recorder()
+        run_table(second, reloaded)
+        assert [row["task"] for row in second.inserted] == [f"task {i}" for i in range(10, 20)]
+        assert all(row["embedding"] for row in second.inserted)
+        assert reloaded.offset("experiences") == 25
+
+    def test_reset(self, tmp_path):
+        path = str(tmp_path / "ckpt.json")
+        checkpoint = MigrationCheckpoint(path)
+        checkpoint.mark_done("experiences", 0, 10)
+        assert os.path.exists(path)
+
+        checkpoint.reset()
+
+        assert not os.path.exists(path)
+        assert checkpoint.offset("experiences") == 0
@@ -0,0 +1,360 @@
+"""
+Persistent Learning 테스트
+
+가짜 비동기 Supabase 클라이언트로 쿼리 fan-out / bulk insert 동작 확인
+"""
+
+import asyncio
+from datetime import datetime
+
+from neural.baby.persistence import (
+    SessionManager,
+    PersistentLearningSubstrate,
+    LearningRestorer,
+    RestoreType,
+    SnapshotType,
+    KEYFRAME_INTERVAL,
+    normalize_learning_state,
+    compute_state_delta,
+    apply_state_delta,
+    encode_snapshot_payload,
+    decode_snapshot_payload,
+)
+
+
+class FakeResponse:
+    def __init__(self, data=None, count=None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """체이닝 가능한 가짜 PostgREST 쿼리 빌더"""
+
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table = table
+        self.op = "select"
+        self.payload = None
+        self.filters = []
+        self.order_by = None
+        self.is_single = False
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def insert(self, payload):
+        self.op = "insert"
+        self.payload = payload
+        return self
+
+    def update(self, payload):
+        self.op = "update"
+        self.payload = payload
+        return self
+
+    def upsert(self, payload, **kwargs):
+        self.op = "upsert"
+        self.payload = payload
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(("eq", column, value))
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(("in", column, tuple(values)))
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(("lte", column, value))
+        return self
+
+    def gte(self, *args):
+        return self
+
+    def is_(self, *args):
+        return self
+
+    def is_not(self, *args):
+        return self
+
+    def order(self, column, *args, **kwargs):
+        self.order_by = column
+        return self
+
+    def limit(self, *args):
+        return self
+
+    def single(self):
+        self.is_single = True
+        return self
+
+    def matches(self, row: dict) -> bool:
+        for op, column, value in self.filters:
+            if op == "eq" and row.get(column) != value:
+                return False
+            if op == "in" and row.get(column) not in value:
+                return False
+            if op == "lte" and not (row.get(column) is not None and row[column] <= value):
+                return False
+        return True
+
+    async def execute(self):
+        self.client.active += 1
+        self.client.peak = max(self.client.peak, self.client.active)
+        await asyncio.sleep(0.01)
+        self.client.active -= 1
+        self.client.calls.append(self)
+        return self.client.respond(self)
+
+
+class FakeAsyncSupabase:
+    """테이블별 행을 메모리에 보관하는 가짜 비동기 클라이언트"""
+
+    def __init__(self, tables: dict = None):
+        self.tables = tables or {}
+        self.calls: list[FakeQuery] = []
+        self.active = 0
+        self.peak = 0
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict = None) -> FakeQuery:
+        query = FakeQuery(self, f"rpc:{name}")
+        query.op = "rpc"
+        query.payload = params
+        return query
+
+    def respond(self, query: FakeQuery) -> FakeResponse:
+        store = self.tables.setdefault(query.table, [])
+        if query.op == "insert":
+            rows = query.payload if isinstance(query.payload, list) else [query.payload]
+            rows = [{"id": f"{query.table}-{len(self.calls)}-{i}", **r} for i, r in enumerate(rows)]
+            store.extend(rows)
+            return FakeResponse(rows)
+        if query.op == "update":
+            rows = [r for r in store if query.matches(r)]
+            for row in rows:
+                row.update(query.payload)
+            return FakeResponse(rows)
+        rows = [r for r in store if query.matches(r)]
+        if query.order_by:
+            rows = sorted(rows, key=lambda r: r.get(query.order_by) or 0)
+        if query.is_single:
+            return FakeResponse(rows[0] if rows else None)
+        return FakeResponse(rows, count=len(rows))
+
+    def writes(self, table: str) -> list[FakeQuery]:
+        return [c for c in self.calls if c.table == table and c.op != "select"]
+
+
+def make_client() -> FakeAsyncSupabase:
+    return FakeAsyncSupabase({
+        "baby_state": [{"id": "s1", "development_stage": 2, "curiosity": 0.8}],
+        "learned_prompt_rules": [
+            {
+                "id": "r1", "rule_name": "null_check", "rule_text": "check None",
+                "priority": 5, "is_active": True,
+            },
+        ],
+        "strategy_effectiveness": [
+            {"strategy_name": "exploit", "effectiveness_score": 0.7},
+        ],
+        "semantic_concepts": [{"name": "함수", "strength": 0.9}],
+        "experiences": [{"id": "e1", "success": True}, {"id": "e2", "success": False}],
+        "prompt_evolution": [
+            {"id": "p1", "improvement_hypothesis": "h1", "post_evolution_success_rate": 0.8,
+             "was_adopted": True},
+            {"id": "p2", "improvement_hypothesis": "h2", "post_evolution_success_rate": 0.6,
+             "was_adopted": True},
+        ],
+        "self_reflection_insights": [
+            {"insight_type": "failure_pattern", "insight_text": "i1", "confidence": 0.7,
+             "outcome_after_apply": "improved"},
+        ],
+        "learning_continuity": [{"continuity_score": 0.5}],
+    })
+
+
+class TestSessionManager:
+    """세션 관리자 fan-out 테스트"""
+
+    def _start(self, client: FakeAsyncSupabase) -> SessionManager:
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+        manager._session_started_at = datetime.now().isoformat()
+        return manager
+
+    def test_end_session_bulk_inserts_core_learnings(self):
+        """핵심 학습은 한 번의 insert로 저장"""
+        client = make_client()
+        manager = self._start(client)
+
+        asyncio.run(manager.end_session(["learned"]))
+
+        inserts = client.writes("core_learnings")
+        assert len(inserts) == 1
+        assert len(inserts[0].payload) == 3
+        assert manager.current_session_id is None
+
+    def test_end_session_fans_out(self):
+        """독립 쿼리는 동시에 실행됨"""
+        client = make_client()
+        manager = self._start(client)
+
+        asyncio.run(manager.end_session())
+
+        assert client.peak >= 4
+        assert len(client.writes("learning_snapshots")) == 1
+        assert len(client.writes("session_restore_points")) == 1
+        assert len(client.writes("learning_sessions")) == 1
+
+    def test_session_stats(self):
+        """세션 통계 계산"""
+        client = make_client()
+        manager = self._start(client)
+
+        stats = asyncio.run(manager._calculate_session_stats())
+
+        assert stats["experiences_created"] == 2
+        assert stats["success_rate"] == 0.5
+        assert stats["evolutions_tried"] == 2
+
+
+class TestPersistenceStats:
+    """영속 학습 통계 테스트"""
+
+    def test_stats_queries_run_concurrently(self):
+        client = make_client()
+        substrate = PersistentLearningSubstrate(client)
+
+        stats = asyncio.run(substrate.get_persistence_stats())
+
+        assert client.peak == 5
+        assert stats["avg_continuity_score"] == 0.5
+
+
+class TestDeltaSnapshots:
+    """델타 스냅샷 인코딩/재생 테스트"""
+
+    def test_delta_roundtrip(self):
+        """델타 적용 시 원래 상태 복원"""
+        before = normalize_learning_state({
+            "baby_state": {"curiosity": 0.5},
+            "active_rules": [{"id": "r1", "rule_text": "a"}, {"id": "r2", "rule_text": "b"}],
+            "strategy_weights": {"exploit": 0.5},
+            "concept_strengths": {"함수": 0.3, "클래스": 0.2},
+        })
+        after = normalize_learning_state({
+            "baby_state": {"curiosity": 0.6},
+            "active_rules": [{"id": "r1", "rule_text": "a"}],
+            "strategy_weights": {"exploit": 0.5},
+            "concept_strengths": {"함수": 0.4, "정렬": 0.1},
+        })
+
+        delta = compute_state_delta(before, after)
+
+        assert "strategy_weights" not in delta
+        assert delta["active_rules"]["del"] == ["r2"]
+        assert apply_state_delta(before, delta) == after
+
+    def test_payload_compression(self):
+        """압축 페이로드 왕복 + 크기 감소"""
+        data = {"concept_strengths": {f"concept_{i}": 0.5 for i in range(200)}}
+
+        encoded = encode_snapshot_payload(data)
+
+        assert decode_snapshot_payload(encoded) == data
+        assert len(encoded) < len(str(data))
+
+    def _checkpoint(self, client, manager, strength: float):
+        client.tables["semantic_concepts"] = [{"name": "함수", "strength": strength}]
+        return asyncio.run(manager._create_snapshot(SnapshotType.CHECKPOINT))
+
+    def test_checkpoints_store_deltas(self):
+        """첫 스냅샷만 키프레임, 이후는 델타 / 변경 없으면 생략"""
+        client = make_client()
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+
+        first = self._checkpoint(client, manager, 0.1)
+        second = self._checkpoint(client, manager, 0.2)
+        unchanged = self._checkpoint(client, manager, 0.2)
+
+        rows = client.tables["learning_snapshots"]
+        assert len(rows) == 2
+        assert rows[0]["is_keyframe"] and not rows[1]["is_keyframe"]
+        assert rows[1]["base_snapshot_id"] == first
+        assert decode_snapshot_payload(rows[1]["payload"]) == {
+            "concept_strengths": {"set": {"함수": 0.2}, "del": []}
+        }
+        assert unchanged == second
+
+    def test_timestamps_do_not_create_delta(self):
+        """타임스탬프만 바뀐 체크포인트는 생략"""
+        client = make_client()
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+
+        first = self._checkpoint(client, manager, 0.1)
+        client.tables["baby_state"][0]["updated_at"] = "2026-10-19T10:00:00"
+        client.tables["learned_prompt_rules"][0]["updated_at"] = "2026-10-19T10:00:00"
+        again = self._checkpoint(client, manager, 0.1)
+
+        assert again == first
+        assert len(client.tables["learning_snapshots"]) == 1
+
+    def test_concurrent_checkpoints_chain(self):
+        """동시 체크포인트가 같은 기준에 diff하지 않음 (중복 델타 방지)"""
+        client = make_client()
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+        first = self._checkpoint(client, manager, 0.1)
+        client.tables["semantic_concepts"] = [{"name": "함수", "strength": 0.2}]
+
+        async def concurrent():
+            return await asyncio.gather(
+                manager._create_snapshot(SnapshotType.CHECKPOINT),
+                manager._create_snapshot(SnapshotType.CHECKPOINT),
+            )
+
+        second, third = asyncio.run(concurrent())
+
+        rows = client.tables["learning_snapshots"]
+        assert [r["sequence"] for r in rows] == [0, 1]
+        assert rows[1]["base_snapshot_id"] == first
+        assert second == third == rows[1]["id"]
+
+    def test_keyframe_interval(self):
+        """KEYFRAME_INTERVAL개 델타 후 새 키프레임"""
+        client = make_client()
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+
+        for i in range(KEYFRAME_INTERVAL + 2):
+            self._checkpoint(client, manager, 0.01 * (i + 1))
+
+        keyframes = [r for r in client.tables["learning_snapshots"] if r["is_keyframe"]]
+        assert len(keyframes) == 2
+
+    def test_restore_replays_deltas(self):
+        """복원 포인트는 키프레임 + 델타 재생으로 상태 재구성"""
+        client = make_client()
+        manager = SessionManager(client)
+        manager._current_session_id = "session-1"
+
+        for strength in (0.1, 0.2, 0.3):
+            snapshot_id = self._checkpoint(client, manager, strength)
+        asyncio.run(manager._insert_restore_point(RestoreType.MANUAL, snapshot_id))
+
+        restorer = LearningRestorer(client)
+        state = asyncio.run(restorer.load_snapshot_state(snapshot_id))
+        point = client.tables["session_restore_points"][0]
+        restored = asyncio.run(restorer.restore_from_point(point["id"]))
+
+        assert state["concept_strengths"] == {"함수": 0.3}
+        assert state["active_rules"][0]["rule_name"] == "null_check"
+        assert restored
+        assert client.tables["learned_prompt_rules"][0]["is_active"] is True
@@ -0,0 +1,161 @@
+"""
+프롬프트 캐싱 테스트
+
+Anthropic system 블록 캐시 지점, 적중 통계, LLMClient 캐시 토큰 집계,
+진화된 프롬프트 규칙 → 에이전트 system 접두부
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from common.prompt_cache import (
+    ANTHROPIC_MIN_CACHE_TOKENS,
+    CachedPromptMixin,
+    PromptCacheStats,
+    cached_system,
+    estimate_prefix_tokens,
+)
+from neural.baby.llm_client import LLMClient, CACHED_INPUT_COST_FACTOR
+from neural.baby.substrate import BabyConfig, BabySubstrate
+
+
+class TestCachedSystem:
+    """system 블록 구성"""
+
+    LONG_RULES = "## 필수 규칙\n" + "- 타입 힌트 사용\n" * 400    # 최소 캐시 길이 이상
+
+    def test_last_block_marked(self):
+        system = cached_system("기본 프롬프트", self.LONG_RULES)
+
+        assert [b["text"] for b in system] == ["기본 프롬프트", self.LONG_RULES]
+        assert "cache_control" not in system[0]
+        assert system[1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_empty_rules_skipped(self):
+        system = cached_system(self.LONG_RULES, "")
+
+        assert len(system) == 1
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_short_prefix_not_marked(self):
+        """제공자 최소 캐시 길이 미만 → 캐시 지점 없음 (지정해도 무시됨)"""
+        system = cached_system("기본 프롬프트", "## 필수 규칙\n- 타입 힌트 사용")
+
+        assert all("cache_control" not in block for block in system)
+        assert estimate_prefix_tokens("기본 프롬프트") < ANTHROPIC_MIN_CACHE_TOKENS
+
+
+class TestPromptCacheStats:
+    """적중률 집계"""
+
+    def test_hit_ratios(self):
+        stats = PromptCacheStats()
+        stats.record("claude", SimpleNamespace(input_tokens=50, cache_creation_input_tokens=1000))
+        stats.record("claude", SimpleNamespace(input_tokens=50, cache_read_input_tokens=1000))
+
+        result = stats.get_stats()["claude"]
+        assert result["calls"] == 2
+        assert result["hit_rate"] == 0.5
+        assert result["token_hit_ratio"] == pytest.approx(1000 / 2100)
+
+
+class TestClientCachedTokens:
+    """OpenAI/Gemini 자동 캐싱 토큰"""
+
+    def test_openai_cached_tokens_discounted(self):
+        client = LLMClient()
+
+        def fake(prompt, config, *args):
+            client._note_usage(SimpleNamespace(usage=SimpleNamespace(
+                prompt_tokens=2000,
+                completion_tokens=0,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+            )))
+            return "ok"
+
+        client._generate_openai = fake
+        client.generate("hi", "gpt-4o-mini")
+
+        model = client.get_telemetry()["models"]["gpt-4o-mini"]
+        assert model["cached_prompt_tokens_total"] == 1024
+        assert model["cache_hit_rate"] == 1.0
+        billed = 2000 - 1024 + 1024 * CACHED_INPUT_COST_FACTOR
+        assert model["cost"] == pytest.approx(billed * 0.15 / 1_000_000)
+
+    def test_gemini_usage_metadata(self):
+        client = LLMClient()
+
+        def fake(prompt, config, *args):
+            client._note_usage(SimpleNamespace(usage_metadata=SimpleNamespace(
+                prompt_token_count=300, candidates_token_count=20, cached_content_token_count=None,
+            )))
+            return "ok"
+
+        client._generate_google = fake
+        client.generate("hi", "gemini-2-flash")
+
+        model = client.get_telemetry()["models"]["gemini-2-flash"]
+        assert model["prompt_tokens_total"] == 300
+        assert model["cached_prompt_tokens_total"] == 0
+        assert model["cache_hit_rate"] == 0.0
+
+
+class FakeAnthropic:
+    def __init__(self):
+        self.requests = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=10), content=[])
+
+
+class FakeAgent(CachedPromptMixin):
+    SYSTEM_PROMPT = "기본 프롬프트"
+    MODEL = "fake-model"
+
+    def __init__(self):
+        self.client = FakeAnthropic()
+
+
+class FakeEvolution:
+    def __init__(self, rules: dict):
+        self.rules = rules
+        self.queried = []
+
+    async def get_active_prompt(self, agent_type):
+        self.queried.append(agent_type)
+        if agent_type == "reviewer":
+            raise RuntimeError("db down")
+        return self.rules.get(agent_type, "")
+
+
+class TestAgentPromptRules:
+    """진화된 규칙 적용"""
+
+    def test_rules_appended_to_cached_system(self):
+        agent = FakeAgent()
+        agent._create_message(100, "hi")
+        agent.set_prompt_rules("## 필수 규칙\n- 타입 힌트 사용")
+        agent._create_message(100, "hi")
+
+        first, second = (r["system"] for r in agent.client.requests)
+        assert [b["text"] for b in first] == ["기본 프롬프트"]
+        assert [b["text"] for b in second] == ["기본 프롬프트", "## 필수 규칙\n- 타입 힌트 사용"]
+
+    def test_substrate_loads_active_rules_once(self):
+        substrate = BabySubstrate(BabyConfig(
+            verbose=False, enable_supabase=False, enable_world_model=False, enable_vision=False,
+        ))
+        substrate._agents = {name: FakeAgent() for name in ("coder", "tester", "reviewer")}
+        substrate._evolution = FakeEvolution({"coder": "- 타입 힌트 사용"})
+
+        asyncio.run(substrate._load_prompt_rules())
+        asyncio.run(substrate._load_prompt_rules())
+
+        assert substrate._evolution.queried == ["coder", "tester", "reviewer"]
+        assert substrate._agents["coder"].prompt_rules == "- 타입 힌트 사용"
+        assert substrate._agents["tester"].prompt_rules == ""
+        assert substrate._agents["reviewer"].prompt_rules == ""    # 조회 실패 → 기본 프롬프트
@@ -0,0 +1,120 @@
+"""
+Rate Limiter 테스트
+
+스레드로 동시 요청을 흉내내어 우선순위/동시 실행 제한/429 재시도 확인
+"""
+
+import threading
+import time
+
+import pytest
+
+from neural.baby.rate_limiter import (
+    ProviderLimits,
+    ProviderScheduler,
+    RateLimitScheduler,
+    RequestPriority,
+    get_retry_after,
+    is_rate_limit_error,
+)
+
+
+class FakeRateLimit(Exception):
+    """429 응답을 흉내내는 예외"""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str = None):
+        super().__init__("Too Many Requests")
+        self.response = type("Resp", (), {"headers": {"retry-after": retry_after} if retry_after else {}})()
+
+
+class TestProviderScheduler:
+    """단일 제공자 스케줄러"""
+
+    def test_priority_order(self):
+        """슬롯이 비면 INTERACTIVE 요청이 BACKGROUND보다 먼저"""
+        scheduler = ProviderScheduler("test", ProviderLimits(requests_per_minute=6000, max_concurrency=1, burst=10))
+        order = []
+
+        scheduler.acquire()  # 슬롯 점유
+
+        def worker(priority):
+            scheduler.acquire(priority)
+            order.append(priority)
+            scheduler.release()
+
+        threads = [threading.Thread(target=worker, args=(RequestPriority.BACKGROUND,))]
+        threads[0].start()
+        time.sleep(0.05)
+        threads.append(threading.Thread(target=worker, args=(RequestPriority.INTERACTIVE,)))
+        threads[1].start()
+        time.sleep(0.05)
+
+        assert scheduler.get_stats()["queue_depth"] == {"INTERACTIVE": 1, "NORMAL": 0, "BACKGROUND": 1}
+        scheduler.release()
+        for t in threads:
+            t.join(timeout=2)
+
+        assert order == [RequestPriority.INTERACTIVE, RequestPriority.BACKGROUND]
+
+    def test_concurrency_cap(self):
+        scheduler = RateLimitScheduler({"test": ProviderLimits(requests_per_minute=60000, max_concurrency=2, burst=50)})
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return True
+
+        threads = [threading.Thread(target=scheduler.run, args=("test", call)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert peak[0] == 2
+        assert scheduler.get_stats()["test"]["completed"] == 8
+
+
+class TestRateLimitRetry:
+    """429 재시도"""
+
+    def test_retry_after_honoured(self):
+        scheduler = RateLimitScheduler({"test": ProviderLimits(requests_per_minute=60000, max_concurrency=4)})
+        attempts = []
+
+        def call():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise FakeRateLimit(retry_after="0.1")
+            return "ok"
+
+        assert scheduler.run("test", call) == "ok"
+        assert attempts[1] - attempts[0] >= 0.1
+
+        stats = scheduler.get_stats()["test"]
+        assert stats["rate_limited"] == 1
+        assert stats["current_rpm"] < 60000
+
+    def test_other_errors_propagate(self):
+        scheduler = RateLimitScheduler()
+
+        def call():
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            scheduler.run("openai", call)
+        assert scheduler.get_stats()["openai"]["in_flight"] == 0
+
+    def test_error_detection(self):
+        assert is_rate_limit_error(FakeRateLimit())
+        assert is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(Exception("500 internal"))
+        assert get_retry_after(FakeRateLimit(retry_after="3")) == 3.0
+        assert get_retry_after(Exception("Please retry in 12s")) == 12.0
@@ -0,0 +1,132 @@
+"""
+ResponseCache 테스트
+
+가짜 임베딩 함수로 정확/의미 캐시, TTL, LRU, 디스크 저장 확인
+"""
+
+import time
+
+from neural.baby.response_cache import ResponseCache
+from neural.baby.substrate import BabyConfig, BabySubstrate
+
+
+def fake_embed(text: str) -> list[float]:
+    """피보나치 관련 요청은 비슷한 벡터"""
+    if "피보나치" in text or "fibonacci" in text:
+        return [1.0, 0.05, 0.0]
+    return [0.0, 0.0, 1.0]
+
+
+class TestResponseCache:
+    """2단계 응답 캐시 테스트"""
+
+    def test_exact_hit_ignores_whitespace(self):
+        cache = ResponseCache(embed_fn=fake_embed)
+        cache.put("피보나치 함수 만들어줘", "def fib(n): ...", "gemini-2-flash")
+
+        assert cache.get("피보나치  함수 만들어줘 ", "gemini-2-flash") == "def fib(n): ..."
+        assert cache.stats.exact_hits == 1
+
+    def test_semantic_hit(self):
+        """임계값 이상 유사하면 재사용"""
+        cache = ResponseCache(embed_fn=fake_embed, similarity_threshold=0.95)
+        cache.put("피보나치 함수 만들어줘", "def fib(n): ...", "gemini-2-flash")
+
+        assert cache.get("fibonacci 함수 작성", "gemini-2-flash") == "def fib(n): ..."
+        assert cache.get("정렬 함수 만들어줘", "gemini-2-flash") is None
+        assert cache.stats.semantic_hits == 1
+        assert cache.stats.misses == 1
+
+    def test_scope_isolation(self):
+        """모델/시스템 프롬프트/온도가 다르면 다른 캐시"""
+        cache = ResponseCache(embed_fn=fake_embed)
+        cache.put("피보나치 함수", "A", "gemini-2-flash", system_prompt="sys", temperature=0.7)
+
+        assert cache.get("피보나치 함수", "gpt-4o-mini", system_prompt="sys") is None
+        assert cache.get("피보나치 함수", "gemini-2-flash", system_prompt="other") is None
+        assert cache.get("피보나치 함수", "gemini-2-flash", system_prompt="sys", temperature=0.2) is None
+
+    def test_ttl_and_lru(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60, enable_semantic=False)
+        cache.put("a", "1", "m")
+        cache.put("b", "2", "m")
+        cache.get("a", "m")
+        cache.put("c", "3", "m")
+
+        assert cache.get("b", "m") is None  # 가장 오래 사용 안 된 항목 제거
+        assert cache.get("a", "m") == "1"
+
+        cache._entries[next(iter(cache._entries))].created_at = time.time() - 120
+        assert len([k for k in ("a", "c") if cache.get(k, "m")]) == 1
+
+    def test_invalidate(self):
+        cache = ResponseCache(embed_fn=fake_embed)
+        cache.put("피보나치 함수", "bad code", "m")
+
+        assert cache.invalidate("피보나치 함수", "m")
+        assert cache.get("피보나치 함수", "m") is None
+
+    def test_lookup_returns_source_of_semantic_hit(self):
+        """의미 적중으로 나간 응답이 실패하면 원본 항목을 제거"""
+        cache = ResponseCache(embed_fn=fake_embed)
+        key = cache.put("피보나치 함수 만들어줘", "bad code", "m")
+
+        entry = cache.lookup("fibonacci 함수 작성", "m")
+
+        assert entry.key == key
+        assert not cache.invalidate("fibonacci 함수 작성", "m")   # 프롬프트 키로는 못 지움
+        assert cache.invalidate_key(entry.key)
+        assert cache.get("fibonacci 함수 작성", "m") is None
+
+    def test_semantic_miss_embeds_once(self):
+        """의미 미스 조회의 임베딩을 put()에서 재사용"""
+        calls = []
+
+        def counting_embed(text):
+            calls.append(text)
+            return fake_embed(text)
+
+        cache = ResponseCache(embed_fn=counting_embed)
+        cache.put("피보나치 함수 만들어줘", "def fib(n): ...", "gemini-2-flash")
+        assert cache.get("정렬 함수 만들어줘", "gemini-2-flash") is None
+        cache.put("정렬 함수 만들어줘", "def sort(xs): ...", "gemini-2-flash")
+
+        assert calls == ["피보나치 함수 만들어줘", "정렬 함수 만들어줘"]
+
+    def test_substrate_saves_emptied_cache(self, tmp_path):
+        """비워진 캐시도 save()에서 다시 기록 (오래된 파일이 남지 않도록)"""
+        substrate = BabySubstrate(BabyConfig(
+            memory_path=str(tmp_path), verbose=False, enable_supabase=False,
+            enable_world_model=False, enable_vision=False,
+        ))
+        cache = substrate._cognitive_router.response_cache
+        key = cache.put("피보나치 함수 만들어줘", "def fib(n): ...", "gemini-2-flash")
+        cache.save()
+        cache.invalidate_key(key)
+
+        substrate.save()
+
+        assert not cache.enable_semantic                  # 기질 기본값: 정확 일치만
+        assert len(ResponseCache(persist_path=str(tmp_path / "response_cache.json"))) == 0
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "response_cache.json")
+        cache = ResponseCache(embed_fn=fake_embed, persist_path=path)
+        cache.put("피보나치 함수", "def fib(n): ...", "m")
+        cache.save()
+
+        reloaded = ResponseCache(embed_fn=fake_embed, persist_path=path)
+
+        assert len(reloaded) == 1
+        assert reloaded.get("fibonacci", "m") == "def fib(n): ..."
+
+    def test_embedding_failure_falls_back_to_exact(self):
+        """임베딩 실패 시 정확 일치만 사용"""
+        def broken(text):
+            raise ValueError("no key")
+
+        cache = ResponseCache(embed_fn=broken)
+        cache.put("피보나치 함수", "A", "m")
+
+        assert cache.get("피보나치 함수", "m") == "A"
+        assert cache.get("fibonacci", "m") is None
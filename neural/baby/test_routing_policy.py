@@ -0,0 +1,141 @@
+"""
+적응형 라우팅 정책 테스트
+
+관측 데이터만으로 모델 선택이 바뀌는지 확인 (LLM 호출 없음)
+"""
+
+from neural.baby.cognitive_router import CognitiveRouter, TaskContext
+from neural.baby.response_cache import ResponseCache
+from neural.baby.routing_policy import (
+    AdaptiveRoutingPolicy,
+    MIN_CONTEXT_OBSERVATIONS,
+)
+
+
+CTX = AdaptiveRoutingPolicy.context_key("MODERATE", "function")
+
+
+def train(policy: AdaptiveRoutingPolicy, model: str, latency_ms: float, successes: int, failures: int):
+    for i in range(successes + failures):
+        policy.record_call(CTX, model, latency_ms, prompt_tokens=200, completion_tokens=400)
+        policy.record_outcome(CTX, model, i < successes)
+
+
+class FakeClient:
+    def __init__(self, fail_models=()):
+        self.fail_models = set(fail_models)
+        self.models = []
+
+    def generate(self, prompt, model_key, **kwargs):
+        self.models.append(model_key)
+        if model_key in self.fail_models:
+            raise RuntimeError(f"{model_key} unavailable")
+        return "def fib(n): ..."
+
+
+def make_router(client: FakeClient, response_cache: ResponseCache = None) -> CognitiveRouter:
+    router = CognitiveRouter(response_cache=response_cache, policy=AdaptiveRoutingPolicy(seed=0))
+    router.llm_client = client
+    return router
+
+
+class TestAdaptiveRoutingPolicy:
+    """Thompson Sampling 밴딧 라우팅"""
+
+    def test_cold_start_keeps_heuristic(self):
+        policy = AdaptiveRoutingPolicy(seed=0)
+        train(policy, "gemini-2-flash", 1000, 1, 1)
+
+        assert policy.select(CTX, "gemini-2-flash") is None
+
+    def test_prefers_fast_successful_model(self):
+        """느리고 자주 실패하는 모델보다 빠르고 성공하는 모델 선택"""
+        policy = AdaptiveRoutingPolicy(seed=0)
+        train(policy, "gemini-2-flash", 800, 18, 2)
+        train(policy, "gpt-4o-mini", 5000, 10, 10)
+        train(policy, "gpt-5.2-thinking", 30000, 19, 1)
+
+        picks = [policy.select(CTX, "gpt-4o-mini") for _ in range(50)]
+
+        assert picks.count("gemini-2-flash") > 40
+
+    def test_low_success_rate_shifts_to_stronger_model(self):
+        """빠르지만 거의 실패하는 모델은 기대 성공 시간이 길어짐"""
+        policy = AdaptiveRoutingPolicy(seed=1)
+        train(policy, "gemini-2-flash", 1000, 0, 30)
+        train(policy, "gpt-4o-mini", 3000, 28, 2)
+
+        picks = [policy.select(CTX, "gemini-2-flash") for _ in range(50)]
+
+        assert picks.count("gpt-4o-mini") > 40
+
+    def test_latency_budget(self):
+        """예산을 넘는 모델은 제외"""
+        policy = AdaptiveRoutingPolicy(seed=0)
+        train(policy, "gemini-2-flash", 1500, 5, 5)
+        train(policy, "gpt-5.2-thinking", 25000, 20, 0)
+
+        assert policy.select(CTX, "gpt-5.2-thinking", latency_budget_ms=3000) == "gemini-2-flash"
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "routing_policy.json")
+        policy = AdaptiveRoutingPolicy(persist_path=path)
+        train(policy, "gpt-4o-mini", 2000, MIN_CONTEXT_OBSERVATIONS, 0)
+        policy.save()
+
+        reloaded = AdaptiveRoutingPolicy(persist_path=path)
+
+        assert reloaded.observations(CTX) == MIN_CONTEXT_OBSERVATIONS
+        assert reloaded.get_stats()["contexts"][CTX]["gpt-4o-mini"]["calls"] == MIN_CONTEXT_OBSERVATIONS
+
+
+class TestRouterGenerate:
+    """라우팅 한 번 → 같은 결정으로 호출/지연시간/결과 기록"""
+
+    def test_precomputed_decision_not_rerouted(self):
+        client = FakeClient()
+        router = make_router(client)
+        context = TaskContext(task="피보나치 함수 만들어줘", task_type="function", requires_code=True)
+        decision = router.route(context)
+        coder_input = "[Previous examples]\n" + "복잡한 알고리즘 최적화 설계 분석 " * 40 + "\n피보나치 함수 만들어줘"
+
+        router.generate(task=coder_input, context=context, decision=decision)
+        router.record_outcome(decision, True)
+
+        assert client.models == [decision.model_key]
+        assert router.get_routing_stats()["total_routes"] == 1
+        assert context.task == "피보나치 함수 만들어줘"
+        contexts = router.policy.get_stats()["contexts"]
+        assert list(contexts) == [decision.context_key]
+        arm = contexts[decision.context_key][decision.model_key]
+        assert arm["calls"] == 1 and arm["success_rate"] > 0.5
+
+    def test_outcome_credits_fallback_model(self):
+        router = make_router(FakeClient(fail_models={"gpt-5.2-thinking"}))
+        context = TaskContext(task="버그 수정", task_type="function", previous_failures=2)
+        decision = router.route(context)
+
+        router.generate(task="버그 수정", context=context, decision=decision)
+        router.record_outcome(decision, True)
+
+        assert decision.model_key == "gpt-5.2-thinking"
+        assert decision.served_model_key == "gemini-2-flash"
+        arms = router.policy.get_stats()["contexts"][decision.context_key]
+        assert arms["gemini-2-flash"]["success_rate"] > 0.5
+        assert "gpt-5.2-thinking" not in arms
+
+    def test_failed_cached_response_invalidated_by_serving_key(self):
+        cache = ResponseCache(embed_fn=lambda text: [1.0, 0.0], similarity_threshold=0.9)
+        client = FakeClient()
+        router = make_router(client, cache)
+        context = TaskContext(task="피보나치 함수", task_type="function")
+
+        first = router.route(context)
+        router.generate(task="피보나치 함수 만들어줘", context=context, decision=first)
+        retry = router.route(context)
+        router.generate(task="피보나치 함수 작성해줘", context=context, decision=retry)   # 의미 적중
+
+        assert len(client.models) == 1
+        assert retry.cache_key == first.cache_key
+        assert router.invalidate_cached_response(retry)
+        assert len(cache) == 0
@@ -0,0 +1,224 @@
+"""
+SubstratePool 테스트
+
+아기별 인스턴스 분리, 같은 아기 요청 직렬화, LRU 제거 시 저장
+(BabySubstrate는 가짜 객체로 교체)
+"""
+
+import asyncio
+import threading
+from dataclasses import replace
+
+import pytest
+
+from neural.baby.substrate import BabyConfig, BabySubstrate
+from neural.baby.substrate_pool import DEFAULT_BABY_ID, InvalidBabyIdError, SubstratePool
+
+
+class FakeSubstrate:
+    def __init__(self, config: BabyConfig):
+        self.config = config
+        self.counter = 0
+        self.saved = 0
+        self.drained = 0
+
+    async def process(self, request: str) -> int:
+        # 읽기 → 대기 → 쓰기: 잠금이 없으면 갱신이 유실됨
+        value = self.counter
+        await asyncio.sleep(0.01)
+        self.counter = value + 1
+        return self.counter
+
+    async def drain(self) -> None:
+        self.drained += 1
+
+    def save(self) -> None:
+        self.saved += 1
+
+
+def make_pool(max_resident: int = 2) -> tuple[SubstratePool, list]:
+    created = []
+
+    def factory(config):
+        substrate = FakeSubstrate(config)
+        created.append(substrate)
+        return substrate
+
+    pool = SubstratePool(BabyConfig(memory_path="/tmp/babies"), max_resident=max_resident, factory=factory)
+    return pool, created
+
+
+async def run_request(pool: SubstratePool, baby_id: str) -> int:
+    async with pool.session(baby_id) as substrate:
+        return await substrate.process("요청")
+
+
+class TestSubstratePool:
+    """아기별 풀"""
+
+    def test_same_baby_requests_serialized(self):
+        pool, created = make_pool()
+
+        async def run():
+            await asyncio.gather(*(run_request(pool, "alice") for _ in range(5)))
+
+        asyncio.run(run())
+
+        assert len(created) == 1
+        assert created[0].counter == 5
+        assert pool.get_stats()["hydrations"] == 1
+
+    def test_babies_isolated(self):
+        pool, created = make_pool()
+
+        async def run():
+            await asyncio.gather(run_request(pool, "alice"), run_request(pool, "bob"), run_request(pool, "bob"))
+
+        asyncio.run(run())
+
+        states = {s.config.memory_path: s.counter for s in created}
+        assert states == {"/tmp/babies/babies/alice": 1, "/tmp/babies/babies/bob": 2}
+
+    def test_hydration_does_not_block_other_babies(self):
+        release = threading.Event()
+        created = []
+
+        def factory(config):
+            if config.memory_path.endswith("alice"):
+                release.wait(timeout=5)   # alice 로드가 오래 걸림
+            substrate = FakeSubstrate(config)
+            created.append(substrate)
+            return substrate
+
+        pool = SubstratePool(BabyConfig(memory_path="/tmp/babies"), factory=factory)
+
+        async def run():
+            alice = [asyncio.create_task(run_request(pool, "alice")) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            try:
+                # alice 로드 중에도 bob 요청은 진행
+                bob = await asyncio.wait_for(run_request(pool, "bob"), timeout=1)
+            finally:
+                release.set()
+            return bob, await asyncio.gather(*alice)
+
+        bob, alice = asyncio.run(run())
+
+        assert bob == 1
+        assert sorted(alice) == [1, 2]
+        assert [s.config.memory_path for s in created] == ["/tmp/babies/babies/bob", "/tmp/babies/babies/alice"]
+        assert pool.get_stats()["hydrations"] == 2
+
+    def test_default_baby_uses_base_path(self):
+        pool, _ = make_pool()
+
+        assert pool.config_for(DEFAULT_BABY_ID).memory_path == "/tmp/babies"
+
+    def test_only_default_baby_syncs_cloud_state(self):
+        pool, _ = make_pool()
+
+        assert pool.config_for(DEFAULT_BABY_ID).sync_baby_state
+        assert not pool.config_for("alice").sync_baby_state
+
+    def test_non_default_baby_skips_baby_state_row(self):
+        updates = []
+
+        class FakeDB:
+            def update_baby_state(self, **kwargs):
+                updates.append(kwargs)
+
+        pool, _ = make_pool()
+        for baby_id in ("alice", DEFAULT_BABY_ID):
+            config = replace(pool.config_for(baby_id), memory_path="", verbose=False,
+                             enable_supabase=False, enable_world_model=False, enable_vision=False)
+            substrate = BabySubstrate(config)
+            substrate._db = FakeDB()
+            substrate.save()
+
+        assert len(updates) == 1
+
+    def test_shared_causal_graph_path_fixed_at_base(self):
+        pool, _ = make_pool()
+
+        paths = {pool.config_for(baby_id).causal_graph_path for baby_id in (DEFAULT_BABY_ID, "alice", "bob")}
+        assert paths == {"/tmp/babies/causal_graph.json"}
+
+    def test_lru_eviction_persists_idle_baby(self):
+        pool, created = make_pool(max_resident=2)
+
+        async def run():
+            for baby_id in ["alice", "bob", "carol"]:
+                await run_request(pool, baby_id)
+            # alice 재요청 → 저장된 상태에서 다시 로드
+            await run_request(pool, "alice")
+            await pool.wait_evictions()
+
+        asyncio.run(run())
+
+        alice, bob = created[0], created[1]
+        assert alice.saved == 1 and alice.drained == 1
+        assert bob.saved == 1
+        assert len(created) == 4
+        stats = pool.get_stats()
+        assert stats["evictions"] == 2
+        assert stats["resident"] == 2
+        assert list(stats["babies"]) == ["carol", "alice"]
+
+    def test_busy_baby_not_evicted(self):
+        pool, created = make_pool(max_resident=1)
+
+        async def run():
+            async with pool.session("alice") as alice:
+                await run_request(pool, "bob")
+                assert pool.get_stats()["resident"] == 1
+            await pool.wait_evictions()
+            return alice
+
+        alice = asyncio.run(run())
+
+        assert alice.saved == 0
+        assert created[1].saved == 1
+
+    def test_session_exit_does_not_wait_for_victim_drain(self):
+        pool, created = make_pool(max_resident=1)
+
+        async def run():
+            release = asyncio.Event()
+            await run_request(pool, "alice")
+            alice = created[0]
+
+            async def slow_drain():
+                await release.wait()      # alice의 학습 큐가 오래 걸림
+                alice.drained += 1
+            alice.drain = slow_drain
+
+            # bob 요청 종료 → alice 제거 시작, 하지만 bob 요청은 alice 저장을 기다리지 않음
+            await asyncio.wait_for(run_request(pool, "bob"), timeout=1)
+            evicting = pool.get_stats()["evicting"]
+            release.set()
+            await pool.wait_evictions()
+            return alice, evicting
+
+        alice, evicting = asyncio.run(run())
+
+        assert evicting == 1
+        assert alice.drained == 1 and alice.saved == 1
+
+    def test_close_saves_everyone(self):
+        pool, created = make_pool()
+
+        async def run():
+            await run_request(pool, "alice")
+            await run_request(pool, "bob")
+            await pool.close()
+
+        asyncio.run(run())
+
+        assert [s.saved for s in created] == [1, 1]
+        assert pool.get_stats()["resident"] == 0
+
+    def test_invalid_baby_id(self):
+        pool, _ = make_pool()
+
+        with pytest.raises(InvalidBabyIdError):
+            asyncio.run(run_request(pool, "../etc"))
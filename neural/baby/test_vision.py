@@ -0,0 +1,225 @@
+"""
+VisionProcessor 테스트
+
+바이너리 업로드 버퍼 → memoryview 그대로 LLM 경계까지 전달
+(LLM/Storage/DB는 가짜 객체로 교체)
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from neural.baby.llm_client import LLMClient
+from neural.baby.vision import (
+    ImageBuffer,
+    ImageTooLargeError,
+    VisionProcessor,
+    VisualInput,
+    VisualSource,
+)
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class FakeLLM:
+    def __init__(self, response="- 이름: 공\n- 카테고리: object\n- 확신도: high"):
+        self.response = response
+        self.calls = []
+
+    def generate_multimodal(self, prompt, images=None, model_key="gemini-2-flash", **kwargs):
+        self.calls.append({"prompt": prompt, "images": images})
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeStorage:
+    """업로드가 분석과 동시에 도는지 확인 (둘 다 barrier에 도착해야 통과)"""
+
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+        self.uploads = []
+
+    def from_(self, bucket):
+        return self
+
+    def upload(self, file, path, file_options=None):
+        self.barrier.wait()
+        self.uploads.append(path)
+
+    def get_public_url(self, path):
+        return f"https://storage/{path}"
+
+
+class FakeDB:
+    """insert가 release될 때까지 막힘"""
+
+    def __init__(self):
+        self.client = self
+        self.release = threading.Event()
+        self.inserted = []
+
+    def table(self, name):
+        self._table = name
+        return self
+
+    def insert(self, row):
+        self._row = row
+        return self
+
+    def execute(self):
+        self.release.wait(timeout=2)
+        self.inserted.append(self._table)
+        return type("Result", (), {"data": [{"id": f"{self._table}-1"}]})()
+
+
+JSON_RESPONSE = json.dumps({
+    "description": "방 안에 강아지가 있어요.",
+    "objects": [
+        {"name": "강아지", "category": "animal", "confidence": "high"},
+        {"name": "소파", "category": "object", "confidence": "low"},
+    ],
+}, ensure_ascii=False)
+
+
+def make_processor(llm: FakeLLM, **kwargs) -> VisionProcessor:
+    """가짜 LLM + Storage/DB 없는 프로세서 (kwargs: cache, enable_cache)"""
+    processor = VisionProcessor(verbose=False, **kwargs)
+    processor._llm_client = llm
+    processor._get_storage = lambda: None
+    processor._get_db = lambda: None
+    return processor
+
+
+class TestImageBuffer:
+    """상한 버퍼"""
+
+    def test_chunks_accumulate_without_copy(self):
+        buffer = ImageBuffer(expected_size=len(PNG))
+        for i in range(0, len(PNG), 10):
+            buffer.write(PNG[i:i + 10])
+
+        view = buffer.view()
+
+        assert isinstance(view, memoryview)
+        assert view == PNG
+        assert len(buffer) == len(PNG)
+
+    def test_unknown_length_grows(self):
+        buffer = ImageBuffer()
+        buffer.write(b"abc")
+        buffer.write(memoryview(b"def"))
+
+        assert bytes(buffer.view()) == b"abcdef"
+
+    def test_declared_length_over_limit(self):
+        with pytest.raises(ImageTooLargeError):
+            ImageBuffer(max_bytes=10, expected_size=11)
+
+    def test_streamed_body_over_limit(self):
+        buffer = ImageBuffer(max_bytes=10)
+        buffer.write(b"x" * 8)
+
+        with pytest.raises(ImageTooLargeError):
+            buffer.write(b"x" * 3)
+
+
+class TestVisualInput:
+    """memoryview 처리"""
+
+    def test_view_shares_memory(self):
+        buffer = ImageBuffer()
+        buffer.write(PNG)
+        visual_input = VisualInput(image_data=buffer.view(), mime_type="image/png", source=VisualSource.UPLOAD)
+
+        assert visual_input.file_size == len(PNG)
+        assert visual_input.view.obj is buffer.view().obj
+        assert visual_input.to_bytes() == PNG
+
+    def test_bytes_not_copied(self):
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.UPLOAD)
+
+        assert visual_input.to_bytes() is PNG
+
+    def test_mime_detection_on_memoryview(self):
+        assert LLMClient.detect_image_mime_type(None, memoryview(PNG)) == "image/png"
+
+
+class TestVisionProcessor:
+    """처리 파이프라인"""
+
+    def test_memoryview_reaches_llm_boundary(self):
+        llm = FakeLLM()
+        processor = make_processor(llm)
+        view = memoryview(bytearray(PNG))
+        visual_input = VisualInput(image_data=view, mime_type="image/png", source=VisualSource.UPLOAD)
+
+        experience = asyncio.run(processor.process_image(visual_input))
+
+        assert all(call["images"][0] is view for call in llm.calls)
+        assert experience.objects_detected[0].name == "공"
+
+    def test_single_call_returns_description_and_objects(self):
+        llm = FakeLLM(JSON_RESPONSE)
+        processor = make_processor(llm)
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.CAMERA)
+
+        experience = asyncio.run(processor.process_image(visual_input))
+
+        assert len(llm.calls) == 1
+        assert experience.description == "방 안에 강아지가 있어요."
+        assert [(o.name, o.category, o.confidence) for o in experience.objects_detected] == [
+            ("강아지", "animal", 0.9),
+            ("소파", "object", 0.4),
+        ]
+        assert experience.scene_type == "indoor"
+
+    def test_line_format_fallback(self):
+        processor = make_processor(FakeLLM())
+
+        description, objects = processor._parse_analysis_response("공이 보여요.\n- 이름: 공\n- 카테고리: object")
+
+        assert description == "공이 보여요."
+        assert objects[0].name == "공"
+
+    def test_upload_runs_concurrently_with_analysis(self):
+        barrier = threading.Barrier(2, timeout=2)
+
+        class BarrierLLM(FakeLLM):
+            def generate_multimodal(self, prompt, images=None, model_key="gemini-2-flash", **kwargs):
+                barrier.wait()
+                return super().generate_multimodal(prompt, images, model_key)
+
+        processor = make_processor(BarrierLLM(JSON_RESPONSE))
+        storage = FakeStorage(barrier)
+        processor._get_storage = lambda: storage
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.UPLOAD)
+
+        experience = asyncio.run(processor.process_image(visual_input))
+
+        assert experience.image_url.startswith("https://storage/visual/")
+        assert experience.description == "방 안에 강아지가 있어요."
+
+    def test_db_save_deferred_until_drain(self):
+        processor = make_processor(FakeLLM(JSON_RESPONSE))
+        db = FakeDB()
+        processor._get_db = lambda: db
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.UPLOAD)
+
+        async def run():
+            experience = await processor.process_image(visual_input)
+            assert db.inserted == []
+            assert processor.get_stats()["pending_saves"] == 1
+            db.release.set()
+            await processor.drain()
+            return experience
+
+        experience = asyncio.run(run())
+
+        assert db.inserted == ["media_files", "visual_experiences"]
+        assert experience.db_id == "visual_experiences-1"
+        assert experience.media_file_id == "media_files-1"
+        assert processor.get_stats()["pending_saves"] == 0
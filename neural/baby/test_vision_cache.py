@@ -0,0 +1,221 @@
+"""
+VisionCache 테스트
+
+지각 해시(dHash) → 해밍 거리로 거의 같은 프레임 판별 → 캐시된 시각 경험 재사용
+(해시 함수/LLM은 가짜로 교체, Pillow 없이도 실행)
+"""
+
+import asyncio
+
+from neural.baby.substrate import BabyConfig, BabyResult, BabySubstrate
+from neural.baby.test_vision import JSON_RESPONSE, PNG, FakeLLM, make_processor
+from neural.baby.vision import DEFAULT_DESCRIPTION, VisualInput, VisualSource
+from neural.baby.vision_cache import (
+    VisionCache,
+    dhash_pixels,
+    hamming_distance,
+)
+
+
+def gradient(step: int = 10, bump: int = 0) -> bytes:
+    """9x8 가로 그라데이션 (bump: 첫 픽셀 밝기 변화)"""
+    rows = [bytes(min(255, col * step) for col in range(9)) for _ in range(8)]
+    pixels = bytearray(b"".join(rows))
+    pixels[0] = min(255, pixels[0] + bump)
+    return bytes(pixels)
+
+
+def frame_hasher(frames: dict):
+    """이미지 바이트 → 미리 정한 해시"""
+    return lambda image_data: frames.get(bytes(image_data))
+
+
+class TestPerceptualHash:
+    """dHash"""
+
+    def test_similar_frames_close_different_far(self):
+        base = dhash_pixels(gradient())
+        noisy = dhash_pixels(gradient(bump=15))       # 첫 픽셀만 밝아짐
+        flipped = dhash_pixels(gradient()[::-1])      # 밝기 방향 반대
+
+        assert hamming_distance(base, noisy) == 1
+        assert hamming_distance(base, flipped) == 64
+
+    def test_hash_is_64_bits(self):
+        assert dhash_pixels(gradient()[::-1]) == (1 << 64) - 1
+
+
+class TestVisionCache:
+    """캐시 조회/제거"""
+
+    def test_exact_then_perceptual_hits(self):
+        frames = {b"a": 0b1111, b"b": 0b1110, b"c": 0b0000_1111_1111}
+        cache = VisionCache(max_distance=2, hasher=frame_hasher(frames))
+        cache.put(cache.fingerprint(b"a"), "scene-a")
+
+        exact = cache.get(cache.fingerprint(b"a"))
+        near = cache.get(cache.fingerprint(b"b"))
+        far = cache.get(cache.fingerprint(b"c"))
+
+        assert exact.experience == "scene-a"
+        assert near.experience == "scene-a"
+        assert near.hits == 2
+        assert far is None
+        stats = cache.get_stats()
+        assert (stats["exact_hits"], stats["perceptual_hits"], stats["misses"]) == (1, 1, 1)
+        assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+    def test_lru_bound(self):
+        cache = VisionCache(max_entries=2, hasher=lambda data: None)
+        for name in (b"a", b"b"):
+            cache.put(cache.fingerprint(name), name)
+        cache.get(cache.fingerprint(b"a"))          # a 사용 → b가 가장 오래됨
+        cache.put(cache.fingerprint(b"c"), b"c")
+
+        assert cache.get(cache.fingerprint(b"b")) is None
+        assert cache.get(cache.fingerprint(b"a")) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entry_not_reused(self):
+        cache = VisionCache(ttl_seconds=0.0, hasher=lambda data: 1)
+        cache.put(cache.fingerprint(b"a"), "old")
+        cache._entries[next(iter(cache._entries))].created_at -= 1
+
+        assert cache.get(cache.fingerprint(b"a")) is None
+        assert cache.get(cache.fingerprint(b"b")) is None
+
+    def test_exact_match_without_perceptual_hash(self):
+        cache = VisionCache(hasher=lambda data: None)
+        cache.put(cache.fingerprint(memoryview(b"frame")), "scene")
+
+        assert cache.get(cache.fingerprint(b"frame")).experience == "scene"
+        assert cache.get(cache.fingerprint(b"frame2")) is None
+
+
+class TestProcessorCache:
+    """VisionProcessor 연동"""
+
+    def test_near_duplicate_frame_skips_llm(self):
+        second = PNG + b"\x01"
+        cache = VisionCache(hasher=frame_hasher({PNG: 0b1010, second: 0b1011}))
+        llm = FakeLLM(JSON_RESPONSE)
+        processor = make_processor(llm, cache=cache)
+
+        async def run():
+            first = await processor.process_image(
+                VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.CAMERA))
+            again = await processor.process_image(
+                VisualInput(image_data=second, mime_type="image/png", source=VisualSource.CAMERA))
+            return first, again
+
+        first, again = asyncio.run(run())
+
+        assert len(llm.calls) == 1
+        assert again.description == first.description
+        assert again.id != first.id
+        assert again.from_cache and not first.from_cache
+        assert again.familiarity > first.familiarity
+        assert again.emotional_response["repetition"] is True
+        assert again.curiosity_triggered == 0.0
+        assert processor.get_stats()["cache"]["perceptual_hits"] == 1
+
+    def test_cached_frame_drops_db_refs(self):
+        cache = VisionCache(hasher=frame_hasher({PNG: 0b1010}))
+        processor = make_processor(FakeLLM(JSON_RESPONSE), cache=cache)
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.CAMERA)
+
+        async def run():
+            first = await processor.process_image(visual_input)
+            first.db_id, first.media_file_id = "visual-1", "media-1"    # 저장 완료 후 채워짐
+            return await processor.process_image(visual_input)
+
+        again = asyncio.run(run())
+
+        assert again.from_cache
+        assert again.db_id is None and again.media_file_id is None
+
+    def test_failed_analysis_not_cached(self):
+        cache = VisionCache(hasher=frame_hasher({PNG: 0b1010}))
+        llm = FakeLLM(RuntimeError("vision API down"))
+        processor = make_processor(llm, cache=cache)
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.CAMERA)
+
+        async def run():
+            failed = await processor.process_image(visual_input)
+            llm.response = JSON_RESPONSE                        # API 복구
+            recovered = await processor.process_image(visual_input)
+            return failed, recovered
+
+        failed, recovered = asyncio.run(run())
+
+        assert len(llm.calls) == 2
+        assert failed.description == DEFAULT_DESCRIPTION
+        assert recovered.description == "방 안에 강아지가 있어요."
+        assert not recovered.from_cache
+        assert cache.get_stats()["entries"] == 1
+
+    def test_cache_disabled(self):
+        llm = FakeLLM(JSON_RESPONSE)
+        processor = make_processor(llm, enable_cache=False)
+        visual_input = VisualInput(image_data=PNG, mime_type="image/png", source=VisualSource.CAMERA)
+
+        async def run():
+            await processor.process_image(visual_input)
+            await processor.process_image(visual_input)
+
+        asyncio.run(run())
+
+        assert len(llm.calls) == 2
+        assert "cache" not in processor.get_stats()
+
+
+class TestSubstrateMultimodal:
+    """BabySubstrate.process_multimodal: 익숙한 프레임은 코드 파이프라인 생략"""
+
+    def make_substrate(self, llm: FakeLLM):
+        substrate = BabySubstrate(BabyConfig(
+            verbose=False,
+            enable_supabase=False,
+            enable_world_model=False,
+            enable_vision=False,
+            enable_response_cache=False,
+            enable_adaptive_routing=False,
+        ))
+        substrate._vision_processor = make_processor(
+            llm, cache=VisionCache(hasher=frame_hasher({PNG: 0b1010})))
+        prompts = []
+
+        async def fake_process(task, **kwargs):
+            prompts.append(task)
+            return BabyResult(success=True, output=f"# {task}", iterations=1, execution_time_ms=0.0)
+
+        substrate.process = fake_process
+        return substrate, prompts
+
+    def test_familiar_frame_without_text_skips_pipeline(self):
+        llm = FakeLLM(JSON_RESPONSE)
+        substrate, prompts = self.make_substrate(llm)
+
+        async def run():
+            await substrate.process_multimodal(images=[PNG])
+            return await substrate.process_multimodal(images=[PNG])
+
+        seen = asyncio.run(run())
+
+        assert len(llm.calls) == 1
+        assert len(prompts) == 1                      # 첫 프레임만 파이프라인
+        assert seen.success
+        assert seen.output == "방 안에 강아지가 있어요."
+        assert seen.visual_experience["from_cache"] is True
+
+    def test_familiar_frame_with_text_runs_pipeline(self):
+        substrate, prompts = self.make_substrate(FakeLLM(JSON_RESPONSE))
+
+        async def run():
+            await substrate.process_multimodal(images=[PNG])
+            await substrate.process_multimodal(text="강아지 이름은?", images=[PNG])
+
+        asyncio.run(run())
+
+        assert len(prompts) == 2
+        assert prompts[1].endswith("강아지 이름은?")
@@ -0,0 +1,108 @@
+"""
+World Model 예측 일괄 검증 테스트
+
+관련 예측 선별 (임베딩) → 한 번의 LLM 판정 → 한 번의 일괄 업데이트
+(DB/LLM/임베딩은 가짜 객체로 교체)
+"""
+
+import json
+
+from neural.baby.world_model import WorldModel
+
+
+PREDICTIONS = [
+    {"id": "p1", "scenario": "정렬 알고리즘 작성", "prediction": "성공할 것"},
+    {"id": "p2", "scenario": "정렬 함수 구현", "prediction": "실패할 것"},
+    {"id": "p3", "scenario": "날씨 이야기", "prediction": "모름"},
+    {"id": "p4", "scenario": "정렬 테스트", "prediction": "애매함"},
+]
+
+
+class FakeDB:
+    def __init__(self, predictions):
+        self.predictions = predictions
+        self.bulk_calls = []
+
+    def get_unverified_predictions(self, limit=10):
+        return self.predictions[:limit]
+
+    def update_predictions_bulk(self, rows):
+        self.bulk_calls.append(rows)
+        return rows
+
+
+class FakeLLM:
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.response
+
+
+def fake_embed(texts):
+    """'정렬'이 들어간 텍스트끼리만 유사"""
+    return [[1.0, 0.0] if "정렬" in t else [0.0, 1.0] for t in texts]
+
+
+def make_world_model(response, embed_fn=fake_embed):
+    db = FakeDB([dict(p) for p in PREDICTIONS])
+    llm = FakeLLM(response)
+    model = WorldModel(db=db, llm_client=llm, verbose=False, embed_fn=embed_fn)
+    return model, db, llm
+
+
+EXPERIENCE = {"task": "리스트 정렬 함수 만들어줘", "task_type": "algorithm", "success": True}
+
+
+class TestBatchVerification:
+    """예측 일괄 검증"""
+
+    def test_single_llm_call_and_bulk_update(self):
+        verdicts = [
+            {"index": 0, "verdict": "correct"},
+            {"index": 1, "verdict": "incorrect"},
+            {"index": 2, "verdict": "uncertain"},
+        ]
+        model, db, llm = make_world_model(json.dumps(verdicts))
+
+        verified = model.auto_verify_predictions(EXPERIENCE)
+
+        assert len(llm.prompts) == 1
+        assert len(db.bulk_calls) == 1
+        assert [v["prediction_id"] for v in verified] == ["p1", "p2"]
+        assert [v["was_correct"] for v in verified] == [True, False]
+
+        rows = db.bulk_calls[0]
+        assert rows[0]["auto_verified"] is True
+        assert rows[0]["scenario"] == "정렬 알고리즘 작성"   # 원래 행 유지
+        assert rows[1]["prediction_error"] == 1.0
+
+    def test_embedding_prefilter(self):
+        """관련 없는 예측은 프롬프트에 포함되지 않음"""
+        model, db, llm = make_world_model("[]")
+
+        model.auto_verify_predictions(EXPERIENCE)
+
+        assert "날씨 이야기" not in llm.prompts[0]
+        assert "정렬 테스트" in llm.prompts[0]
+
+    def test_unparseable_response_updates_nothing(self):
+        model, db, llm = make_world_model("잘 모르겠어요")
+
+        assert model.auto_verify_predictions(EXPERIENCE) == []
+        assert db.bulk_calls == []
+
+    def test_keyword_fallback_without_embeddings(self):
+        def broken_embed(texts):
+            raise ValueError("OPENAI_API_KEY not set")
+
+        model, db, llm = make_world_model('[{"index": 0, "verdict": "correct"}]', embed_fn=broken_embed)
+
+        verified = model.auto_verify_predictions(
+            {"task": "정렬 알고리즘 작성", "task_type": "algorithm", "success": True}
+        )
+
+        assert len(llm.prompts) == 1
+        assert verified[0]["prediction_id"] == "p1"
@@ -10,13 +10,61 @@ Phase 4.1: Camera Input
 Gemini Vision API를 사용하여 멀티모달 처리
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, Union
 from enum import Enum
+import asyncio
 import base64
+import json
 import uuid
 
+from .vision_cache import VisionCache, VisualCacheEntry
+
+
+MAX_IMAGE_BYTES = 10 * 1024 * 1024   # 업로드 이미지 최대 크기
+VISION_MODEL_KEY = "gemini-2-flash"
+MAX_OBJECTS = 10
+CONFIDENCE_LEVELS = {'high': 0.9, 'medium': 0.7, 'low': 0.4}
+DEFAULT_DESCRIPTION = "이미지를 설명할 수 없습니다."
+FAMILIARITY_STEP = 0.1   # 같은 장면을 다시 볼 때마다 친숙도 증가
+
+# 이미지 바이너리: bytes 또는 업로드 버퍼를 복사 없이 가리키는 memoryview
+ImageData = Union[bytes, bytearray, memoryview]
+
+
+class ImageTooLargeError(ValueError):
+    """업로드 이미지가 MAX_IMAGE_BYTES 초과"""
+
+
+class ImageBuffer:
+    """
+    업로드 본문을 상한이 있는 버퍼에 chunk 단위로 누적
+
+    Content-Length를 알면 한 번에 할당, view()는 복사 없이 memoryview 반환
+    """
+
+    def __init__(self, max_bytes: int = MAX_IMAGE_BYTES, expected_size: Optional[int] = None):
+        if expected_size is not None and expected_size > max_bytes:
+            raise ImageTooLargeError(f"Image too large: {expected_size} > {max_bytes} bytes")
+        self.max_bytes = max_bytes
+        self._buf = bytearray(expected_size or 0)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, chunk: ImageData) -> None:
+        end = self._size + len(chunk)
+        if end > self.max_bytes:
+            raise ImageTooLargeError(f"Image too large: more than {self.max_bytes} bytes")
+        self._buf[self._size:end] = chunk
+        self._size = end
+
+    def view(self) -> memoryview:
+        """누적된 바이트 (복사 없음, 이후 write 불가)"""
+        return memoryview(self._buf)[:self._size]
+
 
 class VisualSource(Enum):
     """이미지 소스"""
@@ -29,7 +77,7 @@ class VisualSource(Enum):
 @dataclass
 class VisualInput:
     """시각 입력 데이터"""
-    image_data: bytes           # 이미지 바이너리 데이터
+    image_data: ImageData       # 이미지 바이너리 데이터 (memoryview면 복사 없이 참조)
     mime_type: str             # image/jpeg, image/png, image/webp
     source: VisualSource       # 이미지 소스
     timestamp: datetime = field(default_factory=datetime.now)
@@ -43,8 +91,19 @@ class VisualInput:
         if not self.file_size:
             self.file_size = len(self.image_data)
 
+    @property
+    def view(self) -> memoryview:
+        """이미지 바이트 memoryview (복사 없음)"""
+        return memoryview(self.image_data)
+
+    def to_bytes(self) -> bytes:
+        """bytes가 필요한 경계(Storage 업로드 등)에서만 복사"""
+        if isinstance(self.image_data, bytes):
+            return self.image_data
+        return bytes(self.image_data)
+
     def to_base64(self) -> str:
-        """Base64 인코딩"""
+        """Base64 인코딩 (JSON 전송 경계에서만 사용)"""
         return base64.b64encode(self.image_data).decode('utf-8')
 
     @classmethod
@@ -90,6 +149,10 @@ class VisualExperience:
     confidence: float = 0.0
     timestamp: datetime = field(default_factory=datetime.now)
 
+    # 반복 노출 (거의 같은 프레임 → 캐시된 경험 재사용)
+    familiarity: float = 0.0
+    from_cache: bool = False
+
     # DB 연동
     db_id: str = None
     experience_id: str = None     # experiences 테이블 참조
@@ -116,6 +179,8 @@ class VisualExperience:
             "development_stage": self.development_stage,
             "confidence": self.confidence,
             "timestamp": self.timestamp.isoformat(),
+            "familiarity": self.familiarity,
+            "from_cache": self.from_cache,
         }
 
 
@@ -124,17 +189,21 @@ class VisionProcessor:
     시각 처리기
 
     Gemini Vision API를 사용하여:
-    1. 이미지 설명 생성
-    2. 객체 감지
-    3. 장면 분류
-    4. 감정 반응 생성
+    1. 이미지 설명 생성 + 객체 감지 (JSON 응답 한 번)
+    2. 장면 분류
+    3. 감정 반응 생성
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, enable_cache: bool = True, cache: Optional[VisionCache] = None):
         self.verbose = verbose
         self._llm_client = None
         self._db = None
         self._storage = None
+        self._pending_saves: set[asyncio.Task] = set()   # 백그라운드 DB 저장
+        # 최근 경험 캐시 (거의 같은 프레임은 다시 분석하지 않음)
+        if cache is None and enable_cache:
+            cache = VisionCache()
+        self._cache = cache
 
     def _get_llm_client(self):
         """LLM 클라이언트 (lazy init)"""
@@ -175,28 +244,35 @@ class VisionProcessor:
         """
         이미지 처리 메인 파이프라인
 
-        1. 이미지 → Storage 업로드
-        2. Gemini Vision으로 장면 설명
-        3. 객체 감지
-        4. 시각적 경험 생성
-        5. DB 저장
+        0. 최근에 본 장면과 거의 같으면 캐시된 경험 재사용 (업로드/LLM/DB 생략)
+        1. Storage 업로드 ∥ 장면 분석 (설명 + 객체 감지, Gemini 호출 1회)
+        2. 장면 유형 분류 / 감정 반응
+        3. 시각적 경험 생성
+        4. DB 저장은 백그라운드로 (drain()으로 완료 대기)
         """
         if self.verbose:
             print(f"[Vision] Processing image ({visual_input.file_size} bytes, {visual_input.mime_type})")
 
-        # 1. Storage 업로드
-        image_url = await self._upload_to_storage(visual_input)
-
-        # 2. 장면 설명 생성
-        description = await self.describe_scene(visual_input.image_data)
+        # 0. 지각 해시 캐시 (디코딩은 스레드에서)
+        fingerprint = None
+        if self._cache is not None:
+            fingerprint = await asyncio.to_thread(self._cache.fingerprint, visual_input.image_data)
+            entry = self._cache.get(fingerprint)
+            if entry is not None:
+                if self.verbose:
+                    print(f"[Vision] Familiar scene (seen {entry.hits + 1} times), reusing analysis")
+                return self._habituate(entry)
 
-        # 3. 객체 감지
-        objects = await self.detect_objects(visual_input.image_data)
+        # 1. 업로드와 분석은 서로 독립 → 동시에
+        image_url, (description, objects) = await asyncio.gather(
+            self._upload_to_storage(visual_input),
+            self.analyze_scene(visual_input.image_data),
+        )
 
-        # 4. 장면 유형 분류
+        # 2. 장면 유형 분류
         scene_type = self._classify_scene(description, objects)
 
-        # 5. 감정 반응 생성 (발달 단계에 따라 다름)
+        # 3. 감정 반응 생성 (발달 단계에 따라 다름)
         emotional_response = self._generate_emotional_response(
             description=description,
             objects=objects,
@@ -204,7 +280,7 @@ class VisionProcessor:
             current_emotions=emotional_state,
         )
 
-        # 6. 시각적 경험 생성
+        # 4. 시각적 경험 생성
         visual_exp = VisualExperience(
             image_url=image_url,
             description=description,
@@ -216,15 +292,79 @@ class VisionProcessor:
             confidence=self._calculate_confidence(objects),
         )
 
-        # 7. DB 저장
-        visual_exp = await self._save_to_db(visual_exp, visual_input)
+        # 5. DB 저장 (응답을 기다리게 하지 않음, db_id/media_file_id는 저장 후 채워짐)
+        self._schedule_save(visual_exp, visual_input)
+        # 분석 실패(기본 설명 + 객체 없음)는 캐시하지 않음 → 같은 장면도 다음 프레임에서 재분석
+        analysis_failed = description == DEFAULT_DESCRIPTION and not objects
+        if fingerprint is not None and not analysis_failed:
+            self._cache.put(fingerprint, visual_exp)
 
         if self.verbose:
             print(f"[Vision] Processed: {scene_type} scene, {len(objects)} objects detected")
 
         return visual_exp
 
-    async def describe_scene(self, image_data: bytes) -> str:
+    def _habituate(self, entry: VisualCacheEntry) -> VisualExperience:
+        """
+        반복 노출: 캐시된 분석은 그대로, 감정 반응은 새로움 대신 반복(지루함)으로
+
+        같은 자극에 매번 호기심/기쁨이 오르지 않도록 변화량 0 + repetition 표시
+        DB 행 참조(db_id 등)는 원본 경험의 것이므로 비움
+        """
+        return replace(
+            entry.experience,
+            id=str(uuid.uuid4()),
+            db_id=None,
+            experience_id=None,
+            media_file_id=None,
+            emotional_response={
+                "curiosity_change": 0.0,
+                "joy_change": 0.0,
+                "fear_change": 0.0,
+                "surprise_change": 0.0,
+                "repetition": True,
+            },
+            curiosity_triggered=0.0,
+            timestamp=datetime.now(),
+            familiarity=min(1.0, entry.hits * FAMILIARITY_STEP),
+            from_cache=True,
+        )
+
+    async def analyze_scene(self, image_data: ImageData) -> tuple[str, list[DetectedObject]]:
+        """
+        장면 설명 + 객체 감지를 한 번의 Gemini Vision 호출로
+
+        JSON으로 응답받고, JSON이 아니면 기존 줄 형식(- 이름: ...)으로 파싱
+        """
+        client = self._get_llm_client()
+
+        prompt = f"""이 이미지를 보고 아기가 이해할 수 있을 정도로 분석해주세요.
+
+description: 2-3문장의 간단한 설명 (전체적인 장면, 주요 객체, 밝은지/어두운지/즐거운지 같은 분위기)
+objects: 보이는 객체 목록 (최대 {MAX_OBJECTS}개)
+- name: 객체 이름
+- category: person/animal/object/nature/vehicle/food/other
+- confidence: high/medium/low
+
+JSON 형식으로만 응답:
+{{"description": "장면 설명", "objects": [{{"name": "강아지", "category": "animal", "confidence": "high"}}]}}"""
+
+        try:
+            # 동기 SDK 호출 → 스레드에서 (업로드와 동시에 진행)
+            response = await asyncio.to_thread(
+                client.generate_multimodal,
+                prompt=prompt,
+                images=[image_data],
+                model_key=VISION_MODEL_KEY,
+            )
+        except Exception as e:
+            if self.verbose:
+                print(f"[Vision] Scene analysis failed: {e}")
+            return DEFAULT_DESCRIPTION, []
+
+        return self._parse_analysis_response(response)
+
+    async def describe_scene(self, image_data: ImageData) -> str:
         """
         이미지 장면 설명 생성
 
@@ -246,15 +386,15 @@ class VisionProcessor:
             description = client.generate_multimodal(
                 prompt=prompt,
                 images=[image_data],
-                model_key="gemini-2-flash",
+                model_key=VISION_MODEL_KEY,
             )
             return description.strip()
         except Exception as e:
             if self.verbose:
                 print(f"[Vision] Scene description failed: {e}")
-            return "이미지를 설명할 수 없습니다."
+            return DEFAULT_DESCRIPTION
 
-    async def detect_objects(self, image_data: bytes) -> list[DetectedObject]:
+    async def detect_objects(self, image_data: ImageData) -> list[DetectedObject]:
         """
         이미지에서 객체 감지
 
@@ -280,7 +420,7 @@ class VisionProcessor:
             response = client.generate_multimodal(
                 prompt=prompt,
                 images=[image_data],
-                model_key="gemini-2-flash",
+                model_key=VISION_MODEL_KEY,
             )
 
             # 응답 파싱
@@ -292,6 +432,35 @@ class VisionProcessor:
                 print(f"[Vision] Object detection failed: {e}")
             return []
 
+    def _parse_analysis_response(self, response: str) -> tuple[str, list[DetectedObject]]:
+        """장면 분석(JSON) 응답 파싱"""
+        start = response.find('{')
+        end = response.rfind('}') + 1
+        if start >= 0 and end > start:
+            try:
+                data = json.loads(response[start:end])
+                description = str(data.get("description") or "").strip() or DEFAULT_DESCRIPTION
+                objects = [
+                    self._create_detected_object({
+                        'name': str(obj['name']),
+                        'category': obj.get('category') or 'other',
+                        'confidence': CONFIDENCE_LEVELS.get(str(obj.get('confidence', '')).lower(), 0.5),
+                    })
+                    for obj in data.get("objects") or []
+                    if isinstance(obj, dict) and obj.get('name')
+                ]
+                return description, objects[:MAX_OBJECTS]
+            except (json.JSONDecodeError, AttributeError):
+                pass
+
+        # JSON이 아니면: 객체 줄은 객체로, 나머지는 설명으로
+        objects = self._parse_objects_response(response)
+        description = "\n".join(
+            line for line in response.strip().split('\n')
+            if line.strip() and not line.strip().startswith('- ')
+        ).strip()
+        return description or DEFAULT_DESCRIPTION, objects
+
     def _parse_objects_response(self, response: str) -> list[DetectedObject]:
         """객체 감지 응답 파싱"""
         objects = []
@@ -311,11 +480,7 @@ class VisionProcessor:
                 current_obj['category'] = line.replace('- 카테고리:', '').strip()
             elif line.startswith('- 확신도:'):
                 confidence_text = line.replace('- 확신도:', '').strip().lower()
-                current_obj['confidence'] = {
-                    'high': 0.9,
-                    'medium': 0.7,
-                    'low': 0.4,
-                }.get(confidence_text, 0.5)
+                current_obj['confidence'] = CONFIDENCE_LEVELS.get(confidence_text, 0.5)
 
         # 마지막 객체 추가
         if current_obj.get('name'):
@@ -390,7 +555,10 @@ class VisionProcessor:
         return round(avg_confidence, 2)
 
     async def _upload_to_storage(self, visual_input: VisualInput) -> str:
-        """이미지를 Supabase Storage에 업로드"""
+        """이미지를 Supabase Storage에 업로드 (동기 클라이언트 → 스레드)"""
+        return await asyncio.to_thread(self._upload_sync, visual_input)
+
+    def _upload_sync(self, visual_input: VisualInput) -> str:
         storage = self._get_storage()
         if not storage:
             return ""
@@ -402,7 +570,7 @@ class VisionProcessor:
 
             # 업로드
             storage.from_("media").upload(
-                file=visual_input.image_data,
+                file=visual_input.to_bytes(),
                 path=filename,
                 file_options={"content-type": visual_input.mime_type}
             )
@@ -416,8 +584,28 @@ class VisionProcessor:
                 print(f"[Vision] Storage upload failed: {e}")
             return ""
 
+    def _schedule_save(self, visual_exp: VisualExperience, visual_input: VisualInput) -> None:
+        """DB 저장을 백그라운드 태스크로 (참조를 보관해 GC되지 않게)"""
+        task = asyncio.get_running_loop().create_task(self._save_to_db(visual_exp, visual_input))
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+
+    async def drain(self) -> None:
+        """
+        대기 중인 백그라운드 DB 저장이 모두 끝날 때까지 대기
+
+        asyncio.run()은 끝날 때 남은 태스크를 취소하므로 같은 루프에서 호출
+        """
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._pending_saves if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _save_to_db(self, visual_exp: VisualExperience, visual_input: VisualInput) -> VisualExperience:
-        """시각적 경험을 DB에 저장"""
+        """시각적 경험을 DB에 저장 (동기 클라이언트 → 스레드)"""
+        return await asyncio.to_thread(self._save_sync, visual_exp, visual_input)
+
+    def _save_sync(self, visual_exp: VisualExperience, visual_input: VisualInput) -> VisualExperience:
         db = self._get_db()
         if not db:
             return visual_exp
@@ -457,15 +645,19 @@ class VisionProcessor:
 
     def get_stats(self) -> dict:
         """통계 조회"""
+        stats = {"visual_experiences": 0, "pending_saves": len(self._pending_saves)}
+        if self._cache is not None:
+            stats["cache"] = self._cache.get_stats()
         db = self._get_db()
         if not db:
-            return {"visual_experiences": 0}
+            return stats
 
         try:
             result = db.client.table("visual_experiences").select("id", count="exact").execute()
-            return {"visual_experiences": result.count or 0}
+            stats["visual_experiences"] = result.count or 0
         except:
-            return {"visual_experiences": 0}
+            pass
+        return stats
 
 
 # 싱글톤 인스턴스
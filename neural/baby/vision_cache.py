@@ -0,0 +1,198 @@
+"""
+Vision Cache - 지각 해시 기반 시각 경험 캐시
+
+카메라 프레임은 연속으로 거의 같은 장면 → 매 프레임 업로드/LLM/DB는 낭비
+1. 정확 일치: 이미지 바이트 해시
+2. 지각 유사: dHash (9x8 그레이스케일로 축소 → 가로 이웃 밝기 비교 64비트),
+   해밍 거리 임계값 이하면 같은 장면
+
+- TTL 만료 + LRU 제거
+- 적중률 통계
+
+Pillow가 없으면 이미지를 디코딩할 수 없으므로 정확 일치만 사용
+"""
+
+import hashlib
+import io
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, Union
+
+
+# 기본 설정
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_DISTANCE = 5          # 64비트 중 다른 비트 수 (이하면 같은 장면)
+DEFAULT_TTL_SECONDS = 300.0       # 같은 장면이라도 이 시간이 지나면 다시 분석
+HASH_WIDTH, HASH_HEIGHT = 9, 8    # 가로 비교 8 x 세로 8 = 64비트
+
+ImageBytes = Union[bytes, bytearray, memoryview]
+
+
+def dhash_pixels(pixels: bytes, width: int = HASH_WIDTH, height: int = HASH_HEIGHT) -> int:
+    """그레이스케일 픽셀(행 우선)의 dHash: 왼쪽이 오른쪽보다 밝으면 1"""
+    value = 0
+    for row in range(height):
+        base = row * width
+        for col in range(width - 1):
+            value = (value << 1) | (pixels[base + col] > pixels[base + col + 1])
+    return value
+
+
+def pillow_available() -> bool:
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def perceptual_hash(image_data: ImageBytes) -> Optional[int]:
+    """이미지 dHash (Pillow 없거나 디코딩 실패 시 None)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as img:
+            # JPEG은 디코딩 단계에서 축소 (전체 해상도 디코딩 생략)
+            img.draft("L", (HASH_WIDTH * 8, HASH_HEIGHT * 8))
+            small = img.convert("L").resize((HASH_WIDTH, HASH_HEIGHT), Image.BILINEAR)
+            return dhash_pixels(small.tobytes())
+    except Exception:
+        return None
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class ImageFingerprint:
+    """이미지 지문"""
+    digest: str                    # 바이트 해시 (정확 일치)
+    phash: Optional[int] = None    # 지각 해시 (없으면 정확 일치만)
+
+
+@dataclass
+class VisualCacheEntry:
+    """캐시 항목"""
+    fingerprint: ImageFingerprint
+    experience: Any                # VisualExperience
+    created_at: float
+    hits: int = 0
+
+
+@dataclass
+class VisionCacheStats:
+    """캐시 통계"""
+    exact_hits: int = 0
+    perceptual_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.exact_hits + self.perceptual_hits + self.misses
+        data = asdict(self)
+        data["hit_rate"] = (self.exact_hits + self.perceptual_hits) / lookups if lookups else 0.0
+        return data
+
+
+class VisionCache:
+    """
+    최근 시각 경험 캐시
+
+    - fingerprint(): 이미지 지문 계산 (디코딩 포함, 스레드에서 호출 권장)
+    - get(): 정확 일치 → 해밍 거리 순으로 조회
+    - put(): 경험 저장 (LRU 초과 시 가장 오래된 항목 제거)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        hasher: Optional[Callable[[ImageBytes], Optional[int]]] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self.ttl_seconds = ttl_seconds
+        self._hasher = hasher or perceptual_hash
+        self.perceptual = hasher is not None or pillow_available()
+        if not self.perceptual:
+            print("[VisionCache] Pillow not installed, exact-match only")
+        self._entries: "OrderedDict[str, VisualCacheEntry]" = OrderedDict()
+        self.stats = VisionCacheStats()
+
+    def fingerprint(self, image_data: ImageBytes) -> ImageFingerprint:
+        digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+        phash = self._hasher(image_data) if self.perceptual else None
+        return ImageFingerprint(digest=digest, phash=phash)
+
+    def _is_expired(self, entry: VisualCacheEntry, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+
+    def get(self, fingerprint: ImageFingerprint) -> Optional[VisualCacheEntry]:
+        """캐시 조회 (없으면 None)"""
+        now = time.time()
+
+        # 1. 정확 일치
+        entry = self._entries.get(fingerprint.digest)
+        if entry is not None:
+            if self._is_expired(entry, now):
+                del self._entries[fingerprint.digest]
+            else:
+                return self._hit(entry, exact=True)
+
+        # 2. 지각 유사 (가장 가까운 항목)
+        if fingerprint.phash is not None:
+            best, best_distance = None, self.max_distance + 1
+            for candidate in self._entries.values():
+                if candidate.fingerprint.phash is None or self._is_expired(candidate, now):
+                    continue
+                distance = hamming_distance(fingerprint.phash, candidate.fingerprint.phash)
+                if distance < best_distance:
+                    best, best_distance = candidate, distance
+            if best is not None:
+                return self._hit(best, exact=False)
+
+        self.stats.misses += 1
+        return None
+
+    def _hit(self, entry: VisualCacheEntry, exact: bool) -> VisualCacheEntry:
+        self._entries.move_to_end(entry.fingerprint.digest)
+        entry.hits += 1
+        if exact:
+            self.stats.exact_hits += 1
+        else:
+            self.stats.perceptual_hits += 1
+        return entry
+
+    def put(self, fingerprint: ImageFingerprint, experience: Any) -> None:
+        """경험 저장"""
+        now = time.time()
+        self._entries[fingerprint.digest] = VisualCacheEntry(
+            fingerprint=fingerprint,
+            experience=experience,
+            created_at=now,
+        )
+        self._entries.move_to_end(fingerprint.digest)
+
+        # TTL 만료 → LRU 순으로 제거
+        if len(self._entries) > self.max_entries:
+            for digest in [d for d, e in self._entries.items() if self._is_expired(e, now)]:
+                del self._entries[digest]
+                self.stats.evictions += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        stats = self.stats.to_dict()
+        stats["entries"] = len(self._entries)
+        stats["perceptual"] = self.perceptual
+        return stats
@@ -12,11 +12,23 @@ World Model - Baby AI의 세계 모델
 
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Any, Callable, Optional
 from datetime import datetime
 from enum import Enum
 import json
 
+from .causal_graph import CausalGraph, get_causal_graph
+from .concept_index import ConceptIndex, get_concept_index
+from .rate_limiter import RequestPriority
+
+
+AUTO_VERIFY_LIMIT = 20                 # 한 번에 검토할 미검증 예측 수
+RELATED_PREDICTION_SIMILARITY = 0.4    # 경험-시나리오 임베딩 코사인 유사도 기준
+VERDICTS = ("correct", "incorrect", "uncertain")
+MAX_RELATED_CONCEPTS = 20              # 예측 프롬프트에 넣을 관련 개념 수
+CAUSAL_CONTEXT_HOPS = 2                # 시뮬레이션/상상 프롬프트에 넣을 인과 경로 깊이
+CAUSAL_CONTEXT_LIMIT = 6               # 프롬프트에 넣을 인과 경로 수
+
 
 class PredictionType(Enum):
     """예측 유형"""
@@ -87,12 +99,27 @@ class WorldModel:
         llm_client=None,
         development_stage: int = 0,
         verbose: bool = True,
+        embed_fn: Optional[Callable[[list[str]], list[list[float]]]] = None,
+        concept_index: Optional[ConceptIndex] = None,
+        causal_graph: Optional[CausalGraph] = None,
     ):
         self._db = db
         self._llm_client = llm_client
         self._development_stage = development_stage
         self._verbose = verbose
 
+        # 관련 예측 선별용 일괄 임베딩 함수 (기본: OpenAI embeddings)
+        if embed_fn is None:
+            from .embeddings import create_embeddings_batch
+            embed_fn = create_embeddings_batch
+        self._embed_fn = embed_fn
+
+        # 개념 이름/ID 인메모리 인덱스 (get_all_concepts 반복 호출 대체)
+        self._concept_index = concept_index if concept_index is not None else get_concept_index()
+
+        # 인메모리 인과 그래프 (causal_models 스캔 대체)
+        self._causal_graph = causal_graph if causal_graph is not None else get_causal_graph()
+
         # 활성 상상 세션
         self._active_imagination: Optional[str] = None
 
@@ -145,12 +172,9 @@ class WorldModel:
         related_concepts = []
         if self._db:
             try:
-                concepts = self._db.get_all_concepts()
-                # 시나리오와 관련된 개념 필터링 (간단한 키워드 매칭)
-                scenario_lower = scenario.lower()
-                for concept in concepts[:20]:  # 상위 20개만 검사
-                    if concept["name"].lower() in scenario_lower:
-                        related_concepts.append(concept["name"])
+                # 모든 개념 이름을 시나리오에 대해 한 번에 매칭 (Aho-Corasick)
+                self._concept_index.ensure_fresh(self._db)
+                related_concepts = self._concept_index.match(scenario)[:MAX_RELATED_CONCEPTS]
             except Exception as e:
                 if self._verbose:
                     print(f"[WORLD_MODEL] 개념 수집 실패: {e}")
@@ -171,6 +195,7 @@ class WorldModel:
             response = self._llm_client.generate(
                 prompt=prompt,
                 max_tokens=500,
+                priority=RequestPriority.BACKGROUND,
             )
 
             # 응답 파싱
@@ -259,7 +284,11 @@ class WorldModel:
 예측이 맞았나요? "correct" 또는 "incorrect"로 답하세요."""
 
         try:
-            response = self._llm_client.generate(prompt=prompt, max_tokens=50)
+            response = self._llm_client.generate(
+                prompt=prompt,
+                max_tokens=50,
+                priority=RequestPriority.BACKGROUND,
+            )
             was_correct = "correct" in response.lower() and "incorrect" not in response.lower()
 
             # DB 업데이트
@@ -322,18 +351,26 @@ class WorldModel:
                 if self._verbose:
                     print(f"[WORLD_MODEL] 시뮬레이션 저장 실패: {e}")
 
+        # 목표/초기 상태 개념에서 출발하는 알려진 인과 경로
+        causal_context = self._causal_context(f"{goal} {initial_state}")
+
         # 단계별 시뮬레이션
         for step_num in range(1, max_steps + 1):
             prompt = f"""시뮬레이션 단계 {step_num}
 
 현재 상태: {current_state}
 목표: {goal}
+{causal_context}
 
 다음 행동과 예상 결과를 JSON 형식으로 제공하세요:
 {{"action": "행동", "outcome": "결과", "new_state": {{"key": "value"}}}}"""
 
             try:
-                response = self._llm_client.generate(prompt=prompt, max_tokens=300)
+                response = self._llm_client.generate(
+                    prompt=prompt,
+                    max_tokens=300,
+                    priority=RequestPriority.BACKGROUND,
+                )
 
                 # JSON 파싱 시도
                 try:
@@ -466,6 +503,7 @@ class WorldModel:
         prompt = f"""상상 세션 - 주제: {topic}
 
 이전 생각들: {previous_thoughts[-3:] if previous_thoughts else '없음'}
+{self._causal_context(topic)}
 
 새로운 생각을 하나 생성하세요. 유형: {thought_type}
 
@@ -473,7 +511,11 @@ JSON 형식으로 응답:
 {{"content": "생각 내용", "type": "{thought_type}", "connections": ["관련 개념1", "관련 개념2"]}}"""
 
         try:
-            response = self._llm_client.generate(prompt=prompt, max_tokens=200)
+            response = self._llm_client.generate(
+                prompt=prompt,
+                max_tokens=200,
+                priority=RequestPriority.BACKGROUND,
+            )
 
             try:
                 start = response.find('{')
@@ -539,7 +581,11 @@ JSON 배열로 인사이트 3개를 제공하세요:
 ["인사이트1", "인사이트2", "인사이트3"]"""
 
             try:
-                response = self._llm_client.generate(prompt=prompt, max_tokens=200)
+                response = self._llm_client.generate(
+                    prompt=prompt,
+                    max_tokens=200,
+                    priority=RequestPriority.BACKGROUND,
+                )
                 try:
                     start = response.find('[')
                     end = response.rfind(']') + 1
@@ -598,11 +644,11 @@ JSON 배열로 인사이트 3개를 제공하세요:
         if not self._db:
             return None
 
-        # 개념 ID 조회
-        cause = self._db.get_concept_by_name(cause_concept)
-        effect = self._db.get_concept_by_name(effect_concept)
+        # 개념 ID 조회 (인덱스 우선, 없으면 DB)
+        cause_id = self._resolve_concept_id(cause_concept)
+        effect_id = self._resolve_concept_id(effect_concept)
 
-        if not cause or not effect:
+        if not cause_id or not effect_id:
             if self._verbose:
                 print(f"[WORLD_MODEL] 개념을 찾을 수 없음: {cause_concept}, {effect_concept}")
             return None
@@ -619,7 +665,11 @@ JSON 배열로 인사이트 3개를 제공하세요:
 한 단어로만 응답: """
 
             try:
-                response = self._llm_client.generate(prompt=prompt, max_tokens=20)
+                response = self._llm_client.generate(
+                    prompt=prompt,
+                    max_tokens=20,
+                    priority=RequestPriority.BACKGROUND,
+                )
                 response_lower = response.lower().strip()
                 if "enables" in response_lower:
                     relationship_type = "enables"
@@ -633,8 +683,8 @@ JSON 배열로 인사이트 3개를 제공하세요:
         # DB에 저장
         try:
             result = self._db.upsert_causal_model(
-                cause_concept_id=cause["id"],
-                effect_concept_id=effect["id"],
+                cause_concept_id=cause_id,
+                effect_concept_id=effect_id,
                 relationship_type=relationship_type,
                 discovered_at_stage=self._development_stage,
             )
@@ -649,6 +699,47 @@ JSON 배열로 인사이트 3개를 제공하세요:
                 print(f"[WORLD_MODEL] 인과 관계 저장 실패: {e}")
             return None
 
+    def _causal_context(self, text: str) -> str:
+        """
+        텍스트에 등장하는 개념에서 출발하는 강한 인과 경로 (프롬프트용)
+
+        인과 그래프/개념 인덱스만 사용 (DB 스캔 없음), 없으면 빈 문자열
+        """
+        try:
+            self._concept_index.ensure_fresh(self._db)
+            self._causal_graph.ensure_fresh(self._db)
+        except Exception as e:
+            if self._verbose:
+                print(f"[WORLD_MODEL] 인과 그래프 로드 실패: {e}")
+            return ""
+
+        paths = []
+        for name in self._concept_index.match(text)[:MAX_RELATED_CONCEPTS]:
+            concept_id = self._concept_index.get_id(name)
+            paths.extend(self._causal_graph.top_effects(
+                concept_id, limit=CAUSAL_CONTEXT_LIMIT, max_hops=CAUSAL_CONTEXT_HOPS,
+            ))
+        if not paths:
+            return ""
+
+        paths.sort(key=lambda p: p["score"], reverse=True)
+        lines = []
+        for path in paths[:CAUSAL_CONTEXT_LIMIT]:
+            names = [self._concept_index.get_name(cid) or cid for cid in path["path"]]
+            lines.append(f"- {' → '.join(names)} (강도 {path['score']:.2f})")
+        return "알려진 인과관계:\n" + "\n".join(lines)
+
+    def _resolve_concept_id(self, name: str) -> Optional[str]:
+        """개념 이름 → ID (인덱스에 없으면 DB 조회 후 인덱스에 추가)"""
+        concept_id = self._concept_index.get_id(name)
+        if concept_id:
+            return concept_id
+        concept = self._db.get_concept_by_name(name)
+        if not concept:
+            return None
+        self._concept_index.add(concept)
+        return concept["id"]
+
     def extract_causal_relations_from_experience(
         self,
         experience: dict,
@@ -807,7 +898,11 @@ JSON 배열로 인사이트 3개를 제공하세요:
 
 JSON만 응답:"""
 
-            response = self._llm_client.generate(prompt=prompt, max_tokens=150)
+            response = self._llm_client.generate(
+                prompt=prompt,
+                max_tokens=150,
+                priority=RequestPriority.BACKGROUND,
+            )
 
             # JSON 파싱
             import re
@@ -833,6 +928,97 @@ JSON만 응답:"""
 
     # ==================== Auto-Verification ====================
 
+    def _find_related_predictions(
+        self,
+        predictions: list[dict],
+        task: str,
+        task_type: str,
+    ) -> list[dict]:
+        """
+        현재 경험과 관련된 예측 선별
+
+        경험과 시나리오들을 한 번에 임베딩해 코사인 유사도로 판단.
+        임베딩을 쓸 수 없으면 키워드 매칭으로 폴백.
+        """
+        scenarios = [p.get("scenario", "") for p in predictions]
+        try:
+            from .embeddings import cosine_similarity
+            vectors = self._embed_fn([f"[{task_type}] {task}"] + scenarios)
+            query = vectors[0]
+            return [
+                prediction
+                for prediction, vector in zip(predictions, vectors[1:])
+                if cosine_similarity(query, vector) >= RELATED_PREDICTION_SIMILARITY
+            ]
+        except Exception as e:
+            if self._verbose:
+                print(f"[WORLD_MODEL] 임베딩 관련성 판단 실패, 키워드 매칭 사용: {e}")
+
+        keywords = task.lower().split()[:3]
+        return [
+            prediction
+            for prediction, scenario in zip(predictions, scenarios)
+            if task_type.lower() in scenario.lower()
+            or any(keyword in scenario.lower() for keyword in keywords)
+        ]
+
+    def _judge_predictions_batch(
+        self,
+        predictions: list[dict],
+        actual_outcome: str,
+    ) -> dict[int, str]:
+        """
+        여러 예측을 한 번의 LLM 호출로 판정
+
+        Returns:
+            {예측 인덱스: "correct" | "incorrect" | "uncertain"} (응답에 없는 인덱스는 제외)
+        """
+        listing = "\n".join(
+            f"[{i}] 시나리오: {p.get('scenario', '')}\n    예측: {p.get('prediction', '')}"
+            for i, p in enumerate(predictions)
+        )
+        prompt = f"""예측들의 정확성을 판단하세요.
+
+실제 결과: {actual_outcome}
+
+예측 목록:
+{listing}
+
+각 예측에 대해 판정하세요.
+- "correct": 예측과 실제 결과가 대체로 일치
+- "incorrect": 예측과 실제 결과가 다름
+- "uncertain": 판단 불가
+
+JSON 배열로 응답하세요. 각 항목은 {{"index": 번호, "verdict": "correct"}} 형식입니다.
+
+JSON만 응답:"""
+
+        try:
+            response = self._llm_client.generate(
+                prompt=prompt,
+                max_tokens=30 + 25 * len(predictions),
+                priority=RequestPriority.BACKGROUND,
+            )
+            import re
+            json_match = re.search(r'\[.*\]', response, re.DOTALL)
+            if not json_match:
+                return {}
+            items = json.loads(json_match.group())
+        except Exception as e:
+            if self._verbose:
+                print(f"[WORLD_MODEL] 예측 일괄 판정 실패: {e}")
+            return {}
+
+        verdicts = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index")
+            verdict = str(item.get("verdict", "")).lower().strip()
+            if isinstance(index, int) and 0 <= index < len(predictions) and verdict in VERDICTS:
+                verdicts[index] = verdict
+        return verdicts
+
     def auto_verify_predictions(
         self,
         current_experience: dict,
@@ -841,9 +1027,9 @@ JSON만 응답:"""
         현재 경험을 기반으로 이전 예측들을 자동 검증
 
         전략:
-        1. 미검증 예측 중 현재 경험과 관련된 것 찾기
-        2. 예측 시나리오와 실제 결과 비교
-        3. auto_verified = true로 표시
+        1. 미검증 예측 중 현재 경험과 관련된 것 찾기 (임베딩 유사도)
+        2. 관련 예측 전체를 한 번의 LLM 호출로 실제 결과와 비교 (JSON 판정 배열)
+        3. auto_verified = true로 일괄 업데이트
         """
         if not self._db or not self._llm_client:
             return []
@@ -855,7 +1041,7 @@ JSON만 응답:"""
 
         # 미검증 예측 조회
         try:
-            unverified = self._db.get_unverified_predictions(limit=20)
+            unverified = self._db.get_unverified_predictions(limit=AUTO_VERIFY_LIMIT)
         except Exception as e:
             if self._verbose:
                 print(f"[WORLD_MODEL] 미검증 예측 조회 실패: {e}")
@@ -864,82 +1050,64 @@ JSON만 응답:"""
         if not unverified:
             return []
 
-        # 각 예측에 대해 관련성 확인 및 검증
-        for prediction in unverified:
-            scenario = prediction.get("scenario", "")
-            prediction_text = prediction.get("prediction", "")
-            prediction_id = prediction.get("id", "")
+        # 관련 예측 선별 (임베딩 유사도, 한 번의 임베딩 호출)
+        related = self._find_related_predictions(unverified, task, task_type)
+        if not related:
+            return []
 
-            # 관련성 확인 (시나리오에 task_type이 포함되어 있는지)
-            is_related = (
-                task_type.lower() in scenario.lower() or
-                any(keyword in scenario.lower() for keyword in task.lower().split()[:3])
-            )
+        # 관련 예측 전체를 한 번의 LLM 호출로 판정
+        actual_outcome = f"task_type: {task_type}, success: {success}, task: {task[:100]}"
+        verdicts = self._judge_predictions_batch(related, actual_outcome)
 
-            if not is_related:
+        verified_at = datetime.utcnow().isoformat()
+        rows = []
+        for index, prediction in enumerate(related):
+            verdict = verdicts.get(index, "uncertain")
+            # 판단 불가면 건너뛰기
+            if verdict == "uncertain":
                 continue
 
-            # LLM으로 예측 정확성 판단
-            actual_outcome = f"task_type: {task_type}, success: {success}, task: {task[:100]}"
-
-            try:
-                prompt = f"""예측의 정확성을 판단하세요.
-
-원래 예측: {prediction_text}
-시나리오: {scenario}
-
-실제 결과: {actual_outcome}
-
-이 예측이 맞았나요?
-- "correct": 예측과 실제 결과가 대체로 일치
-- "incorrect": 예측과 실제 결과가 다름
-- "uncertain": 판단 불가
-
-한 단어로만 응답:"""
-
-                response = self._llm_client.generate(prompt=prompt, max_tokens=30)
-                response_lower = response.lower().strip()
-
-                # 판단 불가면 건너뛰기
-                if "uncertain" in response_lower:
-                    continue
-
-                was_correct = "correct" in response_lower and "incorrect" not in response_lower
-
-                # DB 업데이트 (auto_verified 플래그 포함)
-                update_data = {
-                    "actual_outcome": actual_outcome,
-                    "was_correct": was_correct,
-                    "prediction_error": 0.0 if was_correct else 1.0,
-                    "verified_at": datetime.utcnow().isoformat(),
-                    "auto_verified": True,
-                    "verification_context": {
-                        "verified_by": "auto_verify_predictions",
-                        "related_task": task[:100],
-                        "task_type": task_type,
-                        "task_success": success,
-                    },
-                }
-
-                self._db.client.table("predictions").update(update_data).eq("id", prediction_id).execute()
+            was_correct = verdict == "correct"
+            rows.append({
+                **prediction,
+                "actual_outcome": actual_outcome,
+                "was_correct": was_correct,
+                "prediction_error": 0.0 if was_correct else 1.0,
+                "verified_at": verified_at,
+                "auto_verified": True,
+                "verification_context": {
+                    "verified_by": "auto_verify_predictions",
+                    "related_task": task[:100],
+                    "task_type": task_type,
+                    "task_success": success,
+                },
+            })
+
+        if not rows:
+            return []
 
-                verified_predictions.append({
-                    "prediction_id": prediction_id,
-                    "was_correct": was_correct,
-                    "scenario": scenario[:50],
-                })
+        # DB 일괄 업데이트 (auto_verified 플래그 포함)
+        try:
+            self._db.update_predictions_bulk(rows)
+        except Exception as e:
+            if self._verbose:
+                print(f"[WORLD_MODEL] 예측 일괄 검증 저장 실패: {e}")
+            return []
 
-                if was_correct:
-                    self._correct_predictions += 1
+        for row in rows:
+            scenario = row.get("scenario", "")
+            verified_predictions.append({
+                "prediction_id": row.get("id", ""),
+                "was_correct": row["was_correct"],
+                "scenario": scenario[:50],
+            })
 
-                if self._verbose:
-                    result = "[O] 정확" if was_correct else "[X] 부정확"
-                    print(f"[WORLD_MODEL] 예측 자동검증: {result} - {scenario[:30]}...")
+            if row["was_correct"]:
+                self._correct_predictions += 1
 
-            except Exception as e:
-                if self._verbose:
-                    print(f"[WORLD_MODEL] 예측 검증 실패 ({prediction_id}): {e}")
-                continue
+            if self._verbose:
+                result = "[O] 정확" if row["was_correct"] else "[X] 부정확"
+                print(f"[WORLD_MODEL] 예측 자동검증: {result} - {scenario[:30]}...")
 
         if self._verbose and verified_predictions:
             correct_count = sum(1 for p in verified_predictions if p["was_correct"])
@@ -1063,4 +1231,5 @@ JSON만 응답:"""
             "can_reason_causally": self.can_reason_causally(),
             "development_stage": self._development_stage,
             "active_imagination": self._active_imagination is not None,
+            "causal_graph": self._causal_graph.get_stats(),
         }
@@ -4,13 +4,20 @@ Baby AI Ablation Study Analysis
 
 Generates publication-ready figures from Supabase ablation data.
 Usage: python scripts/generate_paper_figures.py [--output-dir path]
+                                                [--offline] [--refresh] [--cache-dir path]
 
-Requires: matplotlib, pandas, scipy, supabase
+Raw data is cached locally (Parquet if pyarrow is installed, pickle otherwise),
+keyed by a data version derived from the completed runs. Re-running only
+re-downloads when runs change; --offline renders from the latest cache
+without touching the network.
+
+Requires: matplotlib, pandas, scipy, supabase (optional: pyarrow)
 """
 
 import os
 import sys
 import argparse
+import hashlib
 import json
 from pathlib import Path
 from datetime import datetime
@@ -29,6 +36,11 @@ from supabase import create_client
 SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
 
+PAGE_SIZE = 1000          # PostgREST default max rows per response
+IN_CHUNK_SIZE = 100       # run ids per in_() filter (keeps URLs short)
+DEFAULT_CACHE_DIR = '.cache/paper_figures'
+CACHE_FRAMES = ('runs', 'metrics', 'concepts')
+
 CONDITIONS = ['C_full', 'C_nostage', 'C_noemo', 'C_nosleep']
 CONDITION_LABELS = {
     'C_full': 'Full System',
@@ -73,33 +85,173 @@ plt.rcParams.update({
 
 # ─── Data Loading ─────────────────────────────────────────────────────────────
 
-def load_data(supabase):
-    """Load all ablation data from Supabase."""
-    print("Loading data from Supabase...")
+def fetch_paginated(build_query, page_size=PAGE_SIZE):
+    """Fetch all rows of a query page by page using range()."""
+    rows = []
+    start = 0
+    while True:
+        page = build_query().range(start, start + page_size - 1).execute()
+        rows.extend(page.data)
+        if len(page.data) < page_size:
+            return rows
+        start += page_size
 
-    # Ablation runs
-    runs = supabase.table('ablation_runs').select('*').eq('status', 'completed').execute()
-    df_runs = pd.DataFrame(runs.data)
-    print(f"  Loaded {len(df_runs)} completed runs")
 
-    # Ablation metrics (per-turn)
-    run_ids = df_runs['id'].tolist()
-    all_metrics = []
-    for rid in run_ids:
-        m = supabase.table('ablation_metrics').select('*').eq('run_id', rid).order('turn_number').execute()
-        all_metrics.extend(m.data)
-    df_metrics = pd.DataFrame(all_metrics)
-    print(f"  Loaded {len(df_metrics)} metric rows")
+def fetch_by_run_ids(supabase, table, columns, run_column, run_ids, order_columns=()):
+    """Fetch rows for many runs with paginated in_() queries instead of one query per run."""
+    rows = []
+    for i in range(0, len(run_ids), IN_CHUNK_SIZE):
+        chunk = run_ids[i:i + IN_CHUNK_SIZE]
+
+        def build_query(chunk=chunk):
+            query = supabase.table(table).select(columns).in_(run_column, chunk)
+            for column in order_columns:
+                query = query.order(column)
+            return query
+
+        rows.extend(fetch_paginated(build_query))
+    return rows
+
 
-    # Concepts with CDI-normalized categories (via the view)
-    # Since views may not be accessible via REST API, load raw + normalize
-    all_concepts = []
-    for rid in run_ids:
-        c = supabase.table('semantic_concepts').select(
-            'id, name, category, strength, ablation_run_id'
-        ).eq('ablation_run_id', rid).execute()
-        all_concepts.extend(c.data)
-    df_concepts = pd.DataFrame(all_concepts) if all_concepts else pd.DataFrame()
+def compute_data_version(run_rows):
+    """Hash of the completed runs; changes whenever a run is added or updated."""
+    keys = sorted(
+        (str(r.get('id')), str(r.get('updated_at') or r.get('completed_at') or ''), str(r.get('status')))
+        for r in run_rows
+    )
+    digest = hashlib.sha256(json.dumps(keys).encode('utf-8')).hexdigest()
+    return digest[:16]
+
+
+def _frame_writer():
+    """Parquet when pyarrow is available, compressed pickle otherwise."""
+    try:
+        import pyarrow  # noqa: F401
+        return 'parquet'
+    except ImportError:
+        return 'pkl.gz'
+
+
+def save_cache(cache_dir, version, frames):
+    """Write raw frames to cache_dir/<version>/ and point LATEST at it."""
+    version_dir = Path(cache_dir) / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+    fmt = _frame_writer()
+    json_columns = {}
+
+    for name, df in frames.items():
+        path = version_dir / f'{name}.{fmt}'
+        if fmt == 'parquet':
+            # Nested JSON columns are not Parquet-friendly; store them as strings
+            # and record them in the manifest so load_cache() can decode them.
+            df = df.copy()
+            json_columns[name] = []
+            for col in df.columns:
+                if df[col].map(lambda v: isinstance(v, (dict, list))).any():
+                    df[col] = df[col].map(lambda v: None if v is None else json.dumps(v))
+                    json_columns[name].append(col)
+            df.to_parquet(path, index=False)
+        else:
+            df.to_pickle(path)
+
+    manifest = {
+        'version': version,
+        'format': fmt,
+        'created_at': datetime.now().isoformat(),
+        'rows': {name: len(df) for name, df in frames.items()},
+        'json_columns': json_columns,
+    }
+    (version_dir / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+    (Path(cache_dir) / 'LATEST').write_text(version)
+
+
+def load_cache(cache_dir, version=None):
+    """Load cached frames for a version (default: LATEST). Returns None on miss."""
+    cache_dir = Path(cache_dir)
+    if version is None:
+        latest = cache_dir / 'LATEST'
+        if not latest.exists():
+            return None
+        version = latest.read_text().strip()
+
+    manifest_path = cache_dir / version / 'manifest.json'
+    if not manifest_path.exists():
+        return None
+
+    manifest = json.loads(manifest_path.read_text())
+    fmt = manifest['format']
+    if fmt == 'parquet' and 'json_columns' not in manifest:
+        return None  # written before JSON columns were recorded; refetch
+    json_columns = manifest.get('json_columns', {})
+    frames = {}
+    for name in CACHE_FRAMES:
+        path = cache_dir / version / f'{name}.{fmt}'
+        if fmt == 'parquet':
+            df = pd.read_parquet(path)
+            for col in json_columns.get(name, []):
+                df[col] = df[col].map(lambda v: json.loads(v) if isinstance(v, str) else v)
+        else:
+            df = pd.read_pickle(path)
+        frames[name] = df
+    return frames
+
+
+def load_data(supabase, cache_dir=DEFAULT_CACHE_DIR, offline=False, refresh=False):
+    """
+    Load all ablation data, using the local cache when the data version matches.
+
+    Online: one query for completed runs (also yields the data version), then
+    paginated in_() queries for metrics and concepts only on a cache miss.
+    Offline: latest cached version, no network.
+    """
+    frames = None
+
+    if offline:
+        print(f"Loading data from cache ({cache_dir}, offline)...")
+        frames = load_cache(cache_dir)
+        if frames is None:
+            print("ERROR: No cached data found; run once online first")
+            sys.exit(1)
+    else:
+        print("Loading data from Supabase...")
+        runs = fetch_paginated(
+            lambda: supabase.table('ablation_runs').select('*').eq('status', 'completed').order('id')
+        )
+        version = compute_data_version(runs)
+
+        if not refresh:
+            frames = load_cache(cache_dir, version)
+            if frames is not None:
+                print(f"  Cache hit (data version {version})")
+
+        if frames is None:
+            run_ids = [r['id'] for r in runs]
+            # Ablation metrics (per-turn)
+            metrics = fetch_by_run_ids(
+                supabase, 'ablation_metrics', '*', 'run_id', run_ids,
+                order_columns=('run_id', 'turn_number'),
+            )
+            # Concepts with CDI-normalized categories (via the view)
+            # Since views may not be accessible via REST API, load raw + normalize
+            concepts = fetch_by_run_ids(
+                supabase, 'semantic_concepts',
+                'id, name, category, strength, ablation_run_id',
+                'ablation_run_id', run_ids,
+                order_columns=('id',),
+            )
+            frames = {
+                'runs': pd.DataFrame(runs),
+                'metrics': pd.DataFrame(metrics),
+                'concepts': pd.DataFrame(concepts),
+            }
+            save_cache(cache_dir, version, frames)
+            print(f"  Cached data version {version} in {cache_dir}")
+
+    df_runs = frames['runs']
+    df_metrics = frames['metrics']
+    df_concepts = frames['concepts']
+    print(f"  Loaded {len(df_runs)} completed runs")
+    print(f"  Loaded {len(df_metrics)} metric rows")
     print(f"  Loaded {len(df_concepts)} concepts")
 
     # Normalize categories
@@ -632,6 +784,12 @@ def main():
     parser = argparse.ArgumentParser(description='Generate ICDL 2026 paper figures')
     parser.add_argument('--output-dir', type=str, default='docs/figures',
                         help='Output directory for figures')
+    parser.add_argument('--cache-dir', type=str, default=DEFAULT_CACHE_DIR,
+                        help='Local cache directory for raw data frames')
+    parser.add_argument('--offline', action='store_true',
+                        help='Render from the latest cached data without network access')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore the cache and re-download everything')
     args = parser.parse_args()
 
     # Load env from .env.local if available
@@ -644,20 +802,24 @@ def main():
                 key, _, value = line.partition('=')
                 os.environ.setdefault(key.strip(), value.strip())
 
-    url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
-    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "") or os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
-    if not url or not key:
-        print("ERROR: Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or NEXT_PUBLIC_SUPABASE_ANON_KEY)")
-        sys.exit(1)
+    supabase = None
+    if not args.offline:
+        url = os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
+        key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "") or os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
+        if not url or not key:
+            print("ERROR: Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (or NEXT_PUBLIC_SUPABASE_ANON_KEY)")
+            sys.exit(1)
 
-    supabase = create_client(url, key)
+        supabase = create_client(url, key)
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"Output directory: {output_dir}")
 
     # Load data
-    df_runs, df_metrics, df_concepts = load_data(supabase)
+    df_runs, df_metrics, df_concepts = load_data(
+        supabase, cache_dir=args.cache_dir, offline=args.offline, refresh=args.refresh,
+    )
 
     if df_runs.empty:
         print("ERROR: No completed ablation runs found")
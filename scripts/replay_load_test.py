@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+카세트 재생 부하 테스트
+
+녹화된 LLM 응답(카세트)으로 BabySubstrate 파이프라인을 네트워크 없이 실행하고
+처리량/지연시간을 측정한다.
+
+1. 녹화: LLM_CASSETTE_MODE=record python scripts/replay_load_test.py --requests 5
+2. 재생: python scripts/replay_load_test.py --requests 200 --concurrency 20 --latency lognormal:800:0.5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# 프로젝트 루트 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+DEFAULT_TASKS = [
+    "피보나치 함수 만들어줘",
+    "리스트를 정렬하는 함수 작성해줘",
+    "스택 클래스 구현해줘",
+    "이진 탐색 알고리즘 작성해줘",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay load test for BabySubstrate")
+    parser.add_argument("--requests", type=int, default=50, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--cassette", default=None, help="카세트 경로 (기본: LLM_CASSETTE_PATH)")
+    parser.add_argument("--latency", default=None, help="재생 지연시간 분포 (예: fixed:50, lognormal:800:0.5)")
+    return parser.parse_args()
+
+
+async def run(args) -> None:
+    from neural.baby.substrate import BabySubstrate, BabyConfig
+    from neural.baby.llm_metrics import LatencyHistogram
+
+    substrate = BabySubstrate(BabyConfig(
+        verbose=False,
+        enable_supabase=False,
+        enable_response_cache=False,  # 캐시 없이 파이프라인 전체 부하 측정
+    ))
+    histogram = LatencyHistogram()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failures = 0
+
+    async def one(i: int) -> None:
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await substrate.process(DEFAULT_TASKS[i % len(DEFAULT_TASKS)])
+            except Exception as e:
+                failures += 1
+                print(f"  [ERROR] request {i}: {e}")
+            histogram.record((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    # 응답 후 백그라운드 학습 (처리량/지연시간 측정에는 포함하지 않음)
+    drain_started = time.perf_counter()
+    await substrate.drain()
+    drain_elapsed = time.perf_counter() - drain_started
+
+    stats = histogram.to_dict()
+    print("\n" + "=" * 60)
+    print("  REPLAY LOAD TEST")
+    print("=" * 60)
+    print(f"  Requests:    {args.requests} (concurrency {args.concurrency}, failures {failures})")
+    print(f"  Throughput:  {args.requests / elapsed:.1f} req/s")
+    print(f"  Latency p50: {stats['p50_ms']:.0f}ms  p95: {stats['p95_ms']:.0f}ms  p99: {stats['p99_ms']:.0f}ms")
+    print(f"  Learning drain: {drain_elapsed:.1f}s ({substrate.get_learning_stats()})")
+
+
+def main():
+    args = parse_args()
+
+    # Config는 import 시점에 환경변수를 읽으므로 먼저 설정
+    os.environ.setdefault("LLM_CASSETTE_MODE", "replay")
+    if args.cassette:
+        os.environ["LLM_CASSETTE_PATH"] = args.cassette
+    if args.latency:
+        os.environ["LLM_REPLAY_LATENCY"] = args.latency
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()